@@ -1,4 +1,6 @@
 
+from typing import List
+
 from logging import Logger
 from logging import getLogger
 
@@ -19,8 +21,7 @@ from pyut.general.PyutSystemMetrics import PyutSystemMetrics
 
 from pyut.PyutUtils import PyutUtils
 
-from pyut.ui.main.PyutApp import PyutApp
-
+from pyut.enums.ImageFormat import ImageFormat
 from pyut.enums.ResourceTextType import ResourceTextType
 
 
@@ -63,8 +64,23 @@ class Pyut:
         logging.logThreads   = False
 
     def startApplication(self):
+        from time import perf_counter
+
+        startTime: float = perf_counter()
+        # Imported here so that headless command line options do not pay for the UI
+        from pyut.ui.main.PyutApp import PyutApp
+
+        from pyut.preferences.PyutPreferences import PyutPreferences
+
         self._displayIntroduction()
-        app: PyutApp = PyutApp(redirect=False)
+
+        preferences: PyutPreferences = PyutPreferences()
+        if preferences.profilingControl is True and preferences.profileOnStartup is True:
+            from pyut.general.SessionProfiler import SessionProfiler
+
+            SessionProfiler().start(cpuProfile=preferences.profileCpu, memoryProfile=preferences.profileMemory)
+
+        app: PyutApp = PyutApp(redirect=False, showSplash=preferences.fastStartup is False, startTime=startTime)
 
         pyut._displaySystemMetrics()
 
@@ -136,10 +152,66 @@ class Pyut:
             print(helpText)
             self.cmdLineArgsHandled = True
             return
+        elif argv[1] == "--validate":
+            if len(argv) < 3:
+                print(f'Usage: pyut --validate <directory>')
+            else:
+                self._validateProjects(directory=argv[2])
+            self.cmdLineArgsHandled = True
+            return
+        elif argv[1] == "--render":
+            imageFormats: List[str] = [imageFormat.value for imageFormat in ImageFormat]
+            if len(argv) < 4 or (len(argv) > 4 and argv[4] not in imageFormats):
+                print(f'Usage: pyut --render <directory> <outputDirectory> [{"|".join(imageFormats)}]')
+            else:
+                imageFormat: ImageFormat = ImageFormat(argv[4]) if len(argv) > 4 else ImageFormat.PNG
+                self._renderProjects(directory=argv[2], outputDirectory=argv[3], imageFormat=imageFormat)
+            self.cmdLineArgsHandled = True
+            return
         else:
             self.logger.debug(f'If these are files, the will be loaded by PyutApp startup')
         self.cmdLineArgsHandled = False
 
+    def _validateProjects(self, directory: str):
+        """
+        Load every project in the directory tree without starting the UI
+        and report the results
+
+        Args:
+            directory:  The top of the directory tree
+        """
+        from time import perf_counter
+
+        from pyut.headless.ProjectValidator import ProjectValidator
+        from pyut.headless.ProjectValidator import ValidationResults
+
+        startTime: float             = perf_counter()
+        validator: ProjectValidator  = ProjectValidator()
+        results:   ValidationResults = validator.validate(directory=directory)
+
+        validator.report(results=results, totalTime=perf_counter() - startTime)
+
+    def _renderProjects(self, directory: str, outputDirectory: str, imageFormat: ImageFormat):
+        """
+        Write an image of every diagram in the directory tree without starting the UI
+        and report the results
+
+        Args:
+            directory:          The top of the directory tree
+            outputDirectory:    Where to write the images
+            imageFormat:        The image file format
+        """
+        from time import perf_counter
+
+        from pyut.headless.DiagramRenderer import DiagramRenderer
+        from pyut.headless.DiagramRenderer import RenderResults
+
+        startTime: float           = perf_counter()
+        renderer:  DiagramRenderer = DiagramRenderer()
+        results:   RenderResults   = renderer.render(directory=directory, outputDirectory=outputDirectory, imageFormat=imageFormat)
+
+        renderer.report(results=results, totalTime=perf_counter() - startTime)
+
 
 if __name__ == "__main__":
 
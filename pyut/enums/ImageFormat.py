@@ -0,0 +1,11 @@
+
+from enum import Enum
+
+
+class ImageFormat(Enum):
+
+    PNG = 'png'
+    SVG = 'svg'
+
+    def __str__(self):
+        return str(self.name)
@@ -0,0 +1,149 @@
+
+from logging import Logger
+from logging import getLogger
+
+from os import O_RDONLY
+from os import chmod
+from os import close
+from os import fdopen
+from os import fsync
+from os import link
+from os import open as osOpen
+from os import remove
+from os import replace
+from os import stat
+from os import umask
+
+from os.path import abspath
+from os.path import basename
+from os.path import dirname
+from os.path import exists
+
+from shutil import copy2
+
+from stat import S_IMODE
+
+from tempfile import mkstemp
+
+DEFAULT_FILE_MODE: int = 0o666
+
+
+def _readUmask() -> int:
+    """
+    The umask can only be read by setting it, and it is process wide;  So read it
+    once, at import, before Pyut starts any threads
+
+    Returns:  The process umask
+    """
+    mask: int = umask(0)
+    umask(mask)
+
+    return mask
+
+
+PROCESS_UMASK: int = _readUmask()
+
+
+class AtomicFileWriter:
+    """
+    Writes a file so that a crash or a full disk never leaves a partially written target.
+    The data goes to a temporary file in the target's directory.  The temporary file is
+    flushed to disk and then atomically renamed over the target
+
+    Optionally keeps the previous `generations` versions of the target as
+    `<target>.1` (the newest) through `<target>.N`
+    """
+    def __init__(self, generations: int = 0):
+        """
+
+        Args:
+            generations:  The number of previous versions to keep;  0 keeps none
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._generations: int = generations
+
+    def write(self, fqFileName: str, data: bytes):
+        """
+        Args:
+            fqFileName: The fully qualified target file name
+            data:       What to write
+        """
+        directory: str = dirname(abspath(fqFileName))
+
+        fd, tempFileName = mkstemp(dir=directory, prefix=f'.{basename(fqFileName)}.', suffix='.tmp')
+        try:
+            with fdopen(fd, 'wb') as binaryIO:
+                binaryIO.write(data)
+                binaryIO.flush()
+                fsync(binaryIO.fileno())
+
+            chmod(tempFileName, self._fileMode(fqFileName=fqFileName))
+
+            if self._generations > 0 and exists(fqFileName) is True:
+                self._rotateGenerations(fqFileName=fqFileName)
+
+            replace(tempFileName, fqFileName)
+        except (ValueError, Exception) as e:
+            self.logger.error(f'Write of {fqFileName} failed: {e}')
+            if exists(tempFileName) is True:
+                remove(tempFileName)
+            raise e
+
+        self._syncDirectory(directory=directory)
+
+    @classmethod
+    def generationName(cls, fqFileName: str, generation: int) -> str:
+        """
+        Args:
+            fqFileName:  The target file name
+            generation:  1 is the most recent previous version
+
+        Returns:  The name of the generation file
+        """
+        return f'{fqFileName}.{generation}'
+
+    def _rotateGenerations(self, fqFileName: str):
+        """
+        Shift the existing generations down by one and make the current target generation 1.
+        The target is linked (or copied) so that it exists until the rename replaces it
+        """
+        for generation in range(self._generations - 1, 0, -1):
+            olderName: str = AtomicFileWriter.generationName(fqFileName=fqFileName, generation=generation)
+            if exists(olderName) is True:
+                replace(olderName, AtomicFileWriter.generationName(fqFileName=fqFileName, generation=generation + 1))
+
+        newestName: str = AtomicFileWriter.generationName(fqFileName=fqFileName, generation=1)
+        if exists(newestName) is True:
+            remove(newestName)
+        try:
+            link(fqFileName, newestName)
+        except OSError:
+            copy2(fqFileName, newestName)
+
+    def _fileMode(self, fqFileName: str) -> int:
+        """
+        mkstemp creates owner only files;  Keep the target's permissions or use the
+        ones a plain open would use
+
+        Returns:  The permission bits for the new file
+        """
+        if exists(fqFileName) is True:
+            return S_IMODE(stat(fqFileName).st_mode)
+
+        return DEFAULT_FILE_MODE & ~PROCESS_UMASK
+
+    def _syncDirectory(self, directory: str):
+        """
+        Make the rename durable;  Not supported on all platforms
+        """
+        try:
+            fd: int = osOpen(directory, O_RDONLY)
+        except OSError:
+            return
+        try:
+            fsync(fd)
+        except OSError:
+            pass
+        finally:
+            close(fd)
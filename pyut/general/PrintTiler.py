@@ -0,0 +1,78 @@
+
+from logging import Logger
+from logging import getLogger
+
+from pyut.general.SpatialGrid import Bounds
+
+
+class PrintTiler:
+    """
+    Splits the diagram content into a grid of equal sized tiles;  One tile per printed page.
+    Every tile is printed at the same scale so that the pages can be put back together.
+    The pages are numbered from 1 left to right and then top to bottom
+    """
+    def __init__(self, contentBounds: Bounds, pagesAcross: int = 1, pagesDown: int = 1):
+        """
+
+        Args:
+            contentBounds:  The area the diagram shapes draw in
+            pagesAcross:    The number of pages to spread the width over
+            pagesDown:      The number of pages to spread the height over
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._contentBounds: Bounds = contentBounds
+        self._pagesAcross:   int    = max(1, pagesAcross)
+        self._pagesDown:     int    = max(1, pagesDown)
+
+        contentWidth:  int = contentBounds.maxX - contentBounds.minX
+        contentHeight: int = contentBounds.maxY - contentBounds.minY
+
+        self._tileWidth:  int = max(1, -(-contentWidth  // self._pagesAcross))      # Round up;  So the tiles cover the content
+        self._tileHeight: int = max(1, -(-contentHeight // self._pagesDown))
+
+    @property
+    def pageCount(self) -> int:
+        return self._pagesAcross * self._pagesDown
+
+    @property
+    def tileWidth(self) -> int:
+        return self._tileWidth
+
+    @property
+    def tileHeight(self) -> int:
+        return self._tileHeight
+
+    def hasPage(self, page: int) -> bool:
+        return 1 <= page <= self.pageCount
+
+    def tileBounds(self, page: int) -> Bounds:
+        """
+        Args:
+            page:  The 1 based page number
+
+        Returns:  The part of the diagram printed on the page
+        """
+        assert self.hasPage(page=page), f'No such page: {page}'
+
+        column: int = (page - 1) % self._pagesAcross
+        row:    int = (page - 1) // self._pagesAcross
+
+        minX: int = self._contentBounds.minX + column * self._tileWidth
+        minY: int = self._contentBounds.minY + row * self._tileHeight
+
+        return Bounds(minX=minX, minY=minY, maxX=minX + self._tileWidth, maxY=minY + self._tileHeight)
+
+    def scale(self, pageWidth: int, pageHeight: int, margin: int) -> float:
+        """
+        Args:
+            pageWidth:   The printable page width in device units
+            pageHeight:  The printable page height in device units
+            margin:      The space to leave around a tile in device units
+
+        Returns:  The largest scale at which a tile fits on a page
+        """
+        usableWidth:  int = max(1, pageWidth  - 2 * margin)
+        usableHeight: int = max(1, pageHeight - 2 * margin)
+
+        return min(usableWidth / self._tileWidth, usableHeight / self._tileHeight)
@@ -0,0 +1,328 @@
+
+from typing import Callable
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from xml.etree.ElementTree import Element as TreeElement
+from xml.etree.ElementTree import fromstring
+from xml.etree.ElementTree import tostring
+
+from zlib import decompress
+
+from untangle import Element
+from untangle import parse
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from ogl.OglClass import OglClass
+
+from untanglepyut import XmlConstants
+
+from untanglepyut.Types import Document
+from untanglepyut.Types import DocumentTitle
+from untanglepyut.Types import GraphicInformation
+from untanglepyut.Types import LinkableOglObjects
+from untanglepyut.Types import UntangledOglClasses
+from untanglepyut.Types import createLinkableOglObjects
+from untanglepyut.Types import createUntangledOglClasses
+
+from untanglepyut.UnTangleOglLinks import UnTangleOglLinks
+from untanglepyut.UnTangleOglNotes import UnTangleOglNotes
+from untanglepyut.UnTangleOglTexts import UnTangleOglTexts
+from untanglepyut.UnTanglePyut import UnTanglePyut
+from untanglepyut.UnTangleSequenceDiagram import UnTangleSequenceDiagram
+from untanglepyut.UnTangleUseCaseDiagram import UnTangleUseCaseDiagram
+from untanglepyut.XmlVersion import XmlVersion
+
+from oglio.Types import OglActors
+from oglio.Types import OglClasses
+from oglio.Types import OglDocument
+from oglio.Types import OglLinks
+from oglio.Types import OglNotes
+from oglio.Types import OglProject
+from oglio.Types import OglSDInstances
+from oglio.Types import OglSDMessages
+from oglio.Types import OglTexts
+from oglio.Types import OglUseCases
+
+from oglio.UnsupportedVersion import UnsupportedVersion
+
+from pyut.PyutConstants import PyutConstants
+
+from pyut.general.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+ELEMENT_PROJECT:  str = 'PyutProject'
+ELEMENT_DOCUMENT: str = 'PyutDocument'
+
+CancelledCallback = Callable[[], bool]
+
+
+@dataclass
+class UntangledDocument:
+    """
+    A document parsed off the UI thread;  It holds the XML and the class models, but no Ogl objects
+    """
+    xmlVersion:   XmlVersion      = XmlVersion.V11
+    document:     Document        = field(default_factory=Document)
+    """
+    Just the document attributes;  The Ogl lists stay empty
+    """
+    xmlElement:   TreeElement     = cast(TreeElement, None)
+    """
+    The document exactly as read;  Written back as is while the document is not materialized
+    """
+    pyutDocument: Element         = cast(Element, None)
+    pyutClasses:  List[PyutClass] = field(default_factory=list)
+    """
+    One for each class element, in document order
+    """
+
+
+@dataclass
+class ProjectXml:
+    """
+    A project file read into memory;  No Ogl objects are created yet
+    """
+    fqFileName:  str                     = ''
+    version:     str                     = ''
+    codePath:    str                     = ''
+    documents:   List[UntangledDocument] = field(default_factory=list)
+    cancelled:   bool                    = False
+    """
+    `True` if the reader stopped before it parsed every document
+    """
+
+
+class ProjectReader:
+    """
+    The single place where Pyut turns project XML into Ogl objects.
+
+    Reading is split in two.  `.readXml()` does the file I/O, the XML parsing and builds
+    the class models;  It does not touch wx, so it can run on a background thread.
+    `.toOglDocument()` creates the Ogl shapes, pens, brushes and fonts for a single document,
+    so it must run on the UI thread, or in a headless process
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def readFile(self, fqFileName: str) -> OglProject:
+        """
+        Supports .put and .xml extensions
+
+        Args:
+            fqFileName: The fully qualified file name
+
+        Returns:    An OglProject
+        """
+        return self.toOglProject(projectXml=self.readXml(fqFileName=fqFileName))
+
+    def readXml(self, fqFileName: str, cancelled: CancelledCallback = lambda: False) -> ProjectXml:
+        """
+        Supports .put and .xml extensions;  Safe to call off the UI thread
+
+        Args:
+            fqFileName: The fully qualified file name
+            cancelled:  Polled between documents;  Parsing stops once it returns `True`
+
+        Returns:    The parsed project
+        """
+        self.logger.debug(f'{fqFileName=}')
+
+        if fqFileName.endswith(PyutConstants.PYUT_EXTENSION):
+            with open(fqFileName, 'rb') as binaryIO:
+                xmlString: str = decompress(binaryIO.read()).decode()
+        elif fqFileName.endswith(PyutConstants.XML_EXTENSION):
+            with open(fqFileName, 'r') as textIO:
+                xmlString = textIO.read()
+        else:
+            raise UnsupportedFileTypeException()
+
+        return self.fromXml(xmlString=xmlString, fqFileName=fqFileName, cancelled=cancelled)
+
+    def fromXml(self, xmlString: str, fqFileName: str = '', cancelled: CancelledCallback = lambda: False) -> ProjectXml:
+        """
+        Parses project XML that is already in memory;  Safe to call off the UI thread
+
+        Args:
+            xmlString:  The project XML
+            fqFileName: Where the XML came from
+            cancelled:  Polled between documents;  Parsing stops once it returns `True`
+
+        Returns:    The parsed project
+        """
+        projectElement: TreeElement = fromstring(xmlString)
+        if projectElement.tag != ELEMENT_PROJECT:
+            raise ValueError(f'Not a Pyut project: {projectElement.tag}')
+
+        version: str = projectElement.get('version', '')
+        if version != XmlVersion.V10.value and version != XmlVersion.V11.value:
+            raise UnsupportedVersion(message=f'Unsupported version: {version}')
+
+        projectXml: ProjectXml = ProjectXml(fqFileName=fqFileName, version=version, codePath=projectElement.get('CodePath', ''))
+
+        for xmlElement in projectElement.findall(ELEMENT_DOCUMENT):
+            if cancelled() is True:
+                projectXml.cancelled = True
+                break
+            projectXml.documents.append(self._untangleDocument(xmlVersion=XmlVersion(version), xmlElement=xmlElement))
+
+        return projectXml
+
+    def toOglProject(self, projectXml: ProjectXml) -> OglProject:
+        """
+        Creates the Ogl objects for every document;  Call it on the UI thread
+
+        Args:
+            projectXml:  The output of `.readXml()`
+
+        Returns:    An OglProject
+        """
+        oglProject: OglProject = OglProject()
+
+        oglProject.fileName = projectXml.fqFileName
+        oglProject.version  = projectXml.version
+        oglProject.codePath = projectXml.codePath
+
+        for untangledDocument in projectXml.documents:
+            oglDocument: OglDocument = self.toOglDocument(untangledDocument=untangledDocument)
+            oglProject.oglDocuments[oglDocument.documentTitle] = oglDocument
+
+        return oglProject
+
+    def toOglDocument(self, untangledDocument: UntangledDocument) -> OglDocument:
+        """
+        Creates the Ogl objects for a single document;  Call it on the UI thread
+
+        Args:
+            untangledDocument:  A document parsed by `.readXml()` or `.fromXml()`
+
+        Returns:    An OglDocument
+        """
+        xmlVersion:   XmlVersion = untangledDocument.xmlVersion
+        pyutDocument: Element    = untangledDocument.pyutDocument
+        document:     Document   = Document()
+
+        document.documentType  = untangledDocument.document.documentType
+        document.documentTitle = untangledDocument.document.documentTitle
+
+        if document.documentType == 'CLASS_DIAGRAM':
+            document.oglClasses = self._toOglClasses(untangledDocument=untangledDocument)
+            document.oglNotes   = UnTangleOglNotes(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument)
+            document.oglTexts   = UnTangleOglTexts(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument)
+            document.oglLinks   = UnTangleOglLinks(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument,
+                                                                                   linkableOglObjects=self._linkableOglObjects(document=document))
+        elif document.documentType == 'SEQUENCE_DIAGRAM':
+            untangleSequenceDiagram: UnTangleSequenceDiagram = UnTangleSequenceDiagram(xmlVersion=xmlVersion)
+
+            untangleSequenceDiagram.unTangle(pyutDocument=pyutDocument)
+            document.oglSDInstances = untangleSequenceDiagram.oglSDInstances
+            document.oglSDMessages  = untangleSequenceDiagram.oglSDMessages
+            document.oglActors      = untangleSequenceDiagram.oglActors
+            document.oglLinks       = untangleSequenceDiagram.oglLinks
+        elif document.documentType == 'USECASE_DIAGRAM':
+            unTangleUseCaseDiagram: UnTangleUseCaseDiagram = UnTangleUseCaseDiagram(xmlVersion=xmlVersion)
+
+            unTangleUseCaseDiagram.unTangle(pyutDocument=pyutDocument)
+            document.oglActors   = unTangleUseCaseDiagram.oglActors
+            document.oglUseCases = unTangleUseCaseDiagram.oglUseCases
+            document.oglNotes    = UnTangleOglNotes(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument)
+            document.oglTexts    = UnTangleOglTexts(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument)
+            document.oglLinks    = UnTangleOglLinks(xmlVersion=xmlVersion).unTangle(pyutDocument=pyutDocument,
+                                                                                    linkableOglObjects=self._linkableOglObjects(document=document))
+        else:
+            raise ValueError(f'Unknown document type: {document.documentType}')
+
+        oglDocument: OglDocument = OglDocument()
+        oglDocument.toOglDocument(untangledDocument.document)
+        #
+        # Same cheat as the oglio Reader
+        #
+        oglDocument.oglClasses     = cast(OglClasses,     document.oglClasses)
+        oglDocument.oglLinks       = cast(OglLinks,       document.oglLinks)
+        oglDocument.oglNotes       = cast(OglNotes,       document.oglNotes)
+        oglDocument.oglTexts       = cast(OglTexts,       document.oglTexts)
+        oglDocument.oglActors      = cast(OglActors,      document.oglActors)
+        oglDocument.oglUseCases    = cast(OglUseCases,    document.oglUseCases)
+        oglDocument.oglSDInstances = cast(OglSDInstances, document.oglSDInstances)
+        oglDocument.oglSDMessages  = cast(OglSDMessages,  document.oglSDMessages)
+
+        return oglDocument
+
+    def _untangleDocument(self, xmlVersion: XmlVersion, xmlElement: TreeElement) -> UntangledDocument:
+        """
+        Parses the document and builds its class models;  The class models are the expensive ones
+
+        Args:
+            xmlVersion:  The project XML version
+            xmlElement:  The document element
+
+        Returns:  The document without any Ogl objects
+        """
+        pyutDocument: Element  = parse(tostring(xmlElement, encoding='unicode')).PyutDocument
+        document:     Document = Document()
+
+        document.documentType    = pyutDocument['type']
+        document.documentTitle   = DocumentTitle(pyutDocument['title'])
+        document.scrollPositionX = int(pyutDocument['scrollPositionX'])
+        document.scrollPositionY = int(pyutDocument['scrollPositionY'])
+        document.pixelsPerUnitX  = int(pyutDocument['pixelsPerUnitX'])
+        document.pixelsPerUnitY  = int(pyutDocument['pixelsPerUnitY'])
+
+        untangledDocument: UntangledDocument = UntangledDocument(xmlVersion=xmlVersion, document=document, xmlElement=xmlElement, pyutDocument=pyutDocument)
+
+        untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
+        for graphicClass in pyutDocument.get_elements(self._classElementName(xmlVersion=xmlVersion)):
+            untangledDocument.pyutClasses.append(untanglePyut.classToPyutClass(graphicClass=graphicClass))
+
+        return untangledDocument
+
+    def _toOglClasses(self, untangledDocument: UntangledDocument) -> UntangledOglClasses:
+        """
+        Wraps the class models that `._untangleDocument()` built
+
+        Args:
+            untangledDocument:  The parsed document
+
+        Returns:  The Ogl classes
+        """
+        oglClasses:     UntangledOglClasses = createUntangledOglClasses()
+        graphicClasses: List[Element]       = untangledDocument.pyutDocument.get_elements(self._classElementName(xmlVersion=untangledDocument.xmlVersion))
+
+        for graphicClass, pyutClass in zip(graphicClasses, untangledDocument.pyutClasses):
+            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=graphicClass)
+            oglClass:           OglClass           = OglClass(pyutClass=pyutClass, w=graphicInformation.width, h=graphicInformation.height)
+
+            oglClass.SetPosition(x=graphicInformation.x, y=graphicInformation.y)
+            # Necessary if it is never added to a diagram and immediately serialized
+            oglClass.model.SetPosition(x=graphicInformation.x, y=graphicInformation.y)
+
+            oglClasses.append(oglClass)
+
+        return oglClasses
+
+    def _linkableOglObjects(self, document: Document) -> LinkableOglObjects:
+
+        linkableOglObjects: LinkableOglObjects = createLinkableOglObjects()
+
+        for oglClass in document.oglClasses:
+            linkableOglObjects[oglClass.pyutObject.id] = oglClass
+        for oglNote in document.oglNotes:
+            linkableOglObjects[oglNote.pyutObject.id] = oglNote
+        for oglUseCase in document.oglUseCases:
+            linkableOglObjects[oglUseCase.pyutObject.id] = oglUseCase
+        for oglActor in document.oglActors:
+            linkableOglObjects[oglActor.pyutObject.id] = oglActor
+
+        return linkableOglObjects
+
+    def _classElementName(self, xmlVersion: XmlVersion) -> str:
+
+        if xmlVersion == XmlVersion.V10:
+            return XmlConstants.V10_ELEMENT_CLASS
+        return XmlConstants.V11_ELEMENT_CLASS
@@ -0,0 +1,119 @@
+
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from os import remove
+
+from os.path import exists
+from os.path import getmtime
+
+from pathlib import Path
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pyut.PyutConstants import PyutConstants
+
+JOURNAL_FILE_NAME: str = 'pyutRecovery.txt'
+RECOVERY_SUFFIX:   str = '.recovery'
+
+
+@dataclass
+class RecoveryCandidate:
+    """
+    A project with a recovery snapshot that is newer than the project file
+    """
+    projectFileName:  str = ''
+    snapshotFileName: str = ''
+
+
+RecoveryCandidates = NewType('RecoveryCandidates', List[RecoveryCandidate])
+
+
+class RecoveryJournal:
+    """
+    Remembers which projects have an autosave snapshot.  The snapshot is written next to
+    the project;  The journal lives with the Pyut preferences so that Pyut can find the
+    snapshots when it starts after a crash
+    """
+    def __init__(self, journalFileName: Path | None = None):
+        """
+
+        Args:
+            journalFileName:  Override the default journal location;  Intended for unit tests
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if journalFileName is None:
+            self._journalFileName: Path = ConfigurationLocator().applicationPath('pyut') / JOURNAL_FILE_NAME
+        else:
+            self._journalFileName = journalFileName
+
+    @classmethod
+    def snapshotName(cls, projectFileName: str) -> str:
+        """
+        Args:
+            projectFileName:  The fully qualified project file name
+
+        Returns:  The fully qualified name of the project's recovery snapshot
+        """
+        if projectFileName.endswith(PyutConstants.PYUT_EXTENSION) is True:
+            projectFileName = projectFileName[:-len(PyutConstants.PYUT_EXTENSION)]
+
+        return f'{projectFileName}{RECOVERY_SUFFIX}{PyutConstants.PYUT_EXTENSION}'
+
+    def add(self, projectFileName: str):
+        """
+        Args:
+            projectFileName:  A project that now has a snapshot
+        """
+        projectFileNames: List[str] = self._read()
+        if projectFileName not in projectFileNames:
+            projectFileNames.append(projectFileName)
+            self._write(projectFileNames=projectFileNames)
+
+    def discard(self, projectFileName: str):
+        """
+        Forget the project and delete its snapshot
+
+        Args:
+            projectFileName:  A project that was saved or intentionally closed
+        """
+        snapshotFileName: str = RecoveryJournal.snapshotName(projectFileName=projectFileName)
+        if exists(snapshotFileName) is True:
+            remove(snapshotFileName)
+
+        projectFileNames: List[str] = self._read()
+        if projectFileName in projectFileNames:
+            projectFileNames.remove(projectFileName)
+            self._write(projectFileNames=projectFileNames)
+
+    def recoveryCandidates(self) -> RecoveryCandidates:
+        """
+        Returns:  The journaled projects whose snapshot is newer than the project file
+        """
+        candidates: RecoveryCandidates = RecoveryCandidates([])
+
+        for projectFileName in self._read():
+            snapshotFileName: str = RecoveryJournal.snapshotName(projectFileName=projectFileName)
+            if exists(snapshotFileName) is False:
+                continue
+            if exists(projectFileName) is False or getmtime(snapshotFileName) > getmtime(projectFileName):
+                candidates.append(RecoveryCandidate(projectFileName=projectFileName, snapshotFileName=snapshotFileName))
+
+        return candidates
+
+    def _read(self) -> List[str]:
+
+        if self._journalFileName.exists() is False:
+            return []
+
+        return [line for line in self._journalFileName.read_text().splitlines() if line != '']
+
+    def _write(self, projectFileNames: List[str]):
+
+        self._journalFileName.write_text(''.join([f'{projectFileName}\n' for projectFileName in projectFileNames]))
@@ -0,0 +1,247 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import FileHandler
+from logging import Logger
+from logging import getLogger
+
+from cProfile import Profile
+
+from dataclasses import dataclass
+
+from datetime import datetime
+
+from functools import wraps
+
+from json import dumps as jsonDumps
+
+from pathlib import Path
+
+from time import perf_counter
+
+from tracemalloc import is_tracing
+from tracemalloc import take_snapshot
+from tracemalloc import start as tracemallocStart
+from tracemalloc import stop as tracemallocStop
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+PROFILE_SUFFIX:  str = '.prof'
+SNAPSHOT_SUFFIX: str = '.snapshot'
+TIMINGS_SUFFIX:  str = '-timings.json'
+
+MENU_HANDLER_PREFIX: str = 'on'
+
+
+@dataclass
+class ActionTiming:
+    """
+    The accumulated time of a single kind of action
+    """
+    count:        int   = 0
+    totalSeconds: float = 0.0
+    maxSeconds:   float = 0.0
+
+    def record(self, seconds: float):
+
+        self.count        += 1
+        self.totalSeconds += seconds
+        if seconds > self.maxSeconds:
+            self.maxSeconds = seconds
+
+    @property
+    def meanSeconds(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.totalSeconds / self.count
+
+
+ActionTimings = NewType('ActionTimings', Dict[str, ActionTiming])
+ProfileFiles  = NewType('ProfileFiles',  List[str])
+
+
+def logDirectory() -> Path:
+    """
+    Returns:  The directory of the first log file;  Else the Pyut preferences directory
+    """
+    for handler in getLogger().handlers:
+        if isinstance(handler, FileHandler):
+            return Path(handler.baseFilename).parent
+
+    from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+    return ConfigurationLocator().applicationPath('pyut')
+
+
+class SessionProfiler(metaclass=SingletonV3):
+    """
+    Wraps part of a Pyut session in cProfile and/or tracemalloc so that an end-user can capture
+    what happened when Pyut is slow.  While it runs the menu handlers, command submits and event
+    handlers that were instrumented record their times.  When it stops it writes a .prof file,
+    a tracemalloc .snapshot and the action timings next to the log.
+
+    Instrumenting costs a check of `.running` per action when the profiler is stopped
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputDirectory: Path          = cast(Path, None)
+        self._profile:         Profile | None = None
+        self._memoryProfiling: bool           = False
+        self._running:         bool           = False
+        self._startTime:       datetime       = datetime.now()
+        self._actionTimings:   ActionTimings  = ActionTimings({})
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def actionTimings(self) -> ActionTimings:
+        """
+        Returns:  The timings of the current, or last, profiling session
+        """
+        return self._actionTimings
+
+    @property
+    def outputDirectory(self) -> Path:
+        """
+        Returns:  Where the profile files go;  Defaults to the log directory
+        """
+        if self._outputDirectory is None:
+            self._outputDirectory = logDirectory()
+        return self._outputDirectory
+
+    @outputDirectory.setter
+    def outputDirectory(self, newValue: Path):
+        self._outputDirectory = newValue
+
+    def start(self, cpuProfile: bool = True, memoryProfile: bool = False):
+        """
+        Start a profiling session;  Does nothing if one is running
+
+        Args:
+            cpuProfile:     If True, run cProfile
+            memoryProfile:  If True, trace the memory allocations
+        """
+        if self._running is True:
+            return
+
+        self._actionTimings = ActionTimings({})
+        self._startTime     = datetime.now()
+
+        if cpuProfile is True:
+            self._profile = Profile()
+            self._profile.enable()
+        if memoryProfile is True and is_tracing() is False:
+            tracemallocStart()
+            self._memoryProfiling = True
+
+        self._running = True
+        self.logger.info(f'Profiling started {cpuProfile=} {memoryProfile=}')
+
+    def stop(self) -> ProfileFiles:
+        """
+        Stop the profiling session and write the results;  Does nothing if none is running
+
+        Returns:  The files that were written
+        """
+        profileFiles: ProfileFiles = ProfileFiles([])
+        if self._running is False:
+            return profileFiles
+
+        self._running = False
+        baseName: Path = self.outputDirectory / f'pyut-{self._startTime.strftime("%Y%m%d-%H%M%S")}'
+
+        if self._profile is not None:
+            self._profile.disable()
+            profileFileName: str = f'{baseName}{PROFILE_SUFFIX}'
+            self._profile.dump_stats(profileFileName)
+            profileFiles.append(profileFileName)
+            self._profile = None
+
+        if self._memoryProfiling is True:
+            snapshotFileName: str = f'{baseName}{SNAPSHOT_SUFFIX}'
+            take_snapshot().dump(snapshotFileName)
+            tracemallocStop()
+            profileFiles.append(snapshotFileName)
+            self._memoryProfiling = False
+
+        timingsFileName: str = f'{baseName}{TIMINGS_SUFFIX}'
+        with open(timingsFileName, 'w') as textIO:
+            textIO.write(jsonDumps(self.toDict(), indent=4))
+        profileFiles.append(timingsFileName)
+
+        self.logger.info(f'Profiling stopped;  Wrote {profileFiles}')
+
+        return profileFiles
+
+    def recordAction(self, actionName: str, seconds: float):
+        """
+        Args:
+            actionName:  What was timed
+            seconds:     How long it took
+        """
+        if self._running is False:
+            return
+
+        actionTiming: ActionTiming | None = self._actionTimings.get(actionName)
+        if actionTiming is None:
+            actionTiming = ActionTiming()
+            self._actionTimings[actionName] = actionTiming
+
+        actionTiming.record(seconds)
+
+    def timedCallback(self, actionName: str, callback: Callable) -> Callable:
+        """
+        Args:
+            actionName:  The name the timings are recorded under
+            callback:    The callback to time
+
+        Returns:  The wrapped callback
+        """
+        @wraps(callback)
+        def timed(*args, **kwargs):
+            if self._running is False:
+                return callback(*args, **kwargs)
+
+            startTime: float = perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                self.recordAction(actionName=actionName, seconds=perf_counter() - startTime)
+
+        return timed
+
+    def instrument(self, handler: Any):
+        """
+        Time every menu handler method, the ones named `on...`, of a handler instance.
+        Call it before the methods are bound
+
+        Args:
+            handler:  A menu handler
+        """
+        className: str = handler.__class__.__name__
+        for name in dir(handler.__class__):
+            if name.startswith(MENU_HANDLER_PREFIX) and callable(getattr(handler.__class__, name)) is True:
+                setattr(handler, name, self.timedCallback(actionName=f'{className}.{name}', callback=getattr(handler, name)))
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            'started': self._startTime.isoformat(),
+            'actions': {
+                actionName: {
+                    'count':   actionTiming.count,
+                    'meanMs':  actionTiming.meanSeconds * 1000,
+                    'maxMs':   actionTiming.maxSeconds * 1000,
+                    'totalMs': actionTiming.totalSeconds * 1000,
+                }
+                for actionName, actionTiming in sorted(self._actionTimings.items())
+            }
+        }
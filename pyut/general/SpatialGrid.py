@@ -0,0 +1,130 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Set
+from typing import Tuple
+
+from dataclasses import dataclass
+
+DEFAULT_CELL_SIZE: int = 256
+
+
+@dataclass(frozen=True)
+class Bounds:
+    """
+    An axis aligned rectangle in diagram coordinates;  The maximums are inclusive
+    """
+    minX: int = 0
+    minY: int = 0
+    maxX: int = 0
+    maxY: int = 0
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.minX <= x <= self.maxX and self.minY <= y <= self.maxY
+
+    def intersects(self, other: 'Bounds') -> bool:
+        return self.minX <= other.maxX and other.minX <= self.maxX and self.minY <= other.maxY and other.minY <= self.maxY
+
+
+Cell     = NewType('Cell', Tuple[int, int])
+EntryIds = NewType('EntryIds', Set[int])
+
+
+class SpatialGrid:
+    """
+    A uniform grid spatial index.  Each entry is registered in every cell its bounds overlap;  So
+    point queries only look at a single cell and rectangle queries only at the cells the rectangle
+    overlaps.  Entries are identified by an integer the caller chooses
+    """
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:  The width and height of a grid cell in diagram coordinates
+        """
+        self._cellSize: int                   = cellSize
+        self._cells:    Dict[Cell, EntryIds]  = {}
+        self._bounds:   Dict[int, Bounds]     = {}
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, entryId: int) -> bool:
+        return entryId in self._bounds
+
+    def insert(self, entryId: int, bounds: Bounds):
+        """
+        Add an entry or move an existing one
+
+        Args:
+            entryId:  The entry identifier
+            bounds:   The entry's extent
+        """
+        if entryId in self._bounds:
+            self.remove(entryId=entryId)
+
+        self._bounds[entryId] = bounds
+        for cell in self._cellsFor(bounds=bounds):
+            self._cells.setdefault(cell, EntryIds(set())).add(entryId)
+
+    def remove(self, entryId: int):
+        """
+        Remove an entry;  Unknown entries are ignored
+
+        Args:
+            entryId:  The entry identifier
+        """
+        bounds: Bounds | None = self._bounds.pop(entryId, None)
+        if bounds is None:
+            return
+
+        for cell in self._cellsFor(bounds=bounds):
+            entryIds: EntryIds | None = self._cells.get(cell)
+            if entryIds is not None:
+                entryIds.discard(entryId)
+                if len(entryIds) == 0:
+                    del self._cells[cell]
+
+    def clear(self):
+        self._cells  = {}
+        self._bounds = {}
+
+    def queryPoint(self, x: int, y: int) -> EntryIds:
+        """
+        Args:
+            x:  abscissa
+            y:  ordinate
+
+        Returns:  The entries whose bounds contain the point
+        """
+        entryIds: EntryIds | None = self._cells.get(self._cell(x=x, y=y))
+        if entryIds is None:
+            return EntryIds(set())
+
+        return EntryIds({entryId for entryId in entryIds if self._bounds[entryId].contains(x=x, y=y)})
+
+    def queryRectangle(self, bounds: Bounds) -> EntryIds:
+        """
+        Args:
+            bounds:  The query rectangle
+
+        Returns:  The entries whose bounds intersect the rectangle
+        """
+        found: EntryIds = EntryIds(set())
+        for cell in self._cellsFor(bounds=bounds):
+            entryIds: EntryIds | None = self._cells.get(cell)
+            if entryIds is not None:
+                found.update(entryIds)
+
+        return EntryIds({entryId for entryId in found if self._bounds[entryId].intersects(bounds)})
+
+    def _cell(self, x: int, y: int) -> Cell:
+        return Cell((int(x) // self._cellSize, int(y) // self._cellSize))
+
+    def _cellsFor(self, bounds: Bounds) -> List[Cell]:
+
+        minColumn, minRow = self._cell(x=bounds.minX, y=bounds.minY)
+        maxColumn, maxRow = self._cell(x=bounds.maxX, y=bounds.maxY)
+
+        return [Cell((column, row)) for column in range(minColumn, maxColumn + 1) for row in range(minRow, maxRow + 1)]
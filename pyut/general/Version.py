@@ -9,19 +9,11 @@ from platform import platform as osPlatform
 
 from sys import version as pythonVersion
 
-from wx import __version__ as wxVersion
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as packageVersion
 
 from codeallybasic.SingletonV3 import SingletonV3
 
-from pyutmodelv2 import __version__ as dataModelVersion
-
-from ogl import __version__ as oglVersion
-
-# noinspection PyPackageRequirements
-from untanglepyut import __version__ as untanglePyutVersion
-from oglio import __version__ as oglioVersion
-from pyutplugins import __version__ as pyutPluginsVersion
-
 from pyut import __version__
 
 PackageName    = NewType('PackageName', str)
@@ -29,6 +21,8 @@ PackageVersion = NewType('PackageVersion', str)
 
 PackageVersionsMap = NewType('PackageVersionsMap', Dict[PackageName, PackageVersion])
 
+UNKNOWN_VERSION: PackageVersion = PackageVersion('Unknown')
+
 
 class Version(metaclass=SingletonV3):
 
@@ -41,6 +35,8 @@ class Version(metaclass=SingletonV3):
 
         self.logger: Logger = getLogger(__name__)
 
+        self._packageVersions: PackageVersionsMap = PackageVersionsMap({})
+
     @property
     def platform(self) -> str:
         return osPlatform(terse=True)
@@ -67,24 +63,43 @@ class Version(metaclass=SingletonV3):
 
     @property
     def wxPythonVersion(self) -> str:
-        return wxVersion
+        return self._packageVersion(PackageName('wxPython'))
 
     @property
     def pyutModelVersion(self) -> str:
-        return dataModelVersion
+        return self._packageVersion(PackageName('pyutmodelv2'))
 
     @property
     def oglVersion(self) -> str:
-        return oglVersion
+        return self._packageVersion(PackageName('ogl'))
 
     @property
     def untanglePyutVersion(self) -> str:
-        return untanglePyutVersion
+        return self._packageVersion(PackageName('untanglepyut'))
 
     @property
     def oglioVersion(self) -> str:
-        return oglioVersion
+        return self._packageVersion(PackageName('oglio'))
 
     @property
     def pyutPluginsVersion(self) -> str:
-        return pyutPluginsVersion
+        return self._packageVersion(PackageName('pyutplugins'))
+
+    def _packageVersion(self, packageName: PackageName) -> PackageVersion:
+        """
+        Read the installed package metadata;  Importing the packages just to read their
+        version would load most of Pyut
+
+        Args:
+            packageName:  The distribution name
+
+        Returns:  The installed version or UNKNOWN_VERSION if the package is not installed
+        """
+        if packageName not in self._packageVersions:
+            try:
+                self._packageVersions[packageName] = PackageVersion(packageVersion(packageName))
+            except PackageNotFoundError:
+                self.logger.warning(f'{packageName} is not installed')
+                self._packageVersions[packageName] = UNKNOWN_VERSION
+
+        return self._packageVersions[packageName]
@@ -0,0 +1,262 @@
+
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from math import sqrt
+
+from os import cpu_count
+from os import makedirs
+
+from os.path import dirname
+from os.path import join as osPathJoin
+from os.path import relpath
+
+from pathlib import Path
+
+from re import sub as regExSub
+
+from time import perf_counter
+
+from concurrent.futures import ProcessPoolExecutor
+
+from xml.etree.ElementTree import ParseError
+
+from xml.sax import SAXParseException
+
+from zlib import error as ZlibError
+
+from oglio.Types import OglDocument
+from oglio.Types import OglProject
+
+from oglio.UnsupportedVersion import UnsupportedVersion
+
+from pyut.enums.ImageFormat import ImageFormat
+
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.SpatialGrid import Bounds
+
+from pyut.headless.ProjectValidator import ProjectValidator
+
+IMAGE_MARGIN:         int = 20
+MAXIMUM_IMAGE_PIXELS: int = 64_000_000      # Larger PNG renders are scaled down to fit
+
+UNSAFE_FILE_NAME_CHARACTERS: str = r'[^A-Za-z0-9_.-]'
+
+
+def createImageFilesFactory() -> List[str]:
+    return []
+
+
+@dataclass
+class RenderTask:
+    """
+    A single project to render;  Sent to a worker process
+    """
+    fileName:        str         = ''
+    outputDirectory: str         = ''
+    imageFormat:     ImageFormat = ImageFormat.PNG
+
+
+@dataclass
+class RenderResult:
+    """
+    The outcome of rendering every document in a single project
+    """
+    fileName:    str       = ''
+    imageFiles:  List[str] = field(default_factory=createImageFilesFactory)
+    message:     str       = ''
+    elapsedTime: float     = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return self.message == ''
+
+
+RenderResults = NewType('RenderResults', List[RenderResult])
+
+# One per worker process;  ogl needs a wx.App to build its shapes and the off-screen
+# diagram frames need a parent;  The parent is never shown
+_workerApp    = None
+_workerParent = None
+
+
+def _initializeWorker():
+    """
+    Process pool initializer;  Also lets `renderProject` run in a process that already has a wx.App
+    """
+    global _workerApp
+    global _workerParent
+
+    from wx import App
+    from wx import Frame
+    from wx import GetApp
+
+    if _workerParent is None:
+        if GetApp() is None:
+            _workerApp = App(redirect=False)
+        _workerParent = Frame(None)
+
+
+def renderProject(task: RenderTask) -> RenderResult:
+    """
+    Read a single project and write one image per document
+
+    Args:
+        task:  What to render and where
+
+    Returns:  The render result
+    """
+    _initializeWorker()
+
+    result:    RenderResult = RenderResult(fileName=task.fileName)
+    startTime: float        = perf_counter()
+    try:
+        oglProject: OglProject = ProjectReader().readFile(fqFileName=task.fileName)
+
+        makedirs(task.outputDirectory, exist_ok=True)
+        projectName: str = Path(task.fileName).stem
+        for oglDocument in oglProject.oglDocuments.values():
+            documentName: str = regExSub(UNSAFE_FILE_NAME_CHARACTERS, '_', oglDocument.documentTitle)
+            imageFile:    str = osPathJoin(task.outputDirectory, f'{projectName}-{documentName}.{task.imageFormat.value}')
+
+            DiagramRenderer.renderDocument(oglDocument=oglDocument, imageFile=imageFile, imageFormat=task.imageFormat)
+            result.imageFiles.append(imageFile)
+    except (ZlibError, ParseError, SAXParseException, UnsupportedVersion, FileNotFoundError, ValueError) as e:
+        result.message = f'{e}'
+
+    result.elapsedTime = perf_counter() - startTime
+
+    return result
+
+
+class DiagramRenderer:
+    """
+    Renders every diagram in a directory tree of projects to image files without creating any
+    Pyut UI.  Each document is laid out on an off-screen diagram frame and drawn on a memory DC
+    for PNG or an SVG file DC.  The images are bounded to the diagram content.
+
+    The projects are spread across a process pool the same way as the ProjectValidator
+
+    Use it:
+    ```python
+        renderer: DiagramRenderer = DiagramRenderer()
+        results:  RenderResults   = renderer.render(directory='/path/to/designs', outputDirectory='/path/to/images')
+
+        renderer.report(results=results)
+    ```
+    """
+    CHUNK_SIZE: int = 4
+
+    def __init__(self, maxWorkers: int = 0):
+        """
+
+        Args:
+            maxWorkers:  The number of worker processes;  0 means use the cpu count
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if maxWorkers == 0:
+            self._maxWorkers: int = cast(int, cpu_count())
+        else:
+            self._maxWorkers = maxWorkers
+
+    def render(self, directory: str, outputDirectory: str, imageFormat: ImageFormat = ImageFormat.PNG) -> RenderResults:
+        """
+        The images keep the directory layout of the projects
+
+        Args:
+            directory:          The top of the directory tree to search for projects
+            outputDirectory:    Where to write the images
+            imageFormat:        The image file format
+
+        Returns:  One result per project sorted by file name
+        """
+        fileNames: List[str] = sorted(ProjectValidator().findProjectFiles(directory=directory))
+        self.logger.info(f'Rendering {len(fileNames)} projects with {self._maxWorkers} workers')
+
+        results: RenderResults = RenderResults([])
+        if len(fileNames) == 0:
+            return results
+
+        tasks: List[RenderTask] = [
+            RenderTask(fileName=fileName, outputDirectory=osPathJoin(outputDirectory, relpath(dirname(fileName), directory)), imageFormat=imageFormat)
+            for fileName in fileNames
+        ]
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, initializer=_initializeWorker) as executor:
+            for result in executor.map(renderProject, tasks, chunksize=DiagramRenderer.CHUNK_SIZE):
+                results.append(result)
+
+        return results
+
+    def report(self, results: RenderResults, totalTime: float = 0.0):
+        """
+        Print a per project report followed by a summary
+
+        Args:
+            results:    The render results
+            totalTime:  Wall clock time for the entire run
+        """
+        for result in results:
+            status: str = 'Rendered' if result.valid is True else 'Failed'
+            print(f'{status:<10} {result.elapsedTime * 1000:>9.1f} ms  images: {len(result.imageFiles):>3}  {result.fileName}')
+            if result.valid is False:
+                print(f'{"":<10} {result.message}')
+
+        failedCount: int = len([result for result in results if result.valid is False])
+        imageCount:  int = sum([len(result.imageFiles) for result in results])
+        print('')
+        print(f'Projects: {len(results)}  Images: {imageCount}  Failed: {failedCount}  Elapsed: {totalTime:.2f} seconds')
+
+    @classmethod
+    def renderDocument(cls, oglDocument: OglDocument, imageFile: str, imageFormat: ImageFormat):
+        """
+        Use `renderProject`;  It makes sure that the wx.App and the parent window exist
+
+        Args:
+            oglDocument:    The document to render
+            imageFile:      The fully qualified image file name
+            imageFormat:    The image file format
+        """
+        from wx import Bitmap
+        from wx import BITMAP_TYPE_PNG
+        from wx import DC
+        from wx import MemoryDC
+        from wx import NullBitmap
+        from wx import SVGFileDC
+        from wx import WHITE_BRUSH
+
+        from pyut.headless.OffScreenDiagramFrame import OffScreenDiagramFrame
+
+        diagramFrame: OffScreenDiagramFrame = OffScreenDiagramFrame(parent=_workerParent)
+        try:
+            diagramFrame.layout(oglDocument=oglDocument)
+
+            bounds: Bounds = diagramFrame.contentBounds()
+            width:  int    = bounds.maxX - bounds.minX + 2 * IMAGE_MARGIN
+            height: int    = bounds.maxY - bounds.minY + 2 * IMAGE_MARGIN
+
+            if imageFormat == ImageFormat.SVG:
+                dc: DC = SVGFileDC(imageFile, width, height)
+                diagramFrame.drawContent(dc=dc, bounds=bounds, margin=IMAGE_MARGIN)
+                del dc                      # The SVG is written when the DC goes away
+            else:
+                scale:  float = min(1.0, sqrt(MAXIMUM_IMAGE_PIXELS / (width * height)))
+                bitmap: Bitmap = Bitmap(max(1, int(width * scale)), max(1, int(height * scale)))
+
+                memoryDC: MemoryDC = MemoryDC(bitmap)
+                memoryDC.SetBackground(WHITE_BRUSH)
+                memoryDC.Clear()
+                memoryDC.SetUserScale(scale, scale)         # Applied after the logical origin;  So the content stays at the top left
+                diagramFrame.drawContent(dc=memoryDC, bounds=bounds, margin=IMAGE_MARGIN)
+                memoryDC.SelectObject(NullBitmap)
+
+                bitmap.SaveFile(imageFile, BITMAP_TYPE_PNG)
+        finally:
+            diagramFrame.Destroy()
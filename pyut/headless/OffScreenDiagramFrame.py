@@ -0,0 +1,88 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+from wx import Window
+
+from miniogl.DiagramFrame import DiagramFrame
+from miniogl.Shape import Shapes
+
+from oglio.Types import OglDocument
+
+from pyut.general.SpatialGrid import Bounds
+
+from pyut.ui.umlframes.IndexedDiagram import IndexedDiagram
+
+
+class OffScreenDiagramFrame(DiagramFrame):
+    """
+    A diagram frame that is never shown.  It gives the shapes the diagram and the panel that
+    they expect so that a document can be laid out and drawn without the Pyut UI
+    """
+    def __init__(self, parent: Window):
+
+        super().__init__(parent)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagram: IndexedDiagram = IndexedDiagram(self)
+
+        self.Hide()
+
+    def layout(self, oglDocument: OglDocument):
+        """
+        Place the document shapes on this frame with the same code that Pyut uses to open a document
+
+        Args:
+            oglDocument:  The document to lay out
+        """
+        from pyut.ui.LayoutEngine import LayoutEngine
+        from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
+        LayoutEngine().layout(umlFrame=cast(UmlDiagramsFrame, self), oglDocument=oglDocument)
+
+    def addShapes(self, shapes: Shapes, withModelUpdate: bool = True):
+        """
+        The LayoutEngine batch entry point;  Nothing to refresh
+
+        Args:
+            shapes:           The shapes, their anchors, control points and labels
+            withModelUpdate:  If True, the shape models are updated from the shapes
+        """
+        self._diagram.addShapes(shapes=shapes, withModelUpdate=withModelUpdate)
+
+    def contentBounds(self) -> Bounds:
+        """
+        Returns:  The area the shapes draw in;  An empty rectangle at the origin if there are no shapes
+        """
+        bounds: Bounds | None = None
+        for shape in self._diagram.shapes:
+            shapeBounds: Bounds | None = self._diagram.shapeBounds(shape=shape)
+            if shapeBounds is None:
+                continue
+            if bounds is None:
+                bounds = shapeBounds
+            else:
+                bounds = Bounds(minX=min(bounds.minX, shapeBounds.minX), minY=min(bounds.minY, shapeBounds.minY),
+                                maxX=max(bounds.maxX, shapeBounds.maxX), maxY=max(bounds.maxY, shapeBounds.maxY))
+
+        return Bounds() if bounds is None else bounds
+
+    def drawContent(self, dc: DC, bounds: Bounds, margin: int):
+        """
+        Draw every shape the way DiagramFrame.Redraw does;  The top left of the bounds,
+        less the margin, is at the top left of the DC
+
+        Args:
+            dc:         The device context to draw on
+            bounds:     The content bounds
+            margin:     The space around the content
+        """
+        dc.SetLogicalOrigin(bounds.minX - margin, bounds.minY - margin)
+        dc.SetFont(self._defaultFont)
+
+        for shape in self._diagram.shapes:
+            shape.Draw(dc)
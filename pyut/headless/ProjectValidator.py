@@ -0,0 +1,233 @@
+
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from os import cpu_count
+from os import walk as osWalk
+
+from os.path import join as osPathJoin
+
+from time import perf_counter
+
+from concurrent.futures import ProcessPoolExecutor
+
+from xml.etree.ElementTree import ParseError
+
+from xml.sax import SAXParseException
+
+from oglio.Types import OglProject
+
+from pyut.PyutConstants import PyutConstants
+
+from pyut.general.ProjectReader import ProjectReader
+
+from pyut.ui.ProjectException import ProjectExceptionType
+
+VALIDATION_SUCCESS: str = 'Valid'
+"""
+Classification string for a project that loaded without error
+"""
+
+
+@dataclass
+class ValidationResult:
+    """
+    The outcome of loading a single project file
+    """
+    fileName:        str = ''
+    classification:  str = VALIDATION_SUCCESS
+    message:         str = ''
+    elapsedTime:     float = 0.0
+    documentCount:   int = 0
+    classCount:      int = 0
+    linkCount:       int = 0
+    noteCount:       int = 0
+    textCount:       int = 0
+    actorCount:      int = 0
+    useCaseCount:    int = 0
+    sdInstanceCount: int = 0
+    sdMessageCount:  int = 0
+
+    @property
+    def valid(self) -> bool:
+        return self.classification == VALIDATION_SUCCESS
+
+    @property
+    def objectCount(self) -> int:
+        return self.classCount + self.linkCount + self.noteCount + self.textCount + self.actorCount + self.useCaseCount + \
+            self.sdInstanceCount + self.sdMessageCount
+
+
+ValidationResults = NewType('ValidationResults', List[ValidationResult])
+
+# One per worker process;  ogl creates fonts when it builds shapes, so a wx.App
+# must exist;  We never create a frame
+_workerApp = None
+
+
+def _initializeWorker():
+    """
+    Process pool initializer
+    """
+    global _workerApp
+
+    from wx import App
+
+    if _workerApp is None:
+        _workerApp = App(redirect=False)
+
+
+def validateProject(fileName: str) -> ValidationResult:
+    """
+    Read a single project using the same ProjectReader as `ProjectManager._readFile`
+    and classify any failure the same way `ProjectManager.openProject` does
+
+    Args:
+        fileName:  Fully qualified file name
+
+    Returns:  The validation result
+    """
+    result:    ValidationResult = ValidationResult(fileName=fileName)
+    startTime: float            = perf_counter()
+    try:
+        oglProject: OglProject = ProjectReader().readFile(fqFileName=fileName)
+        ProjectValidator.countObjects(oglProject=oglProject, result=result)
+    except (SAXParseException, ParseError) as spe:
+        result.classification = ProjectExceptionType.INVALID_PROJECT.value
+        result.message        = f'{spe}'
+    except FileNotFoundError as fnf:
+        result.classification = ProjectExceptionType.PROJECT_NOT_FOUND.value
+        result.message        = f'{fnf}'
+    except AttributeError as ae:
+        result.classification = ProjectExceptionType.ATTRIBUTE_ERROR.value
+        result.message        = f'{ae}'
+    except TypeError as te:
+        result.classification = ProjectExceptionType.TYPE_ERROR.value
+        result.message        = f'{te}'
+    except AssertionError as assertionError:
+        result.classification = ProjectExceptionType.ASSERTION_ERROR.value
+        result.message        = f'{assertionError}'
+    except (ValueError, Exception) as e:
+        result.classification = ProjectExceptionType.GENERAL_ERROR.value
+        result.message        = f'{e}'
+
+    result.elapsedTime = perf_counter() - startTime
+
+    return result
+
+
+class ProjectValidator:
+    """
+    Loads every project in a directory tree without creating any Pyut UI.  The files are
+    spread across a process pool;  Each worker only creates a wx.App so that ogl can build
+    its shapes
+
+    Use it:
+    ```python
+        validator: ProjectValidator  = ProjectValidator()
+        results:   ValidationResults = validator.validate(directory='/path/to/designs')
+
+        validator.report(results=results)
+    ```
+    """
+    CHUNK_SIZE: int = 8
+
+    def __init__(self, maxWorkers: int = 0):
+        """
+
+        Args:
+            maxWorkers:  The number of worker processes;  0 means use the cpu count
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if maxWorkers == 0:
+            self._maxWorkers: int = cast(int, cpu_count())
+        else:
+            self._maxWorkers = maxWorkers
+
+    def validate(self, directory: str) -> ValidationResults:
+        """
+        Args:
+            directory:  The top of the directory tree to search for projects
+
+        Returns:  One result per file sorted by file name
+        """
+        fileNames: List[str] = sorted(self.findProjectFiles(directory=directory))
+        self.logger.info(f'Validating {len(fileNames)} projects with {self._maxWorkers} workers')
+
+        results: ValidationResults = ValidationResults([])
+        if len(fileNames) == 0:
+            return results
+
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, initializer=_initializeWorker) as executor:
+            for result in executor.map(validateProject, fileNames, chunksize=ProjectValidator.CHUNK_SIZE):
+                results.append(result)
+
+        return results
+
+    def findProjectFiles(self, directory: str) -> Iterator[str]:
+        """
+        Args:
+            directory:  The top of the directory tree
+
+        Returns:  The fully qualified names of the Pyut project files in the tree
+        """
+        for dirPath, dirNames, fileNames in osWalk(directory):
+            for fileName in fileNames:
+                if fileName.endswith(PyutConstants.PYUT_EXTENSION) or fileName.endswith(PyutConstants.XML_EXTENSION):
+                    yield osPathJoin(dirPath, fileName)
+
+    def report(self, results: ValidationResults, totalTime: float = 0.0):
+        """
+        Print a per file report followed by a summary
+
+        Args:
+            results:    The validation results
+            totalTime:  Wall clock time for the entire run
+        """
+        for result in results:
+            print(f'{result.classification:<18} {result.elapsedTime * 1000:>9.1f} ms  '
+                  f'documents: {result.documentCount:>3} '
+                  f'classes: {result.classCount:>5} '
+                  f'links: {result.linkCount:>5} '
+                  f'notes: {result.noteCount:>4} '
+                  f'texts: {result.textCount:>4} '
+                  f'actors: {result.actorCount:>4} '
+                  f'useCases: {result.useCaseCount:>4} '
+                  f'sdInstances: {result.sdInstanceCount:>4} '
+                  f'sdMessages: {result.sdMessageCount:>4}  '
+                  f'{result.fileName}'
+                  )
+            if result.valid is False:
+                print(f'{"":<18} {result.message}')
+
+        invalidCount: int = len([result for result in results if result.valid is False])
+        print('')
+        print(f'Projects: {len(results)}  Valid: {len(results) - invalidCount}  Invalid: {invalidCount}  Elapsed: {totalTime:.2f} seconds')
+
+    @classmethod
+    def countObjects(cls, oglProject: OglProject, result: ValidationResult):
+        """
+        Update the result with the object counts from all the project documents
+
+        Args:
+            oglProject: The project that was read
+            result:     The result to update
+        """
+        result.documentCount = len(oglProject.oglDocuments)
+        for oglDocument in oglProject.oglDocuments.values():
+            result.classCount      += len(oglDocument.oglClasses)
+            result.linkCount       += len(oglDocument.oglLinks)
+            result.noteCount       += len(oglDocument.oglNotes)
+            result.textCount       += len(oglDocument.oglTexts)
+            result.actorCount      += len(oglDocument.oglActors)
+            result.useCaseCount    += len(oglDocument.oglUseCases)
+            result.sdInstanceCount += len(oglDocument.oglSDInstances)
+            result.sdMessageCount  += len(oglDocument.oglSDMessages)
@@ -44,6 +44,7 @@ DEFAULT_TRACKED_LOGGERS: List[str] = [
 SECTION_GENERAL: ValueDescriptions = ValueDescriptions(
     {
         KeyName('virtualWindowWidth'):      ValueDescription(defaultValue='16000',  deserializer=SecureConversions.secureInteger),
+        KeyName('canvasMargin'):            ValueDescription(defaultValue='1000',   deserializer=SecureConversions.secureInteger),     # scrollable space beyond the content
         KeyName('showTipsOnStartup'):       ValueDescription(defaultValue='False',  deserializer=SecureConversions.secureBoolean),
         KeyName('loadLastOpenedProject'):   ValueDescription(defaultValue='False',  deserializer=SecureConversions.secureBoolean),
         KeyName('displayProjectExtension'): ValueDescription(defaultValue='False',  deserializer=SecureConversions.secureBoolean),
@@ -55,22 +56,40 @@ SECTION_GENERAL: ValueDescriptions = ValueDescriptions(
         KeyName('startupSize'):             ValueDescription(defaultValue=DEFAULT_STARTUP_SIZE,     deserializer=Dimensions.deSerialize),
         KeyName('startupPosition'):         ValueDescription(defaultValue=DEFAULT_STARTUP_POSITION, deserializer=Position.deSerialize),
         KeyName('toolBarIconSize'):         ValueDescription(defaultValue=DEFAULT_TB_ICON_SIZE,         deserializer=ToolBarIconSize.deSerialize, enumUseValue=True),
+        KeyName('saveGenerations'):         ValueDescription(defaultValue='0',      deserializer=SecureConversions.secureInteger),
+        KeyName('autoSave'):                ValueDescription(defaultValue='True',   deserializer=SecureConversions.secureBoolean),
+        KeyName('autoSaveDelay'):           ValueDescription(defaultValue='30',     deserializer=SecureConversions.secureInteger),     # seconds
         KeyName('fileHistoryDisplay'):      ValueDescription(defaultValue=DEFAULT_FILE_HISTORY_DISPLAY, deserializer=FileHistoryPreference,       enumUseValue=True),
+        KeyName('undoHistoryMaxEntries'):   ValueDescription(defaultValue='200',      deserializer=SecureConversions.secureInteger),
+        KeyName('undoHistoryMaxBytes'):     ValueDescription(defaultValue='16000000', deserializer=SecureConversions.secureInteger),   # estimated
+        KeyName('printPagesAcross'):        ValueDescription(defaultValue='1',        deserializer=SecureConversions.secureInteger),
+        KeyName('printPagesDown'):          ValueDescription(defaultValue='1',        deserializer=SecureConversions.secureInteger),
     }
 )
 
 SECTION_FEATURES: ValueDescriptions = ValueDescriptions(
     {
-        KeyName('displayLoggingControl'): ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
-        KeyName('trackedLoggers'):        ValueDescription(defaultValue=DEFAULT_TRACKED_LOGGERS, isStringList=True),
+        KeyName('displayLoggingControl'):    ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
+        KeyName('trackedLoggers'):           ValueDescription(defaultValue=DEFAULT_TRACKED_LOGGERS, isStringList=True),
+        KeyName('renderCache'):              ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('fastStartup'):              ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),   # No splash;  Plugins load on first menu open
+        KeyName('levelOfDetailTitlesZoom'):  ValueDescription(defaultValue='0.6', deserializer=SecureConversions.secureFloat),   # Below this zoom classes are titled boxes
+        KeyName('levelOfDetailBoxesZoom'):   ValueDescription(defaultValue='0.3', deserializer=SecureConversions.secureFloat),   # Below this zoom classes are plain boxes
     }
 )
 
 SECTION_DEBUG: ValueDescriptions = ValueDescriptions(
     {
-        KeyName('debugErrorViews'):  ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
-        KeyName('debugEventEngine'): ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
-        KeyName('errorViewType'):    ValueDescription(defaultValue=DEFAULT_ERROR_VIEW_TYPE, deserializer=ErrorViewType, enumUseValue=True),
+        KeyName('debugErrorViews'):        ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('debugEventEngine'):       ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('eventMetrics'):           ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('eventMetricsSampleRate'): ValueDescription(defaultValue='1',                     deserializer=SecureConversions.secureInteger),
+        KeyName('dumpEventMetricsOnExit'): ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('profilingControl'):       ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),   # Help menu profiling actions
+        KeyName('profileCpu'):             ValueDescription(defaultValue='True',                  deserializer=SecureConversions.secureBoolean),
+        KeyName('profileMemory'):          ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('profileOnStartup'):       ValueDescription(defaultValue='False',                 deserializer=SecureConversions.secureBoolean),
+        KeyName('errorViewType'):          ValueDescription(defaultValue=DEFAULT_ERROR_VIEW_TYPE, deserializer=ErrorViewType, enumUseValue=True),
     }
 )
 
@@ -0,0 +1,200 @@
+
+from typing import Dict
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from concurrent.futures import ThreadPoolExecutor
+
+from zlib import compress
+
+from wx import CallAfter
+from wx import CallLater
+
+from pyut.PyutConstants import PyutConstants
+
+from pyut.general.AtomicFileWriter import AtomicFileWriter
+from pyut.general.RecoveryJournal import RecoveryJournal
+
+from pyut.preferences.PyutPreferences import PyutPreferences
+
+from pyut.ui.IPyutDocument import PyutDocuments
+from pyut.ui.IPyutProject import IPyutProject
+from pyut.ui.ProjectWriter import ProjectWriter
+from pyut.ui.PyutDocument import PyutDocument
+
+MILLISECONDS_PER_SECOND: int = 1000
+
+
+@dataclass
+class PendingSnapshot:
+    """
+    A snapshot whose documents are still being serialized
+    """
+    pyutProject:     IPyutProject  = cast(IPyutProject, None)
+    projectFileName: str           = ''
+    codePath:        str           = ''
+    documents:       PyutDocuments = field(default_factory=lambda: PyutDocuments([]))
+    fragments:       List[str]     = field(default_factory=list)
+
+
+class AutoSaver:
+    """
+    Writes a recovery snapshot next to modified projects.  Each modification restarts a
+    debounce timer so that a burst of edits produces a single snapshot.
+
+    Walking the shapes must happen on the UI thread;  So the documents are serialized one per
+    event loop turn, and the end-user keeps working in between.  The project writer only
+    serializes the documents that changed since the last snapshot or save;  The others come
+    from its cache.  Splicing, compressing and writing the snapshot happen on a single
+    background thread
+    """
+    def __init__(self, projectWriter: ProjectWriter):
+        """
+
+        Args:
+            projectWriter:  The writer the project manager uses;  Shared so both use the same document cache
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectWriter:   ProjectWriter   = projectWriter
+        self._preferences:     PyutPreferences = PyutPreferences()
+        self._recoveryJournal: RecoveryJournal = RecoveryJournal()
+
+        self._modifiedProjects: Dict[IPyutProject, str] = {}
+        """
+        The modified projects and the file name they had when they were modified
+        """
+        self._snapshots: Dict[IPyutProject, str] = {}
+        """
+        The projects that have a snapshot and the project file name the snapshot is for
+        """
+        self._pending: List[PendingSnapshot] = []
+        """
+        Serialized one document at a time by `._serializeStep()`
+        """
+        self._timer:    CallLater | None   = None
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='AutoSave')
+        self._stopped:  bool               = False
+        """
+        Once stopped the executor no longer accepts work;  Everything becomes a no-op
+        """
+
+    def projectModified(self, pyutProject: IPyutProject):
+        """
+        Schedule a snapshot
+
+        Args:
+            pyutProject:  The project that changed
+        """
+        if self._stopped is True or self._preferences.autoSave is False or pyutProject is None:
+            return
+        if pyutProject.filename is None or PyutConstants.DEFAULT_PROJECT_NAME in pyutProject.filename:
+            return          # Nowhere to put it
+
+        self._modifiedProjects[pyutProject] = pyutProject.filename
+
+        delay: int = self._preferences.autoSaveDelay * MILLISECONDS_PER_SECOND
+        if self._timer is None:
+            self._timer = CallLater(delay, self._onTimer)
+        else:
+            self._timer.Start(delay)
+
+    def discard(self, pyutProject: IPyutProject):
+        """
+        The project was saved or closed on purpose;  The snapshot is no longer needed
+
+        Args:
+            pyutProject:  The project
+        """
+        self._modifiedProjects.pop(pyutProject, None)
+        self._pending = [pending for pending in self._pending if pending.pyutProject is not pyutProject]
+
+        projectFileName: str | None = self._snapshots.pop(pyutProject, None)
+        if projectFileName is not None and self._stopped is False:
+            self._executor.submit(self._recoveryJournal.discard, projectFileName)
+
+    def projectSaved(self, pyutProject: IPyutProject):
+        """
+        The project was saved;  Also discards a snapshot left by an earlier session, one the
+        end-user declined to restore, since the saved project supersedes it
+
+        Args:
+            pyutProject:  The project
+        """
+        self._snapshots.setdefault(pyutProject, pyutProject.filename)
+        self.discard(pyutProject=pyutProject)
+
+    def stop(self):
+        """
+        Stop the timer and wait for any snapshot in progress;  Later calls do nothing
+        """
+        self._stopped = True
+        self._pending = []
+        if self._timer is not None:
+            self._timer.Stop()
+        self._executor.shutdown(wait=True)
+
+    def _onTimer(self):
+
+        if self._stopped is True:
+            return
+
+        modifiedProjects: Dict[IPyutProject, str] = self._modifiedProjects
+        self._modifiedProjects = {}
+
+        serializing: bool = len(self._pending) > 0
+        for pyutProject, projectFileName in modifiedProjects.items():
+            if pyutProject.filename != projectFileName:
+                continue            # Saved under a different name since it was modified
+            # Start over;  The documents already serialized come from the writer cache
+            self._pending = [pending for pending in self._pending if pending.pyutProject is not pyutProject]
+            self._pending.append(PendingSnapshot(pyutProject=pyutProject,
+                                                 projectFileName=projectFileName,
+                                                 codePath=pyutProject.codePath,
+                                                 documents=PyutDocuments(list(pyutProject.documents))))
+
+        if serializing is False and len(self._pending) > 0:
+            CallAfter(self._serializeStep)
+
+    def _serializeStep(self):
+        """
+        Serializes a single document;  Once a project is complete its snapshot is handed to
+        the background thread
+        """
+        if self._stopped is True or len(self._pending) == 0:
+            return          # Stopped or discarded in the meantime
+
+        pending: PendingSnapshot = self._pending[0]
+        if len(pending.fragments) < len(pending.documents):
+            pyutDocument: PyutDocument = cast(PyutDocument, pending.documents[len(pending.fragments)])
+            try:
+                pending.fragments.append(self._projectWriter.documentFragment(pyutDocument=pyutDocument))
+            except (ValueError, Exception) as e:
+                self.logger.error(f'Unable to snapshot {pending.projectFileName}: {e}')
+                self._pending.pop(0)
+        else:
+            self._pending.pop(0)
+            self._snapshots[pending.pyutProject] = pending.projectFileName
+            self._executor.submit(self._writeSnapshot, pending.projectFileName, pending.codePath, pending.fragments)
+
+        if len(self._pending) > 0:
+            CallAfter(self._serializeStep)
+
+    def _writeSnapshot(self, projectFileName: str, codePath: str, fragments: List[str]):
+        """
+        Runs on the background thread
+        """
+        snapshotFileName: str = RecoveryJournal.snapshotName(projectFileName=projectFileName)
+        try:
+            rawXml: str = self._projectWriter.spliceFragments(codePath=codePath, fragments=fragments)
+            AtomicFileWriter().write(fqFileName=snapshotFileName, data=compress(rawXml.encode()))
+            self._recoveryJournal.add(projectFileName=projectFileName)
+            self.logger.info(f'Recovery snapshot written: {snapshotFileName}')
+        except (ValueError, Exception) as e:
+            self.logger.error(f'Unable to write {snapshotFileName}: {e}')
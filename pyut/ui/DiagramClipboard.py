@@ -0,0 +1,213 @@
+
+from typing import Dict
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from zlib import compress
+from zlib import decompress
+
+from xml.etree.ElementTree import ParseError
+
+from xml.sax import SAXParseException
+
+from wx import CustomDataObject
+from wx import DataFormat
+from wx import TheClipboard
+
+from pyutmodelv2.PyutObject import PyutObject
+
+from ogl.OglActor import OglActor
+from ogl.OglClass import OglClass
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+from ogl.OglText import OglText
+from ogl.OglUseCase import OglUseCase
+
+from ogl.sd.OglSDInstance import OglSDInstance
+from ogl.sd.OglSDMessage import OglSDMessage
+
+from oglio.Types import OglDocument
+from oglio.Types import OglDocumentTitle
+
+from oglio.UnsupportedVersion import UnsupportedVersion
+
+from oglio.toXmlV11.OglToXml import OglToXml
+
+from pyutplugins.ExternalTypes import OglObjects
+
+from pyut.enums.DiagramType import DiagramType
+
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import ProjectXml
+
+from pyut.ui.ProjectWriter import XML_ENCODING
+
+from pyut.ui.umlframes.UmlFrame import UmlObjects
+
+CLIPBOARD_FORMAT:   str = 'application/x-pyut-diagram-v11'
+CLIPBOARD_TITLE:    str = 'Clipboard'
+COMPRESSION_LEVEL:  int = 6
+
+
+class DiagramClipboard:
+    """
+    Copies UML objects to the system clipboard so that they can be pasted into another
+    frame or another Pyut instance.  The objects are serialized with the project file
+    format and compressed;  Links are copied when both of their ends are copied.
+
+    Deserializing gives every object a new model id;  So pasted objects never share an id
+    with the objects they were copied from
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def serialize(self, umlObjects: UmlObjects, diagramType: DiagramType) -> bytes:
+        """
+        Args:
+            umlObjects:   The objects to copy
+            diagramType:  The type of the diagram they come from
+
+        Returns:  The compressed clipboard payload;  Empty if none of the objects can be copied
+        """
+        oglDocument: OglDocument = self._toOglDocument(umlObjects=umlObjects, diagramType=diagramType)
+        if self.objectCount(oglDocument=oglDocument) == 0:
+            return b''
+
+        oglToXml: OglToXml = OglToXml(projectCodePath='')
+        oglToXml.prettyPrint = False
+        oglToXml.serialize(oglDocument=oglDocument)
+
+        return compress(oglToXml.xml.encode(XML_ENCODING), COMPRESSION_LEVEL)
+
+    def deserialize(self, payload: bytes) -> OglDocument:
+        """
+        Args:
+            payload:  A payload created by .serialize
+
+        Returns:  New Ogl objects with new model ids
+
+        Raises:
+            ValueError:  The payload is not a Pyut diagram;  Another application may have put it there
+        """
+        rawXml: str = decompress(payload).decode(XML_ENCODING)
+
+        projectReader: ProjectReader = ProjectReader()
+        try:
+            projectXml: ProjectXml = projectReader.fromXml(xmlString=rawXml, fqFileName=CLIPBOARD_TITLE)
+            if len(projectXml.documents) == 0:
+                raise ValueError('The clipboard payload has no document')
+
+            oglDocument: OglDocument = projectReader.toOglDocument(untangledDocument=projectXml.documents[0])
+        except (ParseError, SAXParseException, UnsupportedVersion, AttributeError, IndexError, KeyError, TypeError) as e:
+            raise ValueError(f'Bad clipboard payload: {e}') from e
+
+        self._remapIds(oglDocument=oglDocument)
+
+        return oglDocument
+
+    def copy(self, payload: bytes) -> bool:
+        """
+        Put the payload on the system clipboard;  It stays there after Pyut exits
+
+        Args:
+            payload:  A payload created by .serialize
+
+        Returns:  `True` if the clipboard accepted it
+        """
+        dataObject: CustomDataObject = CustomDataObject(DataFormat(CLIPBOARD_FORMAT))
+        dataObject.SetData(payload)
+
+        if TheClipboard.Open() is False:
+            self.logger.error('Unable to open the clipboard')
+            return False
+        try:
+            success: bool = TheClipboard.SetData(dataObject)
+            TheClipboard.Flush()
+        finally:
+            TheClipboard.Close()
+
+        return success
+
+    def paste(self) -> bytes:
+        """
+        Returns:  The payload on the system clipboard;  Empty if the clipboard has no Pyut objects
+        """
+        dataObject: CustomDataObject = CustomDataObject(DataFormat(CLIPBOARD_FORMAT))
+        payload:    bytes            = b''
+
+        if TheClipboard.Open() is False:
+            self.logger.error('Unable to open the clipboard')
+            return payload
+        try:
+            if TheClipboard.IsSupported(dataObject.GetFormat()) is True and TheClipboard.GetData(dataObject) is True:
+                payload = bytes(dataObject.GetData())
+        finally:
+            TheClipboard.Close()
+
+        return payload
+
+    def objectCount(self, oglDocument: OglDocument) -> int:
+        """
+        Args:
+            oglDocument:  A clipboard document
+
+        Returns:  The number of objects in it
+        """
+        return len(oglDocument.oglClasses) + len(oglDocument.oglLinks) + len(oglDocument.oglNotes) + \
+            len(oglDocument.oglTexts) + len(oglDocument.oglActors) + len(oglDocument.oglUseCases)
+
+    def _toOglDocument(self, umlObjects: UmlObjects, diagramType: DiagramType) -> OglDocument:
+
+        oglDocument: OglDocument = OglDocument()
+        oglDocument.documentType  = diagramType.__str__()
+        oglDocument.documentTitle = OglDocumentTitle(CLIPBOARD_TITLE)
+
+        copied: Dict[int, object] = {id(umlObject): umlObject for umlObject in umlObjects}
+        for umlObject in umlObjects:
+            match umlObject:
+                case OglClass() as umlObject:
+                    oglDocument.oglClasses.append(umlObject)
+                case OglSDInstance() | OglSDMessage():              # Put here so messages do not fall into OglLink
+                    self.logger.warning(f'Copying sequence diagram objects is not supported: {umlObject}')
+                case OglLink() as umlObject:
+                    oglLink: OglLink = cast(OglLink, umlObject)
+                    if id(oglLink.sourceShape) in copied and id(oglLink.destinationShape) in copied:
+                        oglDocument.oglLinks.append(oglLink)
+                case OglInterface2() as umlObject:
+                    oglInterface2: OglInterface2 = cast(OglInterface2, umlObject)
+                    if id(oglInterface2.destinationAnchor.parent) in copied:
+                        oglDocument.oglLinks.append(cast(OglLink, oglInterface2))
+                case OglNote() as umlObject:
+                    oglDocument.oglNotes.append(umlObject)
+                case OglText() as umlObject:
+                    oglDocument.oglTexts.append(umlObject)
+                case OglUseCase() as umlObject:
+                    oglDocument.oglUseCases.append(umlObject)
+                case OglActor() as umlObject:
+                    oglDocument.oglActors.append(umlObject)
+                case _:
+                    self.logger.warning(f'Copying {umlObject} is not supported')
+
+        return oglDocument
+
+    def _remapIds(self, oglDocument: OglDocument):
+        """
+        The links refer to their ends by reference;  So only the ids change
+
+        Args:
+            oglDocument: The deserialized document
+        """
+        oglObjects: OglObjects = OglObjects([])
+
+        oglObjects.extend(oglDocument.oglClasses)
+        oglObjects.extend(oglDocument.oglLinks)
+        oglObjects.extend(oglDocument.oglNotes)
+        oglObjects.extend(oglDocument.oglTexts)
+        oglObjects.extend(oglDocument.oglActors)
+        oglObjects.extend(oglDocument.oglUseCases)
+
+        for oglObject in oglObjects:
+            oglObject.pyutObject.id = next(PyutObject.idGenerator)
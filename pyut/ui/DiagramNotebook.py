@@ -1,15 +1,10 @@
 
-from typing import List
-from typing import NewType
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from copy import copy
-
 from miniogl.Shape import Shapes
-from pyutmodelv2.PyutLink import PyutLinks
 from wx import CLIP_CHILDREN
 from wx import EVT_CLOSE
 from wx import ICON_ERROR
@@ -23,11 +18,7 @@ from wx import MessageDialog
 from wx import Notebook
 from wx import Window
 
-from pyutmodelv2.PyutActor import PyutActor
-from pyutmodelv2.PyutClass import PyutClass
-from pyutmodelv2.PyutNote import PyutNote
 from pyutmodelv2.PyutObject import PyutObject
-from pyutmodelv2.PyutUseCase import PyutUseCase
 from pyutmodelv2.PyutInterface import PyutInterface
 from pyutmodelv2.PyutInterface import PyutInterfaces
 
@@ -41,7 +32,13 @@ from ogl.OglObject import OglObject
 from ogl.OglLink import OglLink
 from ogl.OglText import OglText
 
+from pyut.enums.DiagramType import DiagramType
+
+from pyut.ui.DiagramClipboard import DiagramClipboard
+
 from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+from pyut.ui.umlframes.UmlSequenceDiagramsFrame import UmlSequenceDiagramsFrame
+from pyut.ui.umlframes.UmlUseCaseDiagramsFrame import UmlUseCaseDiagramsFrame
 
 from pyut.ui.umlframes.UmlFrame import UmlObject
 from pyut.ui.umlframes.UmlFrame import UmlObjects
@@ -52,6 +49,8 @@ from pyut.ui.wxcommands.CommandDeleteOglLink import CommandDeleteOglLink
 from pyut.ui.wxcommands.CommandDeleteOglNote import CommandDeleteOglNote
 from pyut.ui.wxcommands.CommandDeleteOglText import CommandDeleteOglText
 from pyut.ui.wxcommands.CommandDeleteOglUseCase import CommandDeleteOglUseCase
+from pyut.ui.wxcommands.CommandPasteOglObjects import CommandPasteOglObjects
+from pyut.ui.wxcommands.CommandTransaction import CommandTransaction
 
 from pyut.ui.wxcommands.Types import DoableObjectType
 
@@ -80,7 +79,7 @@ from pyut.ui.eventengine.Events import GetLollipopInterfacesEvent
 
 from pyut.ui.eventengine.EventEngine import GetLollipopInterfacesCallback
 
-PyutObjects = NewType('PyutObjects', List[PyutObject])
+PASTE_OFFSET: int = 20        # Each paste of the same objects moves them this much further
 
 
 class DiagramNotebook(Notebook):
@@ -97,8 +96,10 @@ class DiagramNotebook(Notebook):
 
         self._eventEngine:      IEventEngine     = eventEngine
 
-        self.logger:     Logger      = getLogger(__name__)
-        self._clipboard: PyutObjects = PyutObjects([])            # will be re-created at every copy
+        self.logger:            Logger           = getLogger(__name__)
+        self._diagramClipboard: DiagramClipboard = DiagramClipboard()
+        self._lastPastePayload: bytes            = b''
+        self._pasteCount:       int              = 0
 
         self._eventEngine.registerListener(pyEventBinder=EVENT_SELECT_ALL_SHAPES,   callback=self._onSelectAllShapes)
         self._eventEngine.registerListener(pyEventBinder=EVENT_DESELECT_ALL_SHAPES, callback=self._onDeSelectAllShapes)
@@ -179,71 +180,53 @@ class DiagramNotebook(Notebook):
     # noinspection PyUnusedLocal
     def _onCopy(self, event: CopyShapesEvent):
         """
-        Copy the selected UML Objects into an internal clipboard
-
-        TODO : adapt for OglLinks
+        Copy the selected UML Objects to the system clipboard;  Links are copied when
+        both of their ends are selected
 
         Args:
             event:
         """
         selectedUmlObjects: UmlObjects = self.selectedUmlObjects
         if len(selectedUmlObjects) > 0:
-            self._clipboard = PyutObjects([])
-            # put a copy of the PyutObjects in the clipboard
-            for umlObject in selectedUmlObjects:
-                if isinstance(umlObject, OglClass):
-                    umlObjectCopy = copy(umlObject.pyutObject)
-                    umlObjectCopy.links = PyutLinks([])              # we don't want to copy the links
-                    self._clipboard.append(umlObjectCopy)
-
-            self._updateApplicationStatus(f'Copied {len(self._clipboard)} objects')
+            payload: bytes = self._diagramClipboard.serialize(umlObjects=selectedUmlObjects, diagramType=self._currentDiagramType())
+            if len(payload) == 0:
+                self._updateApplicationStatus('Nothing to copy')
+            elif self._diagramClipboard.copy(payload=payload) is True:
+                self._pasteCount = 0
+                self._updateApplicationStatus(f'Copied {len(selectedUmlObjects)} objects')
+            else:
+                self._displayError('Unable to copy to the clipboard')
 
     # noinspection PyUnusedLocal
     def _onPaste(self, event: PasteShapesEvent):
         """
-        Paste any objects in the internal clipboard to the current frame
+        Paste the objects on the system clipboard to the current frame.  Each paste of the
+        same objects is moved a little further from where they were copied
+
         Args:
             event:
         """
-
-        if len(self._clipboard) == 0:
+        payload: bytes = self._diagramClipboard.paste()
+        if len(payload) == 0:
             return
 
-        self.logger.info(f'Pasting {len(self._clipboard)} objects')
         if self.currentNotebookFrame is None:
             self._displayError("No frame to paste into")
             return
 
-        # put the objects in the clipboard and remove them from the diagram
-        x: int = 100
-        y: int = 100
-        numbObjectsPasted: int = 0
-        for clipboardObject in self._clipboard:
-            pyutObject: PyutObject = copy(clipboardObject)
-            oglObject:  OglObject  = cast(OglObject, None)
-            match pyutObject:
-                case PyutClass() as pyutObject:
-                    oglObject = OglClass(cast(PyutClass, pyutObject))
-                case PyutNote() as pyutObject:
-                    oglObject = OglNote(pyutObject)
-                case PyutActor() as pyutObject:
-                    oglObject = OglActor(pyutObject)
-                case PyutUseCase() as pyutObject:
-                    oglObject = OglUseCase(pyutObject)
-                case _:
-                    self.logger.warning(f'Pasting object: {pyutObject} not supported')
-
-            if oglObject is not None:
-                self.logger.info(f'Pasting: {oglObject=}')
-                self.currentNotebookFrame.addShape(oglObject, x, y)
-                numbObjectsPasted += 1
-                x += 20
-                y += 20
-
-        self.currentNotebookFrame.Refresh()
-
-        self._eventEngine.sendEvent(EventType.UMLDiagramModified)   # will also cause title to be updated
-        self._updateApplicationStatus(f'Pasted {numbObjectsPasted} objects')
+        if payload != self._lastPastePayload:
+            self._lastPastePayload = payload
+            self._pasteCount       = 0
+        self._pasteCount += 1
+
+        umlFrame: UmlDiagramsFrame       = self.currentNotebookFrame
+        command:  CommandPasteOglObjects = CommandPasteOglObjects(payload=payload, offset=self._pasteCount * PASTE_OFFSET, eventEngine=self._eventEngine)
+
+        if umlFrame.commandProcessor.Submit(command=command, storeIt=True) is True:
+            self._eventEngine.sendEvent(EventType.UMLDiagramModified)   # will also cause title to be updated
+            self._updateApplicationStatus(f'Pasted {command.objectCount} objects')
+        else:
+            self._displayError('Unable to paste the clipboard contents')
 
     def _onCutShape(self, event: CutShapeEvent):
 
@@ -289,7 +272,7 @@ class DiagramNotebook(Notebook):
 
     def _onGetLollipopInterfaces(self, event: GetLollipopInterfacesEvent):
         """
-        Invokes the provided eventHandler with any pyutInterfaces on the diagram.
+        Invokes the provided callback with any pyutInterfaces on the diagram.
         It may return an empty list.
 
         Args:
@@ -308,10 +291,20 @@ class DiagramNotebook(Notebook):
                     if pyutInterface not in pyutInterfaces:
                         pyutInterfaces.append(pyutObject)
 
-        callback: GetLollipopInterfacesCallback = event.eventHandler
+        callback: GetLollipopInterfacesCallback = event.callback
 
         callback(pyutInterfaces)
 
+    def _currentDiagramType(self) -> DiagramType:
+
+        umlFrame: UmlDiagramsFrame = self.currentNotebookFrame
+        if isinstance(umlFrame, UmlUseCaseDiagramsFrame) is True:
+            return DiagramType.USECASE_DIAGRAM
+        elif isinstance(umlFrame, UmlSequenceDiagramsFrame) is True:
+            return DiagramType.SEQUENCE_DIAGRAM
+        else:
+            return DiagramType.CLASS_DIAGRAM
+
     def _updateApplicationStatus(self, statusMessage: str):
 
         self._eventEngine.sendEvent(eventType=EventType.UpdateApplicationStatus, applicationStatusMsg=statusMessage)
@@ -345,16 +338,20 @@ class DiagramNotebook(Notebook):
             objectsToCut:
         """
         if len(objectsToCut) > 0:
-            umlFrame: UmlDiagramsFrame = self.currentNotebookFrame
+            umlFrame:    UmlDiagramsFrame   = self.currentNotebookFrame
+            transaction: CommandTransaction = CommandTransaction(name=f'Cut {len(objectsToCut)} objects')
 
             for shape in objectsToCut:
                 cmd: Command = self._createDeleteCommand(cast(DoableObjectType, shape))
                 if cmd is None:
+                    umlFrame.damageTracker.damageShape(shape)
                     shape.Detach()
-                    umlFrame.Refresh()
                 else:
-                    submitStatus: bool = umlFrame.commandProcessor.Submit(command=cmd, storeIt=True)
-                    self.logger.debug(f'{submitStatus=}')
+                    transaction.addCommand(cmd)
+
+            if len(transaction) > 0:
+                submitStatus: bool = umlFrame.commandProcessor.Submit(command=transaction, storeIt=True)
+                self.logger.debug(f'{submitStatus=}')
 
             self._eventEngine.sendEvent(EventType.UMLDiagramModified)   # will also cause title to be updated
         else:
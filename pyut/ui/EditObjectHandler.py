@@ -42,18 +42,6 @@ from ogl.OglObject import OglObject
 from pyut.ui.wxcommands.CommandModify import CommandModify
 from pyut.ui.wxcommands.CommandModify import Parameters
 
-from pyut.ui.dialogs.DlgEditClass import DlgEditClass
-from pyut.ui.dialogs.DlgEditLink import DlgEditLink
-from pyut.ui.dialogs.DlgEditInterface import DlgEditInterface
-
-from pyut.ui.dialogs.Wrappers import DlgEditSDInstanceName
-from pyut.ui.dialogs.Wrappers import DlgEditSDMessage
-from pyut.ui.dialogs.Wrappers import DlgEditActor
-from pyut.ui.dialogs.Wrappers import DlgEditUseCase
-
-from pyut.ui.dialogs.textdialogs.DlgEditNote import DlgEditNote
-from pyut.ui.dialogs.textdialogs.DlgEditText import DlgEditText
-
 from pyut.ui.umlframes.UmlFrame import UmlFrame
 from pyut.ui.umlframes.UmlFrame import UmlObjects
 from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
@@ -101,6 +89,7 @@ class EditObjectHandler:
         if diagramShape is None:
             return
 
+        umlFrame.damageTracker.damageShape(diagramShape)     # The edit may shrink it
         match diagramShape:
             case OglClass() as diagramShape:
                 self._editClass(umlFrame, diagramShape)
@@ -125,9 +114,13 @@ class EditObjectHandler:
             case _:
                 self.logger.error(f'Unknown shape')
                 PyutUtils.displayError(msg=f'EditObjectHandler: Unknown shape: {diagramShape}', title='Developer Error')
-        umlFrame.Refresh()
+        umlFrame.renderCache.invalidate(diagramShape)
+        umlFrame.shapeChanged(shape=diagramShape)       # The edit may resize it
+        umlFrame.damageTracker.damageShape(diagramShape)
 
     def _editClass(self, umlFrame: UmlDiagramsFrame, diagramShape: OglObject):
+        from pyut.ui.dialogs.DlgEditClass import DlgEditClass
+
         pyutClass: PyutClass = diagramShape.pyutObject
         with DlgEditClass(umlFrame, self._eventEngine, pyutClass) as dlg:
             if dlg.ShowModal() == OK:
@@ -136,6 +129,8 @@ class EditObjectHandler:
 
     def _editOglInterface2(self, umlFrame: UmlDiagramsFrame, lollipop: OglInterface2):
 
+        from pyut.ui.dialogs.DlgEditInterface import DlgEditInterface
+
         pyutInterface: PyutInterface = lollipop.pyutInterface
 
         editMode: bool = True
@@ -150,6 +145,8 @@ class EditObjectHandler:
 
     def _editText(self, umlFrame: UmlDiagramsFrame, diagramShape: OglObject):
 
+        from pyut.ui.dialogs.textdialogs.DlgEditText import DlgEditText
+
         oglText:  OglText  = cast(OglText, diagramShape)
         pyutText: PyutText = oglText.pyutText
 
@@ -165,6 +162,8 @@ class EditObjectHandler:
 
     def _editNote(self, umlFrame: UmlDiagramsFrame, oglNote: OglNote):
 
+        from pyut.ui.dialogs.textdialogs.DlgEditNote import DlgEditNote
+
         pyutNote: PyutNote = oglNote.pyutObject
 
         cmdModify: CommandModify = CommandModify(name='Undo Note Text', anyObject=pyutNote, eventEngine=self._eventEngine)
@@ -180,6 +179,8 @@ class EditObjectHandler:
 
     def _editUseCase(self, umlFrame: UmlDiagramsFrame, oglUseCase: OglUseCase):
 
+        from pyut.ui.dialogs.Wrappers import DlgEditUseCase
+
         pyutUseCase: PyutUseCase   = oglUseCase.pyutObject
         cmdModify:   CommandModify = CommandModify(name='Undo Note Text', anyObject=pyutUseCase, eventEngine=self._eventEngine)
         cmdModify.methodName       = 'name'
@@ -195,6 +196,8 @@ class EditObjectHandler:
 
     def _editActor(self, umlFrame: UmlDiagramsFrame, oglActor: OglActor):
 
+        from pyut.ui.dialogs.Wrappers import DlgEditActor
+
         pyutActor:   PyutActor     = oglActor.pyutObject
         cmdModify:   CommandModify = CommandModify(name='Undo Actor Name', anyObject=pyutActor, eventEngine=self._eventEngine)
         cmdModify.methodName       = 'name'
@@ -209,6 +212,8 @@ class EditObjectHandler:
 
     def _editAssociation(self, umlFrame: UmlFrame, oglAssociation: OglAssociation):
 
+        from pyut.ui.dialogs.DlgEditLink import DlgEditLink
+
         pyutLink:    PyutLink      = oglAssociation.pyutObject
         oldPyutLink: PyutLink      = deepcopy(pyutLink)
         cmdModify:   CommandModify = CommandModify(name='Undo Link Edit', anyObject=oglAssociation, eventEngine=self._eventEngine)
@@ -224,6 +229,8 @@ class EditObjectHandler:
 
     def _editSDInstanceName(self, umlFrame: UmlFrame, oglSDInstance: OglSDInstance):
 
+        from pyut.ui.dialogs.Wrappers import DlgEditSDInstanceName
+
         pyutSDInstance:    PyutSDInstance = oglSDInstance.pyutSDInstance
         cmdModify:         CommandModify  = CommandModify(name='Undo Instance Name', anyObject=oglSDInstance, eventEngine=self._eventEngine)
         cmdModify.methodName       = 'pyutSDInstance'
@@ -243,6 +250,8 @@ class EditObjectHandler:
                 self._eventEngine.sendEvent(EventType.UMLDiagramModified)
 
     def _editSDMessage(self, umlFrame: UmlFrame, oglSDMessage: OglSDMessage):
+        from pyut.ui.dialogs.Wrappers import DlgEditSDMessage
+
         pyutSDMessage: PyutSDMessage = oglSDMessage.pyutSDMessage
         cmdModify:     CommandModify = CommandModify(name='Undo SD Message', anyObject=pyutSDMessage, eventEngine=self._eventEngine)
         cmdModify.methodName       = 'message'
@@ -60,6 +60,42 @@ class IPyutDocument(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def materialized(self) -> bool:
+        """
+        Returns: `True` if the document's shapes are on its frame
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def modified(self) -> bool:
+        """
+        Returns: `True` if the document changed since the project was last saved
+        """
+        pass
+
+    @modified.setter
+    @abstractmethod
+    def modified(self, newValue: bool):
+        pass
+
+    @property
+    @abstractmethod
+    def revision(self) -> int:
+        """
+        Returns: A counter that goes up every time the document is marked modified;  It is never reset
+        """
+        pass
+
+    @abstractmethod
+    def materialize(self):
+        """
+        Place the shapes from the parsed document stub onto the frame
+        """
+        pass
+
     @abstractmethod
     def updateTreeText(self):
         """
@@ -8,6 +8,7 @@ from logging import getLogger
 
 from miniogl.Diagram import Diagram
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
+from miniogl.Shape import Shapes
 
 from ogl.OglAssociation import OglAssociation
 from ogl.OglAssociationLabel import OglAssociationLabel
@@ -18,15 +19,9 @@ from ogl.OglObject import OglObject
 from ogl.sd.OglSDInstance import OglSDInstance
 from ogl.sd.OglSDMessage import OglSDMessage
 
-from oglio.Types import OglActors
-from oglio.Types import OglClasses
 from oglio.Types import OglDocument
-from oglio.Types import OglLinks
-from oglio.Types import OglNotes
-from oglio.Types import OglSDInstances
-from oglio.Types import OglSDMessages
-from oglio.Types import OglTexts
-from oglio.Types import OglUseCases
+
+from pyutplugins.ExternalTypes import OglObjects
 
 from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
@@ -41,22 +36,47 @@ class LayoutEngine:
 
     def layout(self, umlFrame: UmlDiagramsFrame, oglDocument: OglDocument):
         """
-        Don't care what type of diagram since those lists will be empty
+        Don't care what type of diagram since those lists will be empty.
+        All the shapes are added to the frame in a single batch
 
         Args:
             umlFrame:       A uml diagram frame to populate
             oglDocument:    The OGL Document
         """
-        self._layoutOglClasses(umlFrame=umlFrame, oglClasses=oglDocument.oglClasses)
-        self._layoutOglLinks(umlFrame=umlFrame, oglLinks=oglDocument.oglLinks)
-        self._layoutOglNotes(umlFrame=umlFrame, oglNotes=oglDocument.oglNotes)
-        self._layoutOglTexts(umlFrame=umlFrame, oglTexts=oglDocument.oglTexts)
+        oglObjects: OglObjects = OglObjects([])
+
+        oglObjects.extend(oglDocument.oglClasses)
+        oglObjects.extend(oglDocument.oglLinks)
+        oglObjects.extend(oglDocument.oglNotes)
+        oglObjects.extend(oglDocument.oglTexts)
+
+        oglObjects.extend(oglDocument.oglActors)
+        oglObjects.extend(oglDocument.oglUseCases)
 
-        self._layoutOglActors(umlFrame=umlFrame, oglActors=oglDocument.oglActors)
-        self._layoutOglUseCases(umlFrame=umlFrame, oglUseCases=oglDocument.oglUseCases)
+        oglObjects.extend(oglDocument.oglSDInstances.values())
+        oglObjects.extend(oglDocument.oglSDMessages.values())
 
-        self._layoutOglSDInstances(umlFrame=umlFrame, oglSDInstances=oglDocument.oglSDInstances)
-        self._layoutOglSDMessages(umlFrame=umlFrame, oglSDMessages=oglDocument.oglSDMessages)
+        self.addShapes(umlFrame=umlFrame, oglObjects=oglObjects)
+
+    def addShapes(self, umlFrame: UmlDiagramsFrame, oglObjects: OglObjects):
+        """
+        Same as .addShape for many objects;  The frame adds them in a single batch
+
+        Args:
+            umlFrame:    The frame to place them on
+            oglObjects:  The objects in the order to place them
+        """
+        batch: Shapes = Shapes([])
+        for oglObject in oglObjects:
+            match oglObject:
+                case OglLink() as oglObject:
+                    self._collectOglLink(batch=batch, oglLink=cast(OglLink, oglObject))
+                case OglSDInstance() | OglSDMessage():
+                    batch.append(oglObject)
+                case _:
+                    self._collectOglObjects(batch=batch, oglObjects=[oglObject])
+
+        umlFrame.addShapes(shapes=batch)
 
     def addShape(self, umlFrame: UmlDiagramsFrame, oglObject: OglObject):
 
@@ -70,42 +90,31 @@ class LayoutEngine:
             case _:
                 self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglObject)
 
-    def _layoutOglClasses(self, umlFrame: UmlDiagramsFrame, oglClasses: OglClasses):
-        for oglClass in oglClasses:
-            self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglClass, )
-
-    def _layoutOglLinks(self, umlFrame: UmlDiagramsFrame, oglLinks: OglLinks):
+    def _collectOglObjects(self, batch: Shapes, oglObjects: List):
 
-        for link in oglLinks:
-            oglLink: OglLink = cast(OglLink, link)
-            self._layoutOglLink(umlFrame=umlFrame, oglLink=oglLink)
+        for oglObject in oglObjects:
+            oglObject.draggable = True
+            batch.append(oglObject)
 
-    def _layoutOglNotes(self, umlFrame: UmlDiagramsFrame, oglNotes: OglNotes):
-        for oglNote in oglNotes:
-            self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglNote)
-
-    def _layoutOglTexts(self, umlFrame: UmlDiagramsFrame, oglTexts: OglTexts):
-        for oglText in oglTexts:
-            self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglText)
-
-    def _layoutOglActors(self, umlFrame: UmlDiagramsFrame, oglActors: OglActors):
-        for oglActor in oglActors:
-            self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglActor)
-
-    def _layoutOglUseCases(self, umlFrame: UmlDiagramsFrame, oglUseCases: OglUseCases):
-        for oglUseCase in oglUseCases:
-            self._layoutAnOglObject(umlFrame=umlFrame, oglObject=oglUseCase)
+    def _collectOglLink(self, batch: Shapes, oglLink: OglLink):
+        """
+        Same as ._layoutOglLink;  But, collects the shapes instead of adding them
 
-    def _layoutOglSDInstances(self, umlFrame: UmlDiagramsFrame, oglSDInstances: OglSDInstances):
-        diagram: Diagram = umlFrame.getDiagram()
-        for oglSDInstance in oglSDInstances.values():
-            self._layoutOglSDInstance(diagram=diagram, oglSDInstance=oglSDInstance)
-        umlFrame.Refresh()
+        Args:
+            batch:      Where to put the link and its anchors, control points and labels
+            oglLink:    The link
+        """
+        oglLink.draggable = True
+        batch.append(oglLink)
+        if isinstance(oglLink, OglInterface2) is False:
+            batch.append(oglLink.sourceAnchor)
+            batch.append(oglLink.destinationAnchor)
+            batch.extend(oglLink.GetControlPoints())
 
-    def _layoutOglSDMessages(self, umlFrame: UmlDiagramsFrame, oglSDMessages: OglSDMessages):
-        diagram: Diagram = umlFrame.getDiagram()
-        for oglSDMessage in oglSDMessages.values():
-            self._layoutOglSDMessage(diagram=diagram, oglSDMessage=oglSDMessage)
+        if isinstance(oglLink, OglAssociation) is True:
+            oglAssociation: OglAssociation = cast(OglAssociation, oglLink)
+            labels: List[OglAssociationLabel] = [oglAssociation.centerLabel, oglAssociation.sourceCardinality, oglAssociation.destinationCardinality]
+            self._collectOglObjects(batch=batch, oglObjects=[label for label in labels if label is not None])
 
     def _layoutOglLink(self, umlFrame: UmlDiagramsFrame, oglLink: OglLink):
 
@@ -0,0 +1,64 @@
+
+from typing import TYPE_CHECKING
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from pyutplugins.plugintypes.PluginDataTypes import PluginIDMap
+
+from pyut.ui.eventengine.IEventEngine import IEventEngine
+
+if TYPE_CHECKING:
+    from pyutplugins.PluginManager import PluginManager
+
+
+class LazyPluginManager:
+    """
+    Creates the plugin manager on first use.  Importing the plugin manager imports every
+    plugin;  So Pyut does not do it until a plugin menu is opened or a plugin is invoked.
+    """
+    def __init__(self, eventEngine: IEventEngine):
+        """
+
+        Args:
+            eventEngine:  The Pyut event engine;  Handed to the plugin adapter
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._eventEngine:   IEventEngine    = eventEngine
+        self._pluginManager: 'PluginManager' = cast('PluginManager', None)
+
+    @property
+    def loaded(self) -> bool:
+        return self._pluginManager is not None
+
+    @property
+    def pluginManager(self) -> 'PluginManager':
+        """
+        Returns:  The plugin manager;  Discovers the plugins the first time
+        """
+        if self._pluginManager is None:
+            from pyutplugins.PluginManager import PluginManager
+
+            from pyut.ui.PluginAdapter import PluginAdapter
+
+            startTime: float = perf_counter()
+            self._pluginManager = PluginManager(pluginAdapter=PluginAdapter(eventEngine=self._eventEngine))
+            self.logger.info(f'Plugins loaded in {(perf_counter() - startTime) * 1000:.1f} ms')
+
+        return self._pluginManager
+
+    @property
+    def toolPlugins(self) -> PluginIDMap:
+        return self.pluginManager.toolPluginsMap.pluginIdMap
+
+    @property
+    def exportPlugins(self) -> PluginIDMap:
+        return self.pluginManager.outputPluginsMap.pluginIdMap
+
+    @property
+    def importPlugins(self) -> PluginIDMap:
+        return self.pluginManager.inputPluginsMap.pluginIdMap
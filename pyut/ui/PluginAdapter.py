@@ -23,6 +23,7 @@ from pyutplugins.ExternalTypes import CurrentProjectCallback
 from pyutplugins.ExternalTypes import FrameInformationCallback
 from pyutplugins.ExternalTypes import FrameSizeCallback
 from pyutplugins.ExternalTypes import OglObjectType
+from pyutplugins.ExternalTypes import OglObjects
 from pyutplugins.ExternalTypes import PluginDocument
 from pyutplugins.ExternalTypes import PluginDocumentType
 from pyutplugins.ExternalTypes import PluginProject
@@ -287,39 +288,23 @@ class PluginAdapter(IPluginAdapter):
 
     def _layoutPluginDocument(self, pluginDocument: PluginDocument):
         """
-        Loads a plugin's Ogl Objects
+        Loads a plugin's Ogl Objects;  They are sent to the frame in a single batch
 
         Args:
             pluginDocument: The plugin document itself
         """
-        for oglClass in pluginDocument.oglClasses:
-            self._layoutAnOglObject(oglObject=oglClass)
-
-        for oglLink in pluginDocument.oglLinks:
-            # self._layoutLinks(oglLinks=pluginDocument.oglLinks)
-            self._layoutAnOglObject(oglObject=oglLink)
-
-        for oglNote in pluginDocument.oglNotes:
-            self._layoutAnOglObject(oglObject=oglNote)
-
-        for oglText in pluginDocument.oglTexts:
-            self._layoutAnOglObject(oglObject=oglText)
-
-        for oglUseCase in pluginDocument.oglUseCases:
-            self._layoutAnOglObject(oglObject=oglUseCase)
-
-        for oglActor in pluginDocument.oglActors:
-            self._layoutAnOglObject(oglObject=oglActor)
-
-        for oglSDInstance in pluginDocument.oglSDInstances.values():
-            self._layoutAnOglObject(oglObject=oglSDInstance)
-
-        for oglSDMessage in pluginDocument.oglSDMessages.values():
-            self._layoutAnOglObject(oglObject=oglSDMessage)
-
-    def _layoutAnOglObject(self, oglObject: OglObjectType):
-
-        self.addShape(shape=oglObject)      # type ignore
+        oglObjects: OglObjects = OglObjects([])
+
+        oglObjects.extend(pluginDocument.oglClasses)
+        oglObjects.extend(pluginDocument.oglLinks)
+        oglObjects.extend(pluginDocument.oglNotes)
+        oglObjects.extend(pluginDocument.oglTexts)
+        oglObjects.extend(pluginDocument.oglUseCases)
+        oglObjects.extend(pluginDocument.oglActors)
+        oglObjects.extend(pluginDocument.oglSDInstances.values())
+        oglObjects.extend(pluginDocument.oglSDMessages.values())
+
+        self._eventEngine.sendEvent(EventType.AddShapes, shapesToAdd=oglObjects)
 
     def _toPyutDiagramType(self, documentType: PluginDocumentType) -> DiagramType:
 
@@ -41,6 +41,8 @@ class PluginProjectCreator:
             pyutDocument:   IPyutDocument = cast(IPyutDocument, document)
             pluginDocument: PluginDocument = PluginDocument()
 
+            pyutDocument.materialize()      # Plugins see every shape
+
             pluginDocument.documentType  = PluginDocumentType.toEnum(pyutDocument.diagramType.name)
             pluginDocument.documentTitle = PluginDocumentTitle(pyutDocument.title)
 
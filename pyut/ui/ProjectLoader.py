@@ -0,0 +1,57 @@
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Thread
+
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import ProjectXml
+
+from pyut.ui.IPyutProject import IPyutProject
+
+from pyut.ui.eventengine.EventType import EventType
+from pyut.ui.eventengine.IEventEngine import IEventEngine
+from pyut.ui.eventengine.eventinformation.ProjectLoadInformation import ProjectLoadInformation
+
+
+class ProjectLoader(Thread):
+    """
+    Reads, decompresses and parses a project file off the UI thread;  It also builds the
+    class models.  When done it hands the parsed project back to the UI via a `ProjectLoaded`
+    event;  The Ogl objects are wx objects, so the UI thread creates them.  The reader checks
+    for a cancel between documents;  The UI discards a cancelled result
+    """
+    def __init__(self, eventEngine: IEventEngine, pyutProject: IPyutProject):
+        """
+
+        Args:
+            eventEngine:  The Pyut event engine
+            pyutProject:  The project to read;  Its filename must be set
+        """
+        super().__init__(name=f'ProjectLoader-{pyutProject.projectName}', daemon=True)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._eventEngine: IEventEngine = eventEngine
+        self._pyutProject: IPyutProject = pyutProject
+        self._cancelled:   bool         = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+
+        info: ProjectLoadInformation = ProjectLoadInformation(pyutProject=self._pyutProject)
+        try:
+            projectXml: ProjectXml = ProjectReader().readXml(fqFileName=self._pyutProject.filename, cancelled=lambda: self._cancelled)
+            info.projectXml = projectXml
+        except (ValueError, Exception) as e:
+            self.logger.error(f'{self._pyutProject.filename} {e}')
+            info.loadException = e
+
+        info.cancelled = self._cancelled
+        self._eventEngine.sendEvent(EventType.ProjectLoaded, projectLoadInformation=info)
@@ -9,6 +9,8 @@ from logging import getLogger
 
 from copy import copy
 
+from xml.etree.ElementTree import ParseError
+
 from xml.sax import SAXParseException
 
 from wx import FD_OVERWRITE_PROMPT
@@ -33,43 +35,23 @@ from pyut.PyutUtils import PyutUtils
 
 from pyut.errorcontroller.ErrorManager import ErrorManager
 
-from pyut.general.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import ProjectXml
 
 from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
 from pyut.ui.CurrentDirectoryHandler import CurrentDirectoryHandler
-from pyut.ui.umlframes.UmlFrame import UmlFrame
-from pyut.ui.umlframes.UmlFrame import UmlObjects
 
 from pyut.ui.IPyutDocument import IPyutDocument
-from pyut.ui.IPyutDocument import PyutDocuments
 from pyut.ui.IPyutProject import IPyutProject
 
 from pyut.ui.DiagramNotebook import DiagramNotebook
 from pyut.ui.ProjectException import ProjectException
 from pyut.ui.ProjectException import ProjectExceptionType
 from pyut.ui.ProjectTree import ProjectTree
-from pyut.ui.PyutDocument import PyutDocument
+from pyut.ui.ProjectWriter import ProjectWriter
 from pyut.ui.PyutProject import PyutProject
 
-from ogl.OglClass import OglClass
-from ogl.OglInterface2 import OglInterface2
-from ogl.OglLink import OglLink
-from ogl.OglNote import OglNote
-from ogl.OglText import OglText
-from oglio.Writer import Writer
-from oglio.Reader import Reader
-from oglio.Types import OglProject
-from oglio.Types import OglDocument
-from oglio.Types import OglDocumentTitle
-from ogl.OglActor import OglActor
-from ogl.OglUseCase import OglUseCase
-
-from ogl.sd.OglSDInstance import OglSDInstance
-from ogl.sd.OglSDMessage import OglSDMessage
-
-from oglio.toXmlV11.OglToXml import XML_VERSION
-
 PyutProjects = NewType('PyutProjects', List[IPyutProject])
 
 MAX_NOTEBOOK_PAGE_NAME_LENGTH: int = 12         # TODO make this a preference
@@ -103,6 +85,7 @@ class ProjectManager:
         self._currentFrame:    UmlDiagramsFrame = cast(UmlDiagramsFrame, None)
 
         self._defaultProjectNumber = defaultProjectNumber()
+        self._projectWriter:       ProjectWriter = ProjectWriter()
 
     @property
     def projects(self) -> PyutProjects:
@@ -143,6 +126,10 @@ class ProjectManager:
     def currentDocument(self, newDocument: IPyutDocument):
         self._currentDocument = newDocument
 
+    @property
+    def projectWriter(self) -> ProjectWriter:
+        return self._projectWriter
+
     @property
     def currentFrame(self) -> UmlDiagramsFrame:
         return self._currentFrame
@@ -168,6 +155,21 @@ class ProjectManager:
 
         return foundProject
 
+    def getDocumentFromFrame(self, frame: UmlDiagramsFrame) -> IPyutDocument:
+        """
+        Args:
+            frame:  A diagram frame
+
+        Returns:  The document that owns the frame;  May return 'None' if no
+        managed project has it
+        """
+        for project in self._projects:
+            for document in project.documents:
+                if document.diagramFrame is frame:
+                    return document
+
+        return cast(IPyutDocument, None)
+
     def addProject(self, project: IPyutProject):
         """
         Add a new project to manage
@@ -259,7 +261,7 @@ class ProjectManager:
             projectToSave.modified = False
             self.logger.info(f'{projectToSave.filename} saved.')
 
-    def openProject(self, filename: str) -> Tuple[OglProject, IPyutProject]:
+    def openProject(self, filename: str) -> Tuple[ProjectXml, IPyutProject]:
         """
         Open a file, creates PyutProject, update myself, make the new project
         the current one;  Update the UI
@@ -268,43 +270,80 @@ class ProjectManager:
         Args:
             filename:
 
-        Returns:  Tuple: The OglProject that was read and a newly created PyutProject
+        Returns:  Tuple: The project that was parsed and a newly created PyutProject
+        """
+        project: IPyutProject = self.prepareProject(filename=filename)
+
+        try:
+            projectXml: ProjectXml = self._readFile(filename=filename)
+        except (ValueError, Exception) as e:
+            raise self.toProjectException(e=e, project=project)
+
+        self.completeProject(project=project)
+
+        return projectXml, project
+
+    def prepareProject(self, filename: str) -> IPyutProject:
+        """
+        Creates the project that a background load eventually fills in;  Since
+        it is managed immediately, `.isProjectLoaded` reports it while it loads
+
+        Args:
+            filename:  The project file name
+
+        Returns:  A newly created PyutProject with no documents
         """
         self.logger.info(f'{filename=}')
 
         project: IPyutProject = self.newProject()
         project.filename = filename
 
-        try:
-            oglProject: OglProject = self._readFile(filename=filename)
-        except SAXParseException:
-            ErrorManager.addToLogFile(title='Invalid Project Content', msg='Recovery Started')
-            raise ProjectException(exceptionType=ProjectExceptionType.INVALID_PROJECT, message='Invalid Project Content', project=project)
-        except FileNotFoundError:
-            ErrorManager.addToLogFile(title='Project not found', msg='Recovery Started')
-            raise ProjectException(exceptionType=ProjectExceptionType.PROJECT_NOT_FOUND, message='Project not found', project=project)
-        except AttributeError as ae:
-            ErrorManager.addToLogFile(title='Attribute Error', msg=f'{ae}')
-            raise ProjectException(exceptionType=ProjectExceptionType.ATTRIBUTE_ERROR, message='Incompatible XML', project=project)
-        except TypeError as te:
-            ErrorManager.addToLogFile(title='Type Error', msg=f'{te}')
-            raise ProjectException(exceptionType=ProjectExceptionType.TYPE_ERROR, message=f'Type Error {te}', project=project)
-        except AssertionError as assertionError:
-            ErrorManager.addToLogFile(title='Assertion Raised', msg=f'{assertionError}')
-            raise ProjectException(exceptionType=ProjectExceptionType.ASSERTION_ERROR, message=f'Type Error {assertionError}', project=project)
-        except (ValueError, Exception) as e:
-            ErrorManager.addToLogFile(title='General Error', msg=f'{e}')
+        return project
 
-            errorMsg: str = ErrorManager.getErrorInfo()
-
-            raise ProjectException(exceptionType=ProjectExceptionType.GENERAL_ERROR, message=errorMsg, project=project)
+    def completeProject(self, project: IPyutProject):
+        """
+        Make the newly read project the current one and update the UI
 
+        Args:
+            project:  The project that was read
+        """
         self.currentProject = project
         self.updateProjectTreeText(pyutProject=project)
         wxYield()
 
         self.logger.info(f'Project {project.projectName} opened')
-        return oglProject, project
+
+    def toProjectException(self, e: Exception, project: IPyutProject) -> ProjectException:
+        """
+        Classify an exception raised while reading a project
+
+        Args:
+            e:        The exception raised by the reader
+            project:  The project that failed to load
+
+        Returns:  The appropriate project exception
+        """
+        if isinstance(e, (SAXParseException, ParseError)):
+            ErrorManager.addToLogFile(title='Invalid Project Content', msg='Recovery Started')
+            return ProjectException(exceptionType=ProjectExceptionType.INVALID_PROJECT, message='Invalid Project Content', project=project)
+        elif isinstance(e, FileNotFoundError):
+            ErrorManager.addToLogFile(title='Project not found', msg='Recovery Started')
+            return ProjectException(exceptionType=ProjectExceptionType.PROJECT_NOT_FOUND, message='Project not found', project=project)
+        elif isinstance(e, AttributeError):
+            ErrorManager.addToLogFile(title='Attribute Error', msg=f'{e}')
+            return ProjectException(exceptionType=ProjectExceptionType.ATTRIBUTE_ERROR, message='Incompatible XML', project=project)
+        elif isinstance(e, TypeError):
+            ErrorManager.addToLogFile(title='Type Error', msg=f'{e}')
+            return ProjectException(exceptionType=ProjectExceptionType.TYPE_ERROR, message=f'Type Error {e}', project=project)
+        elif isinstance(e, AssertionError):
+            ErrorManager.addToLogFile(title='Assertion Raised', msg=f'{e}')
+            return ProjectException(exceptionType=ProjectExceptionType.ASSERTION_ERROR, message=f'Type Error {e}', project=project)
+        else:
+            ErrorManager.addToLogFile(title='General Error', msg=f'{e}')
+
+            errorMsg: str = ErrorManager.getErrorInfo()
+
+            return ProjectException(exceptionType=ProjectExceptionType.GENERAL_ERROR, message=errorMsg, project=project)
 
     def saveProjectAs(self, projectToSave: IPyutProject):
         """
@@ -405,6 +444,7 @@ class ProjectManager:
         project.selectFirstDocument()
 
         if len(project.documents) > 0:
+            project.documents[0].materialize()
             self._currentFrame = project.documents[0].diagramFrame
             self.syncPageFrameAndNotebook(frame=self._currentFrame)
 
@@ -428,73 +468,31 @@ class ProjectManager:
             projectToWrite:
         """
         BeginBusyCursor()
-        oglProject: OglProject = OglProject()
-        oglProject.codePath = projectToWrite.codePath
-        oglProject.version  = XML_VERSION           # Do not really need this as oglio sets it appropriately
-        documents: PyutDocuments = projectToWrite.documents
-        for document in documents:
-            pyutDocument: PyutDocument = cast(PyutDocument, document)
-
-            oglDocument:  OglDocument = self._toBasicOglDocument(pyutDocument=pyutDocument)
-            diagramFrame: UmlFrame    = pyutDocument.diagramFrame
-            oglObjects:   UmlObjects  = diagramFrame.umlObjects
-
-            for oglObject in oglObjects:
-                match oglObject:
-                    case OglClass() as oglObject:
-                        oglDocument.oglClasses.append(oglObject)
-                    case OglSDMessage() as oglObject:               # Put here so it does not fall into OglLink
-                        oglSDMessage: OglSDMessage = cast(OglSDMessage, oglObject)
-                        modelId: int = oglSDMessage.pyutObject.id
-                        oglDocument.oglSDMessages[modelId] = oglSDMessage
-                    case OglLink() as oglObject:
-                        oglDocument.oglLinks.append(oglObject)
-                    case OglInterface2() as oglObject:
-                        oglDocument.oglLinks.append(cast(OglLink, oglObject))      # temp cast until I fix OglInterface2
-                    case OglNote() as oglObject:
-                        oglDocument.oglNotes.append(oglObject)
-                    case OglText() as oglObject:
-                        oglDocument.oglTexts.append(oglObject)
-                    case OglUseCase() as oglObject:
-                        oglDocument.oglUseCases.append(oglObject)
-                    case OglActor() as oglObject:
-                        oglDocument.oglActors.append(oglObject)
-                    case OglSDInstance() as oglObject:
-                        oglSDInstance: OglSDInstance = cast(OglSDInstance, oglObject)
-                        modelId = oglSDInstance.pyutSDInstance.id
-                        oglDocument.oglSDInstances[modelId] = oglSDInstance
-                    case _:
-                        self.logger.error(f'Unknown ogl object type: {oglObject}, not saved')
-            oglProject.oglDocuments[oglDocument.documentTitle] = oglDocument
-
-            oglWriter: Writer = Writer()
-            oglWriter.writeFile(oglProject=oglProject, fqFileName=projectToWrite.filename)
-
-        EndBusyCursor()
-
-    def _readFile(self, filename: str) -> OglProject:
+        try:
+            self._projectWriter.writeProject(pyutProject=projectToWrite)
+        finally:
+            EndBusyCursor()
+
+        for document in projectToWrite.documents:
+            document.modified = False
+
+    def _readFile(self, filename: str) -> ProjectXml:
         """
         Interface to the actual I/O code
-        Get the project Ogl Objects
+        Parse the project;  The documents create their Ogl objects when they are materialized
         Args:
             filename: filename to open
 
-        Returns:    Returns an OglProject
+        Returns:    Returns the parsed project
         """
         self.logger.debug(f'loadFromFilename: {filename=}')
         BeginBusyCursor()
+        try:
+            projectXml: ProjectXml = ProjectReader().readXml(fqFileName=filename)
+        finally:
+            EndBusyCursor()
 
-        reader: Reader = Reader()
-
-        if filename.endswith('.put'):
-            oglProject: OglProject = reader.readFile(fqFileName=filename)
-        elif filename.endswith('.xml'):
-            oglProject = reader.readXmlFile(fqFileName=filename)
-        else:
-            raise UnsupportedFileTypeException()
-
-        EndBusyCursor()
-        return oglProject
+        return projectXml
 
     def _manageProject(self, pyutProject: PyutProject):
         """
@@ -533,27 +531,3 @@ class ProjectManager:
         booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption='Error', style=OK | ICON_ERROR)
         booBoo.ShowModal()
 
-    def _toBasicOglDocument(self, pyutDocument: IPyutDocument) -> OglDocument:
-        """
-        Extracts basic Pyut Document properties and moves them to the OglDocument
-
-        Args:
-            pyutDocument:
-
-        Returns: A new OglDocument
-        """
-        oglDocument: OglDocument = OglDocument()
-        oglDocument.documentType = pyutDocument.diagramType.__str__()
-        oglDocument.documentTitle = OglDocumentTitle(pyutDocument.title)
-
-        diagramFrame: UmlFrame = pyutDocument.diagramFrame
-        scrollPosX, scrollPosY = diagramFrame.GetViewStart()
-
-        xUnit, yUnit = diagramFrame.GetScrollPixelsPerUnit()
-
-        oglDocument.scrollPositionX = scrollPosX
-        oglDocument.scrollPositionY = scrollPosY
-        oglDocument.pixelsPerUnitX = xUnit
-        oglDocument.pixelsPerUnitY = yUnit
-
-        return oglDocument
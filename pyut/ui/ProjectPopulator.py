@@ -0,0 +1,141 @@
+
+from typing import Callable
+
+from logging import Logger
+from logging import getLogger
+
+from wx import PD_AUTO_HIDE
+from wx import PD_CAN_ABORT
+from wx import PD_ELAPSED_TIME
+
+from wx import CallAfter
+from wx import CallLater
+from wx import ProgressDialog
+from wx import Window
+
+from pyut.ui.DiagramNotebook import DiagramNotebook
+from pyut.ui.IPyutDocument import IPyutDocument
+from pyut.ui.IPyutDocument import PyutDocuments
+from pyut.ui.IPyutProject import IPyutProject
+from pyut.ui.ProjectLoader import ProjectLoader
+
+from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
+PopulatedCallback = Callable[['ProjectPopulator', bool], None]
+"""
+Invoked with the populator and a `cancelled` flag
+"""
+
+PULSE_INTERVAL: int = 100   # milliseconds
+
+
+class ProjectPopulator:
+    """
+    Drives the UI side of a background project open.  While the loader thread
+    reads the file, this pulses a progress dialog with a cancel button.  Once the frames
+    are created it only materializes the document on the visible notebook page;
+    The others stay as stubs until the end-user activates them.
+    """
+    def __init__(self, parent: Window, diagramNotebook: DiagramNotebook, projectLoader: ProjectLoader, pyutProject: IPyutProject, callback: PopulatedCallback):
+        """
+
+        Args:
+            parent:             The parent for the progress dialog
+            diagramNotebook:    Used to determine the visible frame
+            projectLoader:      The thread that is reading the project
+            pyutProject:        The project being opened
+            callback:           Invoked when population completes or is cancelled
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramNotebook: DiagramNotebook   = diagramNotebook
+        self._projectLoader:   ProjectLoader     = projectLoader
+        self._pyutProject:     IPyutProject      = pyutProject
+        self._callback:        PopulatedCallback = callback
+
+        self._documents: PyutDocuments = PyutDocuments([])
+        self._parsing:   bool          = True
+        self._finished:  bool          = False
+
+        self._progressDialog: ProgressDialog = ProgressDialog(title='Opening Project',
+                                                              message=f'Reading {pyutProject.projectName}',
+                                                              maximum=100,
+                                                              parent=parent,
+                                                              style=PD_CAN_ABORT | PD_AUTO_HIDE | PD_ELAPSED_TIME)
+        CallLater(PULSE_INTERVAL, self._pulse)
+
+    @property
+    def pyutProject(self) -> IPyutProject:
+        return self._pyutProject
+
+    def addDocument(self, pyutDocument: IPyutDocument):
+        """
+        Args:
+            pyutDocument:  A newly created document that still holds its stub
+        """
+        self._documents.append(pyutDocument)
+
+    def populate(self):
+        """
+        Materialize the visible document once the notebook settles
+        """
+        self._parsing = False
+        self._progressDialog.SetRange(1)
+        CallAfter(self._populateVisibleDocument)
+
+    def abort(self):
+        """
+        Used when the load failed;  Just get rid of the UI
+        """
+        self._parsing  = False
+        self._finished = True
+        self._progressDialog.Destroy()
+
+    def _pulse(self):
+
+        if self._parsing is False or self._finished is True:
+            return
+
+        continueLoading, skip = self._progressDialog.Pulse()
+        if continueLoading is False:
+            self._cancel()
+        else:
+            CallLater(PULSE_INTERVAL, self._pulse)
+
+    def _populateVisibleDocument(self):
+
+        if self._finished is True:
+            return
+
+        if len(self._documents) > 0:
+            pyutDocument: IPyutDocument = self._visibleDocument()
+
+            self._progressDialog.Update(0, f'Laying out {pyutDocument.title}')
+            pyutDocument.materialize()
+            pyutDocument.diagramFrame.Refresh()
+
+        self._finished = True
+        self._progressDialog.Destroy()
+        self._callback(self, False)
+
+    def _visibleDocument(self) -> IPyutDocument:
+        """
+        Returns:  The document the end-user is looking at;  Else the first one
+        """
+        visibleFrame: UmlDiagramsFrame = self._diagramNotebook.currentNotebookFrame
+
+        for pyutDocument in self._documents:
+            if pyutDocument.diagramFrame is visibleFrame:
+                return pyutDocument
+
+        return self._documents[0]
+
+    def _cancel(self):
+
+        self.logger.info(f'Open of {self._pyutProject.filename} cancelled')
+
+        self._projectLoader.cancel()
+        self._parsing  = False
+        self._finished = True
+        self._progressDialog.Destroy()
+        self._callback(self, True)
@@ -0,0 +1,306 @@
+
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from weakref import WeakKeyDictionary
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import fromstring
+from xml.etree.ElementTree import indent
+from xml.etree.ElementTree import tostring
+
+from zlib import compress
+
+from miniogl.LineShape import LineShape
+
+from ogl.OglActor import OglActor
+from ogl.OglClass import OglClass
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+from ogl.OglText import OglText
+from ogl.OglUseCase import OglUseCase
+
+from ogl.sd.OglSDInstance import OglSDInstance
+from ogl.sd.OglSDMessage import OglSDMessage
+
+from oglio.Types import OglDocument
+from oglio.Types import OglDocumentTitle
+
+from oglio.toXmlV11.OglToXml import INDENT_SPACES
+from oglio.toXmlV11.OglToXml import OglToXml
+
+from oglio.toXmlV11.XmlConstants import XmlConstants
+
+from untanglepyut.XmlVersion import XmlVersion
+
+from pyut.PyutConstants import PyutConstants
+
+from pyut.general.AtomicFileWriter import AtomicFileWriter
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import UntangledDocument
+
+from pyut.preferences.PyutPreferences import PyutPreferences
+
+from pyut.ui.IPyutDocument import IPyutDocument
+from pyut.ui.IPyutProject import IPyutProject
+from pyut.ui.PyutDocument import PyutDocument
+
+from pyut.ui.umlframes.UmlFrame import UmlFrame
+from pyut.ui.umlframes.UmlFrame import UmlObjects
+
+XML_ENCODING:       str = 'iso-8859-1'
+FRAGMENT_ENCODING:  str = 'us-ascii'    # Anything else becomes a character reference;  So fragments are safe in any XML encoding
+DOCUMENTS_MARKER:   str = 'PyutDocumentsGoHere'
+
+
+@dataclass
+class DocumentFragment:
+    """
+    The serialized XML for a single document
+    """
+    fingerprint: int = 0
+    revision:    int = 0
+    """
+    The document revision that was serialized
+    """
+    xml:         str = ''
+
+
+def toFragment(documentElement: Element) -> str:
+    """
+    Args:
+        documentElement:  A document element
+
+    Returns:  The document element as XML indented to sit inside the project element
+    """
+    indent(documentElement, space=INDENT_SPACES, level=1)
+
+    return f'{INDENT_SPACES}{tostring(documentElement, encoding=FRAGMENT_ENCODING).decode(FRAGMENT_ENCODING)}\n'
+
+
+class DocumentToXml(OglToXml):
+    """
+    Serializes a single document so that Pyut can cache the result
+    """
+    def __init__(self):
+        super().__init__(projectCodePath='')
+        self.prettyPrint = False
+
+    def toFragment(self, oglDocument: OglDocument) -> str:
+        """
+        Args:
+            oglDocument:  The document to serialize
+
+        Returns:  The document element as indented XML
+        """
+        self.serialize(oglDocument=oglDocument)
+
+        projectElement: Element = fromstring(self.xml)
+
+        return toFragment(documentElement=projectElement[-1])
+
+
+class ProjectWriter:
+    """
+    Writes a Pyut project with a single, atomic write per save.  The serialized XML for each document
+    is cached;  A document is only serialized again if its revision or its geometry
+    fingerprint changed since it was last serialized.  The fingerprint is a safety net for edit
+    paths that do not report a modification.  The writer never touches the document modified
+    flag;  Autosave uses the same cache, and only a project save makes a document clean.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._fragments: WeakKeyDictionary[IPyutDocument, DocumentFragment] = WeakKeyDictionary()
+
+    def writeProject(self, pyutProject: IPyutProject):
+        """
+        Args:
+            pyutProject:  The project to write
+        """
+        fqFileName: str = pyutProject.filename
+        if fqFileName.endswith(PyutConstants.PYUT_EXTENSION) is False:
+            fqFileName = f'{fqFileName}{PyutConstants.PYUT_EXTENSION}'
+
+        rawXml: str = self.toXml(pyutProject=pyutProject)
+
+        atomicFileWriter: AtomicFileWriter = AtomicFileWriter(generations=PyutPreferences().saveGenerations)
+        atomicFileWriter.write(fqFileName=fqFileName, data=compress(rawXml.encode()))
+
+    def toXml(self, pyutProject: IPyutProject) -> str:
+        """
+        Args:
+            pyutProject: The project to serialize
+
+        Returns:  The complete project XML
+        """
+        fragments: List[str] = [self.documentFragment(pyutDocument=cast(PyutDocument, document)) for document in pyutProject.documents]
+
+        return self.spliceFragments(codePath=pyutProject.codePath, fragments=fragments)
+
+    def spliceFragments(self, codePath: str, fragments: List[str]) -> str:
+        """
+        Does not touch the documents;  So it is safe to call off the UI thread
+
+        Args:
+            codePath:   The project code path
+            fragments:  The document fragments in project order
+
+        Returns:  The complete project XML
+        """
+        oglToXml: OglToXml = OglToXml(projectCodePath=codePath)
+        oglToXml.prettyPrint = False
+
+        projectElement: Element = fromstring(oglToXml.xml)
+        projectElement.text = DOCUMENTS_MARKER
+
+        skeleton: str = tostring(projectElement, encoding=XML_ENCODING, xml_declaration=True).decode(XML_ENCODING)
+
+        return skeleton.replace(DOCUMENTS_MARKER, f'\n{"".join(fragments)}')
+
+    def toOglDocument(self, pyutDocument: PyutDocument) -> OglDocument:
+        """
+        Args:
+            pyutDocument:   A materialized document
+
+        Returns:  The OglDocument that oglio serializes
+        """
+        oglDocument:  OglDocument = self._toBasicOglDocument(pyutDocument=pyutDocument)
+        diagramFrame: UmlFrame    = pyutDocument.diagramFrame
+        oglObjects:   UmlObjects  = diagramFrame.umlObjects
+
+        for oglObject in oglObjects:
+            match oglObject:
+                case OglClass() as oglObject:
+                    oglDocument.oglClasses.append(oglObject)
+                case OglSDMessage() as oglObject:               # Put here so it does not fall into OglLink
+                    oglSDMessage: OglSDMessage = cast(OglSDMessage, oglObject)
+                    modelId: int = oglSDMessage.pyutObject.id
+                    oglDocument.oglSDMessages[modelId] = oglSDMessage
+                case OglLink() as oglObject:
+                    oglDocument.oglLinks.append(oglObject)
+                case OglInterface2() as oglObject:
+                    oglDocument.oglLinks.append(cast(OglLink, oglObject))      # temp cast until I fix OglInterface2
+                case OglNote() as oglObject:
+                    oglDocument.oglNotes.append(oglObject)
+                case OglText() as oglObject:
+                    oglDocument.oglTexts.append(oglObject)
+                case OglUseCase() as oglObject:
+                    oglDocument.oglUseCases.append(oglObject)
+                case OglActor() as oglObject:
+                    oglDocument.oglActors.append(oglObject)
+                case OglSDInstance() as oglObject:
+                    oglSDInstance: OglSDInstance = cast(OglSDInstance, oglObject)
+                    modelId = oglSDInstance.pyutSDInstance.id
+                    oglDocument.oglSDInstances[modelId] = oglSDInstance
+                case _:
+                    self.logger.error(f'Unknown ogl object type: {oglObject}, not saved')
+
+        return oglDocument
+
+    def documentFragment(self, pyutDocument: PyutDocument) -> str:
+        """
+        Args:
+            pyutDocument:  The document to serialize
+
+        Returns:  The cached XML if the document is unchanged, else freshly serialized XML
+        """
+        fingerprint: int                     = self._fingerprint(pyutDocument=pyutDocument)
+        fragment:    DocumentFragment | None = self._fragments.get(pyutDocument)
+
+        if fragment is None or fragment.fingerprint != fingerprint or fragment.revision != pyutDocument.revision:
+            self.logger.debug(f'Serializing `{pyutDocument.title}`')
+            if pyutDocument.materialized is True:
+                xml: str = DocumentToXml().toFragment(oglDocument=self.toOglDocument(pyutDocument=pyutDocument))
+            else:
+                xml = self._stubFragment(pyutDocument=pyutDocument)
+
+            fragment = DocumentFragment(fingerprint=fingerprint, revision=pyutDocument.revision, xml=xml)
+            self._fragments[pyutDocument] = fragment
+
+        return fragment.xml
+
+    def _fingerprint(self, pyutDocument: PyutDocument) -> int:
+        """
+        Much cheaper than serializing; Covers the document attributes and the shape geometry
+
+        Args:
+            pyutDocument:  The document
+
+        Returns:  A hash of the values that would change the document XML
+        """
+        diagramFrame: UmlFrame = pyutDocument.diagramFrame
+        scrollPosX, scrollPosY = diagramFrame.GetViewStart()
+        xUnit, yUnit           = diagramFrame.GetScrollPixelsPerUnit()
+
+        values: List[Any] = [pyutDocument.title, pyutDocument.diagramType, pyutDocument.materialized, scrollPosX, scrollPosY, xUnit, yUnit]
+
+        if pyutDocument.materialized is True:
+            for umlObject in diagramFrame.umlObjects:
+                if isinstance(umlObject, LineShape):
+                    values.append((id(umlObject), umlObject.spline, tuple(umlObject.segments)))
+                elif isinstance(umlObject, OglInterface2):
+                    values.append((id(umlObject), umlObject.destinationAnchor.GetPosition()))
+                else:
+                    size: Tuple[int, int] = umlObject.GetSize()
+                    values.append((id(umlObject), umlObject.GetPosition(), size))
+
+        return hash(tuple(values))
+
+    def _stubFragment(self, pyutDocument: PyutDocument) -> str:
+        """
+        A document that was never viewed is written straight from the XML it was read from;
+        Older file versions have to be converted through Ogl objects
+
+        Args:
+            pyutDocument:   An unmaterialized document
+
+        Returns:  The document XML, with the possibly renamed title
+        """
+        untangledDocument: UntangledDocument = cast(UntangledDocument, pyutDocument.untangledDocument)
+
+        if untangledDocument.xmlVersion != XmlVersion.V11:
+            oglDocument: OglDocument = ProjectReader().toOglDocument(untangledDocument=untangledDocument)
+            oglDocument.documentTitle = OglDocumentTitle(pyutDocument.title)
+
+            return DocumentToXml().toFragment(oglDocument=oglDocument)
+
+        documentElement: Element = untangledDocument.xmlElement
+        documentElement.set(XmlConstants.ATTR_TITLE, pyutDocument.title)
+        documentElement.tail = None
+
+        return toFragment(documentElement=documentElement)
+
+    def _toBasicOglDocument(self, pyutDocument: IPyutDocument) -> OglDocument:
+        """
+        Extracts basic Pyut Document properties and moves them to the OglDocument
+
+        Args:
+            pyutDocument:
+
+        Returns: A new OglDocument
+        """
+        oglDocument: OglDocument = OglDocument()
+        oglDocument.documentType = pyutDocument.diagramType.__str__()
+        oglDocument.documentTitle = OglDocumentTitle(pyutDocument.title)
+
+        diagramFrame: UmlFrame = pyutDocument.diagramFrame
+        scrollPosX, scrollPosY = diagramFrame.GetViewStart()
+
+        xUnit, yUnit = diagramFrame.GetScrollPixelsPerUnit()
+
+        oglDocument.scrollPositionX = scrollPosX
+        oglDocument.scrollPositionY = scrollPosY
+        oglDocument.pixelsPerUnitX = xUnit
+        oglDocument.pixelsPerUnitY = yUnit
+
+        return oglDocument
@@ -10,10 +10,16 @@ from wx import OK
 from wx import TreeItemId
 from wx import MessageDialog
 
+from oglio.Types import OglDocument
+
 from pyut.enums.DiagramType import DiagramType
 
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import UntangledDocument
+
 from pyut.ui.IPyutDocument import IPyutDocument
 from pyut.ui.IPyutProject import UmlFrameType
+from pyut.ui.LayoutEngine import LayoutEngine
 
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 
@@ -42,6 +48,13 @@ class PyutDocument(IPyutDocument):
         self._treeRootParent: TreeItemId   = cast(TreeItemId, None)   # Project  entry
         self._title:          str          = cast(str, None)
 
+        self._untangledDocument: UntangledDocument | None = None
+        """
+        The parsed document;  Its Ogl objects are not created yet.  `None` once materialized
+        """
+        self._modified: bool = False
+        self._revision: int  = 0
+
     @property
     def title(self) -> str:
         return self._title
@@ -77,6 +90,54 @@ class PyutDocument(IPyutDocument):
         """
         return self._diagramType
 
+    @property
+    def untangledDocument(self) -> UntangledDocument | None:
+        """
+        Returns: The document stub;  `None` if the document is materialized
+        """
+        return self._untangledDocument
+
+    @untangledDocument.setter
+    def untangledDocument(self, untangledDocument: UntangledDocument):
+        """
+        Defer creating the shapes until someone looks at the document
+
+        Args:
+            untangledDocument: The document as parsed from the project file
+        """
+        self._untangledDocument = untangledDocument
+
+    @property
+    def materialized(self) -> bool:
+        return self._untangledDocument is None
+
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    @modified.setter
+    def modified(self, newValue: bool):
+        if newValue is True:
+            self._revision += 1
+        self._modified = newValue
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def materialize(self):
+        """
+        Create the Ogl objects for the document stub and lay them out on the frame;
+        Does nothing if already materialized
+        """
+        if self._untangledDocument is not None:
+            self.logger.info(f'Materializing `{self._title}`')
+
+            oglDocument: OglDocument = ProjectReader().toOglDocument(untangledDocument=self._untangledDocument)
+            self._untangledDocument = None
+
+            LayoutEngine().layout(umlFrame=self._diagramFrame, oglDocument=oglDocument)
+
     def updateTreeText(self):
         assert False, 'Do not use this method'
 
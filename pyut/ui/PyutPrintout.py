@@ -1,29 +1,51 @@
 
+from typing import TYPE_CHECKING
 
 from wx import Printout
 from wx import DC
 
+from pyutplugins.ExternalTypes import ObjectBoundaries
+
+from pyut.general.PrintTiler import PrintTiler
+from pyut.general.SpatialGrid import Bounds
+
+from pyut.preferences.PyutPreferences import PyutPreferences
+
+if TYPE_CHECKING:
+    from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
 
 class PyutPrintout(Printout):
     """
     Class to prepare for printing
 
-    This class is used to prepare printing
-    It is a copy from the wx.Python documentation
-
+    Only the diagram content is printed;  Not the whole virtual canvas.  The content is split
+    into the number of pages across and down set in the preferences.  Each page draws only the
+    shapes that are on it
     """
-    def __init__(self, canvas):
+    PAGE_MARGIN: int = 50       # device units
+
+    def __init__(self, canvas: 'UmlDiagramsFrame'):
 
         super().__init__()
 
         self.canvas = canvas
-        self.nbPages = 1
+
+        preferences: PyutPreferences = PyutPreferences()
+
+        self._tiler: PrintTiler = PrintTiler(contentBounds=self._contentBounds(),
+                                             pagesAcross=preferences.printPagesAcross,
+                                             pagesDown=preferences.printPagesDown)
+
+    @property
+    def pageCount(self) -> int:
+        return self._tiler.pageCount
 
     def HasPage(self, page):
-        return page <= self.nbPages
+        return self._tiler.hasPage(page=page)
 
     def GetPageInfo(self):
-        return 1, self.nbPages, 1, self.nbPages
+        return 1, self.pageCount, 1, self.pageCount
 
     def OnPrintPage(self, page):
         """
@@ -31,33 +53,32 @@ class PyutPrintout(Printout):
         """
         dc: DC = self.GetDC()
 
-        maxX = self.canvas.getWidth()
-        maxY = self.canvas.getHeight()
-
-        # Let's have at least 50 device units margin
-        marginX = 50
-        marginY = 50
+        tileBounds: Bounds = self._tiler.tileBounds(page=page)
 
-        # Add the margin to the graphic size
-        maxX = maxX + (2 * marginX)
-        maxY = maxY + (2 * marginY)
+        w, h = dc.GetSize()
+        scale: float = self._tiler.scale(pageWidth=w, pageHeight=h, margin=PyutPrintout.PAGE_MARGIN)
+        #
+        # The tile top left goes to the page top left inside the margin
+        #
+        dc.SetUserScale(scale, scale)
+        dc.SetLogicalOrigin(tileBounds.minX, tileBounds.minY)
+        dc.SetDeviceOrigin(PyutPrintout.PAGE_MARGIN, PyutPrintout.PAGE_MARGIN)
+        #
+        # Shapes that straddle tiles are drawn on each page they are on;  Do not let them spill into the margin
+        #
+        dc.SetClippingRegion(tileBounds.minX, tileBounds.minY, self._tiler.tileWidth, self._tiler.tileHeight)
 
-        # Get the size of the DC in pixels
-        (w, h) = dc.GetSize()
-        # Calculate a suitable scaling factor
-        scaleX = float(w) / maxX
-        scaleY = float(h) / maxY
+        self.canvas.Redraw(dc, bounds=tileBounds)
 
-        # Use x or y scaling factor, whichever fits on the DC
-        actualScale = min(scaleX, scaleY)
-
-        # Calculate the position on the DC for centering the graphic
-        posX = (w - (self.canvas.getWidth() * actualScale)) / 2.0
-        posY = (h - (self.canvas.getHeight() * actualScale)) / 2.0
+        dc.DestroyClippingRegion()
+        return True
 
-        # Set the scale and origin
-        dc.SetUserScale(actualScale, actualScale)
-        dc.SetDeviceOrigin(int(posX), int(posY))
+    def _contentBounds(self) -> Bounds:
+        """
+        Returns:  The area the diagram shapes draw in;  An empty rectangle at the origin for an empty diagram
+        """
+        objectBoundaries: ObjectBoundaries = self.canvas.objectBoundaries
+        if objectBoundaries.minX > objectBoundaries.maxX:
+            return Bounds()
 
-        self.canvas.Redraw(dc)
-        return True
+        return Bounds(minX=objectBoundaries.minX, minY=objectBoundaries.minY, maxX=objectBoundaries.maxX, maxY=objectBoundaries.maxY)
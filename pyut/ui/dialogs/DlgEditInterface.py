@@ -25,8 +25,6 @@ from wx import CommandEvent
 from wx import Size
 from wx import ComboBox
 
-from wx import Yield as wxYield
-
 from wx.lib.sized_controls import SizedPanel
 from wx.lib.sized_controls import SizedStaticBox
 
@@ -66,8 +64,6 @@ class DlgEditInterface(DlgEditClassCommon):
 
         self._eventEngine.sendEvent(EventType.GetLollipopInterfaces, callback=self._getLollipopInterfacesCallback)
 
-        wxYield()
-
         self._layoutInterfaceNameSelectionControl(parent=sizedPanel)
         self._layoutMethodControls(parent=sizedPanel)
         self._defineAdditionalDialogButtons(sizedPanel)
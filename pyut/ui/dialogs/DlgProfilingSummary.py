@@ -0,0 +1,91 @@
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DEFAULT_DIALOG_STYLE
+from wx import EVT_BUTTON
+from wx import EVT_CLOSE
+from wx import ID_ANY
+from wx import ID_OK
+from wx import LC_REPORT
+from wx import LIST_FORMAT_RIGHT
+from wx import OK
+from wx import RESIZE_BORDER
+
+from wx import CommandEvent
+from wx import ListCtrl
+from wx import Size
+from wx import StaticText
+from wx import StdDialogButtonSizer
+from wx import Window
+
+from wx import NewIdRef as wxNewIdRef
+
+from wx.lib.sized_controls import SizedDialog
+from wx.lib.sized_controls import SizedPanel
+
+from pyut.general.SessionProfiler import ActionTiming
+from pyut.general.SessionProfiler import SessionProfiler
+
+DIALOG_WIDTH:        int = 700
+DIALOG_HEIGHT:       int = 450
+ACTION_COLUMN_WIDTH: int = 330
+NUMBER_COLUMN_WIDTH: int = 90
+
+
+class DlgProfilingSummary(SizedDialog):
+    """
+    Shows the time spent in the menu handlers, command submits and event handlers during
+    the current, or last, profiling session;  The slowest actions first
+    """
+    def __init__(self, parent: Window):
+
+        self.logger: Logger = getLogger(__name__)
+
+        ID: int = wxNewIdRef()
+
+        super().__init__(parent, ID, 'Profiling Summary', size=Size(DIALOG_WIDTH, DIALOG_HEIGHT), style=DEFAULT_DIALOG_STYLE | RESIZE_BORDER)
+
+        panel: SizedPanel = self.GetContentsPane()
+
+        panel.SetSizerType('vertical')
+
+        sessionProfiler: SessionProfiler = SessionProfiler()
+        status:          str             = 'Profiling is running' if sessionProfiler.running is True else 'Profiling is stopped'
+        StaticText(panel, ID_ANY, f'{status};  Results are written to {sessionProfiler.outputDirectory}')
+
+        self._actionList: ListCtrl = ListCtrl(panel, ID_ANY, style=LC_REPORT)
+        self._actionList.SetSizerProps(proportion=1, expand=True)
+
+        self._populateActionList(sessionProfiler=sessionProfiler)
+        self._layoutStandardOkButtonSizer()
+
+    def _layoutStandardOkButtonSizer(self):
+
+        buttSizer: StdDialogButtonSizer = self.CreateStdDialogButtonSizer(OK)
+
+        self.SetButtonSizer(buttSizer)
+        self.Bind(EVT_BUTTON, self._onOk, id=ID_OK)
+        self.Bind(EVT_CLOSE,  self._onOk)
+
+    # noinspection PyUnusedLocal
+    def _onOk(self, event: CommandEvent):
+        self.EndModal(OK)
+
+    def _populateActionList(self, sessionProfiler: SessionProfiler):
+
+        self._actionList.InsertColumn(0, 'Action',   width=ACTION_COLUMN_WIDTH)
+        self._actionList.InsertColumn(1, 'Count',    format=LIST_FORMAT_RIGHT, width=NUMBER_COLUMN_WIDTH)
+        self._actionList.InsertColumn(2, 'Mean ms',  format=LIST_FORMAT_RIGHT, width=NUMBER_COLUMN_WIDTH)
+        self._actionList.InsertColumn(3, 'Max ms',   format=LIST_FORMAT_RIGHT, width=NUMBER_COLUMN_WIDTH)
+        self._actionList.InsertColumn(4, 'Total ms', format=LIST_FORMAT_RIGHT, width=NUMBER_COLUMN_WIDTH)
+
+        actionTimings = sorted(sessionProfiler.actionTimings.items(), key=lambda item: item[1].totalSeconds, reverse=True)
+        for row, (actionName, actionTiming) in enumerate(actionTimings):
+            timing: ActionTiming = actionTiming
+
+            self._actionList.InsertItem(row, actionName)
+            self._actionList.SetItem(row, 1, str(timing.count))
+            self._actionList.SetItem(row, 2, f'{timing.meanSeconds * 1000:.3f}')
+            self._actionList.SetItem(row, 3, f'{timing.maxSeconds * 1000:.3f}')
+            self._actionList.SetItem(row, 4, f'{timing.totalSeconds * 1000:.3f}')
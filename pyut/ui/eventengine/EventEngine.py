@@ -2,13 +2,19 @@
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import NewType
 
 from logging import Logger
 from logging import getLogger
 
+from functools import partial
+
+from threading import local
+
 from pyutplugins.ExternalTypes import Points
 from wx import CommandEvent
+from wx import IsMainThread
 from wx import PostEvent
 from wx import PyEventBinder
 from wx import TreeItemId
@@ -27,9 +33,13 @@ from ogl.OglInterface2 import OglInterface2
 
 from pyutplugins.ExternalTypes import CurrentProjectCallback
 from pyutplugins.ExternalTypes import FrameInformationCallback
+from pyutplugins.ExternalTypes import FrameSizeCallback
+from pyutplugins.ExternalTypes import OglObjects
 
 from pyut.enums.DiagramType import DiagramType
 
+from pyut.general.SessionProfiler import SessionProfiler
+
 from pyut.preferences.PyutPreferences import PyutPreferences
 from pyut.ui.eventengine.Events import DarkModeChangedEvent
 from pyut.ui.eventengine.Events import ShowOrthogonalRoutingPointsEvent
@@ -39,16 +49,19 @@ from pyut.ui.eventengine.Events import ShowRulersEvent
 from pyut.ui.eventengine.eventinformation.MiniProjectInformation import MiniProjectInformation
 from pyut.ui.eventengine.eventinformation.ActiveProjectInformation import ActiveProjectInformation
 from pyut.ui.eventengine.eventinformation.NewProjectDiagramInformation import NewProjectDiagramInformation
+from pyut.ui.eventengine.eventinformation.ProjectLoadInformation import ProjectLoadInformation
 
 from pyut.ui.IPyutProject import IPyutProject
 
 from pyut.ui.eventengine.EventEngineDebugger import EventEngineDebugger
+from pyut.ui.eventengine.EventEngineDebugger import SEND_TIME_ATTRIBUTE
 
 from pyut.ui.eventengine.EventType import EventType
 
 from pyut.ui.eventengine.Events import AddOglDiagramEvent
 from pyut.ui.eventengine.Events import AddPyutDiagramEvent
 from pyut.ui.eventengine.Events import AddShapeEvent
+from pyut.ui.eventengine.Events import AddShapesEvent
 from pyut.ui.eventengine.Events import AssociateEditMenuEvent
 from pyut.ui.eventengine.Events import ClassNameChangedEvent
 from pyut.ui.eventengine.Events import CloseProjectEvent
@@ -63,12 +76,14 @@ from pyut.ui.eventengine.Events import EditTextEvent
 from pyut.ui.eventengine.Events import EditUseCaseEvent
 from pyut.ui.eventengine.Events import GetLollipopInterfacesEvent
 from pyut.ui.eventengine.Events import FrameInformationEvent
+from pyut.ui.eventengine.Events import FrameSizeEvent
 from pyut.ui.eventengine.Events import NewNamedProjectEvent
 from pyut.ui.eventengine.Events import NewProjectDiagramEvent
 from pyut.ui.eventengine.Events import NewProjectEvent
 from pyut.ui.eventengine.Events import OverrideProgramExitPositionEvent
 from pyut.ui.eventengine.Events import OverrideProgramExitSizeEvent
 from pyut.ui.eventengine.Events import PasteShapesEvent
+from pyut.ui.eventengine.Events import ProjectLoadedEvent
 from pyut.ui.eventengine.Events import RedoEvent
 from pyut.ui.eventengine.Events import RefreshFrameEvent
 from pyut.ui.eventengine.Events import RequestCurrentProjectEvent
@@ -96,18 +111,20 @@ from pyut.ui.eventengine.Events import UpdateTreeItemNameEvent
 
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 from pyut.ui.eventengine.inspector.EventEngineDiagnostics import EventEngineDiagnostics
+from pyut.ui.eventengine.inspector.EventMetrics import NOT_SAMPLED
 from pyut.ui.umlframes.OrthogonalRoutingDiagnosticMixin import IntegerList
 from pyut.ui.umlframes.OrthogonalRoutingDiagnosticMixin import Rectangle
 from pyut.ui.umlframes.OrthogonalRoutingDiagnosticMixin import Rectangles
 
-NEW_NAME_PARAMETER:     str = 'newName'
-DIAGRAM_TYPE_PARAMETER: str = 'diagramType'
-TREE_ITEM_ID_PARAMETER: str = 'treeItemId'
-SHAPE_TO_CUT_PARAMETER: str = 'shapeToCut'
-SHAPE_TO_ADD_PARAMETER: str = 'shapeToAdd'
-TOOL_ID_PARAMETER:      str = 'toolId'
-ACTION_PARAMETER:       str = 'action'
-NEW_FILENAME_PARAMETER: str = 'newFilename'
+NEW_NAME_PARAMETER:      str = 'newName'
+DIAGRAM_TYPE_PARAMETER:  str = 'diagramType'
+TREE_ITEM_ID_PARAMETER:  str = 'treeItemId'
+SHAPE_TO_CUT_PARAMETER:  str = 'shapeToCut'
+SHAPE_TO_ADD_PARAMETER:  str = 'shapeToAdd'
+SHAPES_TO_ADD_PARAMETER: str = 'shapesToAdd'
+TOOL_ID_PARAMETER:       str = 'toolId'
+ACTION_PARAMETER:        str = 'action'
+NEW_FILENAME_PARAMETER:  str = 'newFilename'
 
 IMPLEMENTOR_PARAMETER:         str = 'implementor'
 PYUT_INTERFACE_PARAMETER:      str = 'pyutInterface'
@@ -131,6 +148,7 @@ OGL_INTERFACE2_PARAMETER:            str = 'oglInterface2'
 
 PROJECT_FILENAME_PARAMETER:                str = INSERT_PROJECT_FILENAME_PARAMETER
 NEW_PROJECT_DIAGRAM_INFORMATION_PARAMETER: str = 'newProjectDiagramInformation'
+PROJECT_LOAD_INFORMATION_PARAMETER:        str = 'projectLoadInformation'
 
 OLD_CLASS_NAME_PARAMETER: str = 'oldClassName'
 NEW_CLASS_NAME_PARAMETER: str = 'newClassName'
@@ -151,6 +169,9 @@ NewNamedProjectCallback           = Callable[[IPyutProject], None]
 GetLollipopInterfacesCallback     = Callable[[PyutInterfaces], None]            # Figure out appropriate type for eventHandler
 
 EventEnumToType = NewType('EventEnumToType', Dict[EventType, CommandEvent])
+EventSender     = Callable[..., None]
+EventSenders    = NewType('EventSenders',  Dict[EventType, EventSender])
+QueryHandlers   = NewType('QueryHandlers', Dict[EventType, Callable])
 
 SimpleEvents: EventEnumToType = EventEnumToType({
     EventType.NewProject:         NewProjectEvent,
@@ -171,6 +192,20 @@ SimpleEvents: EventEnumToType = EventEnumToType({
     EventType.RefreshFrame:       RefreshFrameEvent,
 })
 
+QueryEvents: FrozenSet[EventType] = frozenset({
+    EventType.MiniProjectInformation,
+    EventType.ActiveUmlFrame,
+    EventType.ActiveProjectInformation,
+    EventType.GetLollipopInterfaces,
+    EventType.FrameInformation,
+    EventType.FrameSize,
+    EventType.SelectedOglObjects,
+    EventType.RequestCurrentProject,
+})
+"""
+Request/response events;  Their handlers only answer through the supplied callback
+"""
+
 
 class EventEngine(IEventEngine):
     """
@@ -192,7 +227,18 @@ class EventEngine(IEventEngine):
         self._logger:          Logger          = getLogger(__name__)
         self._preferences:     PyutPreferences = PyutPreferences()
 
-        self._eventEngineDebugger:    EventEngineDebugger    = EventEngineDebugger()
+        self._eventEngineDebugger: EventEngineDebugger = EventEngineDebugger(sampleRate=self._preferences.eventMetricsSampleRate)
+        self._metricsEnabled:      bool                = self._preferences.eventMetrics is True or self._preferences.debugEventEngine is True
+        self._sendTimes:           local               = local()
+        """
+        `.sendTime` is the send time of the event being sent;  Per thread, since the project loader thread also sends events
+        """
+
+        self._eventSenders:  EventSenders  = self._buildEventSenders()
+        self._queryHandlers: QueryHandlers = QueryHandlers({})
+        """
+        The handlers for query events;  Called directly instead of posted
+        """
 
     @property
     def eventEngineDiagnostics(self) -> EventEngineDiagnostics:
@@ -200,114 +246,118 @@ class EventEngine(IEventEngine):
 
     def registerListener(self, pyEventBinder: PyEventBinder, callback: Callable):
 
-        self._listeningWindow.Bind(pyEventBinder, callback)
+        eventType: EventType = EventType(pyEventBinder.typeId)
+        handler:   Callable  = callback
+        if self._metricsEnabled is True:
+            handler = self._eventEngineDebugger.timedHandler(eventType=eventType, callback=callback)
+        if self._preferences.profilingControl is True:
+            handler = SessionProfiler().timedCallback(actionName=f'Event {eventType.name}', callback=handler)
+
+        self._listeningWindow.Bind(pyEventBinder, handler)
+
+        if eventType in QueryEvents:
+            # Like wxPython, the most recently bound handler gets the event
+            self._queryHandlers[eventType] = handler
+
         if self._preferences.debugEventEngine is True:
             self._eventEngineDebugger.makeListenerEntry(callback, pyEventBinder)
 
     def sendEvent(self, eventType: EventType, **kwargs):
 
-        if self._preferences.debugEventEngine is True:
-            self._eventEngineDebugger.updateListenerStatistics(eventType=eventType)
-
-        match eventType:
-
-            case EventType.UpdateTreeItemName:
-                self._sendUpdateTreeItemNameEvent(**kwargs)
-            case EventType.UpdateApplicationTitle:
-                self._sendNewTitleEvent(**kwargs)
-            case EventType.UpdateApplicationStatus:
-                self._sendUpdateApplicationStatusEvent(**kwargs)
-            case EventType.NewNamedProject:
-                self._sendNewNamedProjectEvent(**kwargs)
-            case EventType.NewDiagram:
-                self._sendNewDiagramEvent(**kwargs)
-            case EventType.NewProjectDiagram:
-                self._sendNewProjectDiagramEvent(**kwargs)
-            case EventType.InsertProject:
-                self._sendInsertProjectEvent(**kwargs)
-            case EventType.OpenProject:
-                self._sendOpenProjectEvent(**kwargs)
-            case EventType.CutShape:
-                self._sendCutShapeEvent(**kwargs)
-            case EventType.AddShape:
-                self._sendAddShapeEvent(**kwargs)
-            case EventType.SelectTool:
-                self._sendSelectToolEvent(**kwargs)
-            case EventType.SetToolAction:
-                self._sendSetToolActionEvent(**kwargs)
-            case EventType.MiniProjectInformation:
-                self._sendMiniProjectInformationEvent(**kwargs)
-            case EventType.ActiveUmlFrame:
-                self._sendGetActiveUmlFrameEvent(**kwargs)
-            case EventType.ActiveProjectInformation:
-                self._sendActiveProjectInformationEvent(**kwargs)
-            case EventType.EditClass:
-                self._sendEditClassEvent(**kwargs)
-            case EventType.EditNote:
-                self._sendEditNoteEvent(**kwargs)
-            case EventType.EditText:
-                self._sendEditTextEvent(**kwargs)
-            case EventType.EditActor:
-                self._sendEditActorEvent(**kwargs)
-            case EventType.EditUseCase:
-                self._sendEditUseCaseEvent(**kwargs)
-            case EventType.EditInterface:
-                self._sendEditInterfaceEvent(**kwargs)
-
-            case EventType.FrameInformation:
-                self._sendFrameInformationEvent(**kwargs)
-            case EventType.SelectedOglObjects:
-                self._sendSelectedOglObjectsEvent(**kwargs)
-            case EventType.UpdateRecentProjects:
-                self._sendUpdateRecentProjectEvent(**kwargs)
-
-            case EventType.UpdateEditMenu:
-                self._sendUpdateEditMenuEvent(**kwargs)
-            case EventType.AssociateEditMenu:
-                self._sendAssociateEditMenuEvent(**kwargs)
-
-            case EventType.RequestCurrentProject:
-                self._sendRequestCurrentProjectEvent(**kwargs)
-            case EventType.ClassNameChanged:
-                self._sendClassNameChangedEvent(**kwargs)
-
-            case EventType.OverrideProgramExitPosition:
-                self._sendOverrideProgramExitPositionEvent(**kwargs)
-
-            case EventType.OverrideProgramExitSize:
-                self._sendOverrideProgramExitSizeEvent(**kwargs)
-
-            case EventType.DarkModeChanged:
-                self._sendDarkModChangedEvent(**kwargs)
-
-            case EventType.GetLollipopInterfaces:
-                self._sendGetLollipopInterfacesEvent(**kwargs)
-
-            case EventType.ShowOrthogonalRoutingPoints:
-                self._sendShowOrthogonalRoutingPointsEvent(**kwargs)
-
-            case EventType.ShowRouteGrid:
-                self._sendShowRouteGridEvent(**kwargs)
-
-            case EventType.ShowRulers:
-                self._sendShowRulersEvent(**kwargs)
-
-            case EventType.NewProject | EventType.DeleteDiagram | EventType.CloseProject | EventType.SaveProject | EventType.SaveProjectAs | \
-                    EventType.UMLDiagramModified | EventType.SelectAllShapes | EventType.DeSelectAllShapes | \
-                    EventType.CopyShapes | EventType.PasteShapes | EventType.Undo | EventType.Redo | EventType.CutShapes | \
-                    EventType.AddOglDiagram | EventType.AddPyutDiagram | EventType.RefreshFrame:
-                self._simpleSendEvent(eventType=eventType)
-            case _:
-                assert False, f'Unknown event type: `{eventType}`'
-
-    def _simpleSendEvent(self, eventType: EventType):
-
         try:
-            eventClazz = SimpleEvents[eventType]
-            event = eventClazz()
-            PostEvent(dest=self._listeningWindow, event=event)
-        except KeyError:
-            self._logger.error(f'Unhandled event type: {eventType.value}')
+            sender: EventSender = self._eventSenders[eventType]
+        except KeyError as e:
+            raise ValueError(f'Unknown event type: `{eventType}`') from e
+
+        if self._metricsEnabled is True:
+            self._sendTimes.sendTime = self._eventEngineDebugger.eventSent(eventType=eventType)
+
+        sender(**kwargs)
+
+    def _buildEventSenders(self) -> EventSenders:
+        """
+        Built once so that sending an event is a single dictionary lookup
+
+        Returns:  The event type to send method table
+        """
+        eventSenders: EventSenders = EventSenders({
+            EventType.UpdateTreeItemName:          self._sendUpdateTreeItemNameEvent,
+            EventType.UpdateApplicationTitle:      self._sendNewTitleEvent,
+            EventType.UpdateApplicationStatus:     self._sendUpdateApplicationStatusEvent,
+            EventType.NewNamedProject:             self._sendNewNamedProjectEvent,
+            EventType.NewDiagram:                  self._sendNewDiagramEvent,
+            EventType.NewProjectDiagram:           self._sendNewProjectDiagramEvent,
+            EventType.InsertProject:               self._sendInsertProjectEvent,
+            EventType.OpenProject:                 self._sendOpenProjectEvent,
+            EventType.ProjectLoaded:               self._sendProjectLoadedEvent,
+            EventType.CutShape:                    self._sendCutShapeEvent,
+            EventType.AddShape:                    self._sendAddShapeEvent,
+            EventType.AddShapes:                   self._sendAddShapesEvent,
+            EventType.SelectTool:                  self._sendSelectToolEvent,
+            EventType.SetToolAction:               self._sendSetToolActionEvent,
+            EventType.MiniProjectInformation:      self._sendMiniProjectInformationEvent,
+            EventType.ActiveUmlFrame:              self._sendGetActiveUmlFrameEvent,
+            EventType.ActiveProjectInformation:    self._sendActiveProjectInformationEvent,
+            EventType.EditClass:                   self._sendEditClassEvent,
+            EventType.EditNote:                    self._sendEditNoteEvent,
+            EventType.EditText:                    self._sendEditTextEvent,
+            EventType.EditActor:                   self._sendEditActorEvent,
+            EventType.EditUseCase:                 self._sendEditUseCaseEvent,
+            EventType.EditInterface:               self._sendEditInterfaceEvent,
+            EventType.FrameInformation:            self._sendFrameInformationEvent,
+            EventType.FrameSize:                   self._sendFrameSizeEvent,
+            EventType.SelectedOglObjects:          self._sendSelectedOglObjectsEvent,
+            EventType.UpdateRecentProjects:        self._sendUpdateRecentProjectEvent,
+            EventType.UpdateEditMenu:              self._sendUpdateEditMenuEvent,
+            EventType.AssociateEditMenu:           self._sendAssociateEditMenuEvent,
+            EventType.RequestCurrentProject:       self._sendRequestCurrentProjectEvent,
+            EventType.ClassNameChanged:            self._sendClassNameChangedEvent,
+            EventType.OverrideProgramExitPosition: self._sendOverrideProgramExitPositionEvent,
+            EventType.OverrideProgramExitSize:     self._sendOverrideProgramExitSizeEvent,
+            EventType.DarkModeChanged:             self._sendDarkModChangedEvent,
+            EventType.GetLollipopInterfaces:       self._sendGetLollipopInterfacesEvent,
+            EventType.ShowOrthogonalRoutingPoints: self._sendShowOrthogonalRoutingPointsEvent,
+            EventType.ShowRouteGrid:               self._sendShowRouteGridEvent,
+            EventType.ShowRulers:                  self._sendShowRulersEvent,
+        })
+        for eventType, eventClazz in SimpleEvents.items():
+            eventSenders[eventType] = partial(self._simpleSendEvent, eventClazz)
+
+        return eventSenders
+
+    def _simpleSendEvent(self, eventClazz: type):
+
+        self._postEvent(event=eventClazz())
+
+    def _postEvent(self, event: CommandEvent):
+
+        self._stampEvent(event=event)
+        PostEvent(dest=self._listeningWindow, event=event)
+
+    def _stampEvent(self, event: CommandEvent):
+        """
+        Sampled events carry their send time so the listener can measure the dispatch latency
+        """
+        sendTime: float = getattr(self._sendTimes, 'sendTime', NOT_SAMPLED)
+        if sendTime != NOT_SAMPLED:
+            setattr(event, SEND_TIME_ATTRIBUTE, sendTime)
+
+    def _deliverQueryEvent(self, eventType: EventType, event: CommandEvent):
+        """
+        A query event only asks the handler to invoke a callback.  On the UI thread call
+        the handler directly so the callback runs before `sendEvent` returns;  Callers no
+        longer need to yield to get their answer.  Otherwise, post it like any other event
+
+        Args:
+            eventType:  The query event type
+            event:      The event to deliver
+        """
+        handler: Callable | None = self._queryHandlers.get(eventType, None)
+        if handler is not None and IsMainThread() is True:
+            self._stampEvent(event=event)
+            handler(event)
+        else:
+            self._postEvent(event=event)
 
     def _sendUpdateTreeItemNameEvent(self, **kwargs):
 
@@ -315,7 +365,7 @@ class EventEngine(IEventEngine):
         treeItemId: TreeItemId = kwargs[TREE_ITEM_ID_PARAMETER]
 
         eventToPost: UpdateTreeItemNameEvent = UpdateTreeItemNameEvent(newName=newName, treeItemId=treeItemId)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendNewTitleEvent(self, **kwargs):
         newFilename:            str   = kwargs[NEW_FILENAME_PARAMETER]
@@ -324,130 +374,150 @@ class EventEngine(IEventEngine):
         eventToPost: UpdateApplicationTitleEvent = UpdateApplicationTitleEvent(newFilename=newFilename,
                                                                                currentFrameZoomFactor=currentFrameZoomFactor,
                                                                                projectModified=projectModified)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendUpdateApplicationStatusEvent(self, **kwargs):
         newMessage: str = kwargs[APPLICATION_STATUS_MSG_PARAMETER]
 
         eventToPost: UpdateApplicationStatusEvent = UpdateApplicationStatusEvent(applicationStatusMsg=newMessage)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendInsertProjectEvent(self, **kwargs):
         projectFilename: str = kwargs[INSERT_PROJECT_FILENAME_PARAMETER]
         eventToPost: InsertProjectEvent = InsertProjectEvent(projectFilename=projectFilename)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendOpenProjectEvent(self, **kwargs):
         projectFilename: str = kwargs[OPEN_PROJECT_FILENAME_PARAMETER]
         eventToPost: OpenProjectEvent = OpenProjectEvent(projectFilename=projectFilename)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
+
+    def _sendProjectLoadedEvent(self, **kwargs):
+        """
+        Safe to call from the background loader thread;  PostEvent queues the event
+        for the UI thread
+        """
+        info:        ProjectLoadInformation = kwargs[PROJECT_LOAD_INFORMATION_PARAMETER]
+        eventToPost: ProjectLoadedEvent     = ProjectLoadedEvent(projectLoadInformation=info)
+        self._postEvent(event=eventToPost)
 
     def _sendNewNamedProjectEvent(self, **kwargs):
         projectFilename: str                     = kwargs[NEW_PROJECT_FROM_FILENAME_PARAMETER]
         callback:        NewNamedProjectCallback = kwargs[CALLBACK_PARAMETER]
         eventToPost:     NewNamedProjectEvent    = NewNamedProjectEvent(projectFilename=projectFilename, callback=callback)
 
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendNewProjectDiagramEvent(self, **kwargs):
         info: NewProjectDiagramInformation = kwargs[NEW_PROJECT_DIAGRAM_INFORMATION_PARAMETER]
         eventToPost: NewProjectDiagramEvent = NewProjectDiagramEvent(newProjectDiagramInformation=info)
 
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendNewDiagramEvent(self, **kwargs):
 
         diagramType: DiagramType = kwargs[DIAGRAM_TYPE_PARAMETER]
         eventToPost: NewDiagramEvent = NewDiagramEvent(diagramType=diagramType)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendCutShapeEvent(self, **kwargs):
         shapeToCut: OglObject = kwargs[SHAPE_TO_CUT_PARAMETER]
         eventToPost: CutShapeEvent = CutShapeEvent(shapeToCut=shapeToCut)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendAddShapeEvent(self, **kwargs):
         shapeToAdd: OglObject = kwargs[SHAPE_TO_ADD_PARAMETER]
         eventToPost: AddShapeEvent = AddShapeEvent(shapeToAdd=shapeToAdd)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
+
+    def _sendAddShapesEvent(self, **kwargs):
+        shapesToAdd: OglObjects = kwargs[SHAPES_TO_ADD_PARAMETER]
+        eventToPost: AddShapesEvent = AddShapesEvent(shapesToAdd=shapesToAdd)
+        self._postEvent(event=eventToPost)
 
     def _sendSelectToolEvent(self, **kwargs):
 
         toolId: int = kwargs[TOOL_ID_PARAMETER]
         eventToPost: SelectToolEvent = SelectToolEvent(toolId=toolId)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendSetToolActionEvent(self, **kwargs):
         action: int = kwargs[ACTION_PARAMETER]
         eventToPost: SetToolActionEvent = SetToolActionEvent(action=action)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendMiniProjectInformationEvent(self, **kwargs):
 
         cb:          MiniProjectInformationCallback = kwargs[CALLBACK_PARAMETER]
         eventToPost: MiniProjectInformationEvent = MiniProjectInformationEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.MiniProjectInformation, event=eventToPost)
 
     def _sendGetActiveUmlFrameEvent(self, **kwargs):
 
         cb:          ActiveUmlFrameCallback = kwargs[CALLBACK_PARAMETER]
         eventToPost: ActiveUmlFrameEvent = ActiveUmlFrameEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.ActiveUmlFrame, event=eventToPost)
 
     def _sendActiveProjectInformationEvent(self, **kwargs):
 
         cb:          ActiveUmlFrameCallback         = kwargs[CALLBACK_PARAMETER]
         eventToPost: ActiveProjectInformationEvent = ActiveProjectInformationEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.ActiveProjectInformation, event=eventToPost)
 
     def _sendEditClassEvent(self, **kwargs):
         pyutClass:   PyutClass      = kwargs[PYUT_CLASS_PARAMETER]
         eventToPost: EditClassEvent = EditClassEvent(pyutClass=pyutClass)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendEditNoteEvent(self, **kwargs):
         pyutNote:    PyutNote      = kwargs[PYUT_NOTE_PARAMETER]
         eventToPost: EditNoteEvent = EditNoteEvent(pyutNote=pyutNote)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendEditTextEvent(self, **kwargs):
         pyutText:    PyutText      = kwargs[PYUT_TEXT_PARAMETER]
         eventToPost: EditTextEvent = EditTextEvent(pyutText=pyutText)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendEditActorEvent(self, **kwargs):
         pyutActor: PyutActor       = kwargs[PYUT_ACTOR_PARAMETER]
         eventToPost: EditActorEvent = EditActorEvent(pyutActor=pyutActor)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendEditUseCaseEvent(self, **kwargs):
         pyutUseCase: PyutUseCase     = kwargs[PYUT_USE_CASE_PARAMETER]
         eventToPost: EditUseCaseEvent = EditUseCaseEvent(pyutUseCase=pyutUseCase)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendEditInterfaceEvent(self, **kwargs):
 
         oglInterface2: OglInterface2      = kwargs[OGL_INTERFACE2_PARAMETER]
         implementor:   OglClass           = kwargs[IMPLEMENTOR_PARAMETER]
         eventToPost:   EditInterfaceEvent = EditInterfaceEvent(oglInterface2=oglInterface2, implementor=implementor)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendFrameInformationEvent(self, **kwargs):
 
         cb: FrameInformationCallback = kwargs[CALLBACK_PARAMETER]
         eventToPost: FrameInformationEvent = FrameInformationEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.FrameInformation, event=eventToPost)
+
+    def _sendFrameSizeEvent(self, **kwargs):
+
+        cb: FrameSizeCallback = kwargs[CALLBACK_PARAMETER]
+        eventToPost: FrameSizeEvent = FrameSizeEvent(callback=cb)
+        self._deliverQueryEvent(eventType=EventType.FrameSize, event=eventToPost)
 
     def _sendSelectedOglObjectsEvent(self, **kwargs):
 
         cb: FrameInformationCallback = kwargs[CALLBACK_PARAMETER]
         eventToPost: SelectedOglObjectsEvent = SelectedOglObjectsEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.SelectedOglObjects, event=eventToPost)
 
     def _sendUpdateRecentProjectEvent(self, **kwargs):
         projectFilename: str = kwargs[PROJECT_FILENAME_PARAMETER]
         eventToPost: UpdateRecentProjectsEvent = UpdateRecentProjectsEvent(projectFilename=projectFilename)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendUpdateEditMenuEvent(self, **kwargs):
 
@@ -455,7 +525,7 @@ class EventEngine(IEventEngine):
 
         commandProcessor: CommandProcessor    = kwargs[COMMAND_PROCESSOR_PARAMETER]
         eventToPost:      UpdateEditMenuEvent = UpdateEditMenuEvent(commandProcessor=commandProcessor)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendAssociateEditMenuEvent(self, **kwargs):
 
@@ -463,40 +533,40 @@ class EventEngine(IEventEngine):
 
         commandProcessor: CommandProcessor       = kwargs[COMMAND_PROCESSOR_PARAMETER]
         eventToPost:      AssociateEditMenuEvent = AssociateEditMenuEvent(commandProcessor=commandProcessor)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendClassNameChangedEvent(self, **kwargs):
         oldClassName: str = kwargs[OLD_CLASS_NAME_PARAMETER]
         newClassName: str = kwargs[NEW_CLASS_NAME_PARAMETER]
         eventToPost: ClassNameChangedEvent = ClassNameChangedEvent(oldClassName=oldClassName, newClassName=newClassName)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendGetLollipopInterfacesEvent(self, **kwargs):
 
         cb: GetLollipopInterfacesCallback = kwargs[CALLBACK_PARAMETER]
 
         event: GetLollipopInterfacesEvent = GetLollipopInterfacesEvent(callback=cb)
-        PostEvent(dest=self._listeningWindow, event=event)
+        self._deliverQueryEvent(eventType=EventType.GetLollipopInterfaces, event=event)
 
     def _sendRequestCurrentProjectEvent(self, **kwargs):
         callback:    CurrentProjectCallback     = kwargs[CALLBACK_PARAMETER]
         eventToPost: RequestCurrentProjectEvent = RequestCurrentProjectEvent(callback=callback)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._deliverQueryEvent(eventType=EventType.RequestCurrentProject, event=eventToPost)
 
     def _sendOverrideProgramExitPositionEvent(self, **kwargs):
         value:       bool = kwargs[OVERRIDE_PARAMETER]
         eventToPost: OverrideProgramExitPositionEvent = OverrideProgramExitPositionEvent(override=value)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendOverrideProgramExitSizeEvent(self, **kwargs):
         value:       bool = kwargs[OVERRIDE_PARAMETER]
         eventToPost: OverrideProgramExitSizeEvent = OverrideProgramExitSizeEvent(override=value)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendDarkModChangedEvent(self, **kwargs):
         value:       bool                 = kwargs[DARK_MODE_PARAMETER]
         eventToPost: DarkModeChangedEvent = DarkModeChangedEvent(darkMode=value)
-        PostEvent(dest=self._listeningWindow, event=eventToPost)
+        self._postEvent(event=eventToPost)
 
     def _sendShowOrthogonalRoutingPointsEvent(self, **kwargs):
 
@@ -505,7 +575,7 @@ class EventEngine(IEventEngine):
 
         event:  ShowOrthogonalRoutingPointsEvent = ShowOrthogonalRoutingPointsEvent(points=points, show=show)
 
-        PostEvent(dest=self._listeningWindow, event=event)
+        self._postEvent(event=event)
 
     def _sendShowRulersEvent(self, **kwargs):
 
@@ -519,7 +589,7 @@ class EventEngine(IEventEngine):
                                                   diagramBounds=diagramBounds,
                                                   show=show)
 
-        PostEvent(dest=self._listeningWindow, event=event)
+        self._postEvent(event=event)
 
     def _sendShowRouteGridEvent(self, **kwargs):
 
@@ -528,4 +598,4 @@ class EventEngine(IEventEngine):
 
         event: ShowRouteGridEvent = ShowRouteGridEvent(routeGrid=routeGrid, show=show)
 
-        PostEvent(dest=self._listeningWindow, event=event)
+        self._postEvent(event=event)
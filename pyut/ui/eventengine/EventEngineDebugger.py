@@ -2,18 +2,16 @@
 from logging import Logger
 from logging import getLogger
 from typing import Callable
-from typing import cast
+
+from time import perf_counter
 
 from wx import PyEventBinder
 
 from pyut.ui.eventengine.EventType import EventType
 
 from pyut.ui.eventengine.inspector.EventEngineDiagnostics import EventEngineDiagnostics
-from pyut.ui.eventengine.inspector.EventSender import EventSender
-from pyut.ui.eventengine.inspector.EventSender import EventSenders
-from pyut.ui.eventengine.inspector.EventSender import EventSendersMap
-from pyut.ui.eventengine.inspector.EventSender import SenderName
-from pyut.ui.eventengine.inspector.Inspector import Inspector
+from pyut.ui.eventengine.inspector.EventMetrics import EventMetrics
+from pyut.ui.eventengine.inspector.EventMetrics import NOT_SAMPLED
 from pyut.ui.eventengine.inspector.RegisteredListener import EventHandler
 from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredBy
 from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredListener
@@ -22,15 +20,26 @@ from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredListeners
 
 INSPECTOR_SKIP_DEPTH: int = 3
 
+SEND_TIME_ATTRIBUTE: str = 'metricsSendTime'
+"""
+Sampled events carry their send time in this attribute
+"""
+
 
 class EventEngineDebugger:
     """
-    Isolate this code outside the event engine
+    Isolate this code outside the event engine.  Listener registration is rare, so it
+    can afford to inspect the stack;  The per event path only updates the O(1) metrics
     """
-    def __init__(self):
+    def __init__(self, sampleRate: int = 1):
+        """
+
+        Args:
+            sampleRate:  Time one in this many events
+        """
         self._logger: Logger = getLogger(__name__)
 
-        self._eventEngineDiagnostics: EventEngineDiagnostics = EventEngineDiagnostics()
+        self._eventEngineDiagnostics: EventEngineDiagnostics = EventEngineDiagnostics(eventMetrics=EventMetrics(sampleRate=sampleRate))
 
     @property
     def eventEngineDiagnostics(self) -> EventEngineDiagnostics:
@@ -74,30 +83,38 @@ class EventEngineDebugger:
 
         # self._logger.debug(f'{self._eventEngineDiagnostics}')
 
-    def updateListenerStatistics(self, eventType: EventType):
-
-        senderName: SenderName = SenderName(Inspector.getCallerName(skip=INSPECTOR_SKIP_DEPTH))
-
-        eventSendersMap: EventSendersMap = self._eventEngineDiagnostics.eventSendersMap
-
-        # find the senders of a specific event
-        if eventType in eventSendersMap:
-            eventSenders:  EventSenders = eventSendersMap[eventType]
-        else:
-            eventSenders = EventSenders([])
+    def eventSent(self, eventType: EventType) -> float:
+        """
+        Args:
+            eventType:  The event being sent
 
-        foundSender: EventSender = cast(EventSender, None)
+        Returns:  The send time if the event is sampled, else NOT_SAMPLED
+        """
+        return self._eventEngineDiagnostics.eventMetrics.eventSent(eventType=eventType)
 
-        for sender in eventSenders:
-            eventSender: EventSender = cast(EventSender, sender)
-            if eventSender.senderName == senderName:
-                foundSender = eventSender
-                break
+    def timedHandler(self, eventType: EventType, callback: Callable) -> Callable:
+        """
+        Wrap a listener so that sampled events record their dispatch latency and the
+        handler execution time
 
-        if foundSender is None:
-            newSender: EventSender = EventSender(senderName=senderName, callCount=1)
-            eventSendersMap[eventType] = EventSenders([newSender])
-        else:
-            foundSender.callCount += 1
+        Args:
+            eventType:  The event the listener handles
+            callback:   The listener
 
-        self._logger.debug(f'{eventSendersMap=}')
+        Returns:  The wrapped listener
+        """
+        eventMetrics: EventMetrics = self._eventEngineDiagnostics.eventMetrics
+
+        def timedCallback(event):
+            sendTime: float = getattr(event, SEND_TIME_ATTRIBUTE, NOT_SAMPLED)
+            if sendTime == NOT_SAMPLED:
+                callback(event)
+            else:
+                startTime: float = perf_counter()
+                eventMetrics.recordDispatch(eventType=eventType, seconds=startTime - sendTime)
+                try:
+                    callback(event)
+                finally:
+                    eventMetrics.recordHandler(eventType=eventType, seconds=perf_counter() - startTime)
+
+        return timedCallback
@@ -6,6 +6,7 @@ from pyut.ui.eventengine.Events import EVENT_ACTIVE_UML_FRAME
 from pyut.ui.eventengine.Events import EVENT_ADD_OGL_DIAGRAM
 from pyut.ui.eventengine.Events import EVENT_ADD_PYUT_DIAGRAM
 from pyut.ui.eventengine.Events import EVENT_ADD_SHAPE
+from pyut.ui.eventengine.Events import EVENT_ADD_SHAPES
 from pyut.ui.eventengine.Events import EVENT_ASSOCIATE_EDIT_MENU
 from pyut.ui.eventengine.Events import EVENT_CLASS_NAME_CHANGED
 from pyut.ui.eventengine.Events import EVENT_CLOSE_PROJECT
@@ -36,6 +37,7 @@ from pyut.ui.eventengine.Events import EVENT_OPEN_PROJECT
 from pyut.ui.eventengine.Events import EVENT_OVERRIDE_PROGRAM_EXIT_POSITION
 from pyut.ui.eventengine.Events import EVENT_OVERRIDE_PROGRAM_EXIT_SIZE
 from pyut.ui.eventengine.Events import EVENT_PASTE_SHAPES
+from pyut.ui.eventengine.Events import EVENT_PROJECT_LOADED
 from pyut.ui.eventengine.Events import EVENT_REDO
 from pyut.ui.eventengine.Events import EVENT_REFRESH_FRAME
 from pyut.ui.eventengine.Events import EVENT_REQUEST_CURRENT_PROJECT
@@ -87,6 +89,11 @@ class EventType(Enum):
         parameter:
             projectFilename:  The fully qualified filename
 
+    ProjectLoadedEvent
+        Sent by the background project loader when it finishes reading a project file
+        parameter:
+            projectLoadInformation:  ProjectLoadInformation
+
     NewDiagramEvent
         Creates a new diagram on the current project
         parameter:
@@ -127,6 +134,11 @@ class EventType(Enum):
         parameter:
             oglObject      The Ogl document to place on the UML UmlFrame
 
+    AddShapesEvent
+        Adds many shapes on the UI in a single batch
+        parameter:
+            shapesToAdd    The Ogl objects to place on the UML UmlFrame
+
     SelectToolEvent
         Use to select tools in the toolbar as a visual-aid to the end-user/developer
         parameter:
@@ -187,6 +199,7 @@ class EventType(Enum):
     NewProjectDiagram           = EVENT_NEW_PROJECT_DIAGRAM.typeId
     DeleteDiagram               = EVENT_DELETE_DIAGRAM.typeId
     OpenProject                 = EVENT_OPEN_PROJECT.typeId
+    ProjectLoaded               = EVENT_PROJECT_LOADED.typeId
     InsertProject               = EVENT_INSERT_PROJECT.typeId
     SaveProject                 = EVENT_SAVE_PROJECT.typeId
     SaveProjectAs               = EVENT_SAVE_PROJECT_AS.typeId
@@ -199,6 +212,7 @@ class EventType(Enum):
     SelectAllShapes             = EVENT_SELECT_ALL_SHAPES.typeId
     DeSelectAllShapes           = EVENT_DESELECT_ALL_SHAPES.typeId
     AddShape                    = EVENT_ADD_SHAPE.typeId
+    AddShapes                   = EVENT_ADD_SHAPES.typeId
     CopyShapes                  = EVENT_COPY_SHAPES.typeId
     PasteShapes                 = EVENT_PASTE_SHAPES.typeId
     CutShapes                   = EVENT_CUT_SHAPES.typeId
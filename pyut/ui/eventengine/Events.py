@@ -10,6 +10,7 @@ NewDiagramEvent,               EVENT_NEW_DIAGRAM                = NewEvent()
 NewProjectDiagramEvent,        EVENT_NEW_PROJECT_DIAGRAM        = NewEvent()
 DeleteDiagramEvent,            EVENT_DELETE_DIAGRAM             = NewEvent()
 OpenProjectEvent,              EVENT_OPEN_PROJECT               = NewEvent()
+ProjectLoadedEvent,            EVENT_PROJECT_LOADED             = NewEvent()
 InsertProjectEvent,            EVENT_INSERT_PROJECT             = NewEvent()
 SaveProjectEvent,              EVENT_SAVE_PROJECT               = NewEvent()
 SaveProjectAsEvent,            EVENT_SAVE_PROJECT_AS            = NewEvent()
@@ -22,6 +23,7 @@ UpdateRecentProjectsEvent,     EVENT_UPDATE_RECENT_PROJECTS     = NewEvent()
 SelectAllShapesEvent,          EVENT_SELECT_ALL_SHAPES          = NewEvent()
 DeSelectAllShapesEvent,        EVENT_DESELECT_ALL_SHAPES        = NewEvent()
 AddShapeEvent,                 EVENT_ADD_SHAPE                  = NewEvent()
+AddShapesEvent,                EVENT_ADD_SHAPES                 = NewEvent()
 CopyShapesEvent,               EVENT_COPY_SHAPES                = NewEvent()
 PasteShapesEvent,              EVENT_PASTE_SHAPES               = NewEvent()
 CutShapesEvent,                EVENT_CUT_SHAPES                 = NewEvent()
@@ -0,0 +1,25 @@
+
+from typing import cast
+
+from dataclasses import dataclass
+
+from pyut.general.ProjectReader import ProjectXml
+
+from pyut.ui.IPyutProject import IPyutProject
+
+
+@dataclass
+class ProjectLoadInformation:
+    """
+    The result of reading a project on the background loader thread
+    """
+    pyutProject:   IPyutProject     = cast(IPyutProject, None)
+    projectXml:    ProjectXml       = cast(ProjectXml, None)
+    """
+    The parsed project;  The UI thread creates the Ogl objects from it
+    """
+    loadException: Exception | None = None
+    """
+    Set if the reader raised an exception;  The UI thread classifies it
+    """
+    cancelled:     bool             = False
@@ -4,6 +4,8 @@ from logging import getLogger
 from typing import cast
 
 from wx import CANCEL
+from wx import FD_OVERWRITE_PROMPT
+from wx import FD_SAVE
 from wx import DEFAULT_DIALOG_STYLE
 from wx import EVT_CLOSE
 from wx import EVT_BUTTON
@@ -12,7 +14,9 @@ from wx import ID_CANCEL
 from wx import ID_OK
 from wx import OK
 
+from wx import Button
 from wx import CommandEvent
+from wx import FileDialog
 from wx import RESIZE_BORDER
 from wx import SUNKEN_BORDER
 from wx import Size
@@ -32,8 +36,8 @@ from wx.lib.sized_controls import SizedPanel
 
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 from pyut.ui.eventengine.inspector.EventEngineDiagnostics import EventEngineDiagnostics
-from pyut.ui.eventengine.inspector.EventSender import EventSenders
-from pyut.ui.eventengine.inspector.EventSender import EventSendersMap
+from pyut.ui.eventengine.inspector.EventMetrics import EventMetrics
+from pyut.ui.eventengine.inspector.EventMetrics import LatencyHistogram
 from pyut.ui.eventengine.inspector.Inspector import Inspector
 from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredListener
 from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredListenerMap
@@ -43,7 +47,8 @@ DIALOG_WIDTH:                int = 950
 DIALOG_HEIGHT:               int = 600
 EVENT_TYPE_COLUMN_WIDTH:     int = 250
 EVENT_HANDLER_COLUMN_WIDTH:  int = 200
-SENDER_COLUMN_WIDTH:         int = 200
+COUNT_COLUMN_WIDTH:          int = 60
+TIMING_COLUMN_WIDTH:         int = 200
 
 
 class DlgEventEngineDialog(SizedDialog):
@@ -66,6 +71,9 @@ class DlgEventEngineDialog(SizedDialog):
 
         self._tree.SetSizerProps(proportion=1, expand=True)
 
+        exportButton: Button = Button(panel, label='Export Metrics...')
+        self.Bind(EVT_BUTTON, self._onExport, exportButton)
+
         self._populateTree()
         self._layoutStandardOkCancelButtonSizer()
 
@@ -100,16 +108,17 @@ class DlgEventEngineDialog(SizedDialog):
 
         self._tree.AddColumn('',              width=EVENT_TYPE_COLUMN_WIDTH)
         self._tree.AddColumn('Event Handler', width=EVENT_HANDLER_COLUMN_WIDTH)
-        self._tree.AddColumn('Sender Name',   width=SENDER_COLUMN_WIDTH)
-        self._tree.AddColumn('Call Count')
+        self._tree.AddColumn('Sent',          width=COUNT_COLUMN_WIDTH)
+        self._tree.AddColumn('Dispatch mean / p95 / max ms', width=TIMING_COLUMN_WIDTH)
+        self._tree.AddColumn('Handler mean / p95 / max ms',  width=TIMING_COLUMN_WIDTH)
         self._tree.SetMainColumn(0)
 
         self._tree.root = self._tree.AddRoot("Event Engine")
 
         listenerItem: TreeListItem = self._tree.AppendItem(self._tree.root, 'Listeners')
-        senderItem:   TreeListItem = self._tree.AppendItem(self._tree.root, 'Senders')
+        metricsItem:  TreeListItem = self._tree.AppendItem(self._tree.root, 'Metrics')
         self._createListenerSubTree(listenerItem=listenerItem)
-        self._createSenderSubTree(senderItem=senderItem)
+        self._createMetricsSubTree(metricsItem=metricsItem)
 
         # self._tree.ExpandAllChildren(self._tree.root)
         self._tree.Toggle(self._tree.root)
@@ -132,17 +141,28 @@ class DlgEventEngineDialog(SizedDialog):
 
         self._tree.Toggle(listenerItem)
 
-    def _createSenderSubTree(self, senderItem: TreeListItem):
+    def _createMetricsSubTree(self, metricsItem: TreeListItem):
+
+        diagnostics:  EventEngineDiagnostics = self._eventEngine.eventEngineDiagnostics
+        eventMetrics: EventMetrics           = diagnostics.eventMetrics
+
+        for eventType, eventTypeMetrics in sorted(eventMetrics.metrics.items(), key=lambda item: item[0].name):
+            item: TreeListItem = self._tree.AppendItem(metricsItem, eventType.name)
 
-        diagnostics:     EventEngineDiagnostics = self._eventEngine.eventEngineDiagnostics
-        eventSendersMap: EventSendersMap        = diagnostics.eventSendersMap
+            self._tree.SetItemText(item, str(eventTypeMetrics.sentCount), 2)
+            self._tree.SetItemText(item, self._formatHistogram(eventTypeMetrics.dispatch), 3)
+            self._tree.SetItemText(item, self._formatHistogram(eventTypeMetrics.handler), 4)
 
-        for eventType in eventSendersMap:
-            item:         TreeListItem = self._tree.AppendItem(senderItem, eventType.name)
-            eventSenders: EventSenders = eventSendersMap[eventType]
+    def _formatHistogram(self, histogram: LatencyHistogram) -> str:
 
-            for eventSender in eventSenders:
-                trimmedName: str = Inspector.justClassMethodName(eventSender.senderName)
+        if histogram.count == 0:
+            return ''
+
+        return f'{histogram.meanSeconds * 1000:.3f} / {histogram.percentileSeconds(0.95) * 1000:.3f} / {histogram.maxSeconds * 1000:.3f}'
+
+    # noinspection PyUnusedLocal
+    def _onExport(self, event: CommandEvent):
 
-                self._tree.SetItemText(item, trimmedName, 2)
-                self._tree.SetItemText(item, str(eventSender.callCount), 3)
+        with FileDialog(self, 'Export Event Metrics', wildcard='JSON (*.json)|*.json', style=FD_SAVE | FD_OVERWRITE_PROMPT) as dlg:
+            if dlg.ShowModal() == ID_OK:
+                self._eventEngine.eventEngineDiagnostics.eventMetrics.dump(fqFileName=dlg.GetPath())
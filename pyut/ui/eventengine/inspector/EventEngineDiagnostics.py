@@ -1,10 +1,8 @@
 
-
 from dataclasses import dataclass
 from dataclasses import field
 
-from pyut.ui.eventengine.inspector.EventSender import EventSendersMap
-from pyut.ui.eventengine.inspector.EventSender import createEventSendersFactory
+from pyut.ui.eventengine.inspector.EventMetrics import EventMetrics
 
 from pyut.ui.eventengine.inspector.RegisteredListener import RegisteredListenerMap
 from pyut.ui.eventengine.inspector.RegisteredListener import createRegisteredListenersMapFactory
@@ -13,4 +11,4 @@ from pyut.ui.eventengine.inspector.RegisteredListener import createRegisteredLis
 @dataclass
 class EventEngineDiagnostics:
     registeredListenersMap: RegisteredListenerMap = field(default_factory=createRegisteredListenersMapFactory)
-    eventSendersMap:        EventSendersMap       = field(default_factory=createEventSendersFactory)
+    eventMetrics:           EventMetrics          = field(default_factory=EventMetrics)
@@ -0,0 +1,180 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from json import dumps as jsonDumps
+
+from time import perf_counter
+
+from pyut.ui.eventengine.EventType import EventType
+
+MICROSECONDS_PER_SECOND: int = 1_000_000
+BUCKET_COUNT:            int = 24       # The last bucket holds everything >= 2**22 microseconds (about 4 seconds)
+
+NOT_SAMPLED: float = 0.0
+
+
+def createBucketsFactory() -> List[int]:
+    return [0] * BUCKET_COUNT
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Power of two microsecond buckets;  Bucket `n` counts the durations in [2**(n-1), 2**n) microseconds.
+    Recording is O(1) and never allocates
+    """
+    count:        int       = 0
+    totalSeconds: float     = 0.0
+    maxSeconds:   float     = 0.0
+    buckets:      List[int] = field(default_factory=createBucketsFactory)
+
+    def record(self, seconds: float):
+
+        self.count        += 1
+        self.totalSeconds += seconds
+        if seconds > self.maxSeconds:
+            self.maxSeconds = seconds
+
+        bucket: int = min(int(seconds * MICROSECONDS_PER_SECOND).bit_length(), BUCKET_COUNT - 1)
+        self.buckets[bucket] += 1
+
+    @property
+    def meanSeconds(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.totalSeconds / self.count
+
+    def percentileSeconds(self, percentile: float) -> float:
+        """
+        Args:
+            percentile:  0.0 to 1.0
+
+        Returns:  The upper bound of the bucket that holds the percentile
+        """
+        if self.count == 0:
+            return 0.0
+
+        threshold:  float = percentile * self.count
+        cumulative: int   = 0
+        for bucket, bucketCount in enumerate(self.buckets):
+            cumulative += bucketCount
+            if cumulative >= threshold:
+                return (1 << bucket) / MICROSECONDS_PER_SECOND
+
+        return self.maxSeconds
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            'count':       self.count,
+            'meanMs':      self.meanSeconds * 1000,
+            'p50Ms':       self.percentileSeconds(0.50) * 1000,
+            'p95Ms':       self.percentileSeconds(0.95) * 1000,
+            'maxMs':       self.maxSeconds * 1000,
+            'bucketsUsec': {f'<{1 << bucket}': bucketCount for bucket, bucketCount in enumerate(self.buckets) if bucketCount > 0},
+        }
+
+
+@dataclass
+class EventTypeMetrics:
+    """
+    sentCount is always exact;  The histograms only hold the sampled events
+
+    dispatch:  From `sendEvent` to the start of the handler;  The time the event sat in the wx queue
+    handler:   The handler execution time
+    """
+    sentCount: int              = 0
+    dispatch:  LatencyHistogram = field(default_factory=LatencyHistogram)
+    handler:   LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+EventTypeMetricsMap = NewType('EventTypeMetricsMap', Dict[EventType, EventTypeMetrics])
+
+
+class EventMetrics:
+    """
+    Cheap enough to leave on during a real session.  Every event is counted;  Only one in
+    `sampleRate` events is timed
+    """
+    def __init__(self, sampleRate: int = 1):
+        """
+
+        Args:
+            sampleRate:  Time one in this many events;  1 times them all
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._sampleRate: int                 = max(sampleRate, 1)
+        self._sendCount:  int                 = 0
+        self._metrics:    EventTypeMetricsMap = EventTypeMetricsMap({})
+
+    @property
+    def metrics(self) -> EventTypeMetricsMap:
+        return self._metrics
+
+    def eventSent(self, eventType: EventType) -> float:
+        """
+        Args:
+            eventType:  The event being sent
+
+        Returns:  The send time if this event is sampled, else NOT_SAMPLED
+        """
+        self._eventTypeMetrics(eventType=eventType).sentCount += 1
+
+        self._sendCount += 1
+        if self._sendCount % self._sampleRate == 0:
+            return perf_counter()
+
+        return NOT_SAMPLED
+
+    def recordDispatch(self, eventType: EventType, seconds: float):
+        self._eventTypeMetrics(eventType=eventType).dispatch.record(seconds)
+
+    def recordHandler(self, eventType: EventType, seconds: float):
+        self._eventTypeMetrics(eventType=eventType).handler.record(seconds)
+
+    def reset(self):
+        self._sendCount = 0
+        self._metrics   = EventTypeMetricsMap({})
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            'sampleRate': self._sampleRate,
+            'eventTypes': {
+                eventType.name: {
+                    'sentCount': eventTypeMetrics.sentCount,
+                    'dispatch':  eventTypeMetrics.dispatch.toDict(),
+                    'handler':   eventTypeMetrics.handler.toDict(),
+                }
+                for eventType, eventTypeMetrics in sorted(self._metrics.items(), key=lambda item: item[0].name)
+            }
+        }
+
+    def dump(self, fqFileName: str):
+        """
+        Write the metrics as JSON
+
+        Args:
+            fqFileName:  The fully qualified file name
+        """
+        with open(fqFileName, 'w') as fd:
+            fd.write(jsonDumps(self.toDict(), indent=4))
+
+        self.logger.info(f'Event metrics written to {fqFileName}')
+
+    def _eventTypeMetrics(self, eventType: EventType) -> EventTypeMetrics:
+
+        eventTypeMetrics: EventTypeMetrics | None = self._metrics.get(eventType)
+        if eventTypeMetrics is None:
+            eventTypeMetrics = EventTypeMetrics()
+            self._metrics[eventType] = eventTypeMetrics
+
+        return eventTypeMetrics
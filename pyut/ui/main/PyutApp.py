@@ -5,13 +5,20 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
+from os.path import abspath as osPathAbsPath
+
 from sys import argv
 from sys import exc_info
 
+from time import perf_counter
+
 from traceback import extract_tb
 
 from wx import OK
 from wx import ICON_ERROR
+from wx import ICON_QUESTION
+from wx import ID_YES
+from wx import YES_NO
 from wx import HelpProvider
 from wx import SimpleHelpProvider
 from wx import ScreenDC
@@ -25,9 +32,11 @@ from wx.lib.agw.advancedsplash import AS_CENTER_ON_PARENT
 from wx.lib.agw.advancedsplash import AS_TIMEOUT
 from wx.lib.agw.advancedsplash import AdvancedSplash
 
-from pyut.preferences.PyutPreferences import PyutPreferences
+from pyut.general.AtomicFileWriter import AtomicFileWriter
+from pyut.general.RecoveryJournal import RecoveryCandidates
+from pyut.general.RecoveryJournal import RecoveryJournal
 
-from pyut.resources.img.splash.Splash6 import embeddedImage as splashImage
+from pyut.preferences.PyutPreferences import PyutPreferences
 
 from pyut.ui.main.PyutApplicationFrame import PyutApplicationFrame
 
@@ -43,15 +52,22 @@ class PyutApp(wxApp):
     """
     SPLASH_TIMEOUT_MSECS: int = 3000
 
-    def __init__(self, redirect: bool, showSplash: bool = True):
+    def __init__(self, redirect: bool, showSplash: bool = True, startTime: float = 0.0):
+        """
 
+        Args:
+            redirect:    Redirect stdout and stderr to a window
+            showSplash:  If False, the splash image is not even loaded
+            startTime:   The perf_counter() value when startup began;  Used to report the time to the first window
+        """
         self.logger: Logger = getLogger(__name__)
 
         from pyut.ui.main.PyutApplicationFrame import PyutApplicationFrame
 
         self.splash: AdvancedSplash = cast(AdvancedSplash, None)
 
-        self._showSplash: bool = showSplash
+        self._showSplash: bool  = showSplash
+        self._startTime:  float = perf_counter() if startTime == 0.0 else startTime
         self._frame:      PyutApplicationFrame = cast(PyutApplicationFrame, None)
 
         super().__init__(redirect)
@@ -65,7 +81,22 @@ class PyutApp(wxApp):
         wxYield()
 
         HelpProvider.Set(provider)
-        # Create the SplashScreen
+        if self._showSplash is True:
+            self._showSplashScreen()
+
+        self.SetTopWindow(self._frame)
+        self._frame.Show(True)
+        self.logger.info(f'Time to first window: {(perf_counter() - self._startTime) * 1000:.0f} ms')
+
+        self._AfterSplash()
+
+        return True
+
+    def _showSplashScreen(self):
+        """
+        The splash image is a large embedded resource;  Only import it when we show it
+        """
+        from pyut.resources.img.splash.Splash6 import embeddedImage as splashImage
 
         bmp:      Bitmap = splashImage.GetBitmap()
         agwStyle: int    = AS_CENTER_ON_PARENT | AS_TIMEOUT
@@ -78,13 +109,6 @@ class PyutApp(wxApp):
         self.logger.debug(f'Showing splash screen')
         self.splash.Show(True)
 
-        self.SetTopWindow(self._frame)
-        self._frame.Show(True)
-
-        self._AfterSplash()
-
-        return True
-
     def MacOpenFiles(self, fileNames: List[str]):
         """
         Called in response to an "openFiles" Apple event.
@@ -108,7 +132,8 @@ class PyutApp(wxApp):
         try:
             # Handle application filenames on the command line
             prefs: PyutPreferences = PyutPreferences()
-            self._handleCommandLineFileNames(prefs)
+            restoredFileNames: List[str] = self._offerRecovery()
+            self._handleCommandLineFileNames(prefs, restoredFileNames=restoredFileNames)
 
             if self._frame is None:
                 self.logger.error("Exiting due to previous errors")
@@ -136,16 +161,58 @@ class PyutApp(wxApp):
             dlg.Destroy()
             return False
 
-    def _handleCommandLineFileNames(self, prefs: PyutPreferences):
+    def _offerRecovery(self) -> List[str]:
+        """
+        Offer to restore the autosave snapshots that are newer than their project.  A restored
+        snapshot replaces the project file and honors the save generations preference.  A declined
+        snapshot is kept, and offered again, until the project is next saved
+
+        Returns:  The fully qualified names of the restored, and now open, projects
+        """
+        restoredFileNames: List[str] = []
+        if self._frame is None:
+            return restoredFileNames
+
+        recoveryJournal: RecoveryJournal    = RecoveryJournal()
+        candidates:      RecoveryCandidates = recoveryJournal.recoveryCandidates()
+        for candidate in candidates:
+            message: str = f'Pyut did not exit cleanly.  A recovery snapshot of `{candidate.projectFileName}` is newer than the project.  Restore it?'
+            dlg: MessageDialog = MessageDialog(self._frame, message, 'Restore Project?', YES_NO | ICON_QUESTION)
+            if dlg.ShowModal() == ID_YES:
+                with open(candidate.snapshotFileName, 'rb') as binaryIO:
+                    snapshot: bytes = binaryIO.read()
+                AtomicFileWriter(generations=PyutPreferences().saveGenerations).write(fqFileName=candidate.projectFileName, data=snapshot)
+                recoveryJournal.discard(projectFileName=candidate.projectFileName)
+
+                self.logger.warning(f'Restored {candidate.projectFileName} from {candidate.snapshotFileName}')
+                self._frame.loadByFilename(candidate.projectFileName)
+                restoredFileNames.append(osPathAbsPath(candidate.projectFileName))
+            else:
+                self.logger.info(f'Kept {candidate.snapshotFileName} until {candidate.projectFileName} is saved')
+            dlg.Destroy()
+
+        if len(restoredFileNames) > 0:
+            self._frame.removeDefaultEmptyProject()
 
+        return restoredFileNames
+
+    def _handleCommandLineFileNames(self, prefs: PyutPreferences, restoredFileNames: List[str]):
+        """
+        Args:
+            prefs:              The Pyut preferences
+            restoredFileNames:  Projects that `._offerRecovery` already opened;  They are not opened again
+        """
         loadedAFile: bool                 = False
         appFrame:    PyutApplicationFrame = self._frame
 
-        if prefs.loadLastOpenedProject is True:
+        if prefs.loadLastOpenedProject is True and osPathAbsPath(appFrame.lastOpenedProjectFileName) not in restoredFileNames:
             appFrame.loadLastOpenedProject()
             loadedAFile = True
         self.logger.info(f'{argv=}')
         for filename in [el for el in argv[1:] if el[0] != '-']:
+            if osPathAbsPath(filename) in restoredFileNames:
+                self.logger.info(f'Already restored: {filename}')
+                continue
             self.logger.info(f'Load file on command line: {filename}')
             appFrame.loadByFilename(f'{filename}')
             loadedAFile = True
@@ -9,6 +9,8 @@ from logging import getLogger
 
 from sys import platform as sysPlatform
 
+from pathlib import Path
+
 from os import getenv as osGetEnv
 
 from wx import ACCEL_CTRL
@@ -46,12 +48,11 @@ from wx import WindowDestroyEvent
 
 from wx import Yield as wxYield
 
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
 from codeallybasic.Dimensions import Dimensions
 from codeallybasic.Position import Position
 from codeallybasic.SecureConversions import SecureConversions
 
-from pyutplugins.PluginManager import PluginManager
-
 from pyut import START_STOP_MARKER
 from pyut import __version__ as pyutVersion
 from pyut.preferences.FileHistoryPreference import FileHistoryPreference
@@ -69,8 +70,6 @@ from pyut.ui.tools.MenuCreator import MenuCreator
 from pyut.ui.tools.SharedTypes import ToolboxIdMap
 from pyut.ui.tools.ToolsCreator import ToolsCreator
 
-from pyut.ui.dialogs.tips.DlgTipsV2 import DlgTipsV2
-
 from pyut.PyutUtils import PyutUtils
 
 from pyut.PyutConstants import PyutConstants
@@ -79,7 +78,7 @@ from pyut.preferences.PyutPreferences import PyutPreferences
 
 
 from pyut.ui.FileHistoryConfiguration import FileHistoryConfiguration
-from pyut.ui.PluginAdapter import PluginAdapter
+from pyut.ui.LazyPluginManager import LazyPluginManager
 from pyut.ui.main.PyutUI import PyutUI
 from pyut.ui.ToolBoxHandler import ToolBoxHandler
 
@@ -109,6 +108,7 @@ FILE_HISTORY_BASE_FILENAME: str = 'pyutRecentFiles.ini'
 VENDOR_NAME:                str = 'ElGatoMalo'
 APPLICATION_NAME:           str = 'pyutV3'
 HACK_ADJUST_EXIT_HEIGHT:    int = 52
+EVENT_METRICS_FILE_NAME:    str = 'pyutEventMetrics.json'
 
 
 class PyutApplicationFrame(Frame):
@@ -143,10 +143,10 @@ class PyutApplicationFrame(Frame):
         self._toolsMenuHandler: ToolsMenuHandler = cast(ToolsMenuHandler, None)
         self._helpMenuHandler:  HelpMenuHandler  = cast(HelpMenuHandler,  None)
 
-        self._eventEngine:    IEventEngine   = EventEngine(listeningWindow=self)
-        self._pluginMgr:      PluginManager  = PluginManager(pluginAdapter=PluginAdapter(eventEngine=self._eventEngine))
-        self._pyutUI:         PyutUI         = PyutUI(self, eventEngine=self._eventEngine)
-        self._toolBoxHandler: ToolBoxHandler = ToolBoxHandler(frame=self)
+        self._eventEngine:       IEventEngine      = EventEngine(listeningWindow=self)
+        self._lazyPluginManager: LazyPluginManager = LazyPluginManager(eventEngine=self._eventEngine)
+        self._pyutUI:            PyutUI            = PyutUI(self, eventEngine=self._eventEngine)
+        self._toolBoxHandler:    ToolBoxHandler    = ToolBoxHandler(frame=self)
 
         fileMenu, editMenu = self._initializeMenuHandlers()
 
@@ -212,6 +212,15 @@ class PyutApplicationFrame(Frame):
             self._prefs.startupSize = Dimensions(ourSize[0], ourSize[1] - HACK_ADJUST_EXIT_HEIGHT)
             self.logger.info(f'Set new startup size: {ourSize}')
 
+        if self._prefs.dumpEventMetricsOnExit is True:
+            metricsFileName: Path = ConfigurationLocator().applicationPath('pyut') / EVENT_METRICS_FILE_NAME
+            self._eventEngine.eventEngineDiagnostics.eventMetrics.dump(fqFileName=str(metricsFileName))
+
+        if self._prefs.profilingControl is True:
+            from pyut.general.SessionProfiler import SessionProfiler
+
+            SessionProfiler().stop()
+
         self.logger.info(f'Pyut execution complete')
         self.logger.info(START_STOP_MARKER)
         self.Destroy()
@@ -228,8 +237,12 @@ class PyutApplicationFrame(Frame):
         self.logger.debug(f'Remove the default project')
         self._pyutUI.closeDefaultEmptyProject()
 
+    @property
+    def lastOpenedProjectFileName(self) -> str:
+        return self._fileHistory.GetHistoryFile(0)
+
     def loadLastOpenedProject(self):
-        lastOpenFileName: str = self._fileHistory.GetHistoryFile(0)
+        lastOpenFileName: str = self.lastOpenedProjectFileName
         self.loadByFilename(filename=lastOpenFileName)
 
     # noinspection PyUnusedLocal
@@ -348,6 +361,8 @@ class PyutApplicationFrame(Frame):
             prefs: PyutPreferences = PyutPreferences()
             self.logger.debug(f'Show tips on startup: {self._prefs.showTipsOnStartup=}')
             if prefs.showTipsOnStartup is True:
+                from pyut.ui.dialogs.tips.DlgTipsV2 import DlgTipsV2
+
                 # noinspection PyUnusedLocal
                 tipsFrame: DlgTipsV2 = DlgTipsV2(self)
                 tipsFrame.Show(show=True)
@@ -484,19 +499,19 @@ class PyutApplicationFrame(Frame):
         editMenu:  Menu = Menu()
         toolsMenu: Menu = Menu()
         helpMenu:  Menu = Menu()
-        self._fileMenuHandler = FileMenuHandler(fileMenu=fileMenu, eventEngine=self._eventEngine, pluginManager=self._pluginMgr)
+        self._fileMenuHandler = FileMenuHandler(fileMenu=fileMenu, eventEngine=self._eventEngine, lazyPluginManager=self._lazyPluginManager)
         self._editMenuHandler = EditMenuHandler(editMenu=editMenu, eventEngine=self._eventEngine)
         self._initializePyutTools()
 
         self._toolboxIds: ToolboxIdMap     = self._createToolboxIdMap()
         self._toolsMenuHandler = ToolsMenuHandler(toolsMenu=toolsMenu,
                                                   eventEngine=self._eventEngine,
-                                                  pluginManager=self._pluginMgr,
+                                                  lazyPluginManager=self._lazyPluginManager,
                                                   toolboxIds=self._toolboxIds
                                                   )
         self._helpMenuHandler = HelpMenuHandler(helpMenu=helpMenu, eventEngine=self._eventEngine)
 
-        menuCreator = MenuCreator(frame=self, pluginManager=self._pluginMgr)
+        menuCreator = MenuCreator(frame=self, lazyPluginManager=self._lazyPluginManager)
 
         menuCreator.fileMenu  = fileMenu
         menuCreator.editMenu  = editMenu
@@ -508,9 +523,6 @@ class PyutApplicationFrame(Frame):
         menuCreator.toolsMenuHandler = self._toolsMenuHandler
         menuCreator.helpMenuHandler  = self._helpMenuHandler
 
-        menuCreator.toolPlugins   = self._pluginMgr.toolPluginsMap.pluginIdMap
-        menuCreator.exportPlugins = self._pluginMgr.outputPluginsMap.pluginIdMap
-        menuCreator.importPlugins = self._pluginMgr.inputPluginsMap.pluginIdMap
         menuCreator.toolboxIds    = self._toolboxIds
 
         menuCreator.initializeMenus()
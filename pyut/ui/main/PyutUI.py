@@ -1,4 +1,5 @@
 
+from typing import Dict
 from typing import List
 from typing import Union
 from typing import cast
@@ -51,9 +52,6 @@ from ogl.OglObject import OglObject
 from ogl.OglClass import OglClass
 from ogl.OglInterface2 import OglInterface2
 
-from oglio.Types import OglDocument
-from oglio.Types import OglProject
-
 from pyutplugins.ExternalTypes import CurrentProjectCallback
 from pyutplugins.ExternalTypes import FrameInformation
 from pyutplugins.ExternalTypes import FrameInformationCallback
@@ -66,17 +64,10 @@ from pyutplugins.ExternalTypes import SelectedOglObjectsCallback
 from pyut.PyutConstants import PyutConstants
 from pyut.PyutUtils import PyutUtils
 
-from pyut.ui.dialogs.DlgEditClass import DlgEditClass
-from pyut.ui.dialogs.DlgEditInterface import DlgEditInterface
-
-from pyut.ui.dialogs.Wrappers import DlgEditActor
-from pyut.ui.dialogs.Wrappers import DlgEditUseCase
-
-from pyut.ui.dialogs.textdialogs.DlgEditNote import DlgEditNote
-from pyut.ui.dialogs.textdialogs.DlgEditText import DlgEditText
-
 from pyut.enums.DiagramType import DiagramType
 
+from pyut.general.ProjectReader import ProjectXml
+
 from pyut.ui.Action import Action
 from pyut.ui.eventengine.Events import EVENT_SHOW_ORTHOGONAL_ROUTING_POINTS
 from pyut.ui.eventengine.Events import EVENT_SHOW_ROUTE_GRID
@@ -91,6 +82,7 @@ from pyut.ui.umlframes.UmlClassDiagramsFrame import UmlClassDiagramsFrame
 from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 from pyut.ui.umlframes.UmlFrame import UmlObjects
 
+from pyut.ui.AutoSaver import AutoSaver
 from pyut.ui.IPyutDocument import IPyutDocument
 from pyut.ui.IPyutProject import IPyutProject
 
@@ -99,8 +91,10 @@ from pyut.ui.LayoutEngine import LayoutEngine
 from pyut.ui.PluginProjectCreator import PluginProjectCreator
 from pyut.ui.ProjectException import ProjectException
 from pyut.ui.ProjectException import ProjectExceptionType
+from pyut.ui.ProjectLoader import ProjectLoader
 from pyut.ui.ProjectManager import ProjectManager
 from pyut.ui.ProjectManager import PyutProjects
+from pyut.ui.ProjectPopulator import ProjectPopulator
 from pyut.ui.ProjectTree import ProjectTree
 from pyut.ui.PyutDocument import PyutDocument
 from pyut.ui.PyutProject import PyutProject
@@ -114,6 +108,7 @@ from pyut.ui.eventengine.EventEngine import NewNamedProjectCallback
 
 from pyut.ui.eventengine.Events import EVENT_ACTIVE_PROJECT_INFORMATION
 from pyut.ui.eventengine.Events import EVENT_ADD_SHAPE
+from pyut.ui.eventengine.Events import EVENT_ADD_SHAPES
 from pyut.ui.eventengine.Events import EVENT_CLOSE_PROJECT
 from pyut.ui.eventengine.Events import EVENT_EDIT_ACTOR
 from pyut.ui.eventengine.Events import EVENT_EDIT_CLASS
@@ -131,6 +126,7 @@ from pyut.ui.eventengine.Events import EVENT_NEW_NAMED_PROJECT
 from pyut.ui.eventengine.Events import EVENT_NEW_PROJECT
 from pyut.ui.eventengine.Events import EVENT_NEW_PROJECT_DIAGRAM
 from pyut.ui.eventengine.Events import EVENT_OPEN_PROJECT
+from pyut.ui.eventengine.Events import EVENT_PROJECT_LOADED
 from pyut.ui.eventengine.Events import EVENT_DELETE_DIAGRAM
 from pyut.ui.eventengine.Events import EVENT_REFRESH_FRAME
 from pyut.ui.eventengine.Events import EVENT_REQUEST_CURRENT_PROJECT
@@ -144,6 +140,7 @@ from pyut.ui.eventengine.Events import EditNoteEvent
 from pyut.ui.eventengine.Events import EditTextEvent
 from pyut.ui.eventengine.Events import EditUseCaseEvent
 from pyut.ui.eventengine.Events import AddShapeEvent
+from pyut.ui.eventengine.Events import AddShapesEvent
 from pyut.ui.eventengine.Events import ActiveUmlFrameEvent
 from pyut.ui.eventengine.Events import FrameInformationEvent
 from pyut.ui.eventengine.Events import FrameSizeEvent
@@ -154,6 +151,7 @@ from pyut.ui.eventengine.Events import NewNamedProjectEvent
 from pyut.ui.eventengine.Events import NewProjectDiagramEvent
 from pyut.ui.eventengine.Events import NewProjectEvent
 from pyut.ui.eventengine.Events import OpenProjectEvent
+from pyut.ui.eventengine.Events import ProjectLoadedEvent
 from pyut.ui.eventengine.Events import RefreshFrameEvent
 from pyut.ui.eventengine.Events import RequestCurrentProjectEvent
 from pyut.ui.eventengine.Events import SaveProjectAsEvent
@@ -167,6 +165,7 @@ from pyut.ui.eventengine.eventinformation.MiniProjectInformation import MiniProj
 from pyut.ui.eventengine.eventinformation.ActiveProjectInformation import ActiveProjectInformation
 from pyut.ui.eventengine.eventinformation.NewProjectDiagramInformation import NewProjectDiagramCallback
 from pyut.ui.eventengine.eventinformation.NewProjectDiagramInformation import NewProjectDiagramInformation
+from pyut.ui.eventengine.eventinformation.ProjectLoadInformation import ProjectLoadInformation
 
 from pyut.ui.eventengine.EventEngine import ActiveProjectInformationCallback
 
@@ -205,6 +204,12 @@ class PyutUI(SplitterWindow):
         self._documentPopupMenu:         Menu = NO_MENU
 
         self._projectManager: ProjectManager = ProjectManager(projectTree=self._projectTree, diagramNoteBook=self._diagramNotebook)
+        self._autoSaver:      AutoSaver      = AutoSaver(projectWriter=self._projectManager.projectWriter)
+
+        self._projectPopulators: Dict[IPyutProject, ProjectPopulator] = {}
+        """
+        Projects that are being opened in the background
+        """
 
         self._parentWindow.Bind(EVT_NOTEBOOK_PAGE_CHANGED, self._onDiagramNotebookPageChanged)
         self._parentWindow.Bind(EVT_TREE_SEL_CHANGED,      self._onProjectTreeSelectionChanged)
@@ -219,6 +224,7 @@ class PyutUI(SplitterWindow):
         self._eventEngine.registerListener(pyEventBinder=EVENT_NEW_DIAGRAM,          callback=self._onNewDiagram)
         self._eventEngine.registerListener(pyEventBinder=EVENT_NEW_PROJECT_DIAGRAM,  callback=self._onNewProjectDiagram)
         self._eventEngine.registerListener(pyEventBinder=EVENT_OPEN_PROJECT,         callback=self._onOpenProject)
+        self._eventEngine.registerListener(pyEventBinder=EVENT_PROJECT_LOADED,       callback=self._onProjectLoaded)
         self._eventEngine.registerListener(pyEventBinder=EVENT_CLOSE_PROJECT,        callback=self._onCloseProject)
         self._eventEngine.registerListener(pyEventBinder=EVENT_SAVE_PROJECT,         callback=self._onSaveProject)
         self._eventEngine.registerListener(pyEventBinder=EVENT_SAVE_PROJECT_AS,      callback=self._onSaveProjectAs)
@@ -238,6 +244,7 @@ class PyutUI(SplitterWindow):
         #
         # Following provided for the Plugin Adapter
         self._eventEngine.registerListener(pyEventBinder=EVENT_ADD_SHAPE,            callback=self._onAddShape)
+        self._eventEngine.registerListener(pyEventBinder=EVENT_ADD_SHAPES,           callback=self._onAddShapes)
         self._eventEngine.registerListener(pyEventBinder=EVENT_FRAME_INFORMATION,    callback=self._onFrameInformation)
         self._eventEngine.registerListener(pyEventBinder=EVENT_FRAME_SIZE,           callback=self._onFrameSize)
         self._eventEngine.registerListener(pyEventBinder=EVENT_SELECTED_OGL_OBJECTS, callback=self._selectedOglObjects)
@@ -268,7 +275,9 @@ class PyutUI(SplitterWindow):
                 if dlg.ShowModal() == ID_YES:
                     self._projectManager.saveProject(projectToSave=pyutProject)
                 dlg.Destroy()
+            self._autoSaver.discard(pyutProject=pyutProject)
 
+        self._autoSaver.stop()
         self._diagramNotebook.DeleteAllPages()
 
     def closeDefaultEmptyProject(self):
@@ -382,6 +391,7 @@ class PyutUI(SplitterWindow):
         self._projectManager.currentProject = self._getProjectFromFrame(self._projectManager.currentFrame)
 
         self._projectManager.syncPageFrameAndNotebook(frame=self._projectManager.currentFrame)
+        self._materializeCurrentFrame()
         self._updateApplicationTitle()
 
         cp: CommandProcessor = self._projectManager.currentFrame.commandProcessor
@@ -409,6 +419,7 @@ class PyutUI(SplitterWindow):
             self._projectManager.currentDocument = pyutDocument
 
             self._projectManager.syncPageFrameAndNotebook(frame=frame)
+            self._materializeCurrentFrame()
 
         elif isinstance(pyutData, IPyutProject):
             project: IPyutProject = pyutData
@@ -420,6 +431,7 @@ class PyutUI(SplitterWindow):
                 self._projectManager.currentFrame = NO_DIAGRAM_FRAME
 
             self._projectManager.syncPageFrameAndNotebook(frame=self._projectManager.currentFrame)
+            self._materializeCurrentFrame()
             self._updateApplicationTitle()
             self._projectManager.currentProject = project
 
@@ -563,26 +575,71 @@ class PyutUI(SplitterWindow):
         self.logger.info(f'Opened new named project {fqFileName}')
 
     def _onOpenProject(self, event: OpenProjectEvent):
+        """
+        Reads the project on a background thread;  See `._onProjectLoaded`
 
+        Args:
+            event:
+        """
         projectFilename: str = event.projectFilename
         if self._projectManager.isProjectLoaded(projectFilename) is True:
             self._displayError("The selected project is already loaded !")
         else:
-            try:
-                oglProject, pyutProject = self._projectManager.openProject(filename=projectFilename)
-                self._placeShapesOnFrames(oglProject=oglProject, pyutProject=pyutProject)
+            pyutProject:   IPyutProject  = self._projectManager.prepareProject(filename=projectFilename)
+            projectLoader: ProjectLoader = ProjectLoader(eventEngine=self._eventEngine, pyutProject=pyutProject)
+
+            self._projectPopulators[pyutProject] = ProjectPopulator(parent=self._parentWindow,
+                                                                    diagramNotebook=self._diagramNotebook,
+                                                                    projectLoader=projectLoader,
+                                                                    pyutProject=pyutProject,
+                                                                    callback=self._onProjectPopulated)
+            projectLoader.start()
+
+    def _onProjectLoaded(self, event: ProjectLoadedEvent):
+        """
+        The background loader finished parsing the project file;  Create the frames.  The
+        Ogl objects are wx objects;  They are created on this thread when a document is materialized
+
+        Args:
+            event:
+        """
+        info:        ProjectLoadInformation = event.projectLoadInformation
+        pyutProject: IPyutProject           = info.pyutProject
+
+        if info.cancelled is True or pyutProject not in self._projectPopulators:
+            self.logger.info(f'Discarding cancelled load of {pyutProject.filename}')
+            return
+
+        populator:     ProjectPopulator = self._projectPopulators[pyutProject]
+        loadException: Exception | None = info.loadException
+
+        if loadException is not None:
+            populator.abort()
+            del self._projectPopulators[pyutProject]
+            self._handleOpenProjectException(self._projectManager.toProjectException(e=loadException, project=pyutProject))
+        else:
+            self._projectManager.completeProject(project=pyutProject)
+            self._placeShapesOnFrames(projectXml=info.projectXml, pyutProject=pyutProject, populator=populator)
+            populator.populate()
+
+    def _onProjectPopulated(self, populator: ProjectPopulator, cancelled: bool):
 
-                self._updateApplicationTitle()
-                self._eventEngine.sendEvent(EventType.UpdateRecentProjects, projectFilename=projectFilename)
-                self.closeDefaultEmptyProject()
-            except ProjectException as pe:
-                self._handleOpenProjectException(pe)
+        pyutProject: IPyutProject = populator.pyutProject
+
+        del self._projectPopulators[pyutProject]
+        if cancelled is True:
+            self._closeProject(projectToClose=pyutProject)
+        else:
+            self._updateApplicationTitle()
+            self._eventEngine.sendEvent(EventType.UpdateRecentProjects, projectFilename=pyutProject.filename)
+            self.closeDefaultEmptyProject()
 
     # noinspection PyUnusedLocal
     def _onSaveProject(self, event: SaveProjectEvent):
 
         projectToSave: IPyutProject = self._projectManager.currentProject
         self._projectManager.saveProject(projectToSave=projectToSave)
+        self._discardSnapshotIfSaved(pyutProject=projectToSave)
         self._updateApplicationTitle()
 
         commandProcessor: CommandProcessor = self._projectManager.currentFrame.commandProcessor
@@ -597,6 +654,7 @@ class PyutUI(SplitterWindow):
         projectToSaveAs: IPyutProject = self._projectManager.currentProject
 
         self._projectManager.saveProjectAs(projectToSave=projectToSaveAs)
+        self._discardSnapshotIfSaved(pyutProject=projectToSaveAs)
         self._updateApplicationTitle()
 
         commandProcessor: CommandProcessor = self._projectManager.currentFrame.commandProcessor
@@ -641,7 +699,7 @@ class PyutUI(SplitterWindow):
         projectInformation.projectModified = self._projectManager.currentProject.modified
         projectInformation.frameZoom       = self._projectManager.currentFrame.currentZoom
 
-        cb = event.eventHandler
+        cb = event.callback
         cb(projectInformation)
 
     def _onGetActiveUmlFrame(self, event: ActiveUmlFrameEvent):
@@ -649,7 +707,7 @@ class PyutUI(SplitterWindow):
         cb(self._projectManager.currentFrame)
 
     def _onActiveProjectInformation(self, event: ActiveProjectInformationEvent):
-        cb: ActiveProjectInformationCallback = event.eventHandler
+        cb: ActiveProjectInformationCallback = event.callback
 
         activeProjectInformation: ActiveProjectInformation = ActiveProjectInformation()
         activeProjectInformation.umlFrame    = self._projectManager.currentFrame
@@ -658,6 +716,8 @@ class PyutUI(SplitterWindow):
         cb(activeProjectInformation)
 
     def _onEditClass(self, event: EditClassEvent):
+        from pyut.ui.dialogs.DlgEditClass import DlgEditClass
+
         pyutClass: PyutClass = event.pyutClass
         umlFrame: UmlDiagramsFrame = self._projectManager.currentFrame
 
@@ -669,6 +729,8 @@ class PyutUI(SplitterWindow):
                 # Sends its own modify event
 
     def _onEditNote(self, event: EditNoteEvent):
+        from pyut.ui.dialogs.textdialogs.DlgEditNote import DlgEditNote
+
         pyutNote: PyutNote         = event.pyutNote
         umlFrame: UmlDiagramsFrame = self._projectManager.currentFrame
 
@@ -680,6 +742,8 @@ class PyutUI(SplitterWindow):
                 umlFrame.Refresh()
 
     def _onEditText(self, event: EditTextEvent):
+        from pyut.ui.dialogs.textdialogs.DlgEditText import DlgEditText
+
         pyutText: PyutText         = event.pyutText
         umlFrame: UmlDiagramsFrame = self._projectManager.currentFrame
 
@@ -690,6 +754,8 @@ class PyutUI(SplitterWindow):
                 umlFrame.Refresh()
 
     def _onEditActor(self, event: EditActorEvent):
+        from pyut.ui.dialogs.Wrappers import DlgEditActor
+
         pyutActor: PyutActor        = event.pyutActor
         umlFrame:  UmlDiagramsFrame = self._projectManager.currentFrame
 
@@ -701,6 +767,8 @@ class PyutUI(SplitterWindow):
 
     def _onEditUseCase(self, event: EditUseCaseEvent):
 
+        from pyut.ui.dialogs.Wrappers import DlgEditUseCase
+
         pyutUseCase: PyutUseCase      = event.pyutUseCase
         umlFrame:    UmlDiagramsFrame = self._projectManager.currentFrame
 
@@ -712,6 +780,8 @@ class PyutUI(SplitterWindow):
 
     def _onEditInterface(self, event: EditInterfaceEvent):
 
+        from pyut.ui.dialogs.DlgEditInterface import DlgEditInterface
+
         umlFrame:      UmlDiagramsFrame = self._projectManager.currentFrame
         oglInterface2: OglInterface2    = event.oglInterface2
         implementor:   OglClass         = event.implementor
@@ -732,6 +802,14 @@ class PyutUI(SplitterWindow):
         layoutEngine: LayoutEngine = LayoutEngine()
         layoutEngine.addShape(umlFrame=umlFrame, oglObject=oglObject)     # too cute for words
 
+    def _onAddShapes(self, event: AddShapesEvent):
+
+        oglObjects: OglObjects       = event.shapesToAdd
+        umlFrame:   UmlDiagramsFrame = self._projectManager.currentFrame
+
+        layoutEngine: LayoutEngine = LayoutEngine()
+        layoutEngine.addShapes(umlFrame=umlFrame, oglObjects=oglObjects)
+
     def _onFrameInformation(self, event: FrameInformationEvent):
 
         projectManager: ProjectManager = self._projectManager
@@ -764,7 +842,7 @@ class PyutUI(SplitterWindow):
             frameSize.width  = width
             frameSize.height = height
 
-        cb: FrameSizeCallback = event.eventHandler
+        cb: FrameSizeCallback = event.callback
 
         cb(frameSize)
 
@@ -880,24 +958,37 @@ class PyutUI(SplitterWindow):
     def _refreshFrame(self, event: RefreshFrameEvent):
         self._projectManager.currentFrame.Refresh()
 
-    def _placeShapesOnFrames(self, oglProject: OglProject, pyutProject: IPyutProject):
+    def _placeShapesOnFrames(self, projectXml: ProjectXml, pyutProject: IPyutProject, populator: ProjectPopulator):
         """
-        Creates the necessary frames to load the various OglDocuments onto
-        respective Pyut frames in the DiagramNotebook
+        Creates the necessary frames for the various documents in the DiagramNotebook;
+        Each document keeps its parsed document as a stub;  Its Ogl objects are only created
+        and laid out when it is activated.  The populator materializes the visible one
 
-        Assumes `._openProject()` was called to set up the current project
+        Assumes `._projectManager.completeProject()` was called to set up the current project
         Args:
-            oglProject:   The ogl project to display
-            pyutProject:   My version
+            projectXml:   The parsed project to display
+            pyutProject:  My version
+            populator:    Queues the frames for layout
         """
-        layoutEngine: LayoutEngine = LayoutEngine()
-        for document in oglProject.oglDocuments.values():
-            oglDocument: OglDocument = cast(OglDocument, document)
-            diagramType: DiagramType = DiagramType.toEnum(oglDocument.documentType)
-            self._newDiagram(pyutProject=pyutProject, diagramType=diagramType, diagramName=oglDocument.documentTitle)
+        for untangledDocument in projectXml.documents:
+            diagramType:  DiagramType  = DiagramType.toEnum(untangledDocument.document.documentType)
+            pyutDocument: PyutDocument = cast(PyutDocument, self._newDiagram(pyutProject=pyutProject,
+                                                                              diagramType=diagramType,
+                                                                              diagramName=untangledDocument.document.documentTitle))
+            pyutDocument.untangledDocument = untangledDocument
+
+            populator.addDocument(pyutDocument=pyutDocument)
 
-            newFrame = self._projectManager.currentFrame
-            layoutEngine.layout(umlFrame=newFrame, oglDocument=oglDocument)
+    def _materializeCurrentFrame(self):
+        """
+        Lay out the current frame's document if it is still a stub
+        """
+        currentFrame: UmlDiagramsFrame = self._projectManager.currentFrame
+        if currentFrame is not None:
+            pyutDocument: IPyutDocument = self._projectManager.getDocumentFromFrame(frame=currentFrame)
+            if pyutDocument is not None and pyutDocument.materialized is False:
+                pyutDocument.materialize()
+                currentFrame.Refresh()
 
     def _updateApplicationTitle(self):
 
@@ -957,12 +1048,26 @@ class PyutUI(SplitterWindow):
 
     def _setProjectModified(self):
         self._projectManager.currentProject.modified = True
+
+        modifiedDocument: IPyutDocument = self._projectManager.getDocumentFromFrame(frame=self._projectManager.currentFrame)
+        if modifiedDocument is not None:
+            modifiedDocument.modified = True
+
+        self._autoSaver.projectModified(pyutProject=self._projectManager.currentProject)
         self._updateApplicationTitle()
 
+    def _discardSnapshotIfSaved(self, pyutProject: IPyutProject):
+        """
+        The end-user may have cancelled a save as
+
+        Args:
+            pyutProject:  The project that we tried to save
+        """
+        if pyutProject.modified is False:
+            self._autoSaver.projectSaved(pyutProject=pyutProject)
+
     def _handleOpenProjectException(self, pe: ProjectException):
-        from wx import EndBusyCursor
 
-        EndBusyCursor()
         MessageBox(message=f'{pe}', caption='Project Open Error', style=ICON_ERROR)
         if (pe.exceptionType == ProjectExceptionType.INVALID_PROJECT or
                 pe.exceptionType == ProjectExceptionType.PROJECT_NOT_FOUND or
@@ -989,6 +1094,7 @@ class PyutUI(SplitterWindow):
             if dlg.ShowModal() == ID_YES:
                 self._projectManager.saveProject(projectToSave=projectToClose)
 
+        self._autoSaver.discard(pyutProject=projectToClose)
         # Remove the frame in the notebook
         pages = list(range(self._diagramNotebook.GetPageCount()))
         pages.reverse()
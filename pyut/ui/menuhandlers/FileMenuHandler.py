@@ -6,7 +6,6 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from pyutplugins.PluginManager import PluginDetails
 from wx import BOTH
 from wx import FD_MULTIPLE
 from wx import FD_OPEN
@@ -34,13 +33,9 @@ from wx import CloseEvent
 from wx import PostEvent as wxPostEvent
 from wx import Yield as wxYield
 
-from pyutplugins.PluginManager import PluginManager
-
 from pyutplugins.plugintypes.PluginDataTypes import PluginIDMap
 
 from pyut.PyutUtils import PyutUtils
-from pyut.ui.dialogs.DlgEditProjectHistory import DlgEditProjectHistory
-from pyut.ui.dialogs.preferences.DlgPyutPreferences import DlgPyutPreferences
 
 from pyut.enums.DiagramType import DiagramType
 
@@ -49,6 +44,7 @@ from pyut.general.exceptions.UnsupportedOperation import UnsupportedOperation
 from pyut.preferences.PyutPreferences import PyutPreferences
 
 from pyut.ui.CurrentDirectoryHandler import CurrentDirectoryHandler
+from pyut.ui.LazyPluginManager import LazyPluginManager
 from pyut.ui.PyutPrintout import PyutPrintout
 
 from pyut.ui.menuhandlers.BaseMenuHandler import BaseMenuHandler
@@ -66,18 +62,18 @@ FileNames = NewType('FileNames', List[str])
 
 class FileMenuHandler(BaseMenuHandler):
 
-    def __init__(self, fileMenu: Menu, eventEngine: IEventEngine, pluginManager: PluginManager):
+    def __init__(self, fileMenu: Menu, eventEngine: IEventEngine, lazyPluginManager: LazyPluginManager):
         """
 
         Args:
-            fileMenu:       The file menu
-            eventEngine:    The event engine
-            pluginManager:  Plugin manager to get IDs from
+            fileMenu:           The file menu
+            eventEngine:        The event engine
+            lazyPluginManager:  Creates the plugin manager on first use
         """
         super().__init__(menu=fileMenu, eventEngine=eventEngine)
 
-        self._pluginManager: PluginManager = pluginManager
-        self._fileHistory:   FileHistory   = cast(FileHistory, None)    # Must be injected
+        self._lazyPluginManager: LazyPluginManager = lazyPluginManager
+        self._fileHistory:       FileHistory       = cast(FileHistory, None)    # Must be injected
 
         self.logger:       Logger          = getLogger(__name__)
         self._preferences: PyutPreferences = PyutPreferences()
@@ -255,21 +251,27 @@ class FileMenuHandler(BaseMenuHandler):
     def onImport(self, event: CommandEvent):
         """
         """
+        from pyutplugins.PluginManager import PluginDetails
+
         wxId:          int           = event.GetId()
-        pluginDetails: PluginDetails = self._pluginManager.doImport(wxId=wxId)
+        pluginDetails: PluginDetails = self._lazyPluginManager.pluginManager.doImport(wxId=wxId)
 
         self.logger.info(f'Import {pluginDetails=}')
 
     def onExport(self, event: CommandEvent):
         """
         """
+        from pyutplugins.PluginManager import PluginDetails
+
         wxId:          int           = event.GetId()
-        pluginDetails: PluginDetails = self._pluginManager.doExport(wxId=wxId)
+        pluginDetails: PluginDetails = self._lazyPluginManager.pluginManager.doExport(wxId=wxId)
         self.logger.info(f'Export    {pluginDetails=}')
 
     # noinspection PyUnusedLocal
     def onPyutPreferences(self, event: CommandEvent):
 
+        from pyut.ui.dialogs.preferences.DlgPyutPreferences import DlgPyutPreferences
+
         with DlgPyutPreferences(self._parent, eventEngine=self._eventEngine) as dlg:
             if dlg.ShowModal() == ID_OK:
                 self.logger.info(f'Got answer')
@@ -338,6 +340,8 @@ class FileMenuHandler(BaseMenuHandler):
 
     # noinspection PyUnusedLocal
     def onManageFileHistory(self, event: CommandEvent):
+        from pyut.ui.dialogs.DlgEditProjectHistory import DlgEditProjectHistory
+
         with DlgEditProjectHistory(parent=None, fileHistory=self._fileHistory) as dlg:
             dlg.ShowModal()
 
@@ -381,9 +385,9 @@ class FileMenuHandler(BaseMenuHandler):
 
         printDialogData.SetPrintData(self._printData)
         printDialogData.SetMinPage(1)
-        printDialogData.SetMaxPage(1)
-        printer  = Printer(printDialogData)
         printout = PyutPrintout(diagramFrame)
+        printDialogData.SetMaxPage(printout.pageCount)
+        printer  = Printer(printDialogData)
 
         if not printer.Print(self._parent, printout, True):
             # May have been canceled
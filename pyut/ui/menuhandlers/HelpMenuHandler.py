@@ -12,14 +12,17 @@ from semantic_version import Version as SemanticVersion
 
 from pyut import __version__ as pyutVersion
 
-from pyut.ui.dialogs.DlgAbout import DlgAbout
-from pyut.ui.dialogs.logcontrol.DlgLogControl import DlgLogControl
-from pyut.ui.eventengine.inspector.DlgEventEngineDialog import DlgEventEngineDialog
-
 from pyut.ui.menuhandlers.BaseMenuHandler import BaseMenuHandler
 
 from pyut.PyutUtils import PyutUtils
 
+from pyut.general.SessionProfiler import ProfileFiles
+from pyut.general.SessionProfiler import SessionProfiler
+
+from pyut.preferences.PyutPreferences import PyutPreferences
+
+from pyut.ui.tools.SharedIdentifiers import SharedIdentifiers
+
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 
 
@@ -41,6 +44,8 @@ class HelpMenuHandler(BaseMenuHandler):
         Args:
             event:
         """
+        from pyut.ui.dialogs.DlgAbout import DlgAbout
+
         with DlgAbout(self._parent) as dlg:
             dlg.ShowModal()
 
@@ -85,6 +90,8 @@ class HelpMenuHandler(BaseMenuHandler):
         Args:
             event:
         """
+        from pyut.ui.dialogs.logcontrol.DlgLogControl import DlgLogControl
+
         with DlgLogControl(self._parent) as dlg:
             dlg.ShowModal()
 
@@ -95,5 +102,41 @@ class HelpMenuHandler(BaseMenuHandler):
         Args:
             event:
         """
+        from pyut.ui.eventengine.inspector.DlgEventEngineDialog import DlgEventEngineDialog
+
         with DlgEventEngineDialog(self._parent, eventEngine=self._eventEngine) as dlg:
             dlg.ShowModal()
+
+    # noinspection PyUnusedLocal
+    def onToggleProfiling(self, event: CommandEvent):
+        """
+        Start a profiling session;  Or, stop the current one and say where the results are
+
+        Args:
+            event:
+        """
+        sessionProfiler: SessionProfiler = SessionProfiler()
+        if sessionProfiler.running is True:
+            profileFiles: ProfileFiles = sessionProfiler.stop()
+            self._menu.SetLabel(SharedIdentifiers.ID_MENU_HELP_PROFILING, 'Start &Profiling')
+
+            fileNames: str = '\n'.join(profileFiles)
+            PyutUtils.displayInformation(f'Profiling results written to:\n{fileNames}', 'Profiling Stopped', self._parent)
+        else:
+            preferences: PyutPreferences = PyutPreferences()
+
+            sessionProfiler.start(cpuProfile=preferences.profileCpu, memoryProfile=preferences.profileMemory)
+            self._menu.SetLabel(SharedIdentifiers.ID_MENU_HELP_PROFILING, 'Stop &Profiling')
+
+    # noinspection PyUnusedLocal
+    def onProfilingSummary(self, event: CommandEvent):
+        """
+        Show the action timings of the current, or last, profiling session
+
+        Args:
+            event:
+        """
+        from pyut.ui.dialogs.DlgProfilingSummary import DlgProfilingSummary
+
+        with DlgProfilingSummary(self._parent) as dlg:
+            dlg.ShowModal()
@@ -2,11 +2,9 @@
 from logging import Logger
 from logging import getLogger
 
-from pyutplugins.PluginManager import PluginDetails
 from wx import CommandEvent
 from wx import Menu
 
-from pyutplugins.PluginManager import PluginManager
 from pyutplugins.IPluginAdapter import IPluginAdapter
 
 from pyut.ui.menuhandlers.BaseMenuHandler import BaseMenuHandler
@@ -14,6 +12,7 @@ from pyut.ui.menuhandlers.BaseMenuHandler import BaseMenuHandler
 from pyut.ui.tools.SharedTypes import ToolboxIdMap
 from pyut.ui.tools.Tool import Category
 
+from pyut.ui.LazyPluginManager import LazyPluginManager
 from pyut.ui.PluginAdapter import PluginAdapter
 from pyut.ui.ToolBoxHandler import ToolBoxHandler
 
@@ -24,13 +23,13 @@ class ToolsMenuHandler(BaseMenuHandler):
     """
     Handles calling Tool plugins and I/O Plugins
     """
-    def __init__(self, toolsMenu: Menu, pluginManager: PluginManager, toolboxIds: ToolboxIdMap, eventEngine: IEventEngine):
+    def __init__(self, toolsMenu: Menu, lazyPluginManager: LazyPluginManager, toolboxIds: ToolboxIdMap, eventEngine: IEventEngine):
 
         super().__init__(menu=toolsMenu, eventEngine=eventEngine)
 
-        self.logger:         Logger       = getLogger(__name__)
-        self._pluginManager: PluginManager = pluginManager
-        self._toolboxIds:    ToolboxIdMap = toolboxIds
+        self.logger:             Logger            = getLogger(__name__)
+        self._lazyPluginManager: LazyPluginManager = lazyPluginManager
+        self._toolboxIds:        ToolboxIdMap      = toolboxIds
 
         self._pluginAdapter:  IPluginAdapter = PluginAdapter(eventEngine=eventEngine)
 
@@ -40,8 +39,10 @@ class ToolsMenuHandler(BaseMenuHandler):
         Args:
             event:
         """
+        from pyutplugins.PluginManager import PluginDetails
+
         wxId:          int           = event.GetId()
-        pluginDetails: PluginDetails = self._pluginManager.doToolAction(wxId=wxId)
+        pluginDetails: PluginDetails = self._lazyPluginManager.pluginManager.doToolAction(wxId=wxId)
 
         self.logger.info(f'Import {pluginDetails=}')
 
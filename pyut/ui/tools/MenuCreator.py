@@ -6,6 +6,7 @@ from logging import getLogger
 from typing import cast
 
 from wx import EVT_MENU
+from wx import EVT_MENU_OPEN
 from wx import EVT_MENU_RANGE
 from wx import ID_ABOUT
 from wx import ID_CUT
@@ -25,8 +26,7 @@ from wx import Frame
 from wx import ID_UNDO
 from wx import Menu
 from wx import MenuBar
-
-from pyutplugins.PluginManager import PluginManager
+from wx import MenuEvent
 
 from pyutplugins.plugintypes.PluginDataTypes import PluginIDMap
 from pyutplugins.plugintypes.PluginDataTypes import FormatName
@@ -34,6 +34,8 @@ from pyutplugins.plugintypes.PluginDataTypes import FormatName
 from pyutplugins.plugininterfaces.IOPluginInterface import IOPluginInterface
 from pyutplugins.plugininterfaces.ToolPluginInterface import ToolPluginInterface
 
+from pyut.general.SessionProfiler import SessionProfiler
+
 from pyut.general.exceptions.InvalidCategoryException import InvalidCategoryException
 
 from pyut.preferences.PyutPreferences import PyutPreferences
@@ -45,6 +47,8 @@ from pyut.ui.menuhandlers.FileMenuHandler import FileMenuHandler
 from pyut.ui.menuhandlers.HelpMenuHandler import HelpMenuHandler
 from pyut.ui.menuhandlers.ToolsMenuHandler import ToolsMenuHandler
 
+from pyut.ui.LazyPluginManager import LazyPluginManager
+
 from pyut.ui.tools.SharedIdentifiers import SharedIdentifiers
 
 from pyut.ui.tools.SharedTypes import ToolboxIdMap
@@ -54,13 +58,13 @@ from pyut.ui.ToolBoxHandler import ToolBoxHandler
 
 class MenuCreator:
 
-    def __init__(self, frame: Frame, pluginManager: PluginManager):
+    def __init__(self, frame: Frame, lazyPluginManager: LazyPluginManager):
 
         self._containingFrame: Frame = frame
 
-        self.logger:       Logger          = getLogger(__name__)
-        self._preferences: PyutPreferences = PyutPreferences()
-        self.plugMgr:      PluginManager   = pluginManager
+        self.logger:             Logger            = getLogger(__name__)
+        self._preferences:       PyutPreferences   = PyutPreferences()
+        self._lazyPluginManager: LazyPluginManager = lazyPluginManager
 
         self._plugins:    PluginIDMap   = PluginIDMap({})     # To store the plugins and their activation IDs
         self._toolboxIds: ToolboxIdMap = ToolboxIdMap({})  # Dictionary id --> toolbox
@@ -70,9 +74,12 @@ class MenuCreator:
         self._toolMenu: Menu = cast(Menu, None)
         self._helpMenu: Menu = cast(Menu, None)
 
-        self._toolPlugins:   PluginIDMap = cast(PluginIDMap, None)
-        self._exportPlugins: PluginIDMap = cast(PluginIDMap, None)
-        self._importPlugins: PluginIDMap = cast(PluginIDMap, None)
+        # The plugin sub menus are filled in by ._populatePluginMenus
+        self._exportMenu:      Menu = cast(Menu, None)
+        self._importMenu:      Menu = cast(Menu, None)
+        self._pluginToolsMenu: Menu = cast(Menu, None)
+
+        self._pluginMenusPopulated: bool = False
 
         self._fileMenuHandler:  FileMenuHandler  = cast(FileMenuHandler, None)
         self._editMenuHandler:  EditMenuHandler  = cast(EditMenuHandler, None)
@@ -111,30 +118,6 @@ class MenuCreator:
     def helpMenu(self, helpMenu: Menu):
         self._helpMenu = helpMenu
 
-    @property
-    def toolPlugins(self) -> PluginIDMap:
-        raise UnsupportedOperation('Property is write only')
-
-    @toolPlugins.setter
-    def toolPlugins(self, toolPlugins: PluginIDMap):
-        self._toolPlugins = toolPlugins
-
-    @property
-    def exportPlugins(self) -> PluginIDMap:
-        raise UnsupportedOperation('Property is write only')
-
-    @exportPlugins.setter
-    def exportPlugins(self, exportPlugins: PluginIDMap):
-        self._exportPlugins = exportPlugins
-
-    @property
-    def importPlugins(self) -> PluginIDMap:
-        raise UnsupportedOperation('Property is write only')
-
-    @importPlugins.setter
-    def importPlugins(self, importPlugins: PluginIDMap):
-        self._importPlugins = importPlugins
-
     @property
     def toolboxIds(self) -> ToolboxIdMap:
         raise UnsupportedOperation('Property is write only')
@@ -177,6 +160,9 @@ class MenuCreator:
 
     def initializeMenus(self):
 
+        if self._preferences.profilingControl is True:
+            self._instrumentMenuHandlers()
+
         self._initializeFileMenu()
         self._initializeEditMenu()
 
@@ -184,18 +170,13 @@ class MenuCreator:
         #    Tools menu
         # -----------------
         # mnuTools = Menu()
-        sub = self._makeToolMenu()
-        if sub is not None:
-            self._toolMenu.AppendSubMenu(sub, "Tools", 'Tools are here')
+        self._pluginToolsMenu = Menu()
+        self._toolMenu.AppendSubMenu(self._pluginToolsMenu, "Tools", 'Tools are here')
 
         sub = self._makeToolboxMenu()
         if sub is not None:
             self._toolMenu.AppendSubMenu(sub, "Toolboxes", 'Toolboxes are here')
 
-        # Plugins identified
-        self._fileMenuHandler.importPlugins = self._importPlugins
-        self._fileMenuHandler.exportPlugins = self._exportPlugins
-
         self._initializeHelpMenu()
 
         mnuBar = MenuBar()
@@ -211,6 +192,11 @@ class MenuCreator:
         self._bindEditMenuHandlers(containingFrame, self._editMenuHandler)
         self._bindHelpMenuHandlers(containingFrame, self._helpMenuHandler)
 
+        if self._preferences.fastStartup is True:
+            containingFrame.Bind(EVT_MENU_OPEN, self._onMenuOpen)
+        else:
+            self._populatePluginMenus()
+
     def _initializeFileMenu(self):
 
         fileMenu: Menu = self._fileMenu
@@ -233,16 +219,10 @@ class MenuCreator:
         fileMenu.Append(SharedIdentifiers.ID_MENU_FILE_REMOVE_DIAGRAM, "&Delete diagram", "Delete the diagram from the project")
         fileMenu.AppendSeparator()
 
-        fileMenuHandler: FileMenuHandler = self._fileMenuHandler
-
-        sub = self._makeExportMenu(fileMenuHandler=fileMenuHandler)
-        if sub is None:
-            sub = Menu()
-        if sub is not None:
-            self._fileMenu.AppendSubMenu(sub, "Export")
-        sub = self._makeImportMenu(fileMenuHandler=fileMenuHandler)
-        if sub is not None:
-            self._fileMenu.AppendSubMenu(sub, "Import")
+        self._exportMenu = Menu()
+        self._fileMenu.AppendSubMenu(self._exportMenu, "Export")
+        self._importMenu = Menu()
+        self._fileMenu.AppendSubMenu(self._importMenu, "Import")
         fileMenu.AppendSeparator()
         fileMenu.Append(ID_PREFERENCES, "P&references", "Pyut preferences")
         # fileMenu.Append(ID_MNU_FILE_DIAGRAM_PROPERTIES,_("&Diagram Properties"), _("Diagram properties"))
@@ -294,6 +274,19 @@ class MenuCreator:
             mnuHelp.Append(SharedIdentifiers.ID_MENU_HELP_LOGGING_CONTROL, "&Logging Control", "Open Logging Control Dialog")
         if self._preferences.debugEventEngine is True:
             mnuHelp.Append(SharedIdentifiers.ID_MENU_HELP_DEBUG_EVENT_ENGINE, "Debug &Event Engine", "Open Debug Loggers")
+        if self._preferences.profilingControl is True:
+            profilingLabel: str = 'Stop &Profiling' if SessionProfiler().running is True else 'Start &Profiling'
+            mnuHelp.AppendSeparator()
+            mnuHelp.Append(SharedIdentifiers.ID_MENU_HELP_PROFILING,         profilingLabel,       "Start or stop profiling this session")
+            mnuHelp.Append(SharedIdentifiers.ID_MENU_HELP_PROFILING_SUMMARY, "Profiling &Summary", "Show the action timings")
+
+    def _instrumentMenuHandlers(self):
+        """
+        Time the menu handlers while a profiling session runs;  Must be done before they are bound
+        """
+        sessionProfiler: SessionProfiler = SessionProfiler()
+        for menuHandler in [self._fileMenuHandler, self._editMenuHandler, self._toolsMenuHandler, self._helpMenuHandler]:
+            sessionProfiler.instrument(handler=menuHandler)
 
     def _initializeErrorViewSubMenu(self, mnuEdit: Menu) -> Menu:
 
@@ -316,12 +309,41 @@ class MenuCreator:
 
         return mnuEdit
 
-    def _makeExportMenu(self, fileMenuHandler: FileMenuHandler):
+    def _populatePluginMenus(self):
+        """
+        Discover the plugins and fill in their sub menus;  Only done once
+        """
+        if self._pluginMenusPopulated is True:
+            return
+        self._pluginMenusPopulated = True
+
+        fileMenuHandler: FileMenuHandler = self._fileMenuHandler
+
+        self._makeExportMenu(fileMenuHandler=fileMenuHandler)
+        self._makeImportMenu(fileMenuHandler=fileMenuHandler)
+        self._makeToolMenu()
+
+        # Plugins identified
+        fileMenuHandler.importPlugins = self._lazyPluginManager.importPlugins
+        fileMenuHandler.exportPlugins = self._lazyPluginManager.exportPlugins
+
+    def _onMenuOpen(self, event: MenuEvent):
+        """
+        Fast startup defers plugin discovery until the end-user opens a menu
+
+        Args:
+            event:
+        """
+        self._populatePluginMenus()
+        self._containingFrame.Unbind(EVT_MENU_OPEN, handler=self._onMenuOpen)
+        event.Skip()
+
+    def _makeExportMenu(self, fileMenuHandler: FileMenuHandler) -> Menu:
         """
         Make the export submenu.
         """
-        pluginMap: PluginIDMap = self._exportPlugins
-        sub:       Menu = Menu()
+        pluginMap: PluginIDMap = self._lazyPluginManager.exportPlugins
+        sub:       Menu = self._exportMenu
 
         for wxId in pluginMap:
             # TODO figure out how to quiet mypy
@@ -337,9 +359,9 @@ class MenuCreator:
         """
         Make the import submenu.
         """
-        pluginMap: PluginIDMap = self._importPlugins
+        pluginMap: PluginIDMap = self._lazyPluginManager.importPlugins
 
-        sub: Menu = Menu()
+        sub: Menu = self._importMenu
 
         for wxId in pluginMap:
             # TODO figure out how to quiet mypy
@@ -355,8 +377,8 @@ class MenuCreator:
         """
         Make the Tools submenu.
         """
-        pluginMap: PluginIDMap = self._toolPlugins
-        sub:       Menu = Menu()
+        pluginMap: PluginIDMap = self._lazyPluginManager.toolPlugins
+        sub:       Menu = self._pluginToolsMenu
 
         for wxId in pluginMap:
 
@@ -441,6 +463,8 @@ class MenuCreator:
         containingFrame.Bind(EVT_MENU, helpMenuHandler.onHelpWeb,          id=SharedIdentifiers.ID_MENU_HELP_WEB)
         containingFrame.Bind(EVT_MENU, helpMenuHandler.onDebug, id=SharedIdentifiers.ID_MENU_HELP_LOGGING_CONTROL)
         containingFrame.Bind(EVT_MENU, helpMenuHandler.onDebugEventEngine, id=SharedIdentifiers.ID_MENU_HELP_DEBUG_EVENT_ENGINE)
+        containingFrame.Bind(EVT_MENU, helpMenuHandler.onToggleProfiling,  id=SharedIdentifiers.ID_MENU_HELP_PROFILING)
+        containingFrame.Bind(EVT_MENU, helpMenuHandler.onProfilingSummary, id=SharedIdentifiers.ID_MENU_HELP_PROFILING_SUMMARY)
 
     def __makeSubMenuEntry(self, subMenu: Menu, wxId: int, formatName: str, callback: Callable) -> Menu:
 
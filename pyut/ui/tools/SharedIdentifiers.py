@@ -22,6 +22,7 @@ class SharedIdentifiers:
         ID_MENU_EDIT_SHOW_TOOLBAR,
 
         ID_MENU_HELP_VERSION, ID_MENU_HELP_WEB, ID_MENU_HELP_LOGGING_CONTROL, ID_MENU_HELP_DEBUG_EVENT_ENGINE,
+        ID_MENU_HELP_PROFILING, ID_MENU_HELP_PROFILING_SUMMARY,
 
         ID_SD_INSTANCE, ID_SD_MESSAGE,
         ID_ARROW, ID_CLASS,
@@ -29,7 +30,7 @@ class SharedIdentifiers:
         ID_USECASE, ID_REL_NOTE, ID_TEXT,
         ID_RELATIONSHIP_INHERITANCE, ID_RELATIONSHIP_REALIZATION, ID_RELATIONSHIP_COMPOSITION, ID_RELATIONSHIP_AGGREGATION, ID_RELATIONSHIP_ASSOCIATION,
         ID_ZOOM_IN, ID_ZOOM_OUT, ID_ZOOM_VALUE,
-    ] = PyutUtils.assignID(42)
+    ] = PyutUtils.assignID(44)
 
     ACTIONS = {
         ID_ARROW:                    Action.SELECTOR,
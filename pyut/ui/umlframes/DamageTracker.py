@@ -0,0 +1,116 @@
+
+from typing import TYPE_CHECKING
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from wx import CallAfter
+from wx import Rect
+
+from miniogl.Shape import Shape
+
+from ogl.OglAssociation import OglAssociation
+from ogl.OglObject import OglObject
+
+from pyut.general.SpatialGrid import Bounds
+
+if TYPE_CHECKING:
+    from pyut.ui.umlframes.UmlFrameShapeHandler import UmlFrameShapeHandler
+
+DAMAGE_MARGIN: int = 4      # Selection handles and arrow heads draw slightly outside a shape
+
+
+class DamageTracker:
+    """
+    Collects the diagram areas that need repainting and issues a single `RefreshRect` for
+    all of them on the next event loop iteration.
+
+    Callers report a shape before and after they change it;  The tracker records the shape's
+    current extent plus the extent of its connected links and their labels.  Shapes whose extent
+    is unknown damage the whole window
+    """
+    def __init__(self, umlFrame: 'UmlFrameShapeHandler'):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlFrame:  'UmlFrameShapeHandler' = umlFrame
+        self._damage:    Bounds | None = None
+        self._damageAll: bool          = False
+        self._scheduled: bool          = False
+
+    def damageShape(self, shape: Shape):
+        """
+        Repaint the area the shape currently covers
+
+        Args:
+            shape:  A shape on the frame's diagram
+        """
+        for affected in self._affectedShapes(shape=shape):
+            bounds: Bounds | None = self._umlFrame.diagram.shapeBounds(shape=affected)
+            if bounds is None:
+                self.damageAll()
+                return
+            self.damageBounds(bounds=bounds)
+
+    def damageBounds(self, bounds: Bounds):
+        """
+        Args:
+            bounds:  An area in diagram coordinates
+        """
+        if self._damage is None:
+            self._damage = bounds
+        else:
+            self._damage = Bounds(minX=min(self._damage.minX, bounds.minX), minY=min(self._damage.minY, bounds.minY),
+                                  maxX=max(self._damage.maxX, bounds.maxX), maxY=max(self._damage.maxY, bounds.maxY))
+        self._schedule()
+
+    def damageAll(self):
+        """
+        Repaint the whole window
+        """
+        self._damageAll = True
+        self._schedule()
+
+    def _schedule(self):
+
+        if self._scheduled is False:
+            self._scheduled = True
+            CallAfter(self._flush)
+
+    def _flush(self):
+
+        damage:    Bounds | None = self._damage
+        damageAll: bool          = self._damageAll
+
+        self._damage    = None
+        self._damageAll = False
+        self._scheduled = False
+
+        if not self._umlFrame:      # The frame was destroyed before we got here
+            return
+
+        w, h = self._umlFrame.GetClientSize()
+        if damageAll is True:
+            self._umlFrame.RefreshRect(Rect(0, 0, w, h), eraseBackground=False)
+        elif damage is not None:
+            x, y = self._umlFrame.CalcScrolledPosition(damage.minX - DAMAGE_MARGIN, damage.minY - DAMAGE_MARGIN)
+            width:  int = damage.maxX - damage.minX + 2 * DAMAGE_MARGIN
+            height: int = damage.maxY - damage.minY + 2 * DAMAGE_MARGIN
+            refreshRect: Rect = Rect(x, y, width, height).Intersect(Rect(0, 0, w, h))
+            if refreshRect.IsEmpty() is False:
+                self.logger.debug(f'{refreshRect=}')
+                self._umlFrame.RefreshRect(refreshRect, eraseBackground=False)
+
+    def _affectedShapes(self, shape: Shape) -> List[Shape]:
+
+        shapes: List[Shape] = [shape]
+        if isinstance(shape, OglObject):
+            shapes.extend(shape.links)
+        for link in list(shapes):
+            if isinstance(link, OglAssociation):
+                for label in (link.centerLabel, link.sourceCardinality, link.destinationCardinality):
+                    if label is not None:
+                        shapes.append(label)
+
+        return shapes
@@ -0,0 +1,514 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from miniogl.Diagram import Diagram
+from miniogl.LinePoint import LinePoint
+from miniogl.LineShape import LineShape
+from miniogl.LollipopLine import LollipopLine
+from miniogl.PointShape import PointShape
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import Shape
+from miniogl.Shape import Shapes
+from miniogl.SizerShape import SizerShape
+
+from ogl.OglActor import OglActor
+from ogl.OglAssociation import OglAssociation
+from ogl.OglClass import OglClass
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+from ogl.OglObject import OglObject
+from ogl.OglText import OglText
+from ogl.OglUseCase import OglUseCase
+
+from ogl.sd.OglSDInstance import OglSDInstance
+from ogl.sd.OglSDMessage import OglSDMessage
+
+from pyut.general.SpatialGrid import Bounds
+from pyut.general.SpatialGrid import SpatialGrid
+
+LINE_TOLERANCE:    int = 8       # Lines accept clicks a few pixels away from the segment
+POINT_TOLERANCE:   int = 8
+MINIMUM_SELECTION: int = 4
+
+# This is a duplicate of the UmlObject, since I cannot use NewType
+UML_OBJECT_KINDS: Tuple[type, ...] = (OglClass, OglLink, OglNote, OglText, OglSDMessage, OglSDInstance, OglActor, OglUseCase, OglInterface2)
+
+
+class IndexedDiagram(Diagram):
+    """
+    A diagram that keeps a model id to shape dictionary, the UML objects bucketed by kind, the diagram
+    boundaries and a spatial index of its shapes so that object lookup, hit testing and the
+    frame's `umlObjects` and `objectBoundaries` do not scan every shape.
+
+    Adding and removing shapes update these incrementally.  Shapes move and resize without telling
+    the diagram;  So, whoever moves or resizes a shape calls `update` with it.  That re-indexes the
+    shape, its children and anchors and the links that end on it.  Only a bulk change, adding many
+    shapes or zooming, calls `invalidate` so that the next query rebuilds everything once
+    """
+    def __init__(self, panel):
+
+        super().__init__(panel)
+
+        self.indexLogger: Logger = getLogger(__name__)
+
+        self._shapesByModelId: Dict[int, Shape] = {}
+        """
+        Keyed by the Pyut model id
+        """
+        self._shapesByKey: Dict[int, Shape] = {}
+        """
+        Keyed by `id(shape)`;  Some shapes override __eq__ without __hash__
+        """
+        self._zOrder:    Dict[int, int] = {}
+        self._nextZ:     int            = 0
+        self._unbounded: Dict[int, Shape] = {}
+        """
+        Shapes whose extent we cannot compute;  Always hit tested
+        """
+        self._grid:    SpatialGrid       = SpatialGrid()
+        self._stale:   bool              = False
+        self._extents: Dict[int, Bounds] = {}
+        """
+        The extent each shape had when it was last indexed;  Tells us whether moving it can shrink the boundaries
+        """
+
+        self._umlObjectsInOrder: Dict[int, Shape]             = {}
+        self._umlObjectBuckets:  Dict[type, Dict[int, Shape]] = {}
+        self._umlObjects:        Shapes | None                = None
+        """
+        The snapshot handed to callers;  Replaced, never modified, when the UML objects change
+        """
+        self._boundaries:      Bounds | None = None
+        self._boundariesStale: bool          = False
+
+        self._pendingModelUpdates: Shapes | None = None
+        """
+        Not None while `addShapes` runs
+        """
+        self._pendingRemovals: Dict[int, Shape] | None = None
+        """
+        Not None while `removeShapes` runs
+        """
+
+    def AddShape(self, shape, withModelUpdate: bool = True):
+
+        if self._pendingModelUpdates is None:
+            super().AddShape(shape, withModelUpdate)
+        else:
+            self._bulkAddShape(shape=shape, withModelUpdate=withModelUpdate)
+
+        key: int = id(shape)
+        if key in self._shapesByKey:
+            return
+        self._shapesByKey[key] = shape
+        self._zOrder[key]      = self._nextZ
+        self._nextZ += 1
+
+        modelId: int | None = self._modelId(shape=shape)
+        if modelId is not None:
+            self._shapesByModelId[modelId] = shape
+
+        if isinstance(shape, UML_OBJECT_KINDS):
+            self._umlObjectsInOrder[key] = shape
+            self._umlObjectBuckets.setdefault(type(shape), {})[key] = shape
+            self._umlObjects = None
+
+        if self._stale is False:
+            self._indexShape(key=key, shape=shape)
+        self._updateExtent(key=key, shape=shape)
+
+    def addShapes(self, shapes: Shapes, withModelUpdate: bool = True):
+        """
+        Add many shapes at once.  Shapes are checked for membership by identity instead of
+        scanning the shape list, the model updates run after every shape is attached and the
+        spatial index and the boundaries are rebuilt once on the next query
+
+        Args:
+            shapes:           The shapes to add;  Their anchors and children are added with them
+            withModelUpdate:  If True, the shape models are updated from the shapes
+        """
+        self.invalidate()
+        self._pendingModelUpdates = Shapes([])
+        try:
+            for shape in shapes:
+                self.AddShape(shape, withModelUpdate=withModelUpdate)
+            for shape in self._pendingModelUpdates:
+                shape.UpdateModel()
+        finally:
+            self._pendingModelUpdates = None
+
+    def removeShapes(self, shapes: Shapes):
+        """
+        Detach many shapes at once.  The shape lists are filtered once after every shape
+        is detached instead of being scanned for each shape
+
+        Args:
+            shapes:  The shapes to detach;  Their anchors and children are detached with them
+        """
+        self._pendingRemovals = {}
+        try:
+            for shape in shapes:
+                shape.Detach()
+            if len(self._pendingRemovals) > 0:
+                self._shapes       = [shape for shape in self._shapes       if id(shape) not in self._pendingRemovals]
+                self._parentShapes = [shape for shape in self._parentShapes if id(shape) not in self._pendingRemovals]
+        finally:
+            self._pendingRemovals = None
+
+    def RemoveShape(self, shape):
+
+        if self._pendingRemovals is None:
+            super().RemoveShape(shape)
+        else:
+            self._pendingRemovals[id(shape)] = shape
+
+        key: int = id(shape)
+        if self._shapesByKey.pop(key, None) is None:
+            return
+        self._zOrder.pop(key, None)
+        self._unbounded.pop(key, None)
+        self._grid.remove(entryId=key)
+
+        modelId: int | None = self._modelId(shape=shape)
+        if modelId is not None and self._shapesByModelId.get(modelId) is shape:
+            del self._shapesByModelId[modelId]
+
+        if self._umlObjectsInOrder.pop(key, None) is not None:
+            self._umlObjectBuckets[type(shape)].pop(key, None)
+            self._umlObjects = None
+
+        extent: Bounds | None = self._extents.pop(key, None)
+        if extent is None:
+            extent = self._shapeExtent(shape=shape)
+        if self._boundaries is not None and self._onEdge(extent=extent, boundaries=self._boundaries):
+            self._boundariesStale = True
+
+    def DeleteAllShapes(self):
+
+        super().DeleteAllShapes()
+
+        self._shapesByModelId = {}
+        self._shapesByKey     = {}
+        self._zOrder          = {}
+        self._unbounded       = {}
+        self._extents         = {}
+        self._grid.clear()
+        self._stale = False
+
+        self._umlObjectsInOrder = {}
+        self._umlObjectBuckets  = {}
+        self._umlObjects        = None
+        self._boundaries        = None
+        self._boundariesStale   = False
+
+    def MoveToFront(self, shape: Shape):
+        super().MoveToFront(shape)
+        self._renumber()
+
+    def MoveToBack(self, shape: Shape):
+        super().MoveToBack(shape)
+        self._renumber()
+
+    def update(self, shape: Shape):
+        """
+        The shape moved or changed size;  Re-index it, its children and anchors and the links
+        that end on it.  The other shapes are not touched
+
+        Args:
+            shape:  A shape on this diagram
+        """
+        for affected in self._affectedShapes(shape=shape):
+            key: int = id(affected)
+            if key not in self._shapesByKey:
+                continue
+            if self._stale is False:
+                self._grid.remove(entryId=key)
+                self._unbounded.pop(key, None)
+                self._indexShape(key=key, shape=affected)
+            self._updateExtent(key=key, shape=affected)
+
+    def invalidate(self):
+        """
+        Every shape moved or resized, e.g. a zoom;  Rebuild the spatial index and the boundaries on the next query
+        """
+        self._stale           = True
+        self._boundariesStale = True
+
+    @property
+    def umlObjects(self) -> Shapes:
+        """
+        The UML objects in display order.  The list is shared between calls until the
+        UML objects change;  Callers must not modify it
+
+        Returns:  The UML objects on this diagram
+        """
+        if self._umlObjects is None:
+            self._umlObjects = Shapes(list(self._umlObjectsInOrder.values()))
+
+        return self._umlObjects
+
+    def umlObjectsOfKind(self, kind: type) -> Shapes:
+        """
+        Args:
+            kind:  A UML object class;  Subclasses match too
+
+        Returns:  The UML objects of that kind in the order they were added
+        """
+        shapes: Shapes = Shapes([])
+        for bucketKind, bucket in self._umlObjectBuckets.items():
+            if issubclass(bucketKind, kind):
+                shapes.extend(bucket.values())
+
+        return shapes
+
+    @property
+    def boundaries(self) -> Bounds | None:
+        """
+        Returns:  The smallest rectangle that holds every shape or None if the diagram is empty
+        """
+        if self._boundariesStale is True:
+            self._boundaries = None
+            self._extents    = {}
+            for shape in self._shapes:
+                extent: Bounds = self._shapeExtent(shape=shape)
+                self._extents[id(shape)] = extent
+                self._boundaries = self._union(self._boundaries, extent)
+            self._boundariesStale = False
+
+        return self._boundaries
+
+    def shapeByModelId(self, modelId: int) -> Shape | None:
+        """
+        Args:
+            modelId:  A Pyut model id
+
+        Returns:  The shape that displays that model object or None
+        """
+        shape: Shape | None = self._shapesByModelId.get(modelId)
+        if shape is not None and self._modelId(shape=shape) == modelId:
+            return shape
+        #
+        # The model id changed after the shape was added;  Repair the dictionary
+        #
+        for candidate in self._shapes:
+            if self._modelId(shape=candidate) == modelId:
+                self._shapesByModelId[modelId] = candidate
+                return candidate
+
+        return None
+
+    def shapeForModel(self, modelObject: object) -> Shape | None:
+        """
+        Args:
+            modelObject:  A Pyut model object or a shape
+
+        Returns:  The shape on this diagram that is, or displays, the object;  Else None
+        """
+        if id(modelObject) in self._shapesByKey:
+            return cast(Shape, modelObject)
+
+        modelId: int | None = getattr(modelObject, 'id', None)
+        if not isinstance(modelId, int):
+            return None
+
+        shape: Shape | None = self.shapeByModelId(modelId=modelId)
+        if shape is not None and getattr(shape, 'pyutObject', None) is modelObject:
+            return shape
+
+        return None
+
+    def findShape(self, x: int, y: int) -> Shape | None:
+        """
+        Args:
+            x:  abscissa in diagram coordinates
+            y:  ordinate in diagram coordinates
+
+        Returns:  The top most shape under the point or None
+        """
+        self._refreshIndex()
+
+        keys: List[int] = list(self._grid.queryPoint(x=x, y=y)) + list(self._unbounded.keys())
+        keys.sort(key=lambda k: self._zOrder[k], reverse=True)
+
+        for key in keys:
+            shape: Shape = self._shapesByKey[key]
+            if shape.Inside(x, y):
+                return shape
+
+        return None
+
+    def shapesInRectangle(self, bounds: Bounds) -> Shapes:
+        """
+        Args:
+            bounds:  A rectangle in diagram coordinates
+
+        Returns:  The shapes whose extent intersects the rectangle in display order;  Includes the
+        shapes whose extent is unknown
+        """
+        self._refreshIndex()
+
+        keys: List[int] = list(self._grid.queryRectangle(bounds=bounds)) + list(self._unbounded.keys())
+        keys.sort(key=lambda k: self._zOrder[k])
+
+        return Shapes([self._shapesByKey[key] for key in keys])
+
+    def _bulkAddShape(self, shape: Shape, withModelUpdate: bool):
+        """
+        Diagram.AddShape without the list scans
+        """
+        if id(shape) not in self._shapesByKey:
+            self._shapes.append(shape)
+            if shape.parent is None:
+                self._parentShapes.append(shape)
+
+        shape.Attach(self)
+
+        if withModelUpdate is True:
+            cast(Shapes, self._pendingModelUpdates).append(shape)
+
+    def _refreshIndex(self):
+
+        if self._stale is False:
+            return
+
+        self.indexLogger.debug(f'Rebuilding spatial index for {len(self._shapesByKey)} shapes')
+        self._grid.clear()
+        self._unbounded = {}
+        for key, shape in self._shapesByKey.items():
+            self._indexShape(key=key, shape=shape)
+
+        self._stale = False
+
+    def _indexShape(self, key: int, shape: Shape):
+
+        bounds: Bounds | None = self.shapeBounds(shape=shape)
+        if bounds is None:
+            self._unbounded[key] = shape
+        else:
+            self._grid.insert(entryId=key, bounds=bounds)
+
+    def _updateExtent(self, key: int, shape: Shape):
+        """
+        Grow the boundaries to the shape's new extent;  If its old extent was on the
+        boundaries they may shrink, so rebuild them on the next query
+        """
+        extent:    Bounds        = self._shapeExtent(shape=shape)
+        oldExtent: Bounds | None = self._extents.get(key)
+
+        self._extents[key] = extent
+        if self._boundariesStale is True or extent == oldExtent:
+            return
+        if oldExtent is not None and self._boundaries is not None and self._onEdge(extent=oldExtent, boundaries=self._boundaries):
+            self._boundariesStale = True
+        else:
+            self._boundaries = self._union(self._boundaries, extent)
+
+    def _affectedShapes(self, shape: Shape) -> Shapes:
+        """
+        Args:
+            shape:  A shape that moved or resized
+
+        Returns:  The shape plus every shape whose extent depends on it;  A sizer's parent, the children,
+        the anchors, the links that end on the anchors, their control points and labels
+        """
+        affected: Dict[int, Shape] = {}
+        pending:  List[Shape]      = [shape]
+        if isinstance(shape, SizerShape) and shape.parent is not None:
+            pending.append(shape.parent)
+
+        while len(pending) > 0:
+            current: Shape = pending.pop()
+            if id(current) in affected:
+                continue
+            affected[id(current)] = current
+
+            pending.extend(current.children)
+            pending.extend(current.anchors)
+            if isinstance(current, LinePoint):
+                pending.extend(current.lines)
+            if isinstance(current, OglObject):
+                pending.extend(current.links)
+            if isinstance(current, LineShape):
+                pending.extend(current.GetControlPoints())
+            if isinstance(current, OglAssociation):
+                pending.extend([label for label in (current.centerLabel, current.sourceCardinality, current.destinationCardinality) if label is not None])
+
+        return Shapes(list(affected.values()))
+
+    def _renumber(self):
+        """
+        The display order changed
+        """
+        self._zOrder = {id(shape): z for z, shape in enumerate(self._shapes)}
+        self._nextZ  = len(self._shapes)
+
+        self._umlObjectsInOrder = {id(shape): shape for shape in self._shapes if id(shape) in self._umlObjectsInOrder}
+        self._umlObjects        = None
+
+    def _shapeExtent(self, shape: Shape) -> Bounds:
+        """
+        The extent the frame has always reported;  Position plus size
+        """
+        x, y = shape.GetPosition()
+        w, h = shape.GetSize()
+        return Bounds(minX=x, minY=y, maxX=x + w, maxY=y + h)
+
+    def _union(self, boundaries: Bounds | None, extent: Bounds) -> Bounds:
+
+        if boundaries is None:
+            return extent
+
+        return Bounds(minX=min(boundaries.minX, extent.minX), minY=min(boundaries.minY, extent.minY),
+                      maxX=max(boundaries.maxX, extent.maxX), maxY=max(boundaries.maxY, extent.maxY))
+
+    def _onEdge(self, extent: Bounds, boundaries: Bounds) -> bool:
+        """
+        Removing a shape only shrinks the boundaries if it touches them
+        """
+        return extent.minX <= boundaries.minX or extent.minY <= boundaries.minY or extent.maxX >= boundaries.maxX or extent.maxY >= boundaries.maxY
+
+    def shapeBounds(self, shape: Shape) -> Bounds | None:
+        """
+        Args:
+            shape:  A shape on this diagram
+
+        Returns:  The area in which the shape draws and accepts clicks or None if we cannot compute it
+        """
+
+        if isinstance(shape, LollipopLine):
+            return None
+        elif isinstance(shape, LineShape):
+            points = shape.GetControlPoints() + [shape.sourceAnchor, shape.destinationAnchor]
+            xs: List[int] = []
+            ys: List[int] = []
+            for point in points:
+                px, py = point.GetPosition()
+                xs.append(px)
+                ys.append(py)
+            return Bounds(minX=min(xs) - LINE_TOLERANCE, minY=min(ys) - LINE_TOLERANCE, maxX=max(xs) + LINE_TOLERANCE, maxY=max(ys) + LINE_TOLERANCE)
+        elif isinstance(shape, PointShape):
+            px, py = shape.GetPosition()
+            # noinspection PyProtectedMember
+            zone: int = max(int(shape._selectionZone), POINT_TOLERANCE)
+            return Bounds(minX=px - zone, minY=py - zone, maxX=px + zone, maxY=py + zone)
+        elif isinstance(shape, (RectangleShape, OglSDInstance)):
+            # RectangleShape.Inside accepts negative sizes and selects at least 4 pixels
+            x, y = shape.topLeft
+            w, h = shape.GetSize()
+            return Bounds(minX=min(x, x + w) - MINIMUM_SELECTION, minY=min(y, y + h) - MINIMUM_SELECTION,
+                          maxX=max(x, x + w) + MINIMUM_SELECTION, maxY=max(y, y + h) + MINIMUM_SELECTION)
+
+        return None
+
+    def _modelId(self, shape: Shape) -> int | None:
+
+        if isinstance(shape, (OglClass, OglLink, OglObject)):
+            return cast(int, shape.pyutObject.id)
+        return None
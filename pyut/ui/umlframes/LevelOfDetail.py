@@ -0,0 +1,11 @@
+
+from enum import Enum
+
+
+class LevelOfDetail(Enum):
+    """
+    How much of each shape the frame draws
+    """
+    FULL   = 'Full'      # Everything
+    TITLES = 'Titles'    # Classes as titled boxes, plain links, no labels
+    BOXES  = 'Boxes'     # Classes as plain rectangles, plain links, no labels
@@ -0,0 +1,135 @@
+
+from typing import Dict
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+from wx import FONTFAMILY_DEFAULT
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_BOLD
+
+from wx import Font
+
+from miniogl.LineShape import LineShape
+from miniogl.LollipopLine import LollipopLine
+from miniogl.Shape import Shape
+from miniogl.TextShape import TextShape
+
+from ogl.OglClass import OglClass
+from ogl.OglObject import OglObject
+
+from ogl.sd.OglSDInstance import OglSDInstance
+from ogl.sd.OglSDMessage import OglSDMessage
+
+from pyut.preferences.PyutPreferences import PyutPreferences
+
+from pyut.ui.umlframes.LevelOfDetail import LevelOfDetail
+
+TITLE_FONT_SIZE:         int = 12
+MINIMUM_TITLE_FONT_SIZE: int = 4
+TITLE_MARGIN:            int = 2
+
+
+class LevelOfDetailRenderer:
+    """
+    Draws simplified shapes when the frame is zoomed out far enough that their text is unreadable.
+    The zoom thresholds are the `levelOfDetailTitlesZoom` and `levelOfDetailBoxesZoom` preferences.
+
+    Selected shapes and sequence diagram shapes are always drawn in full
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._preferences: PyutPreferences = PyutPreferences()
+        self._titleFonts:  Dict[int, Font] = {}
+
+    def levelOfDetail(self, zoom: float) -> LevelOfDetail:
+        """
+        Args:
+            zoom:  The frame's current zoom factor
+
+        Returns:  How much detail to draw at that zoom
+        """
+        if zoom < self._preferences.levelOfDetailBoxesZoom:
+            return LevelOfDetail.BOXES
+        elif zoom < self._preferences.levelOfDetailTitlesZoom:
+            return LevelOfDetail.TITLES
+
+        return LevelOfDetail.FULL
+
+    def draw(self, shape: Shape, dc: DC, levelOfDetail: LevelOfDetail, zoom: float) -> bool:
+        """
+        Args:
+            shape:          The shape to draw
+            dc:             The device context
+            levelOfDetail:  The current level of detail
+            zoom:           The frame's current zoom factor
+
+        Returns:  `True` if the shape was handled, `False` if the caller should draw it in full
+        """
+        if levelOfDetail == LevelOfDetail.FULL or shape.selected is True or isinstance(shape, (OglSDInstance, OglSDMessage)):
+            return False
+
+        if isinstance(shape, TextShape):
+            pass                    # Labels are unreadable at this size
+        elif isinstance(shape, OglObject):
+            self._drawBox(shape=shape, dc=dc)
+            if levelOfDetail == LevelOfDetail.TITLES and isinstance(shape, OglClass):
+                self._drawTitle(oglClass=shape, dc=dc, zoom=zoom)
+        elif isinstance(shape, LineShape) and not isinstance(shape, LollipopLine):
+            self._drawPlainLine(lineShape=shape, dc=dc)
+        else:
+            return False
+
+        return True
+
+    def _drawBox(self, shape: OglObject, dc: DC):
+
+        if shape.visible is False:
+            return
+
+        x, y = shape.topLeft
+        w, h = shape.GetSize()
+        dc.SetPen(shape.pen)
+        dc.SetBrush(shape.brush)
+        dc.DrawRectangle(x, y, w, h)
+
+    def _drawTitle(self, oglClass: OglClass, dc: DC, zoom: float):
+
+        if oglClass.visible is False:
+            return
+
+        x, y = oglClass.topLeft
+        w, h = oglClass.GetSize()
+
+        dc.SetFont(self._titleFont(zoom=zoom))
+        dc.SetTextForeground(oglClass.pen.GetColour())
+
+        name: str = oglClass.pyutObject.name
+        textWidth, textHeight = dc.GetTextExtent(name)
+        if textHeight + TITLE_MARGIN <= h:
+            dc.SetClippingRegion(x, y, w, h)
+            dc.DrawText(name, x + max((w - textWidth) // 2, 0), y + TITLE_MARGIN)
+            dc.DestroyClippingRegion()
+
+    def _drawPlainLine(self, lineShape: LineShape, dc: DC):
+        """
+        No arrows, control points or decorations
+        """
+        if lineShape.visible is False:
+            return
+
+        dc.SetPen(lineShape.pen)
+        dc.DrawLines(lineShape.segments)
+
+    def _titleFont(self, zoom: float) -> Font:
+
+        pointSize: int = max(round(TITLE_FONT_SIZE * zoom), MINIMUM_TITLE_FONT_SIZE)
+        font: Font | None = self._titleFonts.get(pointSize)
+        if font is None:
+            font = Font(pointSize, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD)
+            self._titleFonts[pointSize] = font
+
+        return font
@@ -1,6 +1,8 @@
 
 from typing import List
 from typing import NewType
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -10,11 +12,14 @@ from dataclasses import dataclass
 
 from miniogl.MiniOglColorEnum import MiniOglColorEnum
 from wx import BLACK_PEN
+from wx import Bitmap
 from wx import Brush
 from wx import Colour
 from wx import DC
+from wx import Mask
+from wx import MemoryDC
+from wx import NullBitmap
 from wx import PENSTYLE_LONG_DASH
-from wx import PaintDC
 from wx import Pen
 from wx import PenInfo
 from wx import Point
@@ -22,7 +27,10 @@ from wx import Point
 # noinspection PyUnresolvedReferences
 from wx.core import PenStyle
 
-from miniogl.DiagramFrame import DiagramFrame
+from pyut.general.SpatialGrid import Bounds
+
+if TYPE_CHECKING:
+    from pyut.ui.umlframes.UmlFrameShapeHandler import UmlFrameShapeHandler
 
 Points      = NewType('Points',      List[Point])
 IntegerList = NewType('IntegerList', List[int])
@@ -39,6 +47,9 @@ class Rectangle:
 Rectangles = NewType('Rectangles', List[Rectangle])
 
 REFERENCE_POINT_RADIUS: int = 4
+MAXIMUM_OVERLAY_PIXELS: int = 16_000_000
+
+OVERLAY_MASK_COLOUR: Colour = Colour(1, 2, 3)
 
 
 class OrthogonalRoutingDiagnosticMixin:
@@ -58,6 +69,11 @@ class OrthogonalRoutingDiagnosticMixin:
         self._diagramBounds:       Rectangle   = cast(Rectangle, None)
         self._routeGrid:           Rectangles  = cast(Rectangles, None)
 
+        self._overlay:       Bitmap | None = None
+        self._overlayOrigin: Tuple[int, int] = (0, 0)
+        self._overlayStale:  bool          = True
+        self._rulerPen:      Pen | None    = None
+
     @property
     def showReferencePoints(self) -> bool:
         raise AttributeError("This property is write-only.")
@@ -65,6 +81,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @showReferencePoints.setter
     def showReferencePoints(self, value: bool):
         self._showReferencePoints = value
+        self._overlayStale = True
 
     @property
     def showRulers(self) -> bool:
@@ -73,6 +90,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @showRulers.setter
     def showRulers(self, value: bool):
         self._showRulers = value
+        self._overlayStale = True
 
     @property
     def showRouteGrid(self) -> bool:
@@ -81,6 +99,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @showRouteGrid.setter
     def showRouteGrid(self, showRouteGrid: bool):
         self._showRouteGrid = showRouteGrid
+        self._overlayStale = True
 
     @property
     def referencePoints(self) -> Points:
@@ -89,6 +108,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @referencePoints.setter
     def referencePoints(self, points: Points):
         self._referencePoints = points
+        self._overlayStale = True
 
     @property
     def horizontalRulers(self) -> IntegerList:
@@ -97,6 +117,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @horizontalRulers.setter
     def horizontalRulers(self, newRulers: IntegerList):
         self._horizontalRulers = newRulers
+        self._overlayStale = True
 
     @property
     def verticalRulers(self):
@@ -105,6 +126,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @verticalRulers.setter
     def verticalRulers(self, newRulers: IntegerList):
         self._verticalRulers = newRulers
+        self._overlayStale = True
 
     @property
     def diagramBounds(self) -> Rectangle:
@@ -113,6 +135,7 @@ class OrthogonalRoutingDiagnosticMixin:
     @diagramBounds.setter
     def diagramBounds(self, newBounds: Rectangle):
         self._diagramBounds = newBounds
+        self._overlayStale = True
 
     @property
     def routeGrid(self) -> Rectangles:
@@ -121,27 +144,92 @@ class OrthogonalRoutingDiagnosticMixin:
     @routeGrid.setter
     def routeGrid(self, routeGrid: Rectangles):
         self._routeGrid = routeGrid
-
-    def drawDiagnostics(self, umlFrame: DiagramFrame):
-
-        if self._showDiagnostics() is True:
-            w, h = umlFrame.GetSize()
-
-            mem: DC = umlFrame.CreateDC(False, w, h)
-            mem.SetBackground(Brush(umlFrame.GetBackgroundColour()))
-            mem.Clear()
-            x, y = umlFrame.CalcUnscrolledPosition(0, 0)
-
-            if self._showReferencePoints is True:
-                self._drawReferencePoints(dc=mem)
-            if self._showRulers is True:
-                self._drawRulers(dc=mem)
-            if self._showRouteGrid is True:
-                self._drawRouteGrid(dc=mem, umlFrame=umlFrame)
-
-            paintDC: PaintDC = PaintDC(self)
-            umlFrame.Redraw(mem)
-            paintDC.Blit(0, 0, w, h, mem, x, y)
+        self._overlayStale = True
+
+    def drawDiagnostics(self, dc: DC, umlFrame: 'UmlFrameShapeHandler'):
+        """
+        Composite the diagnostics over the frame's paint buffer.  The geometry is rendered into an
+        overlay bitmap that is only rebuilt when new diagnostic data arrives
+
+        Args:
+            dc:         The frame's paint buffer;  Prepared for diagram coordinates
+            umlFrame:   The frame we are mixed into
+        """
+        if self._showDiagnostics() is False:
+            return
+
+        if self._overlayStale is True:
+            self._buildOverlay(umlFrame=umlFrame)
+            self._overlayStale = False
+
+        if self._overlay is None:
+            self._drawGeometry(dc=dc, umlFrame=umlFrame)      # Too big to cache
+        else:
+            x, y = self._overlayOrigin
+            dc.DrawBitmap(self._overlay, x, y, useMask=True)
+
+    def _buildOverlay(self, umlFrame: 'UmlFrameShapeHandler'):
+
+        self._overlay = None
+
+        extent: Bounds | None = self._geometryExtent()
+        if extent is None:
+            return
+        width:  int = extent.maxX - extent.minX + 1
+        height: int = extent.maxY - extent.minY + 1
+        if width * height > MAXIMUM_OVERLAY_PIXELS:
+            self.mixinLogger.info(f'Diagnostic overlay too large: {width}x{height};  Drawing directly')
+            return
+
+        bitmap: Bitmap   = Bitmap(width, height)
+        mem:    MemoryDC = MemoryDC(bitmap)
+        mem.SetBackground(Brush(OVERLAY_MASK_COLOUR))
+        mem.Clear()
+        mem.SetDeviceOrigin(-extent.minX, -extent.minY)
+
+        self._drawGeometry(dc=mem, umlFrame=umlFrame)
+
+        mem.SelectObject(NullBitmap)
+        bitmap.SetMask(Mask(bitmap, OVERLAY_MASK_COLOUR))
+
+        self._overlay       = bitmap
+        self._overlayOrigin = (extent.minX, extent.minY)
+
+    def _drawGeometry(self, dc: DC, umlFrame: 'UmlFrameShapeHandler'):
+
+        if self._showReferencePoints is True:
+            self._drawReferencePoints(dc=dc)
+        if self._showRulers is True:
+            self._drawRulers(dc=dc)
+        if self._showRouteGrid is True:
+            self._drawRouteGrid(dc=dc, umlFrame=umlFrame)
+
+    def _geometryExtent(self) -> Bounds | None:
+        """
+        Returns:  The diagram area the diagnostics cover or None if there is nothing to draw
+        """
+        xs: List[int] = []
+        ys: List[int] = []
+        if self._showReferencePoints is True and self._referencePoints is not None:
+            for pt in self._referencePoints:
+                x, y = cast(Point, pt).Get()
+                xs.extend([x - REFERENCE_POINT_RADIUS, x + REFERENCE_POINT_RADIUS])
+                ys.extend([y - REFERENCE_POINT_RADIUS, y + REFERENCE_POINT_RADIUS])
+        if self._showRulers is True and self._diagramBounds is not None:
+            xs.extend([0, self._diagramBounds.width])
+            ys.extend([0, self._diagramBounds.height])
+            xs.extend(self._verticalRulers or [])
+            ys.extend(self._horizontalRulers or [])
+        if self._showRouteGrid is True and self._routeGrid is not None:
+            for r in self._routeGrid:
+                rectangle: Rectangle = cast(Rectangle, r)
+                xs.extend([rectangle.left, rectangle.left + rectangle.width])
+                ys.extend([rectangle.top,  rectangle.top + rectangle.height])
+
+        if len(xs) == 0 or len(ys) == 0:
+            return None
+
+        return Bounds(minX=min(xs) - 1, minY=min(ys) - 1, maxX=max(xs) + 1, maxY=max(ys) + 1)
 
     def _drawReferencePoints(self, dc: DC):
         savePen:   Pen   = dc.GetPen()
@@ -180,7 +268,7 @@ class OrthogonalRoutingDiagnosticMixin:
         dc.SetPen(savePen)
         dc.SetBrush(saveBrush)
 
-    def _drawRouteGrid(self, dc: DC, umlFrame: DiagramFrame):
+    def _drawRouteGrid(self, dc: DC, umlFrame: 'UmlFrameShapeHandler'):
         savePen:   Pen   = dc.GetPen()
         saveBrush: Brush = dc.GetBrush()
 
@@ -210,9 +298,11 @@ class OrthogonalRoutingDiagnosticMixin:
         return show
 
     def _getRulerPen(self) -> Pen:
-        gridLineColor: Colour = MiniOglColorEnum.toWxColor(MiniOglColorEnum.DARK_SLATE_BLUE)
 
-        gridLineStyle: PenStyle = PENSTYLE_LONG_DASH
-        pen: Pen = Pen(PenInfo(gridLineColor).Style(gridLineStyle).Width(1))
+        if self._rulerPen is None:
+            gridLineColor: Colour = MiniOglColorEnum.toWxColor(MiniOglColorEnum.DARK_SLATE_BLUE)
+
+            gridLineStyle: PenStyle = PENSTYLE_LONG_DASH
+            self._rulerPen = Pen(PenInfo(gridLineColor).Style(gridLineStyle).Width(1))
 
-        return pen
+        return self._rulerPen
@@ -0,0 +1,196 @@
+
+from typing import Dict
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from dataclasses import dataclass
+
+from weakref import ref
+
+from wx import Bitmap
+from wx import DC
+from wx import GCDC
+from wx import MemoryDC
+from wx import NullBitmap
+
+from miniogl.Shape import Shape
+
+from ogl.OglActor import OglActor
+from ogl.OglClass import OglClass
+from ogl.OglNote import OglNote
+from ogl.OglText import OglText
+from ogl.OglUseCase import OglUseCase
+
+CACHED_KINDS: Tuple[type, ...] = (OglClass, OglNote, OglText, OglActor, OglUseCase)
+
+MAXIMUM_CACHED_PIXELS: int = 16_000_000      # About 64 MB of bitmaps
+
+RenderKey = Tuple[int, int, int]             # model revision, width, height
+
+
+@dataclass
+class CachedRendering:
+    shapeReference: ref
+    key:            RenderKey
+    bitmap:         Bitmap
+
+    @property
+    def pixels(self) -> int:
+        return self.key[1] * self.key[2]
+
+
+class ShapeRenderCache:
+    """
+    Keeps an off-screen bitmap of each text heavy shape so that repainting the frame blits
+    the bitmap instead of measuring and drawing all the text again.
+
+    A rendering is reused while the revision of the shape's model and the shape's size are
+    unchanged.  The edit paths call `invalidate` or `invalidateModel` to bump the revision when
+    the content changes;  A zoom or dark mode change drops every rendering.  The renderings
+    have an alpha channel, so the anti-aliased edges blend with whatever is below the shape.
+    Selected and moving shapes are always drawn directly since they draw their handles.
+    The least recently used renderings are dropped once the cache holds MAXIMUM_CACHED_PIXELS
+    """
+    def __init__(self, enabled: bool = False):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._enabled:  bool  = enabled
+        self._darkMode: bool  = False
+        self._zoom:     float = 1.0
+        self._pixels:   int   = 0
+
+        self._renderings: OrderedDict[int, CachedRendering] = OrderedDict()
+        """
+        Keyed by `id(shape)`;  Some shapes override __eq__ without __hash__
+        """
+        self._revisions: Dict[int, int] = {}
+        """
+        Keyed by `id(model)`;  Only the models that changed since the last clear are here
+        """
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        self._enabled = enabled
+        if enabled is False:
+            self.clear()
+
+    @property
+    def darkMode(self) -> bool:
+        return self._darkMode
+
+    @darkMode.setter
+    def darkMode(self, darkMode: bool):
+        self._darkMode = darkMode
+        self.clear()
+
+    def draw(self, shape: Shape, dc: DC, zoom: float):
+        """
+        Draw the shape, from its cached rendering when possible
+
+        Args:
+            shape:  The shape to draw
+            dc:     The frame's drawing buffer
+            zoom:   The frame's current zoom factor
+        """
+        if self._enabled is False or self._isCacheable(shape=shape) is False:
+            shape.Draw(dc)
+            return
+        if zoom != self._zoom:
+            self._zoom = zoom
+            self.clear()
+
+        w, h = shape.GetSize()
+        if w <= 0 or h <= 0:
+            shape.Draw(dc)
+            return
+
+        x, y = shape.topLeft
+        key:       RenderKey              = (self._revisions.get(self._modelKey(modelObject=shape), 0), w, h)
+        shapeKey:  int                    = id(shape)
+        rendering: CachedRendering | None = self._renderings.get(shapeKey)
+
+        if rendering is None or rendering.key != key or rendering.shapeReference() is not shape:
+            self._discard(shapeKey=shapeKey)
+            rendering = self._render(shape=shape, key=key, x=x, y=y, font=dc.GetFont())
+            self._add(shapeKey=shapeKey, rendering=rendering)
+        else:
+            self._renderings.move_to_end(shapeKey)
+
+        dc.DrawBitmap(rendering.bitmap, x, y)
+
+    def invalidate(self, shape: Shape):
+        """
+        The shape's content changed
+
+        Args:
+            shape:  The shape to render again
+        """
+        self.invalidateModel(modelObject=shape)
+
+    def invalidateModel(self, modelObject: object):
+        """
+        A model object changed;  Bump its revision so that the shapes that display it render again
+        the next time they are drawn
+
+        Args:
+            modelObject:  A Pyut model object or the shape itself
+        """
+        modelKey: int = self._modelKey(modelObject=modelObject)
+
+        self._revisions[modelKey] = self._revisions.get(modelKey, 0) + 1
+
+    def clear(self):
+        self._renderings = OrderedDict()
+        self._revisions  = {}
+        self._pixels     = 0
+
+    def _isCacheable(self, shape: Shape) -> bool:
+        return isinstance(shape, CACHED_KINDS) and shape.selected is False and shape.moving is False
+
+    def _modelKey(self, modelObject: object) -> int:
+        """
+        Shapes and their model share a revision
+        """
+        return id(getattr(modelObject, 'pyutObject', modelObject))
+
+    def _render(self, shape: Shape, key: RenderKey, x: int, y: int, font) -> CachedRendering:
+
+        _, w, h = key
+
+        bitmap: Bitmap   = Bitmap.FromRGBA(w, h)      # Fully transparent
+        mem:    MemoryDC = MemoryDC(bitmap)
+        gcDC:   GCDC     = GCDC(mem)                  # Keeps the alpha channel;  A plain MemoryDC does not
+        gcDC.SetFont(font)
+        gcDC.SetDeviceOrigin(-x, -y)                  # So the shape draws at its diagram coordinates
+
+        shape.Draw(gcDC)
+
+        del gcDC                                      # Flushes the drawing into the bitmap
+        mem.SelectObject(NullBitmap)
+
+        return CachedRendering(shapeReference=ref(shape), key=key, bitmap=bitmap)
+
+    def _add(self, shapeKey: int, rendering: CachedRendering):
+
+        self._renderings[shapeKey] = rendering
+        self._pixels += rendering.pixels
+
+        while self._pixels > MAXIMUM_CACHED_PIXELS and len(self._renderings) > 1:
+            oldestKey: int = cast(int, next(iter(self._renderings)))
+            self._discard(shapeKey=oldestKey)
+
+    def _discard(self, shapeKey: int):
+
+        rendering: CachedRendering | None = self._renderings.pop(shapeKey, None)
+        if rendering is not None:
+            self._pixels -= rendering.pixels
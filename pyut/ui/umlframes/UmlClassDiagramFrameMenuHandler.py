@@ -73,24 +73,21 @@ class UmlClassDiagramFrameMenuHandler:
 
     def _autoSize(self):
 
-        umlFrame:   UmlFrame = cast(UmlFrame, self._frame)
-        umlObjects: UmlObjects = umlFrame.umlObjects
+        umlFrame:   UmlFrame   = cast(UmlFrame, self._frame)
+        umlObjects: UmlObjects = umlFrame.umlObjectsOfKind(OglClass)
 
         for umlObject in umlObjects:
-            if isinstance(umlObject, OglClass):
-                oglClass: OglClass = cast(OglClass, umlObject)
+            oglClass: OglClass = cast(OglClass, umlObject)
 
-                oglClass.autoResize()
+            oglClass.autoResize()
+            umlFrame.shapeChanged(shape=oglClass)
 
     def _arrangeLinks(self):
 
-        umlFrame:   UmlFrame = cast(UmlFrame, self._frame)
-        umlObjects: UmlObjects = umlFrame.umlObjects
+        umlFrame:   UmlFrame   = cast(UmlFrame, self._frame)
+        umlObjects: UmlObjects = umlFrame.umlObjectsOfKind(OglLink)
 
         for oglObject in umlObjects:
-            if isinstance(oglObject, OglLink):
-                oglLink: OglLink = cast(OglLink, oglObject)
-                self.logger.info(f"Optimizing: {oglLink}")
-                oglLink.optimizeLine()
-            else:
-                self.logger.debug(f"No line optimizing for: {oglObject}")
+            oglLink: OglLink = cast(OglLink, oglObject)
+            self.logger.info(f"Optimizing: {oglLink}")
+            oglLink.optimizeLine()
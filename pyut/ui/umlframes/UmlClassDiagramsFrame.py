@@ -6,6 +6,7 @@ from logging import getLogger
 
 from collections import namedtuple
 
+from wx import DC
 from wx import MouseEvent
 
 from pyutmodelv2.PyutModelTypes import ClassName
@@ -16,7 +17,6 @@ from pyutmodelv2.PyutInterface import PyutInterface
 from miniogl.Shape import Shape
 
 from ogl.OglInterface2 import OglInterface2
-from wx import PaintEvent
 
 from pyut.ui.umlframes.OrthogonalRoutingDiagnosticMixin import OrthogonalRoutingDiagnosticMixin
 from pyut.ui.umlframes.UmlClassDiagramFrameMenuHandler import UmlClassDiagramFrameMenuHandler
@@ -75,10 +75,8 @@ class UmlClassDiagramsFrame(UmlDiagramsFrame, OrthogonalRoutingDiagnosticMixin):
 
             self._menuHandler.popupMenu(event=event)
 
-    def OnPaint(self, event: PaintEvent):
-        super().OnPaint(event=event)
-
-        OrthogonalRoutingDiagnosticMixin.drawDiagnostics(self, umlFrame=self)
+    def drawUnderShapes(self, dc: DC):
+        OrthogonalRoutingDiagnosticMixin.drawDiagnostics(self, dc=dc, umlFrame=self)
 
     def _onClassNameChanged(self, event: ClassNameChangedEvent):
 
@@ -37,8 +37,11 @@ from ogl.events.ShapeSelectedEventData import ShapeSelectedEventData
 
 from ogl.preferences.OglPreferences import OglPreferences
 
+from pyut.general.SpatialGrid import Bounds
+
 from pyut.ui.eventengine.Events import DarkModeChangedEvent
 from pyut.ui.eventengine.Events import EVENT_DARK_MODE_CHANGED
+from pyut.ui.umlframes.DamageTracker import DamageTracker
 from pyut.ui.umlframes.UmlFrame import UmlFrame
 
 from pyut.ui.eventengine.Events import EVENT_ADD_OGL_DIAGRAM
@@ -82,6 +85,8 @@ class UmlDiagramsFrame(UmlFrame):
 
         super().__init__(parent, eventEngine=eventEngine)
 
+        self._damageTracker: DamageTracker = DamageTracker(umlFrame=self)
+
         self._eventEngine.registerListener(pyEventBinder=EVENT_ADD_PYUT_DIAGRAM,  callback=self._onAddPyutDiagram)
         self._eventEngine.registerListener(pyEventBinder=EVENT_ADD_OGL_DIAGRAM,   callback=self._onAddOglDiagram)
         self._eventEngine.registerListener(pyEventBinder=EVENT_DARK_MODE_CHANGED, callback=self._onDarkModeChanged)
@@ -94,46 +99,39 @@ class UmlDiagramsFrame(UmlFrame):
 
         self.Bind(EVT_CHAR, self._onProcessKeyboard)
 
+    @property
+    def damageTracker(self) -> DamageTracker:
+        """
+        Report changed shapes here instead of refreshing the whole frame
+        """
+        return self._damageTracker
+
     @property
     def objectBoundaries(self) -> ObjectBoundaries:
         """
 
-        Return object boundaries (coordinates)
+        Return object boundaries (coordinates);  The diagram maintains them as shapes are added, removed and moved
 
         """
-        minX: int = maxsize
-        maxX: int = -maxsize
-        minY: int = maxsize
-        maxY: int = -maxsize
-
-        # Get boundaries
-        for shapeObject in self._diagram.shapes:
-            # Get object limits
-            ox1, oy1 = shapeObject.GetPosition()
-            ox2, oy2 = shapeObject.GetSize()
-            ox2 += ox1
-            oy2 += oy1
-
-            # Update min-max
-            minX = min(minX, ox1)
-            maxX = max(maxX, ox2)
-            minY = min(minY, oy1)
-            maxY = max(maxY, oy2)
-
-        # Return values
-        return ObjectBoundaries(minX=minX, minY=minY, maxX=maxX, maxY=maxY)
+        boundaries: Bounds | None = self._diagram.boundaries
+        if boundaries is None:
+            return ObjectBoundaries(minX=maxsize, minY=maxsize, maxX=-maxsize, maxY=-maxsize)
+
+        return ObjectBoundaries(minX=boundaries.minX, minY=boundaries.minY, maxX=boundaries.maxX, maxY=boundaries.maxY)
 
     def undo(self):
         """
         Undo the last operation on this frame
         """
         self._commandProcessor.Undo()
+        self.fitVirtualSize()
 
     def redo(self):
         """
         Redo the last operation on this frame
         """
         self._commandProcessor.Redo()
+        self.fitVirtualSize()
 
     def OnClose(self):
         """
@@ -215,6 +213,9 @@ class UmlDiagramsFrame(UmlFrame):
         Args:
             event:
         """
+        for shape in self.selectedShapes:      # Something moved or resized;  Usually the selection
+            self._diagram.update(shape=shape)
+        self.fitVirtualSize()
         self._eventEngine.sendEvent(EventType.UMLDiagramModified)
 
     def _onRequestLollipopLocation(self, event: RequestLollipopLocationEvent):
@@ -234,6 +235,7 @@ class UmlDiagramsFrame(UmlFrame):
         oglPreferences: OglPreferences = OglPreferences()
         darkMode:       bool           = event.darkMode
 
+        self._renderCache.darkMode = darkMode
         if darkMode is True:
             self.SetBackgroundColour(MiniOglColorEnum.toWxColor(oglPreferences.darkModeBackGroundColor))
         else:
@@ -251,7 +253,7 @@ class UmlDiagramsFrame(UmlFrame):
         for shape in selected:
             if isinstance(shape, OglLink):
                 shape.spline = (not shape.spline)
-        self.Refresh()
+                self._damageTracker.damageShape(shape)
 
     def _moveSelectedShapeUp(self):
         """
@@ -289,7 +291,7 @@ class UmlDiagramsFrame(UmlFrame):
 
                 line.AddControl(cp, selectedShape)
                 self.diagram.AddShape(cp)
-                self.Refresh()
+                self._damageTracker.damageShape(line)
 
     def _moveSelectedShapeZOrder(self, callback: Callable):
         """
@@ -305,4 +307,4 @@ class UmlDiagramsFrame(UmlFrame):
             for oglObject in selected:
                 if isinstance(oglObject, OglObject):
                     callback(oglObject)
-        self.Refresh()
+                    self._damageTracker.damageShape(oglObject)
@@ -9,11 +9,13 @@ from logging import getLogger
 
 from wx import EVT_CLOSE
 from wx import EVT_PAINT
+from wx import EVT_SIZE
 
 from wx import BeginBusyCursor
 from wx import EndBusyCursor
 from wx import MouseEvent
 from wx import Notebook
+from wx import SizeEvent
 from wx import CommandProcessor
 
 from miniogl.Constants import SKIP_EVENT
@@ -21,7 +23,6 @@ from miniogl.DiagramFrame import DiagramFrame
 from miniogl.RectangleShape import RectangleShape
 
 from ogl.OglInterface2 import OglInterface2
-from ogl.OglObject import OglObject
 from ogl.OglLink import OglLink
 from ogl.OglActor import OglActor
 
@@ -42,12 +43,12 @@ from pyut.experimental.GraphicalHandler import GraphicalHandler
 
 from pyut.ui.umlframes.UmlFrameShapeHandler import UmlFrameShapeHandler
 
+from pyut.ui.wxcommands.BoundedCommandProcessor import BoundedCommandProcessor
+
 from pyut.ui.eventengine.Events import AddOglDiagramEvent
 from pyut.ui.eventengine.Events import AddPyutDiagramEvent
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 
-A4_FACTOR:    float = 1.41
-
 UmlObject  = Union[OglClass, OglLink, OglNote, OglText, OglSDMessage, OglSDInstance, OglActor, OglUseCase, OglInterface2]
 UmlObjects = NewType('UmlObjects', List[UmlObject])
 
@@ -74,23 +75,26 @@ class UmlFrame(UmlFrameShapeHandler):
 
         self.logger:            Logger           = UmlFrame.clsUmlFrameLogger
         self._eventEngine:      IEventEngine     = eventEngine
-        self._commandProcessor: CommandProcessor = CommandProcessor()
+        self._commandProcessor: CommandProcessor = BoundedCommandProcessor(maxEntries=self._preferences.undoHistoryMaxEntries,
+                                                                           maxBytes=self._preferences.undoHistoryMaxBytes)
 
         self._actionHandler:     ActionHandler     = ActionHandler(eventEngine=eventEngine)
         self._editObjectHandler: EditObjectHandler = EditObjectHandler(eventEngine=eventEngine)
 
-        self.maxWidth:  int  = self._preferences.virtualWindowWidth
-        self.maxHeight: int = int(self.maxWidth / A4_FACTOR)  # 1.41 is for A4 support
-
-        nbrUnitsX: int = int(self.maxWidth / UmlFrame.PIXELS_PER_UNIT_X)
-        nbrUnitsY: int = int(self.maxHeight / UmlFrame.PIXELS_PER_UNIT_Y)
+        #
+        # The scrollable area follows the content;  See .fitVirtualSize
+        #
+        nbrUnitsX: int = 1
+        nbrUnitsY: int = 1
         initPosX:  int = 0
         initPosY:  int = 0
         self.SetScrollbars(UmlFrame.PIXELS_PER_UNIT_X, UmlFrame.PIXELS_PER_UNIT_Y, nbrUnitsX, nbrUnitsY, initPosX, initPosY, False)
+        self.fitVirtualSize()
 
         # Close event
         self.Bind(EVT_CLOSE, self.evtClose)
         self.Bind(EVT_PAINT, self.OnPaint)
+        self.Bind(EVT_SIZE,  self._onSize)
 
         self.SetInfinite(True)
 
@@ -103,18 +107,20 @@ class UmlFrame(UmlFrameShapeHandler):
     @property
     def umlObjects(self) -> UmlObjects:
         """
-        Retrieve UML objects from the UML Frame
+        Retrieve UML objects from the UML Frame.  The diagram maintains the list;  Do not modify it
 
         Returns:  The Uml objects on this diagram
         """
-        umlObjects: UmlObjects = UmlObjects([])
+        return cast(UmlObjects, self._diagram.umlObjects)
 
-        for s in self._diagram.shapes:
-            # This is a duplicate of the UmlObject, since I cannot use NewType
-            if isinstance(s, (OglClass, OglLink, OglNote, OglText, OglSDMessage, OglSDInstance, OglActor, OglUseCase, OglInterface2)):
-                umlObjects.append(s)
+    def umlObjectsOfKind(self, kind: type) -> UmlObjects:
+        """
+        Args:
+            kind:  The UML object class we want;  Subclasses match too
 
-        return umlObjects
+        Returns:  The Uml objects of that kind on this diagram
+        """
+        return cast(UmlObjects, self._diagram.umlObjectsOfKind(kind=kind))
 
     # noinspection PyUnusedLocal
     def setCodePath(self, path: str):
@@ -202,6 +208,7 @@ class UmlFrame(UmlFrameShapeHandler):
         Remove all shapes
         """
         self._diagram.DeleteAllShapes()
+        self.fitVirtualSize()
         self.Refresh()
 
     def getDiagram(self):
@@ -215,17 +222,17 @@ class UmlFrame(UmlFrameShapeHandler):
     def getWidth(self):
         """
 
-        Returns:  The frame width
+        Returns:  The width of the scrollable area;  It follows the diagram content
 
         """
-        return self.maxWidth
+        return self.GetVirtualSize()[0]
 
     def getHeight(self):
         """
 
-        Returns: The frame height
+        Returns: The height of the scrollable area;  It follows the diagram content
         """
-        return self.maxHeight
+        return self.GetVirtualSize()[1]
 
     def getUmlObjectById(self, objectId: int) -> UmlObject | None:
         """
@@ -236,12 +243,7 @@ class UmlFrame(UmlFrameShapeHandler):
         Returns:  The uml object that has the specified id.
         If no matching object is found, this method returns `None`
         """
-
-        for shape in self.diagram.shapes:
-            if isinstance(shape, (OglClass, OglLink, OglObject)):
-                if shape.pyutObject.id == objectId:
-                    return cast(UmlObject, shape)
-        return cast(UmlObject, None)
+        return cast(UmlObject, self._diagram.shapeByModelId(modelId=objectId))
 
     # noinspection PyUnusedLocal
     def _onAddPyutDiagram(self, event: AddPyutDiagramEvent):
@@ -252,7 +254,7 @@ class UmlFrame(UmlFrameShapeHandler):
 
         BeginBusyCursor()
 
-        gh: GraphicalHandler = GraphicalHandler(umlFrame=self, eventEngine=self._eventEngine, maxWidth=self.maxWidth)
+        gh: GraphicalHandler = GraphicalHandler(umlFrame=self, eventEngine=self._eventEngine, maxWidth=self._preferences.virtualWindowWidth)
         gh.addHierarchy(PyutModelClasses.PyutClassNames)
 
         EndBusyCursor()
@@ -266,7 +268,17 @@ class UmlFrame(UmlFrameShapeHandler):
 
         BeginBusyCursor()
 
-        gh: GraphicalHandler = GraphicalHandler(umlFrame=self, eventEngine=self._eventEngine, maxWidth=self.maxWidth)
+        gh: GraphicalHandler = GraphicalHandler(umlFrame=self, eventEngine=self._eventEngine, maxWidth=self._preferences.virtualWindowWidth)
         gh.addHierarchy(PyutModelClasses.OglClassNames)
 
         EndBusyCursor()
+
+    def _onSize(self, event: SizeEvent):
+        """
+        The scrollable area is never smaller than the window
+
+        Args:
+            event:
+        """
+        self.fitVirtualSize()
+        event.Skip()
@@ -1,15 +1,23 @@
 
+from typing import Tuple
 from typing import Union
 
 from logging import Logger
 from logging import getLogger
 
 from wx import Brush
+from wx import ClientDC
+from wx import DC
+from wx import MouseEvent
+from wx import PaintDC
+from wx import PaintEvent
 from wx import Pen
 from wx import Window
 
 from miniogl.DiagramFrame import DiagramFrame
 from miniogl.SelectAnchorPoint import SelectAnchorPoint
+from miniogl.Shape import Shape
+from miniogl.Shape import Shapes
 
 from ogl.OglInterface2 import OglInterface2
 from ogl.OglAssociationLabel import OglAssociationLabel
@@ -18,8 +26,15 @@ from ogl.OglLink import OglLink
 
 from ogl.sd.OglSDInstance import OglSDInstance
 
+from pyut.general.SpatialGrid import Bounds
+
 from pyut.preferences.PyutPreferences import PyutPreferences
 
+from pyut.ui.umlframes.IndexedDiagram import IndexedDiagram
+from pyut.ui.umlframes.LevelOfDetail import LevelOfDetail
+from pyut.ui.umlframes.LevelOfDetailRenderer import LevelOfDetailRenderer
+from pyut.ui.umlframes.ShapeRenderCache import ShapeRenderCache
+
 
 class UmlFrameShapeHandler(DiagramFrame):
 
@@ -35,6 +50,29 @@ class UmlFrameShapeHandler(DiagramFrame):
         self.logger:       Logger          = getLogger(__name__)
         self._preferences: PyutPreferences = PyutPreferences()
 
+        self._diagram:     IndexedDiagram   = IndexedDiagram(self)
+        self._renderCache: ShapeRenderCache = ShapeRenderCache(enabled=self._preferences.renderCache)
+
+        self._levelOfDetailRenderer: LevelOfDetailRenderer = LevelOfDetailRenderer()
+        self._levelOfDetail:         LevelOfDetail         = LevelOfDetail.FULL
+
+        self._virtualExtent: Tuple[int, int] = (0, 0)
+
+    @property
+    def diagram(self) -> IndexedDiagram:
+        """
+        Returns:  The diagram associated with this frame
+        """
+        return self._diagram
+
+    @diagram.setter
+    def diagram(self, diagram: IndexedDiagram):
+        self._diagram = diagram
+
+    @property
+    def renderCache(self) -> ShapeRenderCache:
+        return self._renderCache
+
     def addShape(self, shape: Union[OglObject, OglInterface2, SelectAnchorPoint, OglLink, OglAssociationLabel, OglSDInstance],
                  x: int, y: int, pen: Pen = None, brush: Brush = None, withModelUpdate: bool = True):
         """
@@ -55,3 +93,250 @@ class UmlFrameShapeHandler(DiagramFrame):
         if brush is not None:
             shape.brush = brush
         self._diagram.AddShape(shape, withModelUpdate)
+        self.fitVirtualSize()
+
+    def addShapes(self, shapes: Shapes, withModelUpdate: bool = True):
+        """
+        Add many shapes at once;  Used when loading documents and plugin output.
+        The shapes keep their current positions.  The window is frozen while they are added,
+        the model updates are deferred until every shape is on the diagram and the frame
+        is refreshed once
+
+        Args:
+            shapes:           The shapes, their anchors, control points and labels
+            withModelUpdate:  If True, the shape models are updated from the shapes
+        """
+        self.Freeze()
+        try:
+            self._diagram.addShapes(shapes=shapes, withModelUpdate=withModelUpdate)
+        finally:
+            self.Thaw()
+
+        self.logger.info(f'Added {len(shapes)} shapes')
+        self.fitVirtualSize()
+        self.Refresh()
+
+    def removeShapes(self, shapes: Shapes):
+        """
+        The reverse of .addShapes;  Detaches many shapes and refreshes the frame once
+
+        Args:
+            shapes:  The shapes to detach;  Their anchors and children are detached with them
+        """
+        self.Freeze()
+        try:
+            self._diagram.removeShapes(shapes=shapes)
+        finally:
+            self.Thaw()
+
+        self.logger.info(f'Removed {len(shapes)} shapes')
+        self.fitVirtualSize()
+        self.Refresh()
+
+    def fitVirtualSize(self):
+        """
+        Size the scrollable area to the diagram content plus the canvas margin;  Never smaller
+        than the window.  Called whenever the content changes;  So the area grows and shrinks
+        with the diagram.  The scroll position is kept
+        """
+        xUnit, yUnit = self.GetScrollPixelsPerUnit()
+        if xUnit == 0 or yUnit == 0:
+            return                          # Scrollbars not set up yet
+
+        margin:     int           = self._preferences.canvasMargin
+        boundaries: Bounds | None = self._diagram.boundaries
+        clientWidth, clientHeight = self.GetClientSize()
+
+        contentWidth:  int = 0 if boundaries is None else boundaries.maxX
+        contentHeight: int = 0 if boundaries is None else boundaries.maxY
+
+        nbrUnitsX: int = -(-max(clientWidth,  contentWidth  + margin) // xUnit)       # Round up to whole scroll units
+        nbrUnitsY: int = -(-max(clientHeight, contentHeight + margin) // yUnit)
+
+        if (nbrUnitsX, nbrUnitsY) == self._virtualExtent:
+            return
+
+        self._virtualExtent = (nbrUnitsX, nbrUnitsY)
+        x, y = self.GetViewStart()
+        self.SetScrollbars(xUnit, yUnit, nbrUnitsX, nbrUnitsY, x, y, True)
+
+    def FindShape(self, x: int, y: int) -> Shape | None:
+        """
+        Override to use the diagram's spatial index instead of testing every shape
+
+        Args:
+            x: coordinate
+            y: coordinate
+
+        Returns:  The top most shape under the coordinates or None
+        """
+        return self._diagram.findShape(x=x, y=y)
+
+    def shapeChanged(self, shape: Shape):
+        """
+        Call this after moving or resizing a shape outside a drag;  Re-indexes the shape and its
+        links and resizes the scrollable area
+
+        Args:
+            shape:  The shape that moved or resized
+        """
+        self._diagram.update(shape=shape)
+        self.fitVirtualSize()
+
+    def OnDrag(self, event: MouseEvent):
+        """
+        Only the dragged shapes, and what hangs off them, are re-indexed
+        """
+        super().OnDrag(event)
+        for shape in self.selectedShapes:
+            self._diagram.update(shape=shape)
+
+    def DoZoomIn(self, ax, ay, width=0, height=0):
+        super().DoZoomIn(ax, ay, width, height)
+        self._diagram.invalidate()
+
+    def DoZoomOut(self, ax: int, ay: int):
+        super().DoZoomOut(ax, ay)
+        self._diagram.invalidate()
+
+    def visibleBounds(self) -> Bounds:
+        """
+        Returns:  The part of the diagram that is in the window, in diagram coordinates
+        """
+        x, y = self.CalcUnscrolledPosition(0, 0)
+        w, h = self.GetClientSize()
+
+        return Bounds(minX=x, minY=y, maxX=x + w, maxY=y + h)
+
+    def OnPaint(self, event: PaintEvent):
+        """
+        Same as DiagramFrame.OnPaint;  But, only draws the shapes in the update region
+
+        Args:
+            event:
+        """
+        dc = PaintDC(self)
+        w, h = self.GetSize()
+        mem = self.CreateDC(False, w, h)
+        mem.SetBackground(Brush(self.GetBackgroundColour()))
+        mem.Clear()
+
+        x, y = self.CalcUnscrolledPosition(0, 0)
+        if self._prefs.backGroundGridEnabled is True:
+            self._drawGrid(memDC=mem, width=w, height=h, startX=x, startY=y)
+
+        ux, uy, uw, uh = self.GetUpdateRegion().GetBox()
+        if uw == 0 or uh == 0:
+            updateBounds: Bounds = self.visibleBounds()
+        else:
+            updateBounds = Bounds(minX=x + ux, minY=y + uy, maxX=x + ux + uw, maxY=y + uy + uh)
+
+        self.drawUnderShapes(dc=mem)
+        self.Redraw(mem, bounds=updateBounds, onScreen=True)
+
+        dc.Blit(0, 0, w, h, mem, x, y)
+
+    def drawUnderShapes(self, dc: DC):
+        """
+        Subclasses override this to draw into the paint buffer after the background and before the shapes
+
+        Args:
+            dc:  The paint buffer;  Prepared for diagram coordinates
+        """
+        pass
+
+    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False,
+               bounds: Bounds | None = None, onScreen: bool = False):
+        """
+        Same as DiagramFrame.Redraw;  But, only draws the shapes that intersect `bounds`.
+        When we draw into our own buffer the bounds default to the window.  When the caller
+        supplies the DC (printing, exporting) they default to the DC clipping box;  If there
+        is no clipping region every shape is drawn.  Only screen drawing uses the render cache
+        and the level of detail
+
+        Args:
+            dc:     If None, a default dc is created
+            full:   If False, only draw the shape borders.
+            saveBackground: If True, save the background
+            useBackground:  If True, use the background
+            bounds:  The part of the diagram to draw, in diagram coordinates
+            onScreen:  Use the render cache and the level of detail;  Implied when we create the DC
+        """
+        needBlit = False
+        w, h = self.GetSize()
+
+        if dc is None:
+            dc = self.CreateDC(useBackground, w, h)
+            needBlit = True
+            onScreen = True
+            if bounds is None:
+                bounds = self.visibleBounds()
+        elif bounds is None:
+            bounds = self._clippingBounds(dc=dc)
+
+        dc.SetFont(self._defaultFont)
+
+        zoom: float = self.currentZoom
+        if onScreen is True:
+            self._levelOfDetail = self._levelOfDetailRenderer.levelOfDetail(zoom=zoom)
+        else:
+            self._levelOfDetail = LevelOfDetail.FULL
+
+        if full:
+            # first time, need to create the background
+            if saveBackground:
+                shapes: Shapes = self._shapesToDraw(bounds=bounds)
+                # first, draw every non-moving shape
+                for shape in shapes:
+                    if shape.moving is False:
+                        self._drawShape(shape=shape, dc=dc, onScreen=onScreen, zoom=zoom)
+                # save the background
+                self.SaveBackground(dc)
+                # draw every moving shape
+                for shape in shapes:
+                    if shape.moving is True:
+                        shape.Draw(dc)
+
+            if useBackground:
+                # draw every moving shape;  They moved, so the spatial index does not know where they are
+                for shape in self._diagram.shapes:
+                    if shape.moving is True:
+                        shape.Draw(dc)
+            else:  # don't use background
+                for shape in self._shapesToDraw(bounds=bounds):
+                    self._drawShape(shape=shape, dc=dc, onScreen=onScreen, zoom=zoom)
+        else:  # not full
+            for shape in self._shapesToDraw(bounds=bounds):
+                shape.DrawBorder(dc)
+                shape.DrawAnchors(dc)
+
+        if needBlit:
+            client = ClientDC(self)
+
+            x, y = self.CalcUnscrolledPosition(0, 0)
+            client.Blit(0, 0, w, h, dc, x, y)
+
+    def _drawShape(self, shape: Shape, dc: DC, onScreen: bool, zoom: float):
+
+        if onScreen is True:
+            if self._levelOfDetailRenderer.draw(shape=shape, dc=dc, levelOfDetail=self._levelOfDetail, zoom=zoom) is False:
+                self._renderCache.draw(shape=shape, dc=dc, zoom=zoom)
+        else:
+            shape.Draw(dc)
+
+    def _shapesToDraw(self, bounds: Bounds | None) -> Shapes:
+
+        if bounds is None:
+            return self._diagram.shapes
+
+        return self._diagram.shapesInRectangle(bounds=bounds)
+
+    def _clippingBounds(self, dc: DC) -> Bounds | None:
+        """
+        Returns:  The DC clipping box in diagram coordinates or None when the DC does not clip
+        """
+        x, y, w, h = dc.GetClippingBox()
+        if w == 0 or h == 0:
+            return None
+
+        return Bounds(minX=x, minY=y, maxX=x + w, maxY=y + h)
@@ -30,6 +30,9 @@ from pyut.ui.wxcommands.Types import DoableObjectType
 if TYPE_CHECKING:
     from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
+MODEL_OBJECT_SIZE: int = 512        # Estimated overhead of a model object
+ATTRIBUTE_SIZE:    int = 64         # Estimated cost of an attribute or a list element
+
 
 class BaseWxCommand(Command):
     """
@@ -67,9 +70,9 @@ class BaseWxCommand(Command):
                     if pyutClass in pyutLinkedObject.parents:
                         self._baseLogger.warning(f'Removing {pyutClass=} from {pyutLinkedObject=}')
                         pyutLinkedObject.parents.remove(cast(PyutLinkedObject, pyutClass))
+                    umlFrame.damageTracker.damageShape(potentialObject)
                     potentialObject.Detach()
                     self._baseLogger.info(f'{potentialObject} deleted')
-                    umlFrame.Refresh()
 
     def _addOglClassToFrame(self, umlFrame: 'UmlDiagramsFrame', oglClass: OglClass, x: int, y: int):
 
@@ -81,6 +84,8 @@ class BaseWxCommand(Command):
 
         if self._preferences.autoResizeShapesOnEdit is True:
             oglClass.autoResize()
+            umlFrame.shapeChanged(shape=oglClass)
+        umlFrame.damageTracker.damageShape(oglClass)
 
         self._baseLogger.info(f'Created {oglClass}')
 
@@ -107,3 +112,23 @@ class BaseWxCommand(Command):
                 ans = True
 
         return ans
+
+    def _estimateModelSize(self, pyutObject: object) -> int:
+        """
+        A rough estimate of the memory a model object holds;  Its strings plus a fixed
+        cost for each attribute and list element
+
+        Args:
+            pyutObject:  A Pyut model object
+
+        Returns:  The estimated size in bytes
+        """
+        size: int = MODEL_OBJECT_SIZE
+        for value in getattr(pyutObject, '__dict__', {}).values():
+            if isinstance(value, str):
+                size += len(value)
+            elif isinstance(value, list):
+                size += len(value) * ATTRIBUTE_SIZE
+            size += ATTRIBUTE_SIZE
+
+        return size
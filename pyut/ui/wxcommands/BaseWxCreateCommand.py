@@ -99,8 +99,8 @@ class BaseWxCreateCommand(BaseWxCommand, metaclass=MyMetaBaseWxCommand):
         umlFrame: UmlDiagramsFrame = frame
 
         self._baseWxCreateLogger.info(f'Undo create {self._shape}')
+        umlFrame.damageTracker.damageShape(self._shape)
         self._shape.Detach()
-        umlFrame.Refresh()
 
     def _cbAddOglObjectToFrame(self, frame: 'UmlDiagramsFrame'):
         """
@@ -117,6 +117,6 @@ class BaseWxCreateCommand(BaseWxCommand, metaclass=MyMetaBaseWxCommand):
 
         umlFrame.addShape(self._shape, self._oglObjX, self._oglObjY, withModelUpdate=True)
 
-        umlFrame.Refresh()
+        umlFrame.damageTracker.damageShape(self._shape)
 
         self._baseWxCreateLogger.info(f'Created {self._shape}')
@@ -1,8 +1,10 @@
+
 from logging import Logger
 from logging import getLogger
 from typing import TYPE_CHECKING
+from typing import cast
 
-from wx import Yield as wxYield
+from pyutmodelv2.PyutObject import PyutObject
 
 from pyut.ui.wxcommands.BaseWxCommand import BaseWxCommand
 from pyut.ui.wxcommands.Types import DoableObjectType
@@ -13,25 +15,30 @@ from pyut.ui.eventengine.IEventEngine import IEventEngine
 if TYPE_CHECKING:
     from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
+SNAPSHOT_SIZE:   int = 128          # The geometry and the references
+LIVE_SHAPE_SIZE: int = 8192         # Estimated size of an Ogl shape with its children, anchors and models
+
 
 class BaseWxDeleteCommand(BaseWxCommand):
+    """
+    Once the shape is off the diagram we only keep its model object and its geometry;
+    Undo recreates the shape from them.  The command processor may release even that
+    when the undo history is over budget
+    """
 
     def __init__(self, name: str, doableObject: DoableObjectType, eventEngine: IEventEngine):
 
         self._name: str = name
 
-        self._bWxDeleteLogger: Logger           = getLogger(__name__)
-        self._objectToDelete:  DoableObjectType = doableObject
-        self._eventEngine:     IEventEngine     = eventEngine
+        self._bWxDeleteLogger: Logger                  = getLogger(__name__)
+        self._objectToDelete:  DoableObjectType | None = doableObject
+        self._eventEngine:     IEventEngine            = eventEngine
+        self._pyutObject:      PyutObject              = doableObject.pyutObject
+        self._released:        bool                    = False
 
         super().__init__(canUndo=True, name=self._name)
 
-        w, h = self._objectToDelete.GetSize()
-        x, y = self._objectToDelete.GetPosition()
-        self._oglObjWidth:  int = w
-        self._oglObjHeight: int = h
-        self._oglObjX:      int = x
-        self._oglObjY:      int = y
+        self._takeSnapshot()
 
     def GetName(self) -> str:
         """
@@ -43,7 +50,7 @@ class BaseWxDeleteCommand(BaseWxCommand):
         """
         Returns true if the command can be undone, false otherwise.
         """
-        return True
+        return self._released is False
 
     def Do(self) -> bool:
         """
@@ -51,24 +58,69 @@ class BaseWxDeleteCommand(BaseWxCommand):
         """
 
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbGetActiveUmlFrameForDelete)
-
-        wxYield()
         return True
 
+    @property
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated memory this command holds for undo
+        """
+        if self._released is True:
+            return SNAPSHOT_SIZE
+
+        size: int = SNAPSHOT_SIZE + self._estimateModelSize(self._pyutObject)
+        if self._objectToDelete is not None:
+            size += LIVE_SHAPE_SIZE
+
+        return size
+
+    def release(self):
+        """
+        The undo history is over budget;  Drop everything we kept for undo
+        """
+        self._released       = True
+        self._objectToDelete = None
+        self._pyutObject     = cast(PyutObject, None)
+
+    def _takeSnapshot(self):
+        """
+        Record the geometry of the shape we are about to delete
+        """
+        assert self._objectToDelete is not None, 'Developer error;  No shape to delete'
+
+        w, h = self._objectToDelete.GetSize()
+        x, y = self._objectToDelete.GetPosition()
+        self._oglObjWidth:  int = w
+        self._oglObjHeight: int = h
+        self._oglObjX:      int = x
+        self._oglObjY:      int = y
+
+    def _releaseShape(self):
+        """
+        The shape is off the diagram;  Keep only the snapshot
+        """
+        self._objectToDelete = None
+
     def _cbGetActiveUmlFrameForDelete(self, frame: 'UmlDiagramsFrame'):
 
         from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
-        self._bWxDeleteLogger.info(f'{self._objectToDelete} deleted')
-        self._objectToDelete.Detach()
+        umlFrame:       UmlDiagramsFrame = frame
+        objectToDelete: DoableObjectType = cast(DoableObjectType, self._objectToDelete)
 
-        umlFrame: UmlDiagramsFrame = frame
-        umlFrame.Refresh()
+        self._takeSnapshot()
+        umlFrame.damageTracker.damageShape(objectToDelete)
+
+        self._bWxDeleteLogger.info(f'{objectToDelete} deleted')
+        objectToDelete.Detach()
+        self._releaseShape()
 
     def _cbGetActiveUmlFrameForUndoDelete(self, frame: 'UmlDiagramsFrame'):
 
         from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
-        umlFrame: UmlDiagramsFrame = frame
-        umlFrame.addShape(self._objectToDelete, x=self._oglObjX, y=self._oglObjY)
-        umlFrame.Refresh()
+        umlFrame:       UmlDiagramsFrame = frame
+        objectToDelete: DoableObjectType = cast(DoableObjectType, self._objectToDelete)
+
+        umlFrame.addShape(objectToDelete, x=self._oglObjX, y=self._oglObjY)
+        umlFrame.damageTracker.damageShape(objectToDelete)
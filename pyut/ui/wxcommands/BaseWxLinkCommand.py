@@ -38,6 +38,11 @@ if TYPE_CHECKING:
     from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
 
+LINK_SNAPSHOT_SIZE: int = 256        # End points, references and the link model
+LIVE_LINK_SIZE:     int = 4096       # Estimated size of an Ogl link with its anchors and labels
+CONTROL_POINT_SIZE: int = 64
+
+
 class BaseWxLinkCommand(Command):
 
     NO_NAME_MESSAGE: str = "testMessage()"
@@ -63,6 +68,7 @@ class BaseWxLinkCommand(Command):
         self._pyutLink:      PyutLink      = cast(PyutLink, None)    # for undo of delete
         self._controlPoints: ControlPoints = ControlPoints([])       # for undo of delete or create link from plugin manager
         self._spline:        bool          = False
+        self._released:      bool          = False
 
     def _controlPointsSetter(self, newValues: ControlPoints):
         self._controlPoints = newValues
@@ -74,7 +80,29 @@ class BaseWxLinkCommand(Command):
         return self._name
 
     def CanUndo(self):
-        return True
+        return self._released is False
+
+    @property
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated memory this command holds for undo
+        """
+        size: int = LINK_SNAPSHOT_SIZE + len(self._controlPoints) * CONTROL_POINT_SIZE
+        if self._link is not None:
+            size += LIVE_LINK_SIZE
+
+        return size
+
+    def release(self):
+        """
+        The undo history is over budget;  Drop everything we kept for undo
+        """
+        self._released      = True
+        self._link          = cast(OglLink, None)
+        self._pyutLink      = cast(PyutLink, None)
+        self._srcOglObject  = cast(DoableObjectType, None)
+        self._dstOglObject  = cast(DoableObjectType, None)
+        self._controlPoints = ControlPoints([])
 
     def _cbDoDeleteLink(self, frame: 'UmlDiagramsFrame'):
         """
@@ -88,6 +116,7 @@ class BaseWxLinkCommand(Command):
         umlFrame: UmlDiagramsFrame = frame
 
         link: OglLink = self._link
+        umlFrame.damageTracker.damageShape(link)
 
         if isinstance(link, OglAssociation):
             oglAssociation: OglAssociation = cast(OglAssociation, link)
@@ -100,7 +129,8 @@ class BaseWxLinkCommand(Command):
 
         link.Detach()
         self._linkLogger.info(f'{link.__repr__()} deleted')
-        umlFrame.Refresh()
+        # Undo and redo create a new link;  Do not hold on to the detached one
+        self._link = cast(OglLink, None)
 
     def _cbPlaceLink(self, frame: 'UmlDiagramsFrame'):
         """
@@ -135,7 +165,8 @@ class BaseWxLinkCommand(Command):
         self._link.destinationAnchor.model.SetPosition(dstPosX, dstPosY)
         self._link.UpdateFromModel()
 
-        umlFrame.Refresh()
+        umlFrame.diagram.update(shape=self._link)       # The anchors moved after the link was indexed
+        umlFrame.damageTracker.damageShape(self._link)
 
         self._linkLogger.info(f'Create: {self._link}')
 
@@ -0,0 +1,78 @@
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from wx import Command
+from wx import CommandProcessor
+
+from pyut.general.SessionProfiler import SessionProfiler
+
+DEFAULT_COMMAND_SIZE: int = 256         # Commands that do not estimate their own size
+
+
+class BoundedCommandProcessor(CommandProcessor):
+    """
+    A command processor with a history budget.  The entry count is enforced by wxPython, which
+    deletes the oldest entry when the history is full.  After each submit the estimated size of the
+    history is checked against the byte budget;  The oldest entries are released until it fits.
+
+    wxPython does not let us take an entry out of the history;  So, a released entry stays in the
+    list but drops its undo state and can no longer be undone.  Commands take part by implementing
+    an `estimatedSize` property and a `release` method;  Others count as DEFAULT_COMMAND_SIZE
+    bytes and are never released
+    """
+    def __init__(self, maxEntries: int, maxBytes: int):
+        """
+        Args:
+            maxEntries: The maximum number of entries;  -1 means unlimited
+            maxBytes:   The estimated memory budget for the history
+        """
+        super().__init__(maxCommands=maxEntries)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxBytes:        int             = maxBytes
+        self._sessionProfiler: SessionProfiler = SessionProfiler()
+
+    @property
+    def estimatedBytes(self) -> int:
+        """
+        Returns:  The estimated size of the history
+        """
+        return sum([self._estimatedSize(command) for command in self.GetCommands()])
+
+    def Submit(self, command: Command, storeIt: bool = True) -> bool:
+
+        startTime: float = perf_counter()
+
+        status: bool = super().Submit(command, storeIt)
+        if status is True and storeIt is True:
+            self._enforceBudget()
+
+        if self._sessionProfiler.running is True:
+            self._sessionProfiler.recordAction(actionName=f'Submit {command.GetName()}', seconds=perf_counter() - startTime)
+
+        return status
+
+    def _enforceBudget(self):
+
+        commands = self.GetCommands()
+        total:   int = sum([self._estimatedSize(command) for command in commands])
+        current: Command = self.GetCurrentCommand()
+
+        released: int = 0
+        for command in commands:
+            if total <= self._maxBytes or command is current:
+                break
+            if hasattr(command, 'release') is True and command.CanUndo() is True:
+                total -= self._estimatedSize(command)
+                command.release()
+                released += 1
+
+        if released > 0:
+            self.logger.info(f'Released {released} undo entries;  History is about {total} bytes')
+
+    def _estimatedSize(self, command: Command) -> int:
+        return getattr(command, 'estimatedSize', DEFAULT_COMMAND_SIZE)
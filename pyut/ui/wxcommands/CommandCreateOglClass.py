@@ -99,4 +99,3 @@ class CommandCreateOglClass(BaseWxCreateCommand):
         oglClass:  OglClass  = cast(OglClass, self._shape)
 
         self._addOglClassToFrame(umlFrame=umlFrame, oglClass=oglClass, x=self._oglObjX, y=self._oglObjY)
-        umlFrame.Refresh()
@@ -3,7 +3,6 @@ from logging import Logger
 from logging import getLogger
 
 from wx import Point
-from wx import Yield as wxYield
 
 from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
 
@@ -56,6 +55,4 @@ class CommandCreateOglLink(BaseWxLinkCommand):
 
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbDoDeleteLink)
 
-        wxYield()
-
         return True
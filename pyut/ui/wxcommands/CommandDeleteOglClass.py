@@ -4,8 +4,6 @@ from logging import getLogger
 from typing import TYPE_CHECKING
 from typing import cast
 
-from wx import Yield as wxYield
-
 from pyutmodelv2.PyutClass import PyutClass
 
 from ogl.OglClass import OglClass
@@ -27,8 +25,6 @@ class CommandDeleteOglClass(BaseWxDeleteCommand):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._pyutClass: PyutClass = oglClass.pyutObject
-
     def Do(self) -> bool:
         """
         Do special delete behavior for a class
@@ -41,7 +37,6 @@ class CommandDeleteOglClass(BaseWxDeleteCommand):
     def Undo(self) -> bool:
 
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbOglClassDeleteUndo)
-        wxYield()
         return True
 
     def _cbOglClassDelete(self, frame: 'UmlDiagramsFrame'):
@@ -49,22 +44,21 @@ class CommandDeleteOglClass(BaseWxDeleteCommand):
         from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
         umlFrame: UmlDiagramsFrame = frame
+        oglClass: OglClass         = cast(OglClass, self._objectToDelete)
 
-        self._removeOglObjectFromFrame(umlFrame=umlFrame, oglObject=self._objectToDelete, pyutClass=self._pyutClass)
+        self._takeSnapshot()
+        self._removeOglObjectFromFrame(umlFrame=umlFrame, oglObject=oglClass, pyutClass=cast(PyutClass, self._pyutObject))
+        self._releaseShape()
 
     def _cbOglClassDeleteUndo(self, frame: 'UmlDiagramsFrame'):
 
         from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
         umlFrame: UmlDiagramsFrame = frame
+        oglClass: OglClass         = OglClass(cast(PyutClass, self._pyutObject), w=self._oglObjWidth, h=self._oglObjHeight)        # create new
 
-        oglClass:  OglClass  = cast(OglClass, self._objectToDelete)              # get old
-
-        self._oglObjWidth, self._oglObjHeight = oglClass.GetSize()
-
-        self._objectToDelete = OglClass(self._pyutClass, w=self._oglObjWidth, h=self._oglObjHeight)        # create new
+        self._objectToDelete = oglClass
 
-        self._addOglClassToFrame(umlFrame=umlFrame, oglClass=self._objectToDelete, x=self._oglObjX, y=self._oglObjY)
+        self._addOglClassToFrame(umlFrame=umlFrame, oglClass=oglClass, x=self._oglObjX, y=self._oglObjY)
 
-        self.logger.info(f'Undo delete of {self._objectToDelete}')
-        umlFrame.Refresh()
+        self.logger.info(f'Undo delete of {oglClass}')
@@ -5,7 +5,6 @@ from logging import Logger
 from logging import getLogger
 
 from wx import Point
-from wx import Yield as wxYield
 
 from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
 
@@ -50,7 +49,6 @@ class CommandDeleteOglLink(BaseWxLinkCommand):
 
     def Do(self) -> bool:
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbDoDeleteLink)
-        wxYield()
 
         return True
 
@@ -61,6 +59,5 @@ class CommandDeleteOglLink(BaseWxLinkCommand):
         self._delLinkLogger.info(f'Undo Delete: {self._link.__repr__()}')
 
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbPlaceLink)
-        wxYield()
 
         return True
@@ -1,8 +1,7 @@
 
 from logging import Logger
 from logging import getLogger
-
-from wx import Yield as wxYield
+from typing import cast
 
 from pyutmodelv2.PyutText import PyutText
 
@@ -22,14 +21,10 @@ class CommandDeleteOglText(BaseWxDeleteCommand):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._pyutText: PyutText = oglText.pyutObject
-
     def Undo(self) -> bool:
         """
         Override this member method to un-execute a previous Do.
         """
-        self._objectToDelete = OglText(self._pyutText, width=self._oglObjWidth, height=self._oglObjHeight)      # create new
+        self._objectToDelete = OglText(cast(PyutText, self._pyutObject), width=self._oglObjWidth, height=self._oglObjHeight)      # create new
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbGetActiveUmlFrameForUndoDelete)
-
-        wxYield()
         return True
@@ -1,8 +1,7 @@
 
 from logging import Logger
 from logging import getLogger
-
-from wx import Yield as wxYield
+from typing import cast
 
 from pyutmodelv2.PyutUseCase import PyutUseCase
 
@@ -22,14 +21,10 @@ class CommandDeleteOglUseCase(BaseWxDeleteCommand):
 
         self.logger: Logger = getLogger(__name__)
 
-        self._pyutUseCase: PyutUseCase = oglUseCase.pyutObject
-
     def Undo(self) -> bool:
         """
         Override this member method to un-execute a previous Do
         """
-        self._objectToDelete = OglUseCase(self._pyutUseCase, w=self._oglObjWidth, h=self._oglObjHeight)      # create new
+        self._objectToDelete = OglUseCase(cast(PyutUseCase, self._pyutObject), w=self._oglObjWidth, h=self._oglObjHeight)      # create new
         self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbGetActiveUmlFrameForUndoDelete)
-
-        wxYield()
         return True
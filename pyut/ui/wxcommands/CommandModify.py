@@ -2,6 +2,7 @@
 from typing import Any
 from typing import List
 from typing import NewType
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
@@ -13,6 +14,8 @@ from codeallybasic.Common import apply
 from pyut.ui.eventengine.EventType import EventType
 from pyut.ui.eventengine.IEventEngine import IEventEngine
 
+if TYPE_CHECKING:
+    from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
 
 Parameters = NewType('Parameters', List[Any])
 
@@ -56,6 +59,7 @@ class CommandModify(Command):
             apply(method, self._newParameters)
             self.logger.info(f'Calling method: {self._methodName} -- {self._newParameters}')
 
+        self._invalidateRenderings()
         return True
 
     def Undo(self) -> bool:
@@ -70,6 +74,7 @@ class CommandModify(Command):
             method = getattr(self._object, self._methodName)
             apply(method, self._oldParameters)
 
+        self._invalidateRenderings()
         self._eventEngine.sendEvent(EventType.RefreshFrame)
         return True
 
@@ -129,3 +134,16 @@ class CommandModify(Command):
             parameters: values that will be changed by calling the redo method. Must be ordered as in the method profile.
         """
         self._newParameters = parameters
+
+    def _invalidateRenderings(self):
+        """
+        The modified object looks different;  Drop its cached renderings
+        """
+        self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbInvalidateRenderings)
+
+    def _cbInvalidateRenderings(self, umlFrame: 'UmlDiagramsFrame'):
+        if umlFrame is not None:
+            umlFrame.renderCache.invalidateModel(self._object)
+            shape = umlFrame.diagram.shapeForModel(modelObject=self._object)
+            if shape is not None:
+                umlFrame.shapeChanged(shape=shape)         # The modification may resize it
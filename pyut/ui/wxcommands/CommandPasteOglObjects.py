@@ -0,0 +1,175 @@
+
+from typing import TYPE_CHECKING
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from zlib import error as ZlibError
+
+from miniogl.Shape import Shapes
+
+from ogl.OglAssociation import OglAssociation
+from ogl.OglAssociationLabel import OglAssociationLabel
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+
+from oglio.Types import OglDocument
+
+from pyutplugins.ExternalTypes import OglObjects
+
+from pyut.ui.DiagramClipboard import DiagramClipboard
+
+from pyut.ui.wxcommands.BaseWxCommand import BaseWxCommand
+
+from pyut.ui.eventengine.EventType import EventType
+from pyut.ui.eventengine.IEventEngine import IEventEngine
+
+if TYPE_CHECKING:
+    from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
+
+class CommandPasteOglObjects(BaseWxCommand):
+    """
+    Places the objects in a clipboard payload on the active frame in a single batch.
+    Like the create commands the visuals are recreated from the payload on each Do so that
+    redo works after an undo;  The payload is all that the undo history keeps
+    """
+
+    def __init__(self, payload: bytes, offset: int, eventEngine: IEventEngine):
+        """
+
+        Args:
+            payload:        A payload created by DiagramClipboard.serialize
+            offset:         How far to move the objects from their copied position
+            eventEngine:    The Pyut event engine
+        """
+
+        super().__init__(canUndo=True, name='Paste')
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._payload:     bytes        = payload
+        self._offset:      int          = offset
+        self._eventEngine: IEventEngine = eventEngine
+
+        self._pastedObjects: OglObjects = OglObjects([])
+        self._released:      bool       = False
+
+    @property
+    def objectCount(self) -> int:
+        """
+        Returns:  The number of objects the last Do pasted
+        """
+        return len(self._pastedObjects)
+
+    @property
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated memory this command holds for undo
+        """
+        return len(self._payload)
+
+    def release(self):
+        """
+        The undo history is over budget;  Drop the payload
+        """
+        self._released      = True
+        self._payload       = b''
+        self._pastedObjects = OglObjects([])
+
+    def GetName(self) -> str:
+        return 'Paste'
+
+    def CanUndo(self) -> bool:
+        return self._released is False
+
+    def Do(self) -> bool:
+        self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbPaste)
+        return self.objectCount > 0
+
+    def Undo(self) -> bool:
+        self._eventEngine.sendEvent(EventType.ActiveUmlFrame, callback=self._cbUndoPaste)
+        return True
+
+    def _cbPaste(self, frame: 'UmlDiagramsFrame'):
+
+        from pyut.ui.LayoutEngine import LayoutEngine
+        from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
+        umlFrame: UmlDiagramsFrame = frame
+
+        try:
+            oglDocument: OglDocument = DiagramClipboard().deserialize(payload=self._payload)
+        except (ZlibError, ValueError) as e:
+            self.logger.error(f'Unable to read the clipboard: {e}')
+            return
+
+        oglObjects: OglObjects = OglObjects([])
+
+        oglObjects.extend(oglDocument.oglClasses)
+        oglObjects.extend(oglDocument.oglNotes)
+        oglObjects.extend(oglDocument.oglTexts)
+        oglObjects.extend(oglDocument.oglActors)
+        oglObjects.extend(oglDocument.oglUseCases)
+        self._moveObjects(oglObjects=oglObjects)
+
+        oglObjects.extend(oglDocument.oglLinks)
+        self._moveControlPoints(oglLinks=oglDocument.oglLinks)
+
+        LayoutEngine().addShapes(umlFrame=umlFrame, oglObjects=oglObjects)
+
+        self._pastedObjects = oglObjects
+        self.logger.info(f'Pasted {len(oglObjects)} objects')
+
+    def _cbUndoPaste(self, frame: 'UmlDiagramsFrame'):
+
+        from pyut.ui.umlframes.UmlDiagramsFrame import UmlDiagramsFrame
+
+        umlFrame: UmlDiagramsFrame = frame
+        #
+        # Links first;  They are attached to the other objects
+        #
+        links:  Shapes = Shapes([])
+        others: Shapes = Shapes([])
+        for oglObject in self._pastedObjects:
+            if isinstance(oglObject, OglLink) is True:
+                links.extend(self._associationLabels(oglLink=cast(OglLink, oglObject)))
+                links.append(oglObject)
+            elif isinstance(oglObject, OglInterface2) is True:
+                links.append(oglObject)
+            else:
+                others.append(oglObject)
+
+        umlFrame.removeShapes(shapes=Shapes(links + others))
+
+        self._pastedObjects = OglObjects([])
+
+    def _moveObjects(self, oglObjects: OglObjects):
+        """
+        Their anchors are relative to them;  So they move with them
+        """
+        for oglObject in oglObjects:
+            x, y = oglObject.GetPosition()
+            oglObject.draggable = True
+            oglObject.SetPosition(x + self._offset, y + self._offset)
+
+    def _moveControlPoints(self, oglLinks: List[OglLink]):
+
+        for oglLink in oglLinks:
+            if isinstance(oglLink, OglInterface2) is True:
+                continue
+            for controlPoint in oglLink.GetControlPoints():
+                x, y = controlPoint.GetPosition()
+                controlPoint.SetPosition(x + self._offset, y + self._offset)
+
+    def _associationLabels(self, oglLink: OglLink) -> Shapes:
+
+        labels: Shapes = Shapes([])
+        if isinstance(oglLink, OglAssociation) is True:
+            oglAssociation: OglAssociation = cast(OglAssociation, oglLink)
+            associationLabels: List[OglAssociationLabel] = [oglAssociation.centerLabel, oglAssociation.sourceCardinality, oglAssociation.destinationCardinality]
+            labels.extend([label for label in associationLabels if label is not None])
+
+        return labels
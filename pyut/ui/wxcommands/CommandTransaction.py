@@ -0,0 +1,95 @@
+
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from wx import Command
+
+from pyut.ui.wxcommands.BoundedCommandProcessor import DEFAULT_COMMAND_SIZE
+
+Commands = NewType('Commands', List[Command])
+
+
+class CommandTransaction(Command):
+    """
+    Groups many create and delete commands into a single command processor entry.
+    The grouped commands are done in order and undone in reverse order;  If one of them
+    fails the ones already done are undone so the diagram is left as it was.
+
+    The grouped commands report their repaints to the frame's damage tracker;  So the frame
+    repaints once after the whole transaction
+    """
+    def __init__(self, name: str, commands: Commands | None = None):
+
+        super().__init__(canUndo=True, name=name)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._name:     str      = name
+        self._commands: Commands = Commands([]) if commands is None else commands
+        self._released: bool     = False
+
+    def addCommand(self, command: Command):
+        """
+        Args:
+            command:  A command to run as part of this transaction;  Do not submit it separately
+        """
+        self._commands.append(command)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def CanUndo(self) -> bool:
+        if self._released is True:
+            return False
+        for command in self._commands:
+            if command.CanUndo() is False:
+                return False
+        return True
+
+    def Do(self) -> bool:
+
+        done: Commands = Commands([])
+        for command in self._commands:
+            if command.Do() is False:
+                self.logger.error(f'{command.GetName()} failed;  Rolling back {len(done)} commands')
+                self._undo(commands=done)
+                return False
+            done.append(command)
+
+        self.logger.info(f'{self._name}: did {len(done)} commands')
+        return True
+
+    def Undo(self) -> bool:
+        return self._undo(commands=self._commands)
+
+    @property
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated memory the grouped commands hold for undo
+        """
+        return sum([getattr(command, 'estimatedSize', DEFAULT_COMMAND_SIZE) for command in self._commands])
+
+    def release(self):
+        """
+        The undo history is over budget;  Release the grouped commands that support it
+        """
+        self._released = True
+        for command in self._commands:
+            if hasattr(command, 'release') is True:
+                command.release()
+
+    def _undo(self, commands: Commands) -> bool:
+
+        success: bool = True
+        for command in reversed(commands):
+            if command.Undo() is False:
+                self.logger.error(f'Could not undo {command.GetName()}')
+                success = False
+
+        return success
+
+    def __len__(self) -> int:
+        return len(self._commands)
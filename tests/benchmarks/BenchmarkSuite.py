@@ -0,0 +1,316 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from datetime import datetime
+from datetime import timezone
+
+from json import dumps as jsonDumps
+
+from os.path import join as osPathJoin
+
+from platform import platform
+from platform import python_version
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter
+
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectGenerator
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectSize
+
+BenchmarkFunction = Callable[[], Any]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The timing of a single benchmark;  The times are in seconds
+    """
+    name:        str   = ''
+    iterations:  int   = 0
+    totalTime:   float = 0.0
+    minimumTime: float = 0.0
+    maximumTime: float = 0.0
+
+    @property
+    def meanTime(self) -> float:
+        return self.totalTime / self.iterations if self.iterations > 0 else 0.0
+
+
+BenchmarkResults = NewType('BenchmarkResults', List[BenchmarkResult])
+
+
+def createBenchmarkResultsFactory() -> BenchmarkResults:
+    return BenchmarkResults([])
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    What gets written to the JSON file;  Enough about the environment to compare runs release to release
+    """
+    pyutVersion:   str                  = ''
+    pythonVersion: str                  = ''
+    platform:      str                  = ''
+    timestamp:     str                  = ''
+    projectSize:   SyntheticProjectSize = field(default_factory=SyntheticProjectSize)
+    results:       BenchmarkResults     = field(default_factory=createBenchmarkResultsFactory)
+
+    def toJson(self) -> str:
+
+        report: Dict[str, Any] = asdict(self)
+        for result, resultDict in zip(self.results, report['results']):
+            resultDict['meanTime'] = result.meanTime
+
+        return jsonDumps(report, indent=4)
+
+
+class BenchmarkSuite:
+    """
+    Times the Pyut start up and hot paths on a synthetic project:
+
+    * Creating the application frame
+    * `ProjectManager.openProject`
+    * `PyutDocument.materialize` of every document;  Creates the Ogl objects and lays them out
+    * Repainting every document
+    * `ProjectManager._writeProject`;  The first save serializes every document, later ones reuse the cache
+    * `EventEngine.sendEvent` throughput
+    * Undo and redo
+
+    The real application frame is created, but never shown;  On a machine without a display run
+    it under a virtual one:
+    ```
+        xvfb-run -a python -m tests.benchmarks.BenchmarkSuite --classes 1000 --links 1500 --output benchmarks.json
+    ```
+    """
+    def __init__(self, projectSize: SyntheticProjectSize, iterations: int = 5, eventCount: int = 10000, undoCount: int = 20):
+        """
+
+        Args:
+            projectSize:  The size of the synthetic project
+            iterations:   How many times to repeat the repeatable benchmarks
+            eventCount:   The number of events to send for the event engine throughput
+            undoCount:    The number of commands to undo and redo
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectSize: SyntheticProjectSize = projectSize
+        self._iterations:  int                  = max(1, iterations)
+        self._eventCount:  int                  = eventCount
+        self._undoCount:   int                  = undoCount
+
+        self._results: BenchmarkResults = BenchmarkResults([])
+
+    def run(self) -> BenchmarkReport:
+        """
+        Returns:  The timings
+        """
+        from wx import App
+
+        from pyut import __version__
+
+        self._results = BenchmarkResults([])
+
+        app: App = App(redirect=False)
+        with TemporaryDirectory() as directoryName:
+            projectFileName: str = osPathJoin(directoryName, 'SyntheticProject.put')
+            SyntheticProjectGenerator(projectSize=self._projectSize).write(fqFileName=projectFileName)
+
+            self._runBenchmarks(app=app, projectFileName=projectFileName, outputFileName=osPathJoin(directoryName, 'SavedProject.put'))
+
+        return BenchmarkReport(pyutVersion=__version__,
+                               pythonVersion=python_version(),
+                               platform=platform(),
+                               timestamp=datetime.now(timezone.utc).isoformat(),
+                               projectSize=self._projectSize,
+                               results=self._results)
+
+    # noinspection PyProtectedMember
+    def _runBenchmarks(self, app, projectFileName: str, outputFileName: str):
+        """
+        The benchmarks reach into the application frame;  They need the same objects that the
+        menu handlers use
+
+        Args:
+            app:              The wx application
+            projectFileName:  The synthetic project
+            outputFileName:   Where to save the project
+        """
+        from pyut.enums.DiagramType import DiagramType
+
+        from pyut.general.ProjectReader import ProjectXml
+
+        from pyut.ui.IPyutProject import IPyutProject
+        from pyut.ui.PyutDocument import PyutDocument
+        from pyut.ui.ProjectManager import ProjectManager
+
+        from pyut.ui.main.PyutApplicationFrame import PyutApplicationFrame
+        from pyut.ui.main.PyutUI import PyutUI
+
+        startTime: float = perf_counter()
+        frame: PyutApplicationFrame = PyutApplicationFrame('Pyut Benchmarks')
+        app.ProcessPendingEvents()
+        self._addResult(name='startup', times=[perf_counter() - startTime])
+
+        pyutUI:         PyutUI         = frame._pyutUI
+        projectManager: ProjectManager = pyutUI._projectManager
+
+        startTime = perf_counter()
+        projectXml, pyutProject = projectManager.openProject(filename=projectFileName)
+        self._addResult(name='ProjectManager.openProject', times=[perf_counter() - startTime])
+
+        pyutDocuments: List[PyutDocument] = []
+        for untangledDocument in cast(ProjectXml, projectXml).documents:
+            diagramType:  DiagramType  = DiagramType.toEnum(untangledDocument.document.documentType)
+            pyutDocument: PyutDocument = cast(PyutDocument, pyutUI._newDiagram(pyutProject=pyutProject, diagramType=diagramType, diagramName=untangledDocument.document.documentTitle))
+            pyutDocument.untangledDocument = untangledDocument
+            pyutDocuments.append(pyutDocument)
+
+        startTime = perf_counter()
+        for pyutDocument in pyutDocuments:
+            pyutDocument.materialize()
+        self._addResult(name='PyutDocument.materialize', times=[perf_counter() - startTime])
+
+        frame.Show()            # The screen path blits to the window
+        app.ProcessPendingEvents()
+        self._time(name='repaint', function=lambda: self._repaint(pyutDocuments=pyutDocuments))
+
+        self._benchmarkWrite(projectManager=projectManager, pyutProject=pyutProject, outputFileName=outputFileName)
+        self._benchmarkSendEvent(app=app, frame=frame)
+        self._benchmarkUndoRedo(app=app, frame=frame, projectManager=projectManager, pyutDocuments=pyutDocuments)
+
+        cast(IPyutProject, pyutProject).modified = False
+        frame.Destroy()
+
+    def _benchmarkWrite(self, projectManager, pyutProject, outputFileName: str):
+
+        pyutProject.filename = outputFileName
+
+        startTime: float = perf_counter()
+        projectManager._writeProject(projectToWrite=pyutProject)
+        self._addResult(name='ProjectManager._writeProject.cold', times=[perf_counter() - startTime])
+
+        self._time(name='ProjectManager._writeProject.warm', function=lambda: projectManager._writeProject(projectToWrite=pyutProject))
+
+    def _benchmarkSendEvent(self, app, frame):
+        """
+        Includes the dispatch;  An event is not useful until the listener gets it
+        """
+        from pyut.ui.eventengine.EventType import EventType
+
+        eventEngine = frame._eventEngine
+
+        startTime: float = perf_counter()
+        for eventNumber in range(self._eventCount):
+            eventEngine.sendEvent(EventType.UpdateApplicationStatus, applicationStatusMsg=f'Benchmark {eventNumber}')
+        app.ProcessPendingEvents()
+
+        self._addResult(name='EventEngine.sendEvent', times=[perf_counter() - startTime], iterations=self._eventCount)
+
+    def _benchmarkUndoRedo(self, app, frame, projectManager, pyutDocuments):
+        """
+        Deletes classes from the first class diagram;  Then times undoing and redoing the deletes
+        """
+        from ogl.OglClass import OglClass
+
+        from pyut.enums.DiagramType import DiagramType
+
+        from pyut.ui.wxcommands.CommandDeleteOglClass import CommandDeleteOglClass
+
+        classDocuments = [pyutDocument for pyutDocument in pyutDocuments if pyutDocument.diagramType == DiagramType.CLASS_DIAGRAM]
+        if len(classDocuments) == 0:
+            return
+
+        umlFrame = classDocuments[0].diagramFrame
+        projectManager.currentFrame = umlFrame
+
+        oglClasses = list(umlFrame.umlObjectsOfKind(kind=OglClass))[:self._undoCount]
+        for oglClass in oglClasses:
+            umlFrame.commandProcessor.Submit(command=CommandDeleteOglClass(oglClass=oglClass, eventEngine=frame._eventEngine), storeIt=True)
+        app.ProcessPendingEvents()
+
+        commandCount: int = len(oglClasses)
+        self._time(name='undo', function=lambda: [umlFrame.undo() for _ in range(commandCount)], iterations=commandCount, repeat=1)
+        self._time(name='redo', function=lambda: [umlFrame.redo() for _ in range(commandCount)], iterations=commandCount, repeat=1)
+
+    def _repaint(self, pyutDocuments):
+        """
+        Redraw every document the way the screen does;  Without a DC the frame draws into its own
+        buffer, so the culling, the render cache and the level of detail are all used.  A caller
+        supplied DC is the print and export path
+        """
+        for pyutDocument in pyutDocuments:
+            pyutDocument.diagramFrame.Redraw()
+
+    def _time(self, name: str, function: BenchmarkFunction, iterations: int = 1, repeat: int = 0):
+        """
+        Args:
+            name:        The benchmark name
+            function:    What to time
+            iterations:  The number of operations a single call does
+            repeat:      The number of calls;  0 means use the suite iterations
+        """
+        times: List[float] = []
+        for _ in range(repeat if repeat > 0 else self._iterations):
+            startTime: float = perf_counter()
+            function()
+            times.append(perf_counter() - startTime)
+
+        self._addResult(name=name, times=times, iterations=iterations * len(times))
+
+    def _addResult(self, name: str, times: List[float], iterations: int = 0):
+
+        result: BenchmarkResult = BenchmarkResult(name=name,
+                                                  iterations=iterations if iterations > 0 else len(times),
+                                                  totalTime=sum(times),
+                                                  minimumTime=min(times),
+                                                  maximumTime=max(times))
+        self._results.append(result)
+        self.logger.info(f'{name}: {result.meanTime * 1000:.3f} ms mean over {result.iterations}')
+
+
+def main():
+
+    parser: ArgumentParser = ArgumentParser(description='Time the Pyut start up and hot paths on a synthetic project')
+
+    parser.add_argument('--classes',          type=int, default=500,  help='The number of classes')
+    parser.add_argument('--links',            type=int, default=750,  help='The number of links')
+    parser.add_argument('--documents',        type=int, default=2,    help='The number of class diagrams')
+    parser.add_argument('--sequenceDiagrams', type=int, default=1,    help='The number of sequence diagrams')
+    parser.add_argument('--iterations',       type=int, default=5,    help='How many times to repeat the repeatable benchmarks')
+    parser.add_argument('--events',           type=int, default=10000, help='The number of events to send')
+    parser.add_argument('--output',           type=str, default='benchmarks.json', help='The JSON results file')
+
+    arguments: Namespace = parser.parse_args()
+
+    projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=arguments.classes,
+                                                             linkCount=arguments.links,
+                                                             documentCount=arguments.documents,
+                                                             sequenceDiagramCount=arguments.sequenceDiagrams)
+
+    benchmarkSuite: BenchmarkSuite  = BenchmarkSuite(projectSize=projectSize, iterations=arguments.iterations, eventCount=arguments.events)
+    report:         BenchmarkReport = benchmarkSuite.run()
+
+    with open(arguments.output, 'w') as textIO:
+        textIO.write(report.toJson())
+
+    print(f'Wrote {len(report.results)} results to {arguments.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from math import ceil
+from math import sqrt
+
+from random import Random
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import SubElement
+from xml.etree.ElementTree import indent
+from xml.etree.ElementTree import tostring
+
+from zlib import compress
+
+XML_ENCODING:  str = 'iso-8859-1'
+INDENT_SPACES: str = '    '
+
+CLASS_WIDTH:    int = 150
+CLASS_HEIGHT:   int = 75
+CLASS_SPACING:  int = 100
+MEMBER_HEIGHT:  int = 15
+
+INSTANCE_WIDTH:   int = 100
+INSTANCE_HEIGHT:  int = 400
+INSTANCE_SPACING: int = 150
+LIFE_LINE_LENGTH: int = 200
+MESSAGE_START:    int = 100
+
+LINK_TYPES:         Tuple[str, ...] = ('INHERITANCE', 'ASSOCIATION', 'AGGREGATION', 'COMPOSITION', 'INTERFACE')
+LABELED_LINK_TYPES: Tuple[str, ...] = ('ASSOCIATION', 'AGGREGATION', 'COMPOSITION')
+
+
+@dataclass
+class SyntheticProjectSize:
+    """
+    How big a synthetic project is.  The classes and links are spread evenly across the class diagrams
+    """
+    classCount:             int = 100
+    linkCount:              int = 100
+    documentCount:          int = 1
+    sequenceDiagramCount:   int = 0
+    instanceCount:          int = 5
+    messageCount:           int = 10
+    fieldCount:             int = 2
+    methodCount:            int = 2
+    controlPointCount:      int = 0
+
+
+class SyntheticProjectGenerator:
+    """
+    Writes a version 11 Pyut project of arbitrary size so that the load, layout, save and
+    repaint paths can be measured on projects larger than anyone wants to draw by hand.
+
+    The XML is the same as the oglio writer output;  Shapes are placed on a grid and the links
+    join randomly chosen classes in the same document.  A seed makes the project repeatable
+    """
+    def __init__(self, projectSize: SyntheticProjectSize, seed: int = 42):
+        """
+
+        Args:
+            projectSize:  The number of classes, links, documents, etc.
+            seed:         Seeds the choice of link end points
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectSize: SyntheticProjectSize = projectSize
+        self._seed:        int                  = seed
+        self._random:      Random               = Random(seed)
+        self._nextId:      int                  = 1
+
+    def write(self, fqFileName: str):
+        """
+        Write the project compressed the same way that Pyut does
+
+        Args:
+            fqFileName:  The fully qualified .put file name
+        """
+        with open(fqFileName, 'wb') as binaryIO:
+            binaryIO.write(compress(self.toXml().encode(XML_ENCODING)))
+
+        self.logger.info(f'Wrote {fqFileName}')
+
+    def toXml(self) -> str:
+        """
+        Returns:  The project XML;  The same every time
+        """
+        self._nextId = 1
+        self._random.seed(self._seed)
+
+        projectElement: Element = Element('PyutProject', {'version': '11', 'CodePath': ''})
+
+        projectSize:   SyntheticProjectSize = self._projectSize
+        documentCount: int = max(1, projectSize.documentCount)
+        for documentNumber in range(documentCount):
+            classCount: int = self._share(total=projectSize.classCount, parts=documentCount, part=documentNumber)
+            linkCount:  int = self._share(total=projectSize.linkCount,  parts=documentCount, part=documentNumber)
+            self._addClassDiagram(projectElement=projectElement, title=f'Class Diagram {documentNumber + 1}', classCount=classCount, linkCount=linkCount)
+
+        for diagramNumber in range(projectSize.sequenceDiagramCount):
+            self._addSequenceDiagram(projectElement=projectElement, title=f'Sequence Diagram {diagramNumber + 1}')
+
+        indent(projectElement, space=INDENT_SPACES)
+
+        return tostring(projectElement, encoding=XML_ENCODING, xml_declaration=True).decode(XML_ENCODING)
+
+    def _addClassDiagram(self, projectElement: Element, title: str, classCount: int, linkCount: int):
+
+        documentElement: Element   = self._addDocument(projectElement=projectElement, documentType='CLASS_DIAGRAM', title=title)
+        columns:         int       = max(1, ceil(sqrt(classCount)))
+        height:          int       = CLASS_HEIGHT + MEMBER_HEIGHT * (self._projectSize.fieldCount + self._projectSize.methodCount)
+        positions:       List[Tuple[int, int, int]] = []        # id, x, y
+
+        for classNumber in range(classCount):
+            x: int = CLASS_SPACING + (classNumber % columns) * (CLASS_WIDTH + CLASS_SPACING)
+            y: int = CLASS_SPACING + (classNumber // columns) * (height + CLASS_SPACING)
+
+            classId: int = self._addClass(documentElement=documentElement, name=f'Class{self._nextId}', x=x, y=y, height=height)
+            positions.append((classId, x, y))
+
+        if classCount < 2:
+            return
+        for linkNumber in range(linkCount):
+            source, destination = self._random.sample(positions, 2)
+            linkType: str = LINK_TYPES[linkNumber % len(LINK_TYPES)]
+            self._addLink(documentElement=documentElement, source=source, destination=destination, linkType=linkType, height=height)
+
+    def _addClass(self, documentElement: Element, name: str, x: int, y: int, height: int) -> int:
+
+        classId: int = self._newId()
+
+        oglClassElement:  Element = SubElement(documentElement, 'OglClass', {'width': str(CLASS_WIDTH), 'height': str(height), 'x': str(x), 'y': str(y)})
+        pyutClassElement: Element = SubElement(oglClassElement, 'PyutClass', {
+            'id':                   str(classId),
+            'name':                 name,
+            'stereotype':           'noStereotype',
+            'displayMethods':       'True',
+            'displayParameters':    'Unspecified',
+            'displayConstructor':   'Unspecified',
+            'displayDunderMethods': 'Unspecified',
+            'displayFields':        'True',
+            'displayStereotype':    'True',
+            'fileName':             '',
+            'description':          f'Synthetic class {name}'
+        })
+        for methodNumber in range(self._projectSize.methodCount):
+            methodElement: Element = SubElement(pyutClassElement, 'PyutMethod', {'name': f'method{methodNumber}', 'visibility': 'PUBLIC', 'returnType': 'int'})
+            SubElement(methodElement, 'PyutParameter', {'name': 'value', 'type': 'int', 'defaultValue': '0'})
+        for fieldNumber in range(self._projectSize.fieldCount):
+            SubElement(pyutClassElement, 'PyutField', {'name': f'field{fieldNumber}', 'visibility': 'PRIVATE', 'type': 'str', 'defaultValue': "''"})
+
+        return classId
+
+    def _addLink(self, documentElement: Element, source: Tuple[int, int, int], destination: Tuple[int, int, int], linkType: str, height: int):
+
+        sourceId,      sourceX,      sourceY      = source
+        destinationId, destinationX, destinationY = destination
+
+        sourceAnchorX:      int = sourceX + CLASS_WIDTH // 2
+        sourceAnchorY:      int = sourceY
+        destinationAnchorX: int = destinationX + CLASS_WIDTH // 2
+        destinationAnchorY: int = destinationY + height
+
+        oglLinkElement: Element = SubElement(documentElement, 'OglLink', {
+            'sourceAnchorX':      str(sourceAnchorX),
+            'sourceAnchorY':      str(sourceAnchorY),
+            'destinationAnchorX': str(destinationAnchorX),
+            'destinationAnchorY': str(destinationAnchorY),
+            'spline':             'False'
+        })
+        if linkType in LABELED_LINK_TYPES:
+            SubElement(oglLinkElement, 'LabelCenter',      {'x': '0', 'y': '0'})
+            SubElement(oglLinkElement, 'LabelSource',      {'x': '0', 'y': '-12'})
+            SubElement(oglLinkElement, 'LabelDestination', {'x': '0', 'y': '12'})
+
+        controlPointCount: int = self._projectSize.controlPointCount
+        for pointNumber in range(1, controlPointCount + 1):
+            x: int = sourceAnchorX + (destinationAnchorX - sourceAnchorX) * pointNumber // (controlPointCount + 1)
+            y: int = sourceAnchorY + (destinationAnchorY - sourceAnchorY) * pointNumber // (controlPointCount + 1)
+            SubElement(oglLinkElement, 'ControlPoint', {'x': str(x), 'y': str(y)})
+
+        SubElement(oglLinkElement, 'PyutLink', {
+            'name':                   '',
+            'type':                   linkType,
+            'cardinalitySource':      '',
+            'cardinalityDestination': '',
+            'bidirectional':          'False',
+            'sourceId':               str(sourceId),
+            'destinationId':          str(destinationId)
+        })
+
+    def _addSequenceDiagram(self, projectElement: Element, title: str):
+
+        documentElement: Element   = self._addDocument(projectElement=projectElement, documentType='SEQUENCE_DIAGRAM', title=title)
+        instanceIds:     List[int] = []
+
+        for instanceNumber in range(self._projectSize.instanceCount):
+            instanceId: int = self._newId()
+            x:          int = INSTANCE_SPACING // 2 + instanceNumber * INSTANCE_SPACING
+
+            oglInstanceElement: Element = SubElement(documentElement, 'OglSDInstance', {'width': str(INSTANCE_WIDTH), 'height': str(INSTANCE_HEIGHT), 'x': str(x), 'y': '50'})
+            SubElement(oglInstanceElement, 'PyutSDInstance', {'id': str(instanceId), 'instanceName': f'Instance{instanceNumber + 1}', 'lifeLineLength': str(LIFE_LINE_LENGTH)})
+
+            instanceIds.append(instanceId)
+
+        if len(instanceIds) < 2:
+            return
+        messageCount: int = self._projectSize.messageCount
+        for messageNumber in range(messageCount):
+            sourceId, destinationId = self._random.sample(instanceIds, 2)
+            messageTime: int = MESSAGE_START + (LIFE_LINE_LENGTH * messageNumber) // messageCount
+
+            oglMessageElement: Element = SubElement(documentElement, 'OglSDMessage')
+            SubElement(oglMessageElement, 'PyutSDMessage', {
+                'id':              str(self._newId()),
+                'message':         f'message{messageNumber + 1}()',
+                'sourceTime':      str(messageTime),
+                'destinationTime': str(messageTime),
+                'sourceId':        str(sourceId),
+                'destinationId':   str(destinationId)
+            })
+
+    def _addDocument(self, projectElement: Element, documentType: str, title: str) -> Element:
+
+        return SubElement(projectElement, 'PyutDocument', {
+            'type':            documentType,
+            'title':           title,
+            'scrollPositionX': '0',
+            'scrollPositionY': '0',
+            'pixelsPerUnitX':  '20',
+            'pixelsPerUnitY':  '20'
+        })
+
+    def _newId(self) -> int:
+
+        newId: int = self._nextId
+        self._nextId += 1
+
+        return newId
+
+    def _share(self, total: int, parts: int, part: int) -> int:
+        """
+        Split `total` into `parts` nearly equal shares;  The first shares get the remainder
+
+        Returns:  The size of share `part`
+        """
+        return total // parts + (1 if part < total % parts else 0)
@@ -0,0 +1,89 @@
+
+from typing import List
+
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import fromstring
+
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectGenerator
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectSize
+from tests.benchmarks.SyntheticProjectGenerator import XML_ENCODING
+
+
+class TestSyntheticProjectGenerator(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testProjectSize(self):
+
+        projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=25, linkCount=31, documentCount=3, sequenceDiagramCount=2, instanceCount=4, messageCount=6)
+        project:     Element              = fromstring(SyntheticProjectGenerator(projectSize=projectSize).toXml())
+
+        documents: List[Element] = project.findall('PyutDocument')
+
+        self.assertEqual('11', project.get('version'), 'Must be the current format')
+        self.assertEqual(5, len(documents), 'Class diagrams plus sequence diagrams')
+        self.assertEqual(25, len(project.findall('PyutDocument/OglClass')), 'Wrong class count')
+        self.assertEqual(31, len(project.findall('PyutDocument/OglLink')), 'Wrong link count')
+        self.assertEqual(8, len(project.findall('PyutDocument/OglSDInstance')), 'Wrong instance count')
+        self.assertEqual(12, len(project.findall('PyutDocument/OglSDMessage')), 'Wrong message count')
+
+    def testLinksStayInTheirDocument(self):
+
+        projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=40, linkCount=60, documentCount=4)
+        project:     Element              = fromstring(SyntheticProjectGenerator(projectSize=projectSize).toXml())
+
+        for document in project.findall('PyutDocument'):
+            classIds: List[str] = [pyutClass.get('id', '') for pyutClass in document.findall('OglClass/PyutClass')]
+            for pyutLink in document.findall('OglLink/PyutLink'):
+                self.assertIn(pyutLink.get('sourceId'),      classIds, 'Link source must be in the same document')
+                self.assertIn(pyutLink.get('destinationId'), classIds, 'Link destination must be in the same document')
+                self.assertNotEqual(pyutLink.get('sourceId'), pyutLink.get('destinationId'), 'No self links')
+
+    def testRepeatable(self):
+
+        projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=10, linkCount=10)
+
+        self.assertEqual(SyntheticProjectGenerator(projectSize=projectSize).toXml(), SyntheticProjectGenerator(projectSize=projectSize).toXml(), 'Same seed same project')
+
+    def testWriteCompressed(self):
+
+        generator: SyntheticProjectGenerator = SyntheticProjectGenerator(projectSize=SyntheticProjectSize(classCount=3, linkCount=2))
+
+        with TemporaryDirectory() as directoryName:
+            fqFileName: str = osPathJoin(directoryName, 'Synthetic.put')
+            generator.write(fqFileName=fqFileName)
+
+            with open(fqFileName, 'rb') as binaryIO:
+                rawXml: str = decompress(binaryIO.read()).decode(XML_ENCODING)
+
+        self.assertEqual(generator.toXml(), rawXml, 'Should be zlib compressed XML')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSyntheticProjectGenerator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,88 @@
+
+from os import listdir
+
+from os.path import exists
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.general.AtomicFileWriter import AtomicFileWriter
+
+TEST_FILE_NAME: str = 'AtomicTest.put'
+
+
+class TestAtomicFileWriter(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._fqFileName:         str                = osPathJoin(self._temporaryDirectory.name, TEST_FILE_NAME)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testWrite(self):
+
+        AtomicFileWriter().write(fqFileName=self._fqFileName, data=b'Gato Malo')
+
+        with open(self._fqFileName, 'rb') as binaryIO:
+            self.assertEqual(b'Gato Malo', binaryIO.read(), 'Incorrect content')
+
+    def testNoTemporaryFilesLeft(self):
+
+        atomicFileWriter: AtomicFileWriter = AtomicFileWriter()
+        atomicFileWriter.write(fqFileName=self._fqFileName, data=b'1')
+        atomicFileWriter.write(fqFileName=self._fqFileName, data=b'2')
+
+        self.assertEqual([TEST_FILE_NAME], listdir(self._temporaryDirectory.name), 'Temporary file left behind')
+
+    def testFailedWriteKeepsOriginal(self):
+
+        atomicFileWriter: AtomicFileWriter = AtomicFileWriter()
+        atomicFileWriter.write(fqFileName=self._fqFileName, data=b'Original')
+
+        self.assertRaises(TypeError, lambda: atomicFileWriter.write(fqFileName=self._fqFileName, data='Not bytes'))  # type: ignore
+
+        with open(self._fqFileName, 'rb') as binaryIO:
+            self.assertEqual(b'Original', binaryIO.read(), 'Original was damaged')
+        self.assertEqual([TEST_FILE_NAME], listdir(self._temporaryDirectory.name), 'Temporary file left behind')
+
+    def testGenerations(self):
+
+        atomicFileWriter: AtomicFileWriter = AtomicFileWriter(generations=2)
+        for version in range(4):
+            atomicFileWriter.write(fqFileName=self._fqFileName, data=f'{version}'.encode())
+
+        expectedContents = {
+            self._fqFileName: b'3',
+            AtomicFileWriter.generationName(fqFileName=self._fqFileName, generation=1): b'2',
+            AtomicFileWriter.generationName(fqFileName=self._fqFileName, generation=2): b'1',
+        }
+        for fqFileName, expectedContent in expectedContents.items():
+            with open(fqFileName, 'rb') as binaryIO:
+                self.assertEqual(expectedContent, binaryIO.read(), f'Incorrect generation: {fqFileName}')
+
+        thirdGeneration: str = AtomicFileWriter.generationName(fqFileName=self._fqFileName, generation=3)
+        self.assertFalse(exists(thirdGeneration), 'Kept too many generations')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAtomicFileWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
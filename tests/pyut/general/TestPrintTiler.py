@@ -0,0 +1,69 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.general.PrintTiler import PrintTiler
+from pyut.general.SpatialGrid import Bounds
+
+
+class TestPrintTiler(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSinglePage(self):
+
+        contentBounds: Bounds     = Bounds(minX=100, minY=200, maxX=500, maxY=400)
+        printTiler:    PrintTiler = PrintTiler(contentBounds=contentBounds)
+
+        self.assertEqual(1, printTiler.pageCount, 'Default is a single page')
+        self.assertEqual(contentBounds, printTiler.tileBounds(page=1), 'The only tile is the content')
+        self.assertFalse(printTiler.hasPage(page=2), 'There is no second page')
+
+    def testTileOrder(self):
+
+        printTiler: PrintTiler = PrintTiler(contentBounds=Bounds(minX=0, minY=0, maxX=200, maxY=100), pagesAcross=2, pagesDown=2)
+
+        self.assertEqual(4, printTiler.pageCount, 'Two by two')
+        self.assertEqual(Bounds(minX=100, minY=0,  maxX=200, maxY=50),  printTiler.tileBounds(page=2), 'Second page is to the right')
+        self.assertEqual(Bounds(minX=0,   minY=50, maxX=100, maxY=100), printTiler.tileBounds(page=3), 'Third page is below the first')
+
+    def testTilesCoverContent(self):
+
+        printTiler: PrintTiler = PrintTiler(contentBounds=Bounds(minX=-10, minY=0, maxX=91, maxY=10), pagesAcross=3)
+
+        self.assertEqual(-10, printTiler.tileBounds(page=1).minX, 'First tile starts at the content')
+        self.assertLessEqual(91, printTiler.tileBounds(page=3).maxX, 'Last tile must reach the content edge')
+
+    def testEmptyContent(self):
+
+        printTiler: PrintTiler = PrintTiler(contentBounds=Bounds(), pagesAcross=0, pagesDown=-1)
+
+        self.assertEqual(1, printTiler.pageCount, 'Always at least one page')
+        self.assertGreater(printTiler.scale(pageWidth=1000, pageHeight=1000, margin=50), 0, 'Scale must be usable')
+
+    def testScale(self):
+
+        printTiler: PrintTiler = PrintTiler(contentBounds=Bounds(minX=0, minY=0, maxX=1800, maxY=450), pagesAcross=2)
+
+        self.assertEqual(1.0, printTiler.scale(pageWidth=1000, pageHeight=1000, margin=50), 'Width limits the scale')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPrintTiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
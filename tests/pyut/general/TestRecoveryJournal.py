@@ -0,0 +1,86 @@
+
+from os import utime
+
+from os.path import exists
+from os.path import join as osPathJoin
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.general.RecoveryJournal import RecoveryCandidates
+from pyut.general.RecoveryJournal import RecoveryJournal
+
+
+class TestRecoveryJournal(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._projectFileName:    str                = osPathJoin(self._temporaryDirectory.name, 'Recover.put')
+        self._snapshotFileName:   str                = RecoveryJournal.snapshotName(projectFileName=self._projectFileName)
+
+        self._recoveryJournal: RecoveryJournal = RecoveryJournal(journalFileName=Path(self._temporaryDirectory.name) / 'journal.txt')
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testSnapshotName(self):
+        self.assertEqual('/designs/Recover.recovery.put', RecoveryJournal.snapshotName(projectFileName='/designs/Recover.put'))
+
+    def testNewerSnapshotIsCandidate(self):
+
+        self._createFile(fileName=self._projectFileName, modificationTime=1000)
+        self._createFile(fileName=self._snapshotFileName, modificationTime=2000)
+        self._recoveryJournal.add(projectFileName=self._projectFileName)
+
+        candidates: RecoveryCandidates = self._recoveryJournal.recoveryCandidates()
+
+        self.assertEqual(1, len(candidates), 'Should find the snapshot')
+        self.assertEqual(self._snapshotFileName, candidates[0].snapshotFileName, 'Wrong snapshot')
+
+    def testOlderSnapshotIsNotCandidate(self):
+
+        self._createFile(fileName=self._projectFileName, modificationTime=2000)
+        self._createFile(fileName=self._snapshotFileName, modificationTime=1000)
+        self._recoveryJournal.add(projectFileName=self._projectFileName)
+
+        self.assertEqual(0, len(self._recoveryJournal.recoveryCandidates()), 'Project was saved after the snapshot')
+
+    def testDiscard(self):
+
+        self._createFile(fileName=self._snapshotFileName, modificationTime=2000)
+        self._recoveryJournal.add(projectFileName=self._projectFileName)
+
+        self._recoveryJournal.discard(projectFileName=self._projectFileName)
+
+        self.assertFalse(exists(self._snapshotFileName), 'Snapshot not removed')
+        self.assertEqual(0, len(self._recoveryJournal.recoveryCandidates()), 'Project not removed from the journal')
+
+    def _createFile(self, fileName: str, modificationTime: int):
+
+        with open(fileName, 'wb') as binaryIO:
+            binaryIO.write(b'Ozzee')
+        utime(fileName, (modificationTime, modificationTime))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestRecoveryJournal))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,108 @@
+
+from os.path import exists
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.general.SessionProfiler import ActionTiming
+from pyut.general.SessionProfiler import ProfileFiles
+from pyut.general.SessionProfiler import SessionProfiler
+
+
+class MenuHandler:
+
+    def __init__(self):
+        self.calls: int = 0
+
+    def onMenuItem(self, event):
+        self.calls += 1
+        return event
+
+    def helper(self):
+        return 'helper'
+
+
+class TestSessionProfiler(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._sessionProfiler: SessionProfiler = SessionProfiler()
+
+    def tearDown(self):
+        super().tearDown()
+        self._sessionProfiler.stop()
+
+    def testStopWritesFiles(self):
+
+        with TemporaryDirectory() as directoryName:
+            self._sessionProfiler.outputDirectory = Path(directoryName)
+
+            self._sessionProfiler.start(cpuProfile=True, memoryProfile=True)
+            self.assertTrue(self._sessionProfiler.running, 'Should be running')
+
+            profileFiles: ProfileFiles = self._sessionProfiler.stop()
+
+            self.assertFalse(self._sessionProfiler.running, 'Should be stopped')
+            self.assertEqual(3, len(profileFiles), 'Profile, snapshot and timings')
+            for profileFile in profileFiles:
+                self.assertTrue(exists(profileFile), f'Not written: {profileFile}')
+
+    def testStopWhenNotRunning(self):
+
+        self.assertEqual(0, len(self._sessionProfiler.stop()), 'Nothing to write')
+
+    def testOnlyRecordsWhileRunning(self):
+
+        with TemporaryDirectory() as directoryName:
+            self._sessionProfiler.outputDirectory = Path(directoryName)
+
+            self._sessionProfiler.recordAction(actionName='Ignored', seconds=1.0)
+
+            self._sessionProfiler.start(cpuProfile=False)
+            self._sessionProfiler.recordAction(actionName='Action', seconds=0.5)
+            self._sessionProfiler.recordAction(actionName='Action', seconds=1.5)
+            self._sessionProfiler.stop()
+
+        self.assertNotIn('Ignored', self._sessionProfiler.actionTimings, 'Not running;  Should not record')
+
+        actionTiming: ActionTiming = self._sessionProfiler.actionTimings['Action']
+        self.assertEqual(2, actionTiming.count, 'Wrong count')
+        self.assertEqual(1.0, actionTiming.meanSeconds, 'Wrong mean')
+        self.assertEqual(1.5, actionTiming.maxSeconds, 'Wrong max')
+
+    def testInstrument(self):
+
+        menuHandler: MenuHandler = MenuHandler()
+        self._sessionProfiler.instrument(handler=menuHandler)
+
+        with TemporaryDirectory() as directoryName:
+            self._sessionProfiler.outputDirectory = Path(directoryName)
+
+            self._sessionProfiler.start(cpuProfile=False)
+            self.assertEqual('event', menuHandler.onMenuItem('event'), 'Must pass the event through')
+            self._sessionProfiler.stop()
+
+        self.assertEqual(1, menuHandler.calls, 'Handler must still be called')
+        self.assertIn('MenuHandler.onMenuItem', self._sessionProfiler.actionTimings, 'Menu handler not timed')
+        self.assertNotIn('MenuHandler.helper', self._sessionProfiler.actionTimings, 'Only the menu handlers are timed')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSessionProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
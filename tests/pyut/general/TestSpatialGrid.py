@@ -0,0 +1,72 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.general.SpatialGrid import Bounds
+from pyut.general.SpatialGrid import SpatialGrid
+
+
+class TestSpatialGrid(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._spatialGrid: SpatialGrid = SpatialGrid(cellSize=100)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPointQuery(self):
+
+        self._spatialGrid.insert(entryId=1, bounds=Bounds(minX=10, minY=10, maxX=50, maxY=50))
+        self._spatialGrid.insert(entryId=2, bounds=Bounds(minX=40, minY=40, maxX=90, maxY=90))
+
+        self.assertEqual({1, 2}, self._spatialGrid.queryPoint(x=45, y=45), 'Both overlap this point')
+        self.assertEqual({1},    self._spatialGrid.queryPoint(x=20, y=20), 'Only the first one')
+        self.assertEqual(set(),  self._spatialGrid.queryPoint(x=95, y=95), 'Same cell but outside both')
+
+    def testEntrySpanningCells(self):
+
+        self._spatialGrid.insert(entryId=7, bounds=Bounds(minX=-150, minY=50, maxX=350, maxY=60))
+
+        self.assertEqual({7}, self._spatialGrid.queryPoint(x=-120, y=55), 'Negative coordinates')
+        self.assertEqual({7}, self._spatialGrid.queryPoint(x=300, y=55),  'Far cell')
+
+    def testRectangleQuery(self):
+
+        self._spatialGrid.insert(entryId=1, bounds=Bounds(minX=0,    minY=0,    maxX=10,   maxY=10))
+        self._spatialGrid.insert(entryId=2, bounds=Bounds(minX=500,  minY=500,  maxX=510,  maxY=510))
+        self._spatialGrid.insert(entryId=3, bounds=Bounds(minX=1000, minY=1000, maxX=1010, maxY=1010))
+
+        found = self._spatialGrid.queryRectangle(bounds=Bounds(minX=5, minY=5, maxX=505, maxY=505))
+
+        self.assertEqual({1, 2}, found, 'Wrong intersection')
+
+    def testMoveAndRemove(self):
+
+        self._spatialGrid.insert(entryId=1, bounds=Bounds(minX=0, minY=0, maxX=10, maxY=10))
+        self._spatialGrid.insert(entryId=1, bounds=Bounds(minX=300, minY=300, maxX=310, maxY=310))
+
+        self.assertEqual(set(), self._spatialGrid.queryPoint(x=5, y=5),     'Old position should be gone')
+        self.assertEqual({1},   self._spatialGrid.queryPoint(x=305, y=305), 'Not at the new position')
+
+        self._spatialGrid.remove(entryId=1)
+        self.assertEqual(0, len(self._spatialGrid), 'Should be empty')
+        self.assertEqual(set(), self._spatialGrid.queryPoint(x=305, y=305), 'Should be removed')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialGrid))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,91 @@
+
+from os import sep as osSep
+
+from os.path import exists
+from os.path import getsize
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.ProjectTestBase import ProjectTestBase
+
+from pyut.enums.ImageFormat import ImageFormat
+
+from pyut.headless.DiagramRenderer import DiagramRenderer
+from pyut.headless.DiagramRenderer import RenderResult
+from pyut.headless.DiagramRenderer import RenderResults
+from pyut.headless.DiagramRenderer import RenderTask
+from pyut.headless.DiagramRenderer import renderProject
+
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectGenerator
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectSize
+
+
+class TestDiagramRenderer(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._diagramRenderer: DiagramRenderer = DiagramRenderer(maxWorkers=1)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRenderEmptyDirectory(self):
+
+        with TemporaryDirectory() as directoryName:
+            results: RenderResults = self._diagramRenderer.render(directory=directoryName, outputDirectory=directoryName)
+
+        self.assertEqual(0, len(results), 'Nothing to render')
+
+    def testProjectNotFound(self):
+
+        with TemporaryDirectory() as directoryName:
+            task:   RenderTask   = RenderTask(fileName=f'{osSep}tmp{osSep}NotThere.put', outputDirectory=directoryName, imageFormat=ImageFormat.SVG)
+            result: RenderResult = renderProject(task=task)
+
+        self.assertFalse(result.valid, 'Missing file cannot be rendered')
+        self.assertEqual(0, len(result.imageFiles), 'Should not write any images')
+
+    def testRenderPng(self):
+        self._renderSyntheticProject(imageFormat=ImageFormat.PNG)
+
+    def testRenderSvg(self):
+        self._renderSyntheticProject(imageFormat=ImageFormat.SVG)
+
+    def _renderSyntheticProject(self, imageFormat: ImageFormat):
+        """
+        Two class diagrams and a sequence diagram;  So three images
+        """
+        projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=8, linkCount=6, documentCount=2, sequenceDiagramCount=1, instanceCount=3, messageCount=4)
+
+        with TemporaryDirectory() as directoryName:
+            fileName: str = osPathJoin(directoryName, 'Synthetic.put')
+            SyntheticProjectGenerator(projectSize=projectSize).write(fqFileName=fileName)
+
+            task:   RenderTask   = RenderTask(fileName=fileName, outputDirectory=osPathJoin(directoryName, 'images'), imageFormat=imageFormat)
+            result: RenderResult = renderProject(task=task)
+
+            self.assertTrue(result.valid, f'Should render: {result.message}')
+            self.assertEqual(3, len(result.imageFiles), 'One image per document')
+            for imageFile in result.imageFiles:
+                self.assertTrue(imageFile.endswith(f'.{imageFormat.value}'), f'Wrong format: {imageFile}')
+                self.assertTrue(exists(imageFile), f'Not written: {imageFile}')
+                self.assertGreater(getsize(imageFile), 0, f'Empty image: {imageFile}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagramRenderer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,111 @@
+
+from typing import List
+
+from os import sep as osSep
+
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.ProjectTestBase import ProjectTestBase
+
+from pyut.headless.ProjectValidator import ProjectValidator
+from pyut.headless.ProjectValidator import ValidationResult
+from pyut.headless.ProjectValidator import VALIDATION_SUCCESS
+from pyut.headless.ProjectValidator import validateProject
+
+from pyut.ui.ProjectException import ProjectExceptionType
+
+SMALL_PROJECT: str = (
+    '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+    '<PyutProject version="11" CodePath="">\n'
+    '    <PyutDocument type="CLASS_DIAGRAM" title="Class Diagram" scrollPositionX="0" scrollPositionY="0" pixelsPerUnitX="20" pixelsPerUnitY="20">\n'
+    '        <OglClass width="150" height="75" x="100" y="100">\n'
+    '            <PyutClass id="1" name="Base" stereotype="noStereotype" displayMethods="True" displayParameters="Unspecified" '
+    'displayConstructor="Unspecified" displayDunderMethods="Unspecified" displayFields="True" displayStereotype="True" fileName="" description="" />\n'
+    '        </OglClass>\n'
+    '        <OglClass width="150" height="75" x="100" y="300">\n'
+    '            <PyutClass id="2" name="Derived" stereotype="noStereotype" displayMethods="True" displayParameters="Unspecified" '
+    'displayConstructor="Unspecified" displayDunderMethods="Unspecified" displayFields="True" displayStereotype="True" fileName="" description="" />\n'
+    '        </OglClass>\n'
+    '        <OglLink sourceAnchorX="175" sourceAnchorY="300" destinationAnchorX="175" destinationAnchorY="175" spline="False">\n'
+    '            <PyutLink name="" type="INHERITANCE" cardinalitySource="" cardinalityDestination="" bidirectional="False" sourceId="2" destinationId="1" />\n'
+    '        </OglLink>\n'
+    '    </PyutDocument>\n'
+    '    <PyutDocument type="SEQUENCE_DIAGRAM" title="Sequence Diagram" scrollPositionX="0" scrollPositionY="0" pixelsPerUnitX="20" pixelsPerUnitY="20">\n'
+    '        <OglSDInstance width="100" height="400" x="75" y="50">\n'
+    '            <PyutSDInstance id="3" instanceName="Caller" lifeLineLength="200" />\n'
+    '        </OglSDInstance>\n'
+    '        <OglSDInstance width="100" height="400" x="225" y="50">\n'
+    '            <PyutSDInstance id="4" instanceName="Callee" lifeLineLength="200" />\n'
+    '        </OglSDInstance>\n'
+    '        <OglSDMessage>\n'
+    '            <PyutSDMessage id="5" message="call()" sourceTime="100" destinationTime="100" sourceId="3" destinationId="4" />\n'
+    '        </OglSDMessage>\n'
+    '    </PyutDocument>\n'
+    '</PyutProject>\n'
+)
+
+
+class TestProjectValidator(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._projectValidator: ProjectValidator = ProjectValidator(maxWorkers=1)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testFindProjectFiles(self):
+
+        with TemporaryDirectory() as directoryName:
+            for fileName in ['one.put', 'two.xml', 'ignored.txt']:
+                with open(osPathJoin(directoryName, fileName), 'w') as fd:
+                    fd.write('')
+
+            fileNames: List[str] = sorted(self._projectValidator.findProjectFiles(directory=directoryName))
+
+            self.assertEqual(2, len(fileNames), 'Should only find project files')
+            self.assertTrue(fileNames[0].endswith(f'{osSep}one.put'), 'Wrong file')
+
+    def testProjectNotFound(self):
+
+        result: ValidationResult = validateProject(fileName=f'{osSep}tmp{osSep}NotThere.put')
+
+        self.assertFalse(result.valid, 'Missing file cannot be valid')
+        self.assertEqual(ProjectExceptionType.PROJECT_NOT_FOUND.value, result.classification, 'Incorrect classification')
+
+    def testValidProject(self):
+
+        with TemporaryDirectory() as directoryName:
+            fileName: str = osPathJoin(directoryName, 'SmallProject.xml')
+            with open(fileName, 'w') as fd:
+                fd.write(SMALL_PROJECT)
+
+            result: ValidationResult = validateProject(fileName=fileName)
+
+        self.assertEqual(VALIDATION_SUCCESS, result.classification, f'Should be valid: {result.message}')
+        self.assertEqual(2, result.documentCount,   'Class diagram plus sequence diagram')
+        self.assertEqual(2, result.classCount,      'Wrong class count')
+        self.assertEqual(1, result.linkCount,       'Wrong link count')
+        self.assertEqual(2, result.sdInstanceCount, 'Wrong instance count')
+        self.assertEqual(1, result.sdMessageCount,  'Wrong message count')
+        self.assertEqual(6, result.objectCount,     'Classes, links, instances and messages')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectValidator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,58 @@
+
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import TreeItemId
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from pyut.ui.AutoSaver import AutoSaver
+from pyut.ui.IPyutProject import IPyutProject
+from pyut.ui.ProjectTree import ProjectTree
+from pyut.ui.ProjectWriter import ProjectWriter
+from pyut.ui.PyutProject import PyutProject
+
+
+class TestAutoSaver(UnitTestBaseW):
+    """
+    PyutUI stops the auto saver while it closes the projects;  Late timer ticks, modifications and
+    discards must not submit work to the stopped executor
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._autoSaver:   AutoSaver    = AutoSaver(projectWriter=ProjectWriter())
+        self._pyutProject: IPyutProject = PyutProject(filename='/tmp/AutoSaverTest.put', tree=cast(ProjectTree, None), treeRoot=cast(TreeItemId, None))
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testCallsAfterStop(self):
+
+        self._autoSaver.stop()
+
+        self._autoSaver.projectModified(pyutProject=self._pyutProject)
+        self._autoSaver._onTimer()
+        self._autoSaver.projectSaved(pyutProject=self._pyutProject)
+        self._autoSaver.discard(pyutProject=self._pyutProject)
+
+    def testStopTwice(self):
+
+        self._autoSaver.stop()
+        self._autoSaver.stop()
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAutoSaver))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
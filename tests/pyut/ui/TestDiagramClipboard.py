@@ -0,0 +1,55 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from zlib import compress
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from pyut.ui.DiagramClipboard import DiagramClipboard
+
+
+class TestDiagramClipboard(UnitTestBaseW):
+    """
+    Any application can put data in the clipboard format;  Payloads that are not a Pyut
+    diagram must be reported as a ValueError so that paste can ignore them
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._diagramClipboard: DiagramClipboard = DiagramClipboard()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testNoDocument(self):
+        self._assertBadPayload(rawXml='<?xml version="1.0"?><PyutProject version="11.0" CodePath=""/>')
+
+    def testNotXml(self):
+        self._assertBadPayload(rawXml='Not a Pyut diagram')
+
+    def testNotAProject(self):
+        self._assertBadPayload(rawXml='<?xml version="1.0"?><SomethingElse/>')
+
+    def testUnsupportedVersion(self):
+        self._assertBadPayload(rawXml='<?xml version="1.0"?><PyutProject version="1.0" CodePath=""/>')
+
+    def _assertBadPayload(self, rawXml: str):
+
+        payload: bytes = compress(rawXml.encode('utf-8'))
+
+        self.assertRaises(ValueError, lambda: self._diagramClipboard.deserialize(payload=payload))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagramClipboard))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
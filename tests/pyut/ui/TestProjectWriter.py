@@ -0,0 +1,162 @@
+
+from typing import List
+from typing import cast
+
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from xml.etree.ElementTree import canonicalize
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from oglio.Reader import Reader
+from oglio.Types import OglDocument
+from oglio.Types import OglProject
+
+from oglio.toXmlV11.OglToXml import OglToXml
+
+from pyut.enums.DiagramType import DiagramType
+
+from pyut.general.ProjectReader import ProjectReader
+from pyut.general.ProjectReader import ProjectXml
+
+from pyut.ui.IPyutProject import IPyutProject
+from pyut.ui.ProjectWriter import ProjectWriter
+from pyut.ui.PyutDocument import PyutDocument
+
+from pyut.ui.main.PyutUI import PyutUI
+
+from pyut.ui.eventengine.EventEngine import EventEngine
+
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectGenerator
+from tests.benchmarks.SyntheticProjectGenerator import SyntheticProjectSize
+
+
+class TestProjectWriter(UnitTestBaseW):
+    """
+    The project writer splices cached document fragments into a skeleton built by oglio's
+    OglToXml;  These tests check that the result is still what oglio writes and reads.  A stub
+    is written back exactly as it was read
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._pyutUI: PyutUI = PyutUI(self._topLevelWindow, eventEngine=EventEngine(listeningWindow=self._topLevelWindow))
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        projectSize: SyntheticProjectSize = SyntheticProjectSize(classCount=12, linkCount=10, documentCount=2, sequenceDiagramCount=1, instanceCount=3, messageCount=4)
+        fqFileName:  str                  = osPathJoin(self._temporaryDirectory.name, 'Original.put')
+
+        self._generator: SyntheticProjectGenerator = SyntheticProjectGenerator(projectSize=projectSize)
+        self._generator.write(fqFileName=fqFileName)
+
+        self._oglProject: OglProject = ProjectReader().readFile(fqFileName=fqFileName)
+        self._projectXml: ProjectXml = ProjectReader().readXml(fqFileName=fqFileName)
+
+    def tearDown(self):
+        self._temporaryDirectory.cleanup()
+        super().tearDown()
+
+    def testSameXmlAsOglio(self):
+
+        pyutProject:   IPyutProject  = self._toPyutProject(materialize=True)
+        projectWriter: ProjectWriter = ProjectWriter()
+
+        oglToXml: OglToXml = OglToXml(projectCodePath=pyutProject.codePath)
+        for pyutDocument in pyutProject.documents:
+            oglToXml.serialize(oglDocument=projectWriter.toOglDocument(pyutDocument=cast(PyutDocument, pyutDocument)))
+        oglToXml.prettyPrint = False
+
+        expectedXml: str = canonicalize(oglToXml.xml, strip_text=True)
+        actualXml:   str = canonicalize(ProjectWriter().toXml(pyutProject=pyutProject), strip_text=True)
+
+        self.assertEqual(expectedXml, actualXml, 'The spliced project must match the oglio output')
+
+    def testStubsWrittenAsRead(self):
+
+        pyutProject: IPyutProject = self._toPyutProject(materialize=False)
+
+        expectedXml: str = canonicalize(self._generator.toXml(), strip_text=True)
+        actualXml:   str = canonicalize(ProjectWriter().toXml(pyutProject=pyutProject), strip_text=True)
+
+        self.assertEqual(expectedXml, actualXml, 'Unmaterialized documents must be written as they were read')
+
+    def testSerializingKeepsModified(self):
+
+        pyutProject:  IPyutProject = self._toPyutProject(materialize=True)
+        pyutDocument: PyutDocument = cast(PyutDocument, pyutProject.documents[0])
+
+        pyutDocument.modified = True
+        ProjectWriter().toXml(pyutProject=pyutProject)
+
+        self.assertTrue(pyutDocument.modified, 'Only a project save may clear the modified flag')
+
+    def testRoundTripStubs(self):
+        self._roundTrip(materialize=False)
+
+    def testRoundTripMaterialized(self):
+        self._roundTrip(materialize=True)
+
+    def _roundTrip(self, materialize: bool):
+
+        pyutProject: IPyutProject = self._toPyutProject(materialize=materialize)
+
+        ProjectWriter().writeProject(pyutProject=pyutProject)
+
+        roundTrip: OglProject = Reader().readFile(fqFileName=pyutProject.filename)
+
+        self.assertEqual(list(self._oglProject.oglDocuments.keys()), list(roundTrip.oglDocuments.keys()), 'Documents are not the same')
+        for title, document in self._oglProject.oglDocuments.items():
+            expected: OglDocument = cast(OglDocument, document)
+            actual:   OglDocument = cast(OglDocument, roundTrip.oglDocuments[title])
+
+            self.assertEqual(expected.documentType,        actual.documentType,        f'{title}: Wrong type')
+            self.assertEqual(len(expected.oglClasses),     len(actual.oglClasses),     f'{title}: Wrong class count')
+            self.assertEqual(len(expected.oglLinks),       len(actual.oglLinks),       f'{title}: Wrong link count')
+            self.assertEqual(len(expected.oglSDInstances), len(actual.oglSDInstances), f'{title}: Wrong instance count')
+            self.assertEqual(len(expected.oglSDMessages),  len(actual.oglSDMessages),  f'{title}: Wrong message count')
+
+    def _toPyutProject(self, materialize: bool) -> IPyutProject:
+        """
+        Create the documents the same way that PyutUI does when it opens a project
+
+        Args:
+            materialize:  If True, lay out the documents;  Else leave them as stubs
+        """
+        pyutProject: IPyutProject = self._pyutUI._projectManager.newProject()
+
+        pyutProject.filename = osPathJoin(self._temporaryDirectory.name, 'RoundTrip.put')
+        pyutProject.codePath = self._oglProject.codePath
+
+        pyutDocuments: List[PyutDocument] = []
+        for untangledDocument in self._projectXml.documents:
+            pyutDocument: PyutDocument = cast(PyutDocument, self._pyutUI._newDiagram(pyutProject=pyutProject,
+                                                                                     diagramType=DiagramType.toEnum(untangledDocument.document.documentType),
+                                                                                     diagramName=untangledDocument.document.documentTitle))
+            pyutDocument.untangledDocument = untangledDocument
+            pyutDocuments.append(pyutDocument)
+
+        if materialize is True:
+            for pyutDocument in pyutDocuments:
+                pyutDocument.materialize()
+
+        return pyutProject
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,91 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyut.ui.eventengine.EventType import EventType
+
+from pyut.ui.eventengine.inspector.EventMetrics import BUCKET_COUNT
+from pyut.ui.eventengine.inspector.EventMetrics import EventMetrics
+from pyut.ui.eventengine.inspector.EventMetrics import EventTypeMetrics
+from pyut.ui.eventengine.inspector.EventMetrics import LatencyHistogram
+from pyut.ui.eventengine.inspector.EventMetrics import NOT_SAMPLED
+
+
+class TestEventMetrics(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testHistogramBuckets(self):
+
+        histogram: LatencyHistogram = LatencyHistogram()
+
+        histogram.record(0.000003)      # 3 microseconds
+        histogram.record(0.000003)
+        histogram.record(10.0)          # Way past the last bucket
+
+        self.assertEqual(3, histogram.count, 'Incorrect count')
+        self.assertEqual(2, histogram.buckets[2], 'Should be in the [2, 4) microsecond bucket')
+        self.assertEqual(1, histogram.buckets[BUCKET_COUNT - 1], 'Should be clamped to the last bucket')
+        self.assertEqual(10.0, histogram.maxSeconds, 'Incorrect maximum')
+
+    def testHistogramPercentile(self):
+
+        histogram: LatencyHistogram = LatencyHistogram()
+        for x in range(99):
+            histogram.record(0.000003)
+        histogram.record(1.0)
+
+        self.assertEqual(0.000004, histogram.percentileSeconds(0.50), 'Median should be the small bucket upper bound')
+
+    def testCountsEveryEvent(self):
+
+        eventMetrics: EventMetrics = EventMetrics(sampleRate=4)
+        for x in range(10):
+            eventMetrics.eventSent(eventType=EventType.UMLDiagramModified)
+
+        eventTypeMetrics: EventTypeMetrics = eventMetrics.metrics[EventType.UMLDiagramModified]
+        self.assertEqual(10, eventTypeMetrics.sentCount, 'Every event should be counted')
+
+    def testSampling(self):
+
+        eventMetrics: EventMetrics = EventMetrics(sampleRate=4)
+
+        sampled: int = 0
+        for x in range(8):
+            if eventMetrics.eventSent(eventType=EventType.RefreshFrame) != NOT_SAMPLED:
+                sampled += 1
+
+        self.assertEqual(2, sampled, 'Should sample one in four')
+
+    def testToDict(self):
+
+        eventMetrics: EventMetrics = EventMetrics()
+        eventMetrics.eventSent(eventType=EventType.RefreshFrame)
+        eventMetrics.recordHandler(eventType=EventType.RefreshFrame, seconds=0.002)
+
+        metricsDict = eventMetrics.toDict()
+
+        self.assertEqual(1, metricsDict['eventTypes']['RefreshFrame']['sentCount'], 'Missing the count')
+        self.assertEqual(1, metricsDict['eventTypes']['RefreshFrame']['handler']['count'], 'Missing the handler timing')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestEventMetrics))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
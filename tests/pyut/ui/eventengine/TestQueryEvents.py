@@ -0,0 +1,85 @@
+
+from typing import List
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from pyut.enums.DiagramType import DiagramType
+
+from pyut.ui.IPyutDocument import IPyutDocument
+from pyut.ui.IPyutProject import IPyutProject
+
+from pyut.ui.main.PyutUI import PyutUI
+
+from pyut.ui.eventengine.EventEngine import EventEngine
+from pyut.ui.eventengine.EventType import EventType
+
+from pyut.ui.eventengine.eventinformation.ActiveProjectInformation import ActiveProjectInformation
+from pyut.ui.eventengine.eventinformation.MiniProjectInformation import MiniProjectInformation
+
+
+class TestQueryEvents(UnitTestBaseW):
+    """
+    The query events are answered by the handlers that PyutUI and its DiagramNotebook register;
+    Each one must invoke the callback that the sender supplied
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._eventEngine: EventEngine = EventEngine(listeningWindow=self._topLevelWindow)
+        self._pyutUI:      PyutUI      = PyutUI(self._topLevelWindow, eventEngine=self._eventEngine)
+
+        self._pyutProject:  IPyutProject  = self._pyutUI._projectManager.newProject()
+        self._pyutDocument: IPyutDocument = self._pyutUI._newDiagram(pyutProject=self._pyutProject, diagramType=DiagramType.CLASS_DIAGRAM)
+
+        self._answers: List = []
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMiniProjectInformation(self):
+
+        self._eventEngine.sendEvent(EventType.MiniProjectInformation, callback=self._answers.append)
+
+        self.assertEqual(1, len(self._answers), 'Callback was not invoked')
+
+        miniProjectInformation: MiniProjectInformation = self._answers[0]
+        self.assertEqual(self._pyutProject.projectName, miniProjectInformation.projectName, 'Wrong project')
+
+    def testActiveProjectInformation(self):
+
+        self._eventEngine.sendEvent(EventType.ActiveProjectInformation, callback=self._answers.append)
+
+        self.assertEqual(1, len(self._answers), 'Callback was not invoked')
+
+        activeProjectInformation: ActiveProjectInformation = self._answers[0]
+        self.assertEqual(self._pyutProject, activeProjectInformation.pyutProject, 'Wrong project')
+        self.assertEqual(self._pyutDocument.diagramFrame, activeProjectInformation.umlFrame, 'Wrong frame')
+
+    def testGetLollipopInterfaces(self):
+
+        self._eventEngine.sendEvent(EventType.GetLollipopInterfaces, callback=self._answers.append)
+
+        self.assertEqual(1, len(self._answers), 'Callback was not invoked')
+        self.assertEqual(0, len(self._answers[0]), 'A new diagram has no interfaces')
+
+    def testUnknownEventType(self):
+
+        self.assertRaises(ValueError, lambda: self._eventEngine.sendEvent(cast(EventType, 'NotAnEventType')))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestQueryEvents))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
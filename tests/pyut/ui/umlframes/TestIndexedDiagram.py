@@ -0,0 +1,78 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from miniogl.RectangleShape import RectangleShape
+
+from pyut.general.SpatialGrid import Bounds
+
+from pyut.ui.umlframes.IndexedDiagram import IndexedDiagram
+
+
+class TestIndexedDiagram(UnitTestBaseW):
+    """
+    Shapes move and resize without telling the diagram;  `update` must make the
+    spatial index and the boundaries follow them
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._diagram: IndexedDiagram = IndexedDiagram(self._listeningWindow)
+        self._shape:   RectangleShape = RectangleShape(x=100, y=100, width=50, height=50)
+
+        self._diagram.AddShape(self._shape)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testHitBeforeResize(self):
+
+        self.assertIs(self._shape, self._diagram.findShape(x=125, y=125), 'Should hit the shape')
+        self.assertIsNone(self._diagram.findShape(x=250, y=250), 'Outside the shape')
+
+    def testHitNewAreaAfterResize(self):
+
+        self._shape.SetSize(200, 200)
+        self._diagram.update(shape=self._shape)
+
+        self.assertIs(self._shape, self._diagram.findShape(x=250, y=250), 'Should hit the area the shape grew into')
+
+        boundaries: Bounds | None = self._diagram.boundaries
+        assert boundaries is not None
+        self.assertEqual(300, boundaries.maxX, 'Boundaries must grow with the shape')
+        self.assertEqual(300, boundaries.maxY, 'Boundaries must grow with the shape')
+
+    def testMissOldAreaAfterShrink(self):
+
+        self._shape.SetSize(10, 10)
+        self._diagram.update(shape=self._shape)
+
+        self.assertIsNone(self._diagram.findShape(x=140, y=140), 'The shape no longer covers this point')
+
+        boundaries: Bounds | None = self._diagram.boundaries
+        assert boundaries is not None
+        self.assertEqual(110, boundaries.maxX, 'Boundaries must shrink with the shape')
+
+    def testMissOldAreaAfterMove(self):
+
+        self._shape.SetPosition(400, 400)
+        self._diagram.update(shape=self._shape)
+
+        self.assertIsNone(self._diagram.findShape(x=125, y=125), 'The shape moved away')
+        self.assertIs(self._shape, self._diagram.findShape(x=425, y=425), 'Should hit the shape where it moved to')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIndexedDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,90 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Bitmap
+from wx import MemoryDC
+from wx import NullBitmap
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from pyutmodelv2.PyutNote import PyutNote
+
+from ogl.OglNote import OglNote
+
+from pyut.ui.umlframes.ShapeRenderCache import ShapeRenderCache
+
+
+class TestShapeRenderCache(UnitTestBaseW):
+    """
+    A rendering is reused until the revision of its model changes or the shape is resized
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._renderCache: ShapeRenderCache = ShapeRenderCache(enabled=True)
+        self._pyutNote:    PyutNote         = PyutNote(content='A cached note')
+        self._oglNote:     OglNote          = OglNote(pyutNote=self._pyutNote, w=100, h=50)
+
+        self._bitmap: Bitmap   = Bitmap(400, 400)
+        self._dc:     MemoryDC = MemoryDC(self._bitmap)
+
+        self._oglNote.SetPosition(20, 20)
+
+    def tearDown(self):
+        self._dc.SelectObject(NullBitmap)
+        super().tearDown()
+
+    def testReusedWhenUnchanged(self):
+
+        first:  Bitmap = self._drawnBitmap()
+        second: Bitmap = self._drawnBitmap()
+
+        self.assertIs(first, second, 'Nothing changed;  Should reuse the rendering')
+
+    def testRenderedAgainAfterModelChange(self):
+
+        first: Bitmap = self._drawnBitmap()
+
+        self._pyutNote.content = 'A changed note'
+        self._renderCache.invalidateModel(modelObject=self._pyutNote)
+
+        self.assertIsNot(first, self._drawnBitmap(), 'The model revision changed;  Should render again')
+
+    def testRenderedAgainAfterShapeInvalidated(self):
+
+        first: Bitmap = self._drawnBitmap()
+
+        self._renderCache.invalidate(shape=self._oglNote)
+
+        self.assertIsNot(first, self._drawnBitmap(), 'Invalidating the shape bumps the revision of its model')
+
+    def testRenderedAgainAfterResize(self):
+
+        first: Bitmap = self._drawnBitmap()
+
+        self._oglNote.SetSize(200, 80)
+
+        second: Bitmap = self._drawnBitmap()
+        self.assertIsNot(first, second, 'The size changed;  Should render again')
+        self.assertEqual(200, second.GetWidth(), 'The rendering must have the new size')
+
+    def _drawnBitmap(self) -> Bitmap:
+
+        self._renderCache.draw(shape=self._oglNote, dc=self._dc, zoom=1.0)
+
+        return self._renderCache._renderings[id(self._oglNote)].bitmap
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestShapeRenderCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,96 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from wx import Command
+
+from pyut.ui.wxcommands.BoundedCommandProcessor import BoundedCommandProcessor
+
+COMMAND_SIZE: int = 1000
+
+
+class SizedCommand(Command):
+
+    def __init__(self, name: str):
+
+        super().__init__(canUndo=True, name=name)
+
+        self._name:     str  = name
+        self._released: bool = False
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    @property
+    def estimatedSize(self) -> int:
+        return 0 if self._released is True else COMMAND_SIZE
+
+    def release(self):
+        self._released = True
+
+    def GetName(self) -> str:
+        return self._name
+
+    def CanUndo(self) -> bool:
+        return self._released is False
+
+    def Do(self) -> bool:
+        return True
+
+    def Undo(self) -> bool:
+        return True
+
+
+class TestBoundedCommandProcessor(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testEntryLimit(self):
+
+        commandProcessor: BoundedCommandProcessor = BoundedCommandProcessor(maxEntries=3, maxBytes=COMMAND_SIZE * 100)
+        for x in range(5):
+            commandProcessor.Submit(SizedCommand(name=f'Command {x}'))
+
+        self.assertEqual(3, len(commandProcessor.GetCommands()), 'Oldest entries not dropped')
+
+    def testByteBudgetReleasesOldest(self):
+
+        commandProcessor: BoundedCommandProcessor = BoundedCommandProcessor(maxEntries=-1, maxBytes=COMMAND_SIZE * 2)
+        commands = [SizedCommand(name=f'Command {x}') for x in range(4)]
+        for command in commands:
+            commandProcessor.Submit(command)
+
+        self.assertEqual([True, True, False, False], [command.released for command in commands], 'Wrong entries released')
+        self.assertLessEqual(commandProcessor.estimatedBytes, COMMAND_SIZE * 2, 'History is over budget')
+
+    def testCurrentCommandNeverReleased(self):
+
+        commandProcessor: BoundedCommandProcessor = BoundedCommandProcessor(maxEntries=-1, maxBytes=COMMAND_SIZE // 2)
+        command:          SizedCommand            = SizedCommand(name='Only')
+
+        commandProcessor.Submit(command)
+
+        self.assertFalse(command.released, 'The latest command must stay undoable')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBoundedCommandProcessor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,93 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from wx import Command
+from wx import CommandProcessor
+
+from pyut.ui.wxcommands.CommandTransaction import CommandTransaction
+
+
+class RecordingCommand(Command):
+
+    def __init__(self, name: str, journal: List[str], succeeds: bool = True):
+
+        super().__init__(canUndo=True, name=name)
+
+        self._name:     str       = name
+        self._journal:  List[str] = journal
+        self._succeeds: bool      = succeeds
+
+    def GetName(self) -> str:
+        return self._name
+
+    def CanUndo(self) -> bool:
+        return True
+
+    def Do(self) -> bool:
+        if self._succeeds is True:
+            self._journal.append(f'do {self._name}')
+        return self._succeeds
+
+    def Undo(self) -> bool:
+        self._journal.append(f'undo {self._name}')
+        return True
+
+
+class TestCommandTransaction(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._journal:          List[str]        = []
+        self._commandProcessor: CommandProcessor = CommandProcessor()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSingleUndoEntry(self):
+
+        transaction: CommandTransaction = self._createTransaction(names=['a', 'b', 'c'])
+
+        self._commandProcessor.Submit(command=transaction, storeIt=True)
+        self.assertEqual(['do a', 'do b', 'do c'], self._journal, 'Commands not done in order')
+        self.assertEqual(1, len(self._commandProcessor.GetCommands()), 'Should be a single undo entry')
+
+        self._journal.clear()
+        self._commandProcessor.Undo()
+        self.assertEqual(['undo c', 'undo b', 'undo a'], self._journal, 'Commands not undone in reverse order')
+
+    def testRollbackOnFailure(self):
+
+        transaction: CommandTransaction = self._createTransaction(names=['a', 'b'])
+        transaction.addCommand(RecordingCommand(name='c', journal=self._journal, succeeds=False))
+
+        self.assertFalse(transaction.Do(), 'The transaction should fail')
+        self.assertEqual(['do a', 'do b', 'undo b', 'undo a'], self._journal, 'Completed commands not rolled back')
+
+    def _createTransaction(self, names: List[str]) -> CommandTransaction:
+
+        transaction: CommandTransaction = CommandTransaction(name='Test Transaction')
+        for name in names:
+            transaction.addCommand(RecordingCommand(name=name, journal=self._journal))
+
+        return transaction
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCommandTransaction))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()